@@ -324,6 +324,8 @@ def import_local_evidence_command(
     claim_element_id: str = "causation",
     kind: str = "document",
     evidence_root: Optional[str] = None,
+    workers: Optional[int] = typer.Option(None, "--workers", help="Parallel parse/copy workers for the import."),
+    resume: bool = typer.Option(False, "--resume", help="Record committed files and messages, and skip those an earlier --resume import already committed."),
 ) -> None:
     payload = service.import_local_evidence(
         user_id,
@@ -331,6 +333,8 @@ def import_local_evidence_command(
         claim_element_id=claim_element_id,
         kind=kind,
         evidence_root=evidence_root,
+        max_workers=workers,
+        resume=resume,
     )
     _print(payload)
 
@@ -466,6 +466,19 @@ def tool_list_payload(service: ComplaintWorkspaceService) -> Dict[str, Any]:
     }
 
 
+def tool_call_result(structured: Any) -> Dict[str, Any]:
+    return {
+        "content": [
+            {
+                "type": "text",
+                "text": json.dumps(structured, sort_keys=True),
+            }
+        ],
+        "structuredContent": structured,
+        "isError": False,
+    }
+
+
 def _success(request_id: Any, result: Any) -> Dict[str, Any]:
     return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "result": result}
 
@@ -544,20 +557,10 @@ def handle_jsonrpc_message(
             return _error(request_id, -32602, "Invalid params", "tools/call arguments must be an object.")
         try:
             structured = service.call_mcp_tool(tool_name, arguments)
-            return _success(
-                request_id,
-                {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": json.dumps(structured, sort_keys=True),
-                        }
-                    ],
-                    "structuredContent": structured,
-                    "isError": False,
-                },
-            )
+            return None if is_notification else _success(request_id, tool_call_result(structured))
         except Exception as exc:
+            if is_notification:
+                return None
             return _success(
                 request_id,
                 {
@@ -1,20 +1,272 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
+import os
 import sys
-from typing import Any, Dict
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
-from .complaint_mcp_protocol import handle_jsonrpc_message
-from .complaint_workspace import ComplaintWorkspaceService
+from .complaint_mcp_protocol import _error, handle_jsonrpc_message
+from .complaint_workspace import DEFAULT_USER_ID, ComplaintWorkspaceService, _slugify_user_id
 
 
-def _write(payload: Dict[str, Any]) -> None:
+SERVER_MODE_ENV = "COMPLAINT_GENERATOR_MCP_SERVER_MODE"
+MAX_WORKERS_ENV = "COMPLAINT_GENERATOR_MCP_MAX_WORKERS"
+DEFAULT_MAX_WORKERS = 8
+DIAGNOSTICS_TOOL_NAME = "complaint.get_mcp_server_diagnostics"
+
+_DIAGNOSTICS_TOOL = {
+    "name": DIAGNOSTICS_TOOL_NAME,
+    "description": "Report per-method latency, in-flight and queued request counts for the concurrent MCP server.",
+}
+
+
+def _write(payload: Any) -> None:
     sys.stdout.write(json.dumps(payload) + "\n")
     sys.stdout.flush()
 
 
-def main() -> None:
-    service = ComplaintWorkspaceService()
+def _parse_error(exc: json.JSONDecodeError) -> Dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": None,
+        "error": {
+            "code": -32700,
+            "message": "Parse error",
+            "data": str(exc),
+        },
+    }
+
+
+def _is_exit(request: Any) -> bool:
+    if isinstance(request, list):
+        return any(_is_exit(item) for item in request)
+    return isinstance(request, dict) and request.get("method") == "exit"
+
+
+def _request_label(request: Any) -> str:
+    if not isinstance(request, dict):
+        return "invalid"
+    method = str(request.get("method") or "")
+    params = request.get("params")
+    if method == "tools/call" and isinstance(params, dict) and isinstance(params.get("name"), str):
+        return params["name"]
+    return method or "invalid"
+
+
+def _serialization_key(request: Any) -> Optional[str]:
+    """Return the workspace a request mutates, or ``None`` if it touches no session."""
+    if not isinstance(request, dict) or request.get("method") != "tools/call":
+        return None
+    params = request.get("params")
+    arguments = params.get("arguments") if isinstance(params, dict) else None
+    if not isinstance(arguments, dict):
+        arguments = {}
+    # Workspaces are stored per slugified id, so key the lock the same way.
+    return _slugify_user_id(arguments.get("user_id") or DEFAULT_USER_ID)
+
+
+class MCPServerStats:
+    """Thread-safe request counters for the concurrent MCP server."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._methods: Dict[str, Dict[str, float]] = {}
+        self.queued = 0
+        self.running = 0
+        self.max_in_flight = 0
+        self.completed = 0
+
+    def enqueue(self) -> None:
+        with self._lock:
+            self.queued += 1
+            self.max_in_flight = max(self.max_in_flight, self.queued + self.running)
+
+    def start(self) -> None:
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+
+    def finish(self, label: str, *, wait_seconds: float, run_seconds: float, error: bool) -> None:
+        with self._lock:
+            self.running -= 1
+            self.completed += 1
+            method = self._methods.setdefault(
+                label,
+                {"count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0, "wait_ms": 0.0},
+            )
+            total_ms = (wait_seconds + run_seconds) * 1000
+            method["count"] += 1
+            method["errors"] += 1 if error else 0
+            method["total_ms"] += total_ms
+            method["max_ms"] = max(method["max_ms"], total_ms)
+            method["wait_ms"] += wait_seconds * 1000
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            methods = {
+                label: {
+                    "count": int(values["count"]),
+                    "errors": int(values["errors"]),
+                    "avg_ms": round(values["total_ms"] / values["count"], 3) if values["count"] else 0.0,
+                    "max_ms": round(values["max_ms"], 3),
+                    "avg_wait_ms": round(values["wait_ms"] / values["count"], 3) if values["count"] else 0.0,
+                }
+                for label, values in sorted(self._methods.items())
+            }
+            return {
+                "queued": self.queued,
+                "running": self.running,
+                "in_flight": self.queued + self.running,
+                "max_in_flight": self.max_in_flight,
+                "completed": self.completed,
+                "methods": methods,
+            }
+
+
+class _DiagnosticsServiceView:
+    """Workspace service as seen by the concurrent server's protocol handler.
+
+    Adds the diagnostics tool to ``list_mcp_tools`` and answers it in
+    ``call_mcp_tool``, so diagnostics requests go through the same JSON-RPC
+    validation and notification handling as every other tool.
+    """
+
+    def __init__(self, server: "ConcurrentComplaintMCPServer") -> None:
+        self._server = server
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._server.service, name)
+
+    def list_mcp_tools(self) -> Dict[str, Any]:
+        listing = self._server.service.list_mcp_tools()
+        return {**listing, "tools": [*listing.get("tools", []), dict(_DIAGNOSTICS_TOOL)]}
+
+    def call_mcp_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        if tool_name == DIAGNOSTICS_TOOL_NAME:
+            return self._server.diagnostics()
+        return self._server.service.call_mcp_tool(tool_name, arguments)
+
+
+class ConcurrentComplaintMCPServer:
+    """Asyncio JSON-RPC loop that runs independent requests concurrently.
+
+    Each request is handled on a worker thread and its response is written
+    as soon as it completes, so clients must match responses by ``id``.
+    ``tools/call`` requests for the same ``user_id`` run one at a time, in
+    arrival order, so a workspace session is never mutated concurrently;
+    a user's lock is dropped once none of their requests is queued or running.
+    Batch arrays are dispatched concurrently and answered with one array.
+    """
+
+    def __init__(
+        self,
+        service: ComplaintWorkspaceService,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        self.service = service
+        self.max_workers = max(1, int(max_workers))
+        self.stats = MCPServerStats()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Each queued or running request holds its user's lock, so the entry
+        # disappears once that user goes idle.
+        self._user_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+        self._service_view = _DiagnosticsServiceView(self)
+
+    def diagnostics(self) -> Dict[str, Any]:
+        return {
+            "mode": "concurrent",
+            "max_workers": self.max_workers,
+            "serialized_workspaces": len(self._user_locks),
+            **self.stats.snapshot(),
+        }
+
+    async def dispatch(self, request: Any) -> Optional[Dict[str, Any]]:
+        """Handle one JSON-RPC request object and return its response."""
+        label = _request_label(request)
+        if label == DIAGNOSTICS_TOOL_NAME:
+            # Answered inline and left out of the counters it reports.
+            return handle_jsonrpc_message(self._service_view, request)
+
+        key = _serialization_key(request)
+        lock = self._user_locks.setdefault(key, asyncio.Lock()) if key is not None else None
+        loop = asyncio.get_running_loop()
+        enqueued_at = time.perf_counter()
+        self.stats.enqueue()
+        async with lock if lock is not None else contextlib.nullcontext():
+            started_at = time.perf_counter()
+            self.stats.start()
+            response: Optional[Dict[str, Any]] = None
+            try:
+                response = await loop.run_in_executor(
+                    self._executor, handle_jsonrpc_message, self._service_view, request
+                )
+            finally:
+                result = (response or {}).get("result")
+                self.stats.finish(
+                    label,
+                    wait_seconds=started_at - enqueued_at,
+                    run_seconds=time.perf_counter() - started_at,
+                    error="error" in (response or {}) or (isinstance(result, dict) and bool(result.get("isError"))),
+                )
+        return response
+
+    async def dispatch_batch(self, batch: List[Any]) -> Optional[Any]:
+        if not batch:
+            return _error(None, -32600, "Invalid Request", "JSON-RPC batch must not be empty.")
+        responses = await asyncio.gather(*(self.dispatch(item) for item in batch))
+        return [response for response in responses if response is not None] or None
+
+    async def _handle_line(self, line: str) -> None:
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as exc:
+            _write(_parse_error(exc))
+            return
+        if isinstance(request, list):
+            response = await self.dispatch_batch(request)
+        else:
+            response = await self.dispatch(request)
+        if response is not None:
+            _write(response)
+
+    async def serve(self, stream: Any = None) -> None:
+        """Read requests from ``stream`` (stdin by default) until EOF or ``exit``."""
+        stream = stream if stream is not None else sys.stdin
+        loop = asyncio.get_running_loop()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="complaint-mcp")
+        pending: set = set()
+        try:
+            while True:
+                raw_line = await loop.run_in_executor(None, stream.readline)
+                if not raw_line:
+                    break
+                line = raw_line.strip()
+                if not line:
+                    continue
+                task = asyncio.create_task(self._handle_line(line))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+                if '"exit"' in line:
+                    try:
+                        if _is_exit(json.loads(line)):
+                            break
+                    except json.JSONDecodeError:
+                        pass
+            if pending:
+                await asyncio.gather(*pending)
+        finally:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+def _serve_sequential(service: ComplaintWorkspaceService) -> None:
     for raw_line in sys.stdin:
         line = raw_line.strip()
         if not line:
@@ -22,22 +274,36 @@ def main() -> None:
         try:
             request = json.loads(line)
         except json.JSONDecodeError as exc:
-            _write({
-                "jsonrpc": "2.0",
-                "id": None,
-                "error": {
-                    "code": -32700,
-                    "message": "Parse error",
-                    "data": str(exc),
-                },
-            })
+            _write(_parse_error(exc))
             continue
-        response = handle_jsonrpc_message(service, request)
+        if isinstance(request, list):
+            responses = [handle_jsonrpc_message(service, item) for item in request]
+            response: Any = [item for item in responses if item is not None] or None
+            if not request:
+                response = _error(None, -32600, "Invalid Request", "JSON-RPC batch must not be empty.")
+        else:
+            response = handle_jsonrpc_message(service, request)
         if response is not None:
             _write(response)
-        if isinstance(request, dict) and request.get("method") == "exit":
+        if _is_exit(request):
             break
 
 
+def main() -> None:
+    """Serve the complaint workspace over stdio JSON-RPC.
+
+    Requests are handled one at a time unless
+    ``COMPLAINT_GENERATOR_MCP_SERVER_MODE=concurrent``, which switches to
+    ``ConcurrentComplaintMCPServer`` with ``COMPLAINT_GENERATOR_MCP_MAX_WORKERS``
+    worker threads.
+    """
+    service = ComplaintWorkspaceService()
+    if str(os.getenv(SERVER_MODE_ENV, "") or "").strip().lower() == "concurrent":
+        max_workers = int(str(os.getenv(MAX_WORKERS_ENV, "") or DEFAULT_MAX_WORKERS).strip())
+        asyncio.run(ConcurrentComplaintMCPServer(service, max_workers=max_workers).serve())
+        return
+    _serve_sequential(service)
+
+
 if __name__ == "__main__":
     main()
@@ -14,7 +14,7 @@ from copy import deepcopy
 from datetime import datetime, timezone
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 from xml.sax.saxutils import escape
 
 from complaint_phases.legal_document import parse_legal_document
@@ -78,6 +78,9 @@ DEFAULT_UI_UX_SCREENSHOT_TARGET = "playwright/tests/complaint-flow.spec.js"
 
 _DATA_DIR = Path(__file__).resolve().parent.parent / ".complaint_workspace"
 _SESSION_DIR = _DATA_DIR / "sessions"
+# Appended session operations are folded back into the JSON snapshot once the
+# log grows past this many entries, bounding replay cost on load.
+_SESSION_OPLOG_COMPACT_THRESHOLD = 256
 
 _INTAKE_QUESTIONS: List[Dict[str, str]] = [
     {
@@ -1561,12 +1564,27 @@ class ComplaintWorkspaceService:
         base_dir = Path(root_dir) if root_dir is not None else _SESSION_DIR
         self._session_dir = base_dir
         self._session_dir.mkdir(parents=True, exist_ok=True)
-        self._last_draft_refinement_error: Optional[str] = None
+        self._draft_refinement = threading.local()
+        self._oplog_lengths: Dict[Path, int] = {}
+        self._oplog_seqs: Dict[Path, int] = {}
+
+    @property
+    def _last_draft_refinement_error(self) -> Optional[str]:
+        # Per thread: the concurrent MCP server drafts for several users on
+        # one service at the same time.
+        return getattr(self._draft_refinement, "error", None)
+
+    @_last_draft_refinement_error.setter
+    def _last_draft_refinement_error(self, value: Optional[str]) -> None:
+        self._draft_refinement.error = value
 
     def _session_path(self, user_id: str) -> Path:
         return self._session_dir / f"{_slugify_user_id(user_id)}.json"
 
-    def _load_state(self, user_id: str) -> Dict[str, Any]:
+    def _session_oplog_path(self, user_id: str) -> Path:
+        return self._session_dir / f"{_slugify_user_id(user_id)}.ops.jsonl"
+
+    def _read_session_snapshot(self, user_id: str) -> Dict[str, Any]:
         path = self._session_path(user_id)
         if not path.exists():
             return _default_state(user_id)
@@ -1576,6 +1594,76 @@ class ComplaintWorkspaceService:
             return _default_state(user_id)
         if not isinstance(payload, dict):
             return _default_state(user_id)
+        return payload
+
+    def _read_session_oplog(self, oplog_path: Path) -> List[Dict[str, Any]]:
+        """Return the logged operations, cutting off a torn trailing write.
+
+        An interrupted append leaves a partial last line. It is truncated away
+        here so the next append starts on a clean line instead of being glued
+        onto the fragment and lost.
+        """
+        operations: List[Dict[str, Any]] = []
+        try:
+            with oplog_path.open("rb") as handle:
+                good_offset = 0
+                for line in handle:
+                    try:
+                        operation = json.loads(line) if line.endswith(b"\n") else None
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        operation = None
+                    if not isinstance(operation, dict):
+                        break
+                    operations.append(operation)
+                    good_offset += len(line)
+                torn = handle.seek(0, os.SEEK_END) > good_offset
+            if torn:
+                with oplog_path.open("r+b") as handle:
+                    handle.truncate(good_offset)
+        except OSError:
+            pass
+        return operations
+
+    def _replay_session_oplog(self, user_id: str, state: Dict[str, Any], snapshot_seq: int = 0) -> None:
+        oplog_path = self._session_oplog_path(user_id)
+        operations = self._read_session_oplog(oplog_path)
+        last_seq = snapshot_seq
+        for operation in operations:
+            seq = operation.get("seq")
+            if isinstance(seq, int):
+                if seq <= snapshot_seq:
+                    # Already folded into the snapshot; the log outlived a compaction.
+                    continue
+                last_seq = max(last_seq, seq)
+            self._apply_session_operation(state, operation)
+        self._oplog_lengths[oplog_path] = len(operations)
+        self._oplog_seqs[oplog_path] = last_seq
+
+    def _current_oplog_seq(self, user_id: str) -> int:
+        oplog_path = self._session_oplog_path(user_id)
+        if oplog_path not in self._oplog_seqs:
+            snapshot = self._read_session_snapshot(user_id)
+            self._replay_session_oplog(user_id, snapshot, self._snapshot_oplog_seq(snapshot))
+        return self._oplog_seqs[oplog_path]
+
+    @staticmethod
+    def _snapshot_oplog_seq(snapshot: Dict[str, Any]) -> int:
+        try:
+            return int(snapshot.pop("oplog_seq", 0) or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    @staticmethod
+    def _apply_session_operation(state: Dict[str, Any], operation: Mapping[str, Any]) -> None:
+        if operation.get("op") == "append_evidence":
+            evidence_store = state.setdefault("evidence", {"testimony": [], "documents": []})
+            evidence_store.setdefault(str(operation.get("collection") or "testimony"), []).append(operation.get("record"))
+        if operation.get("updated_at"):
+            state["updated_at"] = operation["updated_at"]
+
+    def _load_state(self, user_id: str) -> Dict[str, Any]:
+        payload = self._read_session_snapshot(user_id)
+        self._replay_session_oplog(user_id, payload, self._snapshot_oplog_seq(payload))
         payload.setdefault("user_id", user_id)
         payload["claim_type"] = _normalize_claim_type(payload.get("claim_type"))
         payload.setdefault("case_synopsis", "")
@@ -1591,14 +1679,47 @@ class ComplaintWorkspaceService:
 
     def _save_state(self, state: Dict[str, Any]) -> Dict[str, Any]:
         state["updated_at"] = _utc_now()
-        path = self._session_path(str(state.get("user_id") or DEFAULT_USER_ID))
+        user_id = str(state.get("user_id") or DEFAULT_USER_ID)
+        path = self._session_path(user_id)
         temp_path = path.with_name(f"{path.name}.tmp")
+        # Recording the last folded-in sequence lets replay skip those entries
+        # if the process dies between replacing the snapshot and removing the log.
+        oplog_seq = self._current_oplog_seq(user_id)
         try:
-            temp_path.write_text(json.dumps(state, indent=2, sort_keys=True))
+            temp_path.write_text(json.dumps({**state, "oplog_seq": oplog_seq}, indent=2, sort_keys=True))
             os.replace(temp_path, path)
         finally:
             if temp_path.exists():
                 temp_path.unlink()
+        # The snapshot now includes every logged operation.
+        oplog_path = self._session_oplog_path(user_id)
+        oplog_path.unlink(missing_ok=True)
+        self._oplog_lengths[oplog_path] = 0
+        return state
+
+    def _append_state_operations(self, state: Dict[str, Any], operations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Persist ``operations`` (already applied to ``state``) by appending to the session log.
+
+        Writes are proportional to the change rather than to the session size.
+        The log is compacted into the JSON snapshot once it passes
+        ``_SESSION_OPLOG_COMPACT_THRESHOLD`` entries.
+        """
+        user_id = str(state.get("user_id") or DEFAULT_USER_ID)
+        oplog_path = self._session_oplog_path(user_id)
+        logged = self._oplog_lengths.get(oplog_path, 0)
+        if not self._session_path(user_id).exists() or logged + len(operations) > _SESSION_OPLOG_COMPACT_THRESHOLD:
+            return self._save_state(state)
+        updated_at = _utc_now()
+        state["updated_at"] = updated_at
+        seq = self._current_oplog_seq(user_id)
+        lines = "".join(
+            json.dumps({**operation, "updated_at": updated_at, "seq": seq + offset}, sort_keys=True) + "\n"
+            for offset, operation in enumerate(operations, start=1)
+        )
+        with oplog_path.open("a", encoding="utf-8") as handle:
+            handle.write(lines)
+        self._oplog_lengths[oplog_path] = logged + len(operations)
+        self._oplog_seqs[oplog_path] = seq + len(operations)
         return state
 
     def _build_question_status(self, answers: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -4381,10 +4502,72 @@ class ComplaintWorkspaceService:
         attachment_names: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         state = self._load_state(str(user_id or DEFAULT_USER_ID))
+        operation = self._append_evidence_record(
+            state,
+            kind=kind,
+            claim_element_id=claim_element_id,
+            title=title,
+            content=content,
+            source=source,
+            attachment_names=attachment_names,
+        )
+        self._append_state_operations(state, [operation])
+        return {
+            "saved": operation["record"],
+            "review": self._build_review(state),
+            "session": deepcopy(state),
+            "case_synopsis": self._build_case_synopsis(state),
+        }
+
+    def save_evidence_many(
+        self,
+        user_id: Optional[str],
+        items: Iterable[Mapping[str, Any]],
+    ) -> Dict[str, Any]:
+        """Save several evidence items with one session load and one write.
+
+        Each item takes the keyword arguments of ``save_evidence``. Bulk
+        importers should use this so an import of N items costs O(N) rather
+        than re-reading and re-writing the session once per item.
+        """
+        state = self._load_state(str(user_id or DEFAULT_USER_ID))
+        operations = [
+            self._append_evidence_record(
+                state,
+                kind=str(item.get("kind") or "testimony"),
+                claim_element_id=str(item.get("claim_element_id") or "causation"),
+                title=str(item.get("title") or "Untitled evidence"),
+                content=str(item.get("content") or ""),
+                source=item.get("source"),
+                attachment_names=item.get("attachment_names"),
+            )
+            for item in items
+        ]
+        if operations:
+            self._append_state_operations(state, operations)
+        return {
+            "saved": [operation["record"] for operation in operations],
+            "review": self._build_review(state),
+            "session": deepcopy(state),
+            "case_synopsis": self._build_case_synopsis(state),
+        }
+
+    @staticmethod
+    def _append_evidence_record(
+        state: Dict[str, Any],
+        *,
+        kind: str,
+        claim_element_id: str,
+        title: str,
+        content: str,
+        source: Optional[str] = None,
+        attachment_names: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
         evidence_store = state.setdefault("evidence", {"testimony": [], "documents": []})
         collection_key = "documents" if kind == "document" else "testimony"
+        collection = evidence_store.setdefault(collection_key, [])
         record = {
-            "id": f"{collection_key}-{len(evidence_store.get(collection_key, [])) + 1}",
+            "id": f"{collection_key}-{len(collection) + 1}",
             "kind": kind,
             "claim_element_id": claim_element_id,
             "title": title,
@@ -4393,14 +4576,8 @@ class ComplaintWorkspaceService:
             "attachment_names": [str(item).strip() for item in list(attachment_names or []) if str(item).strip()],
             "saved_at": _utc_now(),
         }
-        evidence_store.setdefault(collection_key, []).append(record)
-        self._save_state(state)
-        return {
-            "saved": record,
-            "review": self._build_review(state),
-            "session": deepcopy(state),
-            "case_synopsis": self._build_case_synopsis(state),
-        }
+        collection.append(record)
+        return {"op": "append_evidence", "collection": collection_key, "record": record}
 
     def import_gmail_evidence(
         self,
@@ -4558,6 +4735,8 @@ class ComplaintWorkspaceService:
         claim_element_id: str = "causation",
         kind: str = "document",
         evidence_root: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        resume: bool = False,
     ) -> Dict[str, Any]:
         from complaint_generator.local_evidence_import import import_local_evidence
 
@@ -4569,6 +4748,8 @@ class ComplaintWorkspaceService:
             workspace_root=self._session_dir,
             evidence_root=Path(evidence_root) if evidence_root else None,
             service=self,
+            max_workers=max_workers,
+            resume=resume,
         )
 
     def generate_complaint(
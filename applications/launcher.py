@@ -76,8 +76,25 @@ def _run_uvicorn_app(app: Any, application_config: Dict[str, Any]) -> None:
     )
 
 
+def _server_mediator_factory(mediator: Any, application_config: Dict[str, Any]):
+    # ``per_user_mediators`` only applies to chat turns; review and document
+    # routes keep using the shared mediator.
+    if not application_config.get("per_user_mediators") or not hasattr(mediator, "backends"):
+        return None
+    mediator_type = type(mediator)
+    backends = mediator.backends
+    return lambda: mediator_type(backends=backends)
+
+
 def _run_server_app(mediator: Any, application_config: Dict[str, Any]) -> None:
-    SERVER(mediator).run(
+    SERVER(
+        mediator,
+        mediator_factory=_server_mediator_factory(mediator, application_config),
+        max_workers=application_config.get("max_workers"),
+        max_queue=application_config.get("max_queue"),
+        mediator_pool_size=application_config.get("mediator_pool_size"),
+        session_state_dir=application_config.get("session_state_dir"),
+    ).run(
         host=application_config.get("host", "0.0.0.0"),
         port=application_config.get("port", 8000),
         reload=bool(application_config.get("reload", False)),
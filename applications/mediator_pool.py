@@ -0,0 +1,240 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+SERVER_WORKERS_ENV = "COMPLAINT_GENERATOR_SERVER_WORKERS"
+SERVER_QUEUE_LIMIT_ENV = "COMPLAINT_GENERATOR_SERVER_QUEUE_LIMIT"
+MEDIATOR_POOL_SIZE_ENV = "COMPLAINT_GENERATOR_MEDIATOR_POOL_SIZE"
+DEFAULT_SERVER_WORKERS = 4
+DEFAULT_SERVER_QUEUE_LIMIT = 32
+DEFAULT_MEDIATOR_POOL_SIZE = 16
+DEFAULT_SESSION_STATE_DIR = os.path.join("statefiles", "mediator_sessions")
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(str(os.getenv(name, "") or default).strip()))
+    except ValueError:
+        return default
+
+
+class MediatorBusyError(RuntimeError):
+    """Raised when the mediator executor queue is full."""
+
+    def __init__(self, queue_position: int, queue_limit: int):
+        super().__init__(f"mediator queue is full ({queue_limit} waiting)")
+        self.queue_position = queue_position
+        self.queue_limit = queue_limit
+
+
+class MediatorExecutor:
+    """Bounded worker pool for blocking mediator calls.
+
+    ``run`` must be awaited from the event loop thread. At most
+    ``max_workers`` calls execute at once and at most ``max_queue`` wait
+    behind them; anything beyond that is rejected with ``MediatorBusyError``
+    instead of piling up unbounded work.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_queue: Optional[int] = None):
+        self.max_workers = max_workers or _env_int(SERVER_WORKERS_ENV, DEFAULT_SERVER_WORKERS)
+        self.max_queue = max_queue if max_queue is not None else _env_int(SERVER_QUEUE_LIMIT_ENV, DEFAULT_SERVER_QUEUE_LIMIT)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="complaint-mediator")
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._max_pending = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self._pending - self.max_workers)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Tuple[Any, int]:
+        """Run ``fn(*args)`` on a worker and return ``(result, queue_position)``."""
+        if self._pending >= self.max_workers + self.max_queue:
+            self._rejected += 1
+            raise MediatorBusyError(self._pending - self.max_workers + 1, self.max_queue)
+        queue_position = max(0, self._pending - self.max_workers + 1)
+        self._pending += 1
+        self._max_pending = max(self._max_pending, self._pending)
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._executor, lambda: fn(*args))
+        finally:
+            self._pending -= 1
+            self._completed += 1
+        return result, queue_position
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self._pending,
+            "queue_depth": self.queue_depth,
+            "max_in_flight": self._max_pending,
+            "completed": self._completed,
+            "rejected": self._rejected,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+class _PooledMediator:
+    __slots__ = ("key", "mediator", "lock", "users")
+
+    def __init__(self, key: str, mediator: Any = None):
+        self.key = key
+        self.mediator = mediator
+        self.lock = threading.Lock()
+        self.users = 0
+
+
+class MediatorPool:
+    """Per-user mediator instances with LRU eviction.
+
+    Without a ``factory`` every user shares ``default_mediator`` and calls
+    are serialized on it, matching the single-mediator server. With a
+    factory each hashed username gets its own mediator; the least recently
+    used idle one is evicted past ``max_size`` after its state is written
+    to ``state_dir``, and reloaded from there on the user's next request.
+    Anonymous requests always use the default mediator.
+
+    An evicted entry stays in ``_persisting`` until its state is written, so
+    a user who returns in the meantime gets the same entry back (and waits on
+    its lock) instead of reloading a state file that is not written yet.
+    """
+
+    def __init__(
+        self,
+        default_mediator: Any,
+        factory: Optional[Callable[[], Any]] = None,
+        *,
+        max_size: Optional[int] = None,
+        state_dir: Optional[str] = None,
+    ):
+        self.factory = factory
+        self.max_size = max_size or _env_int(MEDIATOR_POOL_SIZE_ENV, DEFAULT_MEDIATOR_POOL_SIZE)
+        self.state_dir = Path(state_dir or DEFAULT_SESSION_STATE_DIR)
+        self._default = _PooledMediator("", default_mediator)
+        self._entries: "OrderedDict[str, _PooledMediator]" = OrderedDict()
+        self._persisting: Dict[str, _PooledMediator] = {}
+        self._lock = threading.Lock()
+        self._created = 0
+        self._evicted = 0
+        self._reloaded = 0
+        self._state_errors = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def run(self, user_key: Optional[str], fn: Callable[[Any], Any]) -> Any:
+        """Call ``fn(mediator)`` holding the user's mediator exclusively. Blocking."""
+        entry, evicted = self._checkout(str(user_key or "").strip())
+        for stale in evicted:
+            self._persist(stale)
+        try:
+            with entry.lock:
+                if entry.mediator is None:
+                    entry.mediator = self._restore(entry.key)
+                return fn(entry.mediator)
+        finally:
+            with self._lock:
+                entry.users -= 1
+
+    def flush(self) -> None:
+        """Persist every pooled mediator's state without evicting it."""
+        with self._lock:
+            entries = [*self._entries.values(), *self._persisting.values()]
+        for entry in entries:
+            with entry.lock:
+                if entry.mediator is not None:
+                    self._save_state(entry)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "persisting": len(self._persisting),
+                "created": self._created,
+                "evicted": self._evicted,
+                "reloaded": self._reloaded,
+                "state_errors": self._state_errors,
+            }
+
+    def _checkout(self, key: str) -> Tuple[_PooledMediator, List[_PooledMediator]]:
+        with self._lock:
+            if self.factory is None or not key:
+                entry = self._default
+                entry.users += 1
+                return entry, []
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._persisting.pop(key, None) or _PooledMediator(key)
+                self._entries[key] = entry
+            else:
+                self._entries.move_to_end(key)
+            entry.users += 1
+            evicted: List[_PooledMediator] = []
+            if len(self._entries) > self.max_size:
+                for candidate_key, candidate in list(self._entries.items()):
+                    if len(self._entries) <= self.max_size:
+                        break
+                    if candidate.users == 0:
+                        del self._entries[candidate_key]
+                        self._persisting[candidate_key] = candidate
+                        evicted.append(candidate)
+                self._evicted += len(evicted)
+            return entry, evicted
+
+    def _state_path(self, key: str) -> Path:
+        return self.state_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]}.json"
+
+    def _restore(self, key: str) -> Any:
+        mediator = self.factory()
+        with self._lock:
+            self._created += 1
+        path = self._state_path(key)
+        if path.is_file() and callable(getattr(mediator, "set_state", None)):
+            try:
+                mediator.set_state(json.loads(path.read_text(encoding="utf-8")))
+                with self._lock:
+                    self._reloaded += 1
+            except (OSError, ValueError, KeyError, TypeError):
+                with self._lock:
+                    self._state_errors += 1
+        return mediator
+
+    def _persist(self, entry: _PooledMediator) -> None:
+        with entry.lock:
+            with self._lock:
+                if self._persisting.get(entry.key) is not entry:
+                    # The user came back and took the entry over; keep it loaded.
+                    return
+            if entry.mediator is not None:
+                self._save_state(entry)
+                entry.mediator = None
+            with self._lock:
+                if self._persisting.get(entry.key) is entry:
+                    del self._persisting[entry.key]
+
+    def _save_state(self, entry: _PooledMediator) -> None:
+        if not callable(getattr(entry.mediator, "get_state", None)):
+            return
+        try:
+            payload = json.dumps(entry.mediator.get_state(), default=str)
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+            path = self._state_path(entry.key)
+            tmp_path = path.with_suffix(".json.tmp")
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except (OSError, ValueError, TypeError):
+            with self._lock:
+                self._state_errors += 1
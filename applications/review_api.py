@@ -107,6 +107,14 @@ def create_claim_support_review_router(mediator: Any) -> APIRouter:
     ) -> Dict[str, Any]:
         return build_claim_support_document_payload(mediator, request)
 
+    @router.get("/api/claim-support/mediator-log")
+    async def claim_support_mediator_log(
+        start: int = 0,
+        limit: int = 50,
+        resolve_payloads: bool = False,
+    ) -> Dict[str, Any]:
+        return mediator.read_log(start=start, limit=limit, resolve_payloads=resolve_payloads)
+
     if _MULTIPART_AVAILABLE:
 
         @router.post("/api/claim-support/upload-document")
@@ -1,6 +1,7 @@
 import json
 import os
-from typing import Any, Dict, Optional
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, Optional
 
 from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse, JSONResponse
@@ -8,6 +9,7 @@ from fastapi.responses import HTMLResponse, JSONResponse
 from .complaint_workspace_api import attach_complaint_workspace_routes
 from .document_api import attach_document_routes
 from .document_ui import load_document_html
+from .mediator_pool import MediatorBusyError, MediatorExecutor, MediatorPool
 from .review_api import attach_claim_support_review_routes
 from .review_ui import attach_claim_support_review_ui_routes, attach_static_asset_routes
 
@@ -21,10 +23,57 @@ def _read_template(filename: str) -> str:
 
 
 class SERVER:
-    def __init__(self, mediator: Any):
+    """Web UI and chat server around one mediator.
+
+    Chat turns (``/api/chat`` and its websocket) run on ``executor`` through
+    ``mediators``, so with a ``mediator_factory`` each hashed username chats
+    with its own mediator. Only chat is per-user: the claim-support review and
+    document routes are keyed by the ``user_id`` in their request bodies, not
+    by the chat session, and always use the shared ``mediator``.
+    """
+
+    def __init__(
+        self,
+        mediator: Any,
+        *,
+        mediator_factory: Optional[Callable[[], Any]] = None,
+        max_workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        mediator_pool_size: Optional[int] = None,
+        session_state_dir: Optional[str] = None,
+    ):
         self.mediator = mediator
+        self.executor = MediatorExecutor(max_workers=max_workers, max_queue=max_queue)
+        self.mediators = MediatorPool(
+            mediator,
+            mediator_factory,
+            max_size=mediator_pool_size,
+            state_dir=session_state_dir,
+        )
         self.app = self._build_app(mediator)
 
+    @staticmethod
+    def _busy_response(exc: MediatorBusyError) -> JSONResponse:
+        return JSONResponse(
+            {
+                "detail": "server is busy, retry shortly",
+                "queue_position": exc.queue_position,
+                "queue_limit": exc.queue_limit,
+            },
+            status_code=429,
+            headers={"Retry-After": "1"},
+        )
+
+    def shutdown(self) -> None:
+        """Finish in-flight mediator calls, then write every pooled user's state."""
+        self.executor.shutdown()
+        self.mediators.flush()
+
+    async def run_for_user(self, hashed_username: Optional[str], fn: Callable[[Any], Any]) -> Any:
+        """Run ``fn(mediator)`` for a user on the worker pool, off the event loop."""
+        result, _ = await self.executor.run(self.mediators.run, hashed_username, fn)
+        return result
+
     @staticmethod
     def build_chat_payload(
         message: str,
@@ -95,9 +144,15 @@ class SERVER:
         )
 
     def _build_app(self, mediator: Any) -> FastAPI:
-        app = FastAPI()
+        @asynccontextmanager
+        async def lifespan(_app: FastAPI):
+            yield
+            self.shutdown()
+
+        app = FastAPI(lifespan=lifespan)
         attach_static_asset_routes(app)
         attach_complaint_workspace_routes(app)
+        # Review and document routes are not per-user; see the class docstring.
         attach_claim_support_review_routes(app, mediator)
         attach_claim_support_review_ui_routes(app)
         attach_document_routes(app, mediator)
@@ -106,6 +161,10 @@ class SERVER:
         async def health() -> Dict[str, str]:
             return {"status": "healthy"}
 
+        @app.get("/api/chat/queue")
+        async def chat_queue() -> Dict[str, Any]:
+            return {"executor": self.executor.stats(), "mediators": self.mediators.stats()}
+
         @app.get("/", response_class=HTMLResponse)
         @app.get("", response_class=HTMLResponse)
         async def index() -> str:
@@ -177,22 +236,31 @@ class SERVER:
                 payload.get("hashed_username") or request.cookies.get("hashed_username") or ""
             ).strip()
             hashed_password = str(request.cookies.get("hashed_password") or "").strip()
-            if hashed_username and hashed_password and hasattr(mediator, "state"):
-                profile_request = {
-                    "results": {
-                        "hashed_username": hashed_username,
-                        "hashed_password": hashed_password,
+
+            def chat_turn(user_mediator: Any) -> Dict[str, Any]:
+                if hashed_username and hashed_password and hasattr(user_mediator, "state"):
+                    profile_request = {
+                        "results": {
+                            "hashed_username": hashed_username,
+                            "hashed_password": hashed_password,
+                        }
                     }
-                }
-                if callable(getattr(mediator.state, "load_profile", None)):
-                    mediator.state.load_profile(profile_request)
+                    if callable(getattr(user_mediator.state, "load_profile", None)):
+                        user_mediator.state.load_profile(profile_request)
 
-            response_payload = self.process_chat_message(
-                mediator,
-                message_text,
-                hashed_username=hashed_username or None,
-            )
-            return JSONResponse(response_payload)
+                return self.process_chat_message(
+                    user_mediator,
+                    message_text,
+                    hashed_username=hashed_username or None,
+                )
+
+            try:
+                response_payload, queue_position = await self.executor.run(
+                    self.mediators.run, hashed_username, chat_turn
+                )
+            except MediatorBusyError as exc:
+                return self._busy_response(exc)
+            return JSONResponse(response_payload, headers={"X-Queue-Position": str(queue_position)})
 
         @app.post("/api/chat/fallback")
         async def chat_fallback(request: Request) -> JSONResponse:
@@ -204,29 +272,52 @@ class SERVER:
             hashed_username = str(websocket.cookies.get("hashed_username") or "").strip()
             hashed_password = str(websocket.cookies.get("hashed_password") or "").strip()
 
-            initial_payload = self._build_initial_chat_payload(
-                mediator,
-                hashed_username=hashed_username or None,
-            )
-            await websocket.send_json(initial_payload)
+            profile_request = {
+                "results": {
+                    "hashed_username": hashed_username,
+                    "hashed_password": hashed_password,
+                }
+            }
+
+            def record_user_message(user_mediator: Any, user_payload: Dict[str, Any]) -> None:
+                if hashed_username and hashed_password and hasattr(user_mediator, "state"):
+                    if callable(getattr(user_mediator.state, "load_profile", None)):
+                        user_mediator.state.load_profile(profile_request)
+                if hasattr(user_mediator, "state") and callable(getattr(user_mediator.state, "message", None)):
+                    user_mediator.state.message(user_payload)
+
+            def reply(user_mediator: Any, message_text: str) -> Dict[str, Any]:
+                bot_payload = self.process_chat_message(
+                    user_mediator,
+                    message_text,
+                    hashed_username=hashed_username or None,
+                )
+                if hasattr(user_mediator, "state") and callable(getattr(user_mediator.state, "message", None)):
+                    user_mediator.state.message(bot_payload)
+                if hashed_username and hashed_password and hasattr(user_mediator, "state"):
+                    if callable(getattr(user_mediator.state, "store_profile", None)):
+                        user_mediator.state.store_profile(profile_request)
+                return bot_payload
 
             try:
+                try:
+                    initial_payload = await self.run_for_user(
+                        hashed_username,
+                        lambda user_mediator: self._build_initial_chat_payload(
+                            user_mediator,
+                            hashed_username=hashed_username or None,
+                        ),
+                    )
+                except MediatorBusyError:
+                    initial_payload = self._build_initial_chat_payload(None, hashed_username=hashed_username or None)
+                await websocket.send_json(initial_payload)
+
                 while True:
                     data = await websocket.receive_json()
                     message_text = str(data.get("message") or data.get("content") or "").strip()
                     if not message_text:
                         continue
 
-                    profile_request = {
-                        "results": {
-                            "hashed_username": hashed_username,
-                            "hashed_password": hashed_password,
-                        }
-                    }
-                    if hashed_username and hashed_password and hasattr(mediator, "state"):
-                        if callable(getattr(mediator.state, "load_profile", None)):
-                            mediator.state.load_profile(profile_request)
-
                     user_payload = self.build_chat_payload(
                         message_text,
                         {
@@ -237,23 +328,30 @@ class SERVER:
                         sender=hashed_username or "User:",
                         hashed_username=hashed_username or None,
                     )
-                    if hasattr(mediator, "state") and callable(getattr(mediator.state, "message", None)):
-                        mediator.state.message(user_payload)
-                    await websocket.send_json(user_payload)
-
-                    bot_payload = self.process_chat_message(
-                        mediator,
-                        message_text,
-                        hashed_username=hashed_username or None,
-                    )
-                    if hasattr(mediator, "state") and callable(getattr(mediator.state, "message", None)):
-                        mediator.state.message(bot_payload)
+                    try:
+                        await self.run_for_user(
+                            hashed_username,
+                            lambda user_mediator: record_user_message(user_mediator, user_payload),
+                        )
+                        await websocket.send_json(user_payload)
+                        bot_payload = await self.run_for_user(
+                            hashed_username,
+                            lambda user_mediator: reply(user_mediator, message_text),
+                        )
+                    except MediatorBusyError as exc:
+                        await websocket.send_json(
+                            {
+                                **self.build_chat_payload(
+                                    "The server is busy. Please resend your message in a moment.",
+                                    sender="Bot:",
+                                    hashed_username=hashed_username or None,
+                                ),
+                                "queue_position": exc.queue_position,
+                            }
+                        )
+                        continue
                     await websocket.send_json(bot_payload)
 
-                    if hashed_username and hashed_password and hasattr(mediator, "state"):
-                        if callable(getattr(mediator.state, "store_profile", None)):
-                            mediator.state.store_profile(profile_request)
-
             except WebSocketDisconnect:
                 return
 
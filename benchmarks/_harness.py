@@ -0,0 +1,66 @@
+"""Shared helpers for the before/after benchmarks in this directory.
+
+Each ``bench_*.py`` module times an optimized code path next to the
+implementation it replaced. Result equivalence and deterministic counters
+(rows retained, entities re-profiled, collections per turn) are asserted;
+wall-clock timings are only printed, because timing ratios are not stable on
+a loaded CI runner.
+
+A benchmark module marks its tests with ``pytestmark = BENCHMARK_MARKS``,
+builds its rows in ``run_benchmark()`` and prints them with ``report``.
+"""
+
+import time
+from typing import Any, Callable, Mapping, Tuple, TypeVar
+
+import pytest
+
+
+T = TypeVar("T")
+
+BENCHMARK_MARKS = [pytest.mark.benchmark, pytest.mark.performance]
+
+
+def timed(func: Callable[[], T]) -> Tuple[T, float]:
+    """Call ``func`` once and return its result and the elapsed milliseconds."""
+    start = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def speedup(before: float, after: float) -> float:
+    """Return how many times shorter duration ``after`` is than ``before``."""
+    return before / max(after, 1e-9)
+
+
+def assert_same(expected: Any, actual: Any, what: str) -> None:
+    """Fail when the optimized path returns something the legacy path did not.
+
+    Raises explicitly rather than using ``assert`` so the check also runs
+    under ``python -O``.
+    """
+    if expected != actual:
+        raise AssertionError(f"{what} diverged from the implementation it replaced")
+
+
+def report(title: str, result: Mapping[Any, Any]) -> None:
+    """Print ``result`` under ``title``, one line per row.
+
+    ``result`` is either a single row of metrics or a mapping of labelled
+    rows (for example ``{"legacy": {...}, "indexed": {...}}``).
+    """
+    print(title)
+    if result and all(isinstance(row, Mapping) for row in result.values()):
+        rows = list(result.items())
+    else:
+        rows = [(None, result)]
+    width = max((len(str(label)) for label, _ in rows if label is not None), default=0)
+    for label, row in rows:
+        cells = " ".join(f"{key}={_format(value)}" for key, value in row.items())
+        print(f"  {str(label):>{width}}: {cells}" if label is not None else f"  {cells}")
+
+
+def _format(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
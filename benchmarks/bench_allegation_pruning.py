@@ -0,0 +1,148 @@
+"""Micro-benchmark for near-duplicate allegation pruning in formal_document.
+
+Runs ``_prune_near_duplicate_allegations`` over 500-allegation drafts and
+compares it with the pairwise implementation it replaced, which re-ran the
+token, category and feature regexes for every kept allegation on every
+candidate.
+
+Usage:
+    pytest benchmarks/bench_allegation_pruning.py -v -s
+    PYTHONPATH=. python benchmarks/bench_allegation_pruning.py
+"""
+
+import random
+import re
+from typing import Dict, List
+
+from benchmarks._harness import BENCHMARK_MARKS, assert_same, report, speedup, timed
+from mediator.formal_document import _prune_near_duplicate_allegations
+
+
+pytestmark = BENCHMARK_MARKS
+
+
+ALLEGATION_COUNT = 500
+
+_SUBJECTS = ["Plaintiff", "The employee", "Plaintiff's supervisor", "Human resources", "Regional management"]
+_ACTIONS = [
+    "reported unpaid overtime to human resources",
+    "requested a schedule flexibility accommodation for medical restrictions",
+    "was disciplined for treatment-related absences",
+    "lost wages and benefits after the termination",
+    "had key accounts removed after complaining",
+    "was assigned fewer shifts after the complaint",
+    "suffered lost career opportunities",
+    "was terminated two weeks after reporting discrimination",
+]
+
+
+def _draft(count: int = ALLEGATION_COUNT, seed: int = 11) -> List[str]:
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice(_SUBJECTS)} {rng.choice(_ACTIONS)} on day {index} regarding matter{rng.randrange(count)} "
+        f"and record{rng.randrange(count)}."
+        for index in range(count)
+    ]
+
+
+def _legacy_prune_near_duplicate_allegations(allegations: List[str]) -> List[str]:
+    def _tokens(value: str) -> set[str]:
+        scrubbed = re.sub(r"\(see exhibit [^)]+\)", "", value, flags=re.IGNORECASE)
+        return {
+            token
+            for token in re.split(r"\W+", scrubbed.lower())
+            if len(token) >= 4 and token not in {"plaintiff", "defendant", "exhibit", "after", "those", "this", "that"}
+        }
+
+    def _categories(value: str) -> set[str]:
+        lowered = value.lower()
+        flags = set()
+        if re.search(r"\b(reported|complained|opposed|informed|notified|told|requested)\b", lowered):
+            flags.add("report")
+        if re.search(r"\b(terminated|fired|demoted|suspended|disciplined|retaliated|denied|removed|stripped)\b", lowered) or re.search(r"\b(end(?:ed|ing))\b[^.]{0,40}\bemployment\b", lowered):
+            flags.add("adverse")
+        if re.search(r"\b(lost|suffered|experienced|benefits|wages|salary|income|opportunities)\b", lowered):
+            flags.add("harm")
+        return flags
+
+    def _features(value: str) -> set[str]:
+        lowered = value.lower()
+        flags = set()
+        if re.search(r"\b(reported|complained|opposed|informed|notified|told|requested)\b", lowered):
+            flags.add("report")
+        if re.search(r"\b(human resources|hr)\b", lowered):
+            flags.add("hr")
+        if re.search(r"\bregional management|management\b", lowered):
+            flags.add("management")
+        if re.search(r"\b(key|major)\s+accounts?\b|\b(accounts?)\b[^.]{0,20}\b(removed|stripped|taken away)\b|\b(removed|stripped|took away)\b[^.]{0,20}\baccounts?\b", lowered):
+            flags.add("accounts")
+        if re.search(r"\bovertime\b", lowered):
+            flags.add("overtime")
+        if re.search(r"\bshift(s)?\b", lowered):
+            flags.add("shifts")
+        if re.search(r"\b(absences?|attendance|treatment-related absences?)\b", lowered):
+            flags.add("absences")
+        if re.search(r"\b(disciplined|discipline|wrote me up|write-up|write up)\b", lowered):
+            flags.add("discipline")
+        if re.search(r"\b(accommodation|accommodate|light duty|schedule flexibility|medical restrictions?|doctor-imposed restrictions?)\b", lowered):
+            flags.add("accommodation")
+        if re.search(r"\b(restrictions?|light duty|schedule flexibility)\b", lowered):
+            flags.add("restrictions")
+        if re.search(r"\b(terminated|fired)\b", lowered) or re.search(r"\b(end(?:ed|ing))\b[^.]{0,40}\bemployment\b", lowered):
+            flags.add("termination")
+        if re.search(r"\b(wages|pay|salary|income|benefits)\b", lowered):
+            flags.add("economic_harm")
+        if re.search(r"\b(career opportunities|future opportunities|opportunities)\b", lowered):
+            flags.add("opportunities")
+        return flags
+
+    kept: List[str] = []
+    for candidate in allegations:
+        candidate_tokens = _tokens(candidate)
+        candidate_categories = _categories(candidate)
+        candidate_features = _features(candidate)
+        skip = False
+        for existing in kept:
+            existing_tokens = _tokens(existing)
+            existing_categories = _categories(existing)
+            existing_features = _features(existing)
+            if not candidate_tokens or not existing_tokens:
+                continue
+            if not (candidate_categories & existing_categories):
+                continue
+            overlap = len(candidate_tokens & existing_tokens) / max(1, min(len(candidate_tokens), len(existing_tokens)))
+            shared_features = candidate_features & existing_features
+            if overlap >= 0.7:
+                skip = True
+                break
+            if "adverse" in candidate_categories and "adverse" in existing_categories and len(shared_features) >= 3:
+                skip = True
+                break
+            if "report" in candidate_categories and "report" in existing_categories and "accommodation" in shared_features and len(shared_features) >= 2:
+                skip = True
+                break
+        if not skip:
+            kept.append(candidate)
+    return kept
+
+
+def run_benchmark() -> Dict[str, float]:
+    """Return legacy and indexed pruning times in milliseconds for one draft."""
+    draft = _draft()
+    legacy, legacy_ms = timed(lambda: _legacy_prune_near_duplicate_allegations(draft))
+    indexed, indexed_ms = timed(lambda: _prune_near_duplicate_allegations(draft))
+    assert_same(legacy, indexed, "indexed allegation pruning")
+    return {
+        "legacy_ms": legacy_ms,
+        "indexed_ms": indexed_ms,
+        "kept": len(indexed),
+        "speedup": speedup(legacy_ms, indexed_ms),
+    }
+
+
+def test_indexed_pruning_matches_pairwise_scan():
+    report(f"{ALLEGATION_COUNT} allegations", run_benchmark())
+
+
+if __name__ == "__main__":
+    report(f"{ALLEGATION_COUNT} allegations", run_benchmark())
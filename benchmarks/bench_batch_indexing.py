@@ -0,0 +1,87 @@
+"""Throughput benchmark for HybridDocumentIndexer batch indexing.
+
+Indexes a synthetic corpus one document at a time with ``index_document`` and
+again through the streaming ``index_documents`` API backed by a process pool,
+and checks that the bounded index history keeps memory flat while the
+statistics still cover every document.
+
+Usage:
+    pytest benchmarks/bench_batch_indexing.py -v -s
+    PYTHONPATH=. python benchmarks/bench_batch_indexing.py
+"""
+
+import asyncio
+import os
+import random
+from typing import Dict, List
+
+from benchmarks._harness import BENCHMARK_MARKS, assert_same, report, speedup, timed
+from complaint_analysis.indexer import HybridDocumentIndexer
+
+
+pytestmark = BENCHMARK_MARKS
+
+
+DOCUMENT_COUNT = 2_000
+HISTORY_LIMIT = 100
+
+_SENTENCES = [
+    "The tenant asked the landlord for a reasonable accommodation after the injury.",
+    "Management ignored the request and raised the rent the following month.",
+    "My supervisor said the schedule change was final and refused to discuss it.",
+    "I reported the missing overtime pay to human resources in writing.",
+    "Two weeks later I received a written warning and my hours were cut.",
+    "The housing authority never answered my letters about the section 8 voucher.",
+    "Neighbors heard the manager make comments about my religion and national origin.",
+]
+
+
+def _corpus(count: int = DOCUMENT_COUNT, seed: int = 17) -> List[str]:
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(_SENTENCES) for _ in range(rng.randrange(4, 12))) for _ in range(count)]
+
+
+async def _index_sequential(corpus: List[str]) -> HybridDocumentIndexer:
+    indexer = HybridDocumentIndexer(enable_embeddings=False)
+    for text in corpus:
+        await indexer.index_document(text)
+    return indexer
+
+
+async def _index_batched(corpus: List[str], max_workers: int) -> HybridDocumentIndexer:
+    indexer = HybridDocumentIndexer(enable_embeddings=False, history_limit=HISTORY_LIMIT)
+    async for _ in indexer.index_documents(corpus, batch_size=64, max_workers=max_workers):
+        pass
+    return indexer
+
+
+def run_benchmark() -> Dict[str, float]:
+    """Return documents per second for sequential and batched indexing."""
+    corpus = _corpus()
+    workers = max(2, min(4, os.cpu_count() or 1))
+    sequential, sequential_ms = timed(lambda: asyncio.run(_index_sequential(corpus)))
+    batched, batched_ms = timed(lambda: asyncio.run(_index_batched(corpus, workers)))
+    assert_same(
+        sequential.risk_level_distribution(),
+        batched.risk_level_distribution(),
+        "batched indexing",
+    )
+    return {
+        "workers": workers,
+        "sequential_docs_per_s": len(corpus) * 1000 / sequential_ms,
+        "batched_docs_per_s": len(corpus) * 1000 / batched_ms,
+        "speedup": speedup(sequential_ms, batched_ms),
+        "retained": len(list(batched._indexed_documents)),
+        "indexed": batched.total_indexed_documents(),
+    }
+
+
+def test_batched_indexing_keeps_history_bounded():
+    result = run_benchmark()
+    report(f"{DOCUMENT_COUNT} documents", result)
+    assert result["retained"] == HISTORY_LIMIT
+    assert result["indexed"] == DOCUMENT_COUNT
+
+
+if __name__ == "__main__":
+    report(f"{DOCUMENT_COUNT} documents", run_benchmark())
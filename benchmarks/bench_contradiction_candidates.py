@@ -0,0 +1,89 @@
+"""Benchmark for claim-support contradiction candidate detection.
+
+Compares ``ClaimSupportHook._find_contradiction_pairs`` against the
+pairwise scan it replaced for elements backed by 1k and 5k support facts.
+
+Usage:
+    pytest benchmarks/bench_contradiction_candidates.py -v -s
+    PYTHONPATH=. python benchmarks/bench_contradiction_candidates.py
+"""
+
+import random
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("duckdb")
+
+from benchmarks._harness import BENCHMARK_MARKS, assert_same, report, speedup, timed
+from mediator.claim_support_hooks import ClaimSupportHook
+
+
+pytestmark = BENCHMARK_MARKS
+
+
+FACT_COUNTS = (1_000, 5_000)
+# The pairwise scan is O(n^2) with tokenization per pair; time a slice of
+# left-hand facts and extrapolate to the full triangle.
+SCAN_SAMPLE = 50
+
+_VOCABULARY = [f"term{index}" for index in range(2_000)]
+
+
+def _facts(count: int, seed: int = 7) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    facts = []
+    for index in range(count):
+        words = rng.sample(_VOCABULARY, 12)
+        verb = "was not" if index % 4 == 0 else "was"
+        facts.append({"fact_id": f"fact-{index}", "text": f"{' '.join(words[:6])} {verb} {' '.join(words[6:])}"})
+    return facts
+
+
+def _scan_pairs(hook: ClaimSupportHook, facts: List[Dict[str, Any]], limit: int) -> List[Tuple[int, int]]:
+    found = []
+    for index, left in enumerate(facts[:limit]):
+        for offset, right in enumerate(facts[index + 1:], start=index + 1):
+            if hook._fact_polarity(left["text"]) == hook._fact_polarity(right["text"]):
+                continue
+            if len(hook._fact_overlap_terms(left["text"], right["text"])) >= 2:
+                found.append((index, offset))
+    return found
+
+
+def run_benchmark() -> Dict[int, Dict[str, float]]:
+    """Return scan and indexed timings in milliseconds per fact count."""
+    results: Dict[int, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        hook = ClaimSupportHook(Mock(), db_path=str(Path(tmp) / "bench.duckdb"))
+        for count in FACT_COUNTS:
+            facts = _facts(count)
+            scanned, sample_ms = timed(lambda: _scan_pairs(hook, facts, SCAN_SAMPLE))
+            total_pairs = count * (count - 1) / 2
+            sampled_pairs = sum(count - 1 - index for index in range(SCAN_SAMPLE))
+            scan_ms = sample_ms * total_pairs / sampled_pairs
+
+            pairs, indexed_ms = timed(lambda: hook._find_contradiction_pairs(facts))
+            assert_same(
+                scanned,
+                [(left, right) for left, right, _ in pairs if left < SCAN_SAMPLE],
+                "indexed contradiction candidates",
+            )
+            results[count] = {
+                "scan_ms": scan_ms,
+                "indexed_ms": indexed_ms,
+                "pairs": len(pairs),
+                "speedup": speedup(scan_ms, indexed_ms),
+            }
+    return results
+
+
+def test_indexed_contradiction_pairs_match_pairwise_scan():
+    report("facts per element (scan extrapolated)", run_benchmark())
+
+
+if __name__ == "__main__":
+    report("facts per element (scan extrapolated)", run_benchmark())
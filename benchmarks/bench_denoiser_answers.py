@@ -0,0 +1,128 @@
+"""Scaling benchmark for ComplaintDenoiser.process_answer on a long intake.
+
+Feeds 1,000 synthetic answers, each naming new people, organizations and
+dates, into one knowledge graph. The legacy denoiser restores the helpers it
+replaced, which regex-scanned every id to allocate the next one and walked all
+entities and relationships to find an existing match; the indexed denoiser
+uses the graph's id counters and lookup indexes.
+
+Usage:
+    pytest benchmarks/bench_denoiser_answers.py -v -s
+    PYTHONPATH=. python benchmarks/bench_denoiser_answers.py
+"""
+
+import re
+import statistics
+from typing import Dict, List
+
+from benchmarks._harness import BENCHMARK_MARKS, assert_same, report, timed
+from complaint_phases import (
+    ComplaintDenoiser,
+    DependencyGraphBuilder,
+    KnowledgeGraphBuilder,
+    Relationship,
+)
+
+
+ANSWERS = 1_000
+WINDOW = 100
+
+_COMPLAINT = (
+    "My employer fired me on January 20, 2026 after I complained about "
+    "discrimination to human resources. I have emails and a termination letter."
+)
+_QUESTION_TYPES = ["timeline", "responsible_party", "impact", "evidence", "clarification"]
+
+pytestmark = BENCHMARK_MARKS
+
+
+class _LegacyDenoiser(ComplaintDenoiser):
+    def _find_entity(self, knowledge_graph, etype, name):
+        etype_norm = (etype or "").strip().lower()
+        name_norm = (name or "").strip().lower()
+        if not etype_norm or not name_norm:
+            return None
+        for entity in knowledge_graph.entities.values():
+            if entity.type.lower() == etype_norm and entity.name.strip().lower() == name_norm:
+                return entity
+        return None
+
+    def _next_entity_id(self, knowledge_graph):
+        max_id = 0
+        for entity_id in knowledge_graph.entities.keys():
+            match = re.match(r"entity_(\d+)$", str(entity_id))
+            if match:
+                max_id = max(max_id, int(match.group(1)))
+        return f"entity_{max_id + 1}"
+
+    def _next_relationship_id(self, knowledge_graph):
+        max_id = 0
+        for rel_id in knowledge_graph.relationships.keys():
+            match = re.match(r"rel_(\d+)$", str(rel_id))
+            if match:
+                max_id = max(max_id, int(match.group(1)))
+        return f"rel_{max_id + 1}"
+
+    def _add_relationship_if_missing(self, knowledge_graph, source_id, target_id, relation_type, confidence):
+        if not (source_id and target_id and relation_type):
+            return None, False
+        for rel in knowledge_graph.relationships.values():
+            if rel.source_id == source_id and rel.target_id == target_id and rel.relation_type == relation_type:
+                return rel, False
+        relationship = Relationship(
+            id=self._next_relationship_id(knowledge_graph),
+            source_id=source_id,
+            target_id=target_id,
+            relation_type=relation_type,
+            attributes={},
+            confidence=confidence,
+            source='complaint'
+        )
+        knowledge_graph.add_relationship(relationship)
+        return relationship, True
+
+
+def _answer(index: int) -> str:
+    return (
+        f"On March {index % 28 + 1}, {2000 + index % 25} my manager Alex Person{index} "
+        f"at Org{index} Inc sent me letter {index} and I lost ${index} in wages."
+    )
+
+
+def _run(denoiser: ComplaintDenoiser) -> Dict[str, object]:
+    graph = KnowledgeGraphBuilder().build_from_text(_COMPLAINT)
+    dependency_graph = DependencyGraphBuilder().build_from_claims(
+        [{"name": "Retaliation", "type": "retaliation"}], {}
+    )
+    latencies: List[float] = []
+    for index in range(ANSWERS):
+        question = {
+            "type": _QUESTION_TYPES[index % len(_QUESTION_TYPES)],
+            "question": f"Question {index}?",
+            "context": {},
+        }
+        _, answer_ms = timed(lambda: denoiser.process_answer(question, _answer(index), graph, dependency_graph))
+        latencies.append(answer_ms)
+    return {
+        f"first{WINDOW}_ms": statistics.fmean(latencies[:WINDOW]),
+        f"last{WINDOW}_ms": statistics.fmean(latencies[-WINDOW:]),
+        "total_ms": sum(latencies),
+        "entities": len(graph.entities),
+        "graph": graph.to_dict()["entities"],
+    }
+
+
+def run_benchmark() -> Dict[str, Dict[str, float]]:
+    """Return first/last window latency and totals for legacy and indexed denoisers."""
+    legacy = _run(_LegacyDenoiser())
+    indexed = _run(ComplaintDenoiser())
+    assert_same(legacy.pop("graph"), indexed.pop("graph"), "indexed denoiser knowledge graph")
+    return {"legacy": legacy, "indexed": indexed}
+
+
+def test_indexed_denoiser_builds_the_same_graph():
+    report(f"{ANSWERS} answers", run_benchmark())
+
+
+if __name__ == "__main__":
+    report(f"{ANSWERS} answers", run_benchmark())
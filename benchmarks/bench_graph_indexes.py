@@ -0,0 +1,139 @@
+"""Benchmark for KnowledgeGraph/DependencyGraph adjacency indexes.
+
+Builds graphs with 10k+ nodes and compares the indexed lookups against the
+full-scan implementations they replaced.
+
+Usage:
+    pytest benchmarks/bench_graph_indexes.py -v -s
+    PYTHONPATH=. python benchmarks/bench_graph_indexes.py
+"""
+
+from typing import Dict, List
+
+from benchmarks._harness import BENCHMARK_MARKS, assert_same, report, speedup, timed
+from complaint_phases import (
+    Dependency,
+    DependencyGraph,
+    DependencyNode,
+    DependencyType,
+    Entity,
+    KnowledgeGraph,
+    NodeType,
+    Relationship,
+)
+
+
+NODE_COUNT = 12_000
+LOOKUP_SAMPLE = 200
+
+pytestmark = BENCHMARK_MARKS
+
+
+def _build_knowledge_graph(entity_count: int = NODE_COUNT) -> KnowledgeGraph:
+    kg = KnowledgeGraph()
+    for index in range(entity_count):
+        kg.add_entity(Entity(id=f"e{index}", type="person" if index % 3 else "fact", name=f"Entity {index}"))
+    for index in range(1, entity_count):
+        kg.add_relationship(
+            Relationship(id=f"r{index}", source_id=f"e{index}", target_id=f"e{index // 2}", relation_type="related_to")
+        )
+    return kg
+
+
+def _build_dependency_graph(claim_count: int = NODE_COUNT // 10) -> DependencyGraph:
+    graph = DependencyGraph()
+    dep_index = 0
+    for claim_index in range(claim_count):
+        claim_id = f"claim_{claim_index}"
+        graph.add_node(DependencyNode(id=claim_id, node_type=NodeType.CLAIM, name=f"Claim {claim_index}"))
+        for req_index in range(9):
+            req_id = f"req_{claim_index}_{req_index}"
+            graph.add_node(
+                DependencyNode(
+                    id=req_id,
+                    node_type=NodeType.REQUIREMENT,
+                    name=f"Requirement {claim_index}.{req_index}",
+                    satisfied=req_index % 2 == 0,
+                )
+            )
+            dep_index += 1
+            graph.add_dependency(
+                Dependency(
+                    id=f"dep_{dep_index}",
+                    source_id=req_id,
+                    target_id=claim_id,
+                    dependency_type=DependencyType.REQUIRES,
+                )
+            )
+    return graph
+
+
+def _scan_relationships(kg: KnowledgeGraph, entity_id: str) -> List[Relationship]:
+    return [
+        rel for rel in kg.relationships.values()
+        if rel.source_id == entity_id or rel.target_id == entity_id
+    ]
+
+
+def _scan_unsatisfied_requirements(graph: DependencyGraph, node_ids: List[str]) -> List[str]:
+    unsatisfied = []
+    for node in (graph.nodes[node_id] for node_id in node_ids):
+        required = [
+            dep for dep in graph.dependencies.values()
+            if dep.target_id == node.id and dep.required
+        ]
+        if required and not all(graph.nodes[dep.source_id].satisfied for dep in required):
+            unsatisfied.append(node.id)
+    return unsatisfied
+
+
+def _relationship_ids(relationships: List[Relationship]) -> List[str]:
+    return sorted(rel.id for rel in relationships)
+
+
+def run_benchmark() -> Dict[str, Dict[str, float]]:
+    """Run the scan-vs-index comparison and return timings in milliseconds."""
+    kg = _build_knowledge_graph()
+    sample_ids = [f"e{index}" for index in range(0, NODE_COUNT, NODE_COUNT // LOOKUP_SAMPLE)]
+    graph = _build_dependency_graph()
+    scan_sample = list(graph.nodes)[:20]
+    sampled = set(scan_sample)
+
+    scanned, rel_scan_ms = timed(lambda: [_scan_relationships(kg, eid) for eid in sample_ids])
+    indexed, rel_indexed_ms = timed(lambda: [kg.get_relationships_for_entity(eid) for eid in sample_ids])
+    assert_same(
+        [_relationship_ids(rels) for rels in scanned],
+        [_relationship_ids(rels) for rels in indexed],
+        "indexed relationship lookup",
+    )
+
+    unsatisfied, req_scan_ms = timed(lambda: _scan_unsatisfied_requirements(graph, scan_sample))
+    checks, req_indexed_ms = timed(graph.find_unsatisfied_requirements)
+    assert_same(
+        unsatisfied,
+        [check["node_id"] for check in checks if check["node_id"] in sampled],
+        "indexed unsatisfied requirements",
+    )
+    # The scan is O(N*E); it timed a slice of nodes, so extrapolate.
+    req_scan_ms *= len(graph.nodes) / len(scan_sample)
+
+    return {
+        "relationships_for_entity": {
+            "scan_ms": rel_scan_ms,
+            "indexed_ms": rel_indexed_ms,
+            "speedup": speedup(rel_scan_ms, rel_indexed_ms),
+        },
+        "find_unsatisfied_requirements": {
+            "scan_ms": req_scan_ms,
+            "indexed_ms": req_indexed_ms,
+            "speedup": speedup(req_scan_ms, req_indexed_ms),
+        },
+    }
+
+
+def test_indexed_lookups_match_full_scans():
+    report(f"{NODE_COUNT} nodes", run_benchmark())
+
+
+if __name__ == "__main__":
+    report(f"{NODE_COUNT} nodes", run_benchmark())
@@ -0,0 +1,110 @@
+"""Per-turn benchmark for KnowledgeGraph.find_gaps on a growing graph.
+
+Grows a knowledge graph by a few entities per turn, edits one existing entity
+in place, and calls ``find_gaps`` warm (reusing the per-entity gap profiles)
+and cold (after ``rebuild_indexes`` drops them, which re-runs every text check
+the way each call did before the profiles were cached).
+
+Usage:
+    pytest benchmarks/bench_incremental_gaps.py -v -s
+    PYTHONPATH=. python benchmarks/bench_incremental_gaps.py
+"""
+
+import random
+import statistics
+from typing import Any, Dict, List
+
+from benchmarks._harness import BENCHMARK_MARKS, assert_same, report, timed
+from complaint_phases import Entity, KnowledgeGraph, Relationship
+
+
+TURNS = 200
+SEED_ENTITIES = 1_000
+ENTITIES_PER_TURN = 3
+
+_TEXTS = [
+    "My manager denied the request on March 3, 2025",
+    "I filed a grievance and asked for a hearing",
+    "They sent a termination letter after I complained",
+    "I lost wages and want reinstatement",
+    "HR never replied to my email",
+    "I was disciplined because I reported the violation",
+]
+_TYPES = ["fact", "fact", "evidence", "person", "organization", "date", "claim"]
+
+pytestmark = BENCHMARK_MARKS
+
+
+def _add_entity(graph: KnowledgeGraph, rng: random.Random, index: int) -> None:
+    entity_type = rng.choice(_TYPES)
+    graph.add_entity(Entity(
+        id=f"entity_{index}",
+        type=entity_type,
+        name=rng.choice(_TEXTS) if entity_type != "person" else f"Staff Member {index}",
+        attributes={
+            "fact_type": rng.choice(["timeline", "impact", "remedy"]),
+            "claim_type": rng.choice(["retaliation", "discrimination"]),
+        },
+        confidence=rng.choice([0.5, 0.8, 0.95]),
+    ))
+    if index and rng.random() < 0.5:
+        graph.add_relationship(Relationship(
+            id=f"rel_{index}",
+            source_id=f"entity_{index}",
+            target_id=f"entity_{rng.randrange(index)}",
+            relation_type=rng.choice(["occurred_on", "supported_by", "related_to"]),
+        ))
+
+
+def _cold_find_gaps(graph: KnowledgeGraph) -> List[Dict[str, Any]]:
+    graph.rebuild_indexes()
+    return graph.find_gaps()
+
+
+def _run(cold: bool) -> Dict[str, Any]:
+    rng = random.Random(11)
+    graph = KnowledgeGraph()
+    for index in range(SEED_ENTITIES):
+        _add_entity(graph, rng, index)
+    graph.find_gaps()
+    latencies: List[float] = []
+    recomputed: List[int] = []
+    gaps: List[Any] = []
+    next_index = SEED_ENTITIES
+    for _ in range(TURNS):
+        for _ in range(ENTITIES_PER_TURN):
+            _add_entity(graph, rng, next_index)
+            next_index += 1
+        edited = graph.entities[f"entity_{rng.randrange(next_index)}"]
+        edited.attributes["description"] = rng.choice(_TEXTS)
+        turn_gaps, turn_ms = timed(lambda: _cold_find_gaps(graph) if cold else graph.find_gaps())
+        latencies.append(turn_ms)
+        gaps.append(turn_gaps)
+        recomputed.append(graph.gap_cache_stats()["last_gaps_recomputed_entities"])
+    return {
+        "mean_ms": statistics.fmean(latencies),
+        "last10_ms": statistics.fmean(latencies[-10:]),
+        "recomputed_per_turn": statistics.fmean(recomputed),
+        "max_recomputed": max(recomputed),
+        "entities": len(graph.entities),
+        "gaps": gaps,
+    }
+
+
+def run_benchmark() -> Dict[str, Dict[str, float]]:
+    """Return per-turn latency and re-profiled entities for cold and warm calls."""
+    cold = _run(cold=True)
+    warm = _run(cold=False)
+    assert_same(cold.pop("gaps"), warm.pop("gaps"), "cached gap profiles")
+    return {"cold": cold, "warm": warm}
+
+
+def test_find_gaps_reprofiles_only_changed_entities():
+    result = run_benchmark()
+    report(f"{TURNS} turns", result)
+    assert result["warm"]["max_recomputed"] <= ENTITIES_PER_TURN + 1
+    assert result["cold"]["recomputed_per_turn"] > SEED_ENTITIES
+
+
+if __name__ == "__main__":
+    report(f"{TURNS} turns", run_benchmark())
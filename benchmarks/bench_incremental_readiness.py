@@ -0,0 +1,110 @@
+"""Benchmark for incremental DependencyGraph readiness.
+
+Simulates mediator turns that flip one requirement to satisfied and then ask
+for claim readiness and unsatisfied requirements. Per-turn recompute counts
+should stay flat as the graph grows, while a cold graph pays for every claim.
+
+Usage:
+    pytest benchmarks/bench_incremental_readiness.py -v -s
+    PYTHONPATH=. python benchmarks/bench_incremental_readiness.py
+"""
+
+from typing import Any, Dict, List
+
+from benchmarks._harness import BENCHMARK_MARKS, assert_same, report, timed
+from complaint_phases import (
+    Dependency,
+    DependencyGraph,
+    DependencyNode,
+    DependencyType,
+    NodeType,
+)
+
+
+CLAIM_COUNTS = (50, 200, 800)
+REQUIREMENTS_PER_CLAIM = 8
+TURNS = 20
+
+pytestmark = BENCHMARK_MARKS
+
+
+def _build_graph(claim_count: int) -> DependencyGraph:
+    graph = DependencyGraph()
+    for claim_index in range(claim_count):
+        claim_id = f"claim_{claim_index}"
+        graph.add_node(
+            DependencyNode(
+                id=claim_id,
+                node_type=NodeType.CLAIM,
+                name=f"Claim {claim_index}",
+                attributes={"claim_type": "retaliation"},
+            )
+        )
+        for req_index in range(REQUIREMENTS_PER_CLAIM):
+            req_id = f"req_{claim_index}_{req_index}"
+            graph.add_node(
+                DependencyNode(
+                    id=req_id,
+                    node_type=NodeType.REQUIREMENT,
+                    name=f"Requirement {claim_index}.{req_index}",
+                    attributes={"requirement_key": f"element_{req_index}"},
+                )
+            )
+            graph.add_dependency(
+                Dependency(
+                    id=f"dep_{claim_index}_{req_index}",
+                    source_id=req_id,
+                    target_id=claim_id,
+                    dependency_type=DependencyType.REQUIRES,
+                )
+            )
+    return graph
+
+
+def _readiness(graph: DependencyGraph) -> Dict[str, Any]:
+    # Only the per-claim parts are compared; the summary also tracks gap
+    # trends across calls, which a freshly loaded graph has not seen.
+    readiness = graph.get_claim_readiness()
+    return {
+        "ready": readiness["ready_claim_details"],
+        "incomplete": readiness["incomplete_claim_details"],
+        "unsatisfied": graph.find_unsatisfied_requirements(),
+    }
+
+
+def run_benchmark() -> Dict[int, Dict[str, float]]:
+    """Return per-size timings for cold and incremental readiness turns."""
+    rows: Dict[int, Dict[str, float]] = {}
+    for claim_count in CLAIM_COUNTS:
+        graph = _build_graph(claim_count)
+        _, cold_ms = timed(lambda: _readiness(graph))
+
+        recomputed: List[int] = []
+        turn_ms: List[float] = []
+        for turn in range(TURNS):
+            graph.nodes[f"req_{turn % claim_count}_{turn % REQUIREMENTS_PER_CLAIM}"].satisfied = True
+            result, elapsed_ms = timed(lambda: _readiness(graph))
+            turn_ms.append(elapsed_ms)
+            recomputed.append(graph.readiness_cache_stats()["last_readiness_recomputed_claims"])
+        assert_same(
+            _readiness(DependencyGraph.from_dict(graph.to_dict())),
+            result,
+            "incremental claim readiness",
+        )
+        rows[claim_count] = {
+            "nodes": len(graph.nodes),
+            "cold_ms": cold_ms,
+            "incremental_turn_ms": sum(turn_ms) / TURNS,
+            "max_recomputed_claims_per_turn": max(recomputed),
+        }
+    return rows
+
+
+def test_incremental_turn_recomputes_one_claim():
+    rows = run_benchmark()
+    report("claims per graph", rows)
+    assert all(row["max_recomputed_claims_per_turn"] == 1 for row in rows.values())
+
+
+if __name__ == "__main__":
+    report("claims per graph", run_benchmark())
@@ -0,0 +1,117 @@
+"""Throughput benchmark for keyword scoring over an evidence corpus.
+
+Scores a 10k-document corpus with ``ComplaintRiskScorer`` and
+``DEIRiskScorer`` and compares the keyword counting against the loop it
+replaced, which ran ``keyword.lower() in text.lower()`` for every keyword of
+every category and rebuilt each keyword list from the registry per call.
+
+Usage:
+    pytest benchmarks/bench_keyword_scoring.py -v -s
+    PYTHONPATH=. python benchmarks/bench_keyword_scoring.py
+"""
+
+import random
+from typing import Dict, List
+
+from benchmarks._harness import BENCHMARK_MARKS, assert_same, report, speedup, timed
+from complaint_analysis.dei_risk_scoring import DEIRiskScorer
+from complaint_analysis.keywords import _global_registry
+from complaint_analysis.risk_scoring import ComplaintRiskScorer
+
+
+DOCUMENT_COUNT = 10_000
+WORDS_PER_DOCUMENT = 150
+
+pytestmark = BENCHMARK_MARKS
+
+_FILLER = (
+    "the tenant wrote to the office on monday about the repair request and the "
+    "manager replied that the policy required a written notice before any change"
+).split()
+
+
+def _corpus(count: int = DOCUMENT_COUNT, seed: int = 13) -> List[str]:
+    rng = random.Random(seed)
+    vocabulary = sorted({
+        keyword
+        for types in _global_registry._registry.values()
+        for keywords in types.values()
+        for keyword in keywords
+    })
+    documents = []
+    for _ in range(count):
+        words = [rng.choice(_FILLER) for _ in range(WORDS_PER_DOCUMENT)]
+        for _ in range(rng.randrange(8)):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(vocabulary))
+        documents.append(" ".join(words))
+    return documents
+
+
+def _legacy_keywords(category: str, complaint_type=None) -> List[str]:
+    types = _global_registry._registry.get(category, {})
+    keywords = set(types.get(None, ()))
+    if complaint_type:
+        keywords.update(types.get(complaint_type, ()))
+    return sorted(list(keywords))
+
+
+def _legacy_count(text: str, keywords: List[str]) -> int:
+    text_lower = text.lower()
+    return sum(1 for keyword in keywords if keyword.lower() in text_lower)
+
+
+def _legacy_extract(text: str, keywords: List[str]) -> List[str]:
+    text_lower = text.lower()
+    return list({keyword for keyword in keywords if keyword.lower() in text_lower})
+
+
+def _legacy_counts(text: str, dei_scopes: List[List[str]]) -> List[int]:
+    """Keyword work the two scorers did per document before the shared scan."""
+    counts = [
+        _legacy_count(text, _legacy_keywords('complaint')),
+        _legacy_count(text, _legacy_keywords('binding')),
+        _legacy_count(text, _legacy_keywords('severity_high'))
+        + _legacy_count(text, _legacy_keywords('severity_medium')),
+    ]
+    counts.extend(_legacy_count(text, keywords) for keywords in dei_scopes)
+    for keywords in dei_scopes:
+        _legacy_extract(text, keywords)
+    return counts
+
+
+def _scored_counts(risk: ComplaintRiskScorer, dei: DEIRiskScorer, text: str) -> List[int]:
+    complaint = risk.calculate_risk(text, legal_provisions=[])
+    result = dei.calculate_risk(text)
+    return [
+        complaint['complaint_keywords'],
+        complaint['binding_keywords'],
+        complaint['severity_indicators'],
+        result['dei_count'],
+        result['proxy_count'],
+        result['binding_count'],
+    ]
+
+
+def run_benchmark() -> Dict[str, float]:
+    """Return documents per second for the legacy loop and the shared scan."""
+    corpus = _corpus()
+
+    risk, dei = ComplaintRiskScorer(), DEIRiskScorer()
+    dei_scopes = [dei.dei_keywords, dei.proxy_keywords, dei.binding_keywords]
+
+    legacy, legacy_ms = timed(lambda: [_legacy_counts(text, dei_scopes) for text in corpus])
+    scored, scan_ms = timed(lambda: [_scored_counts(risk, dei, text) for text in corpus])
+    assert_same(legacy, scored, "shared keyword scan")
+    return {
+        "legacy_docs_per_s": len(corpus) * 1000 / legacy_ms,
+        "scan_docs_per_s": len(corpus) * 1000 / scan_ms,
+        "speedup": speedup(legacy_ms, scan_ms),
+    }
+
+
+def test_shared_keyword_scan_matches_per_keyword_loop():
+    report(f"{DOCUMENT_COUNT} documents", run_benchmark())
+
+
+if __name__ == "__main__":
+    report(f"{DOCUMENT_COUNT} documents", run_benchmark())
@@ -0,0 +1,129 @@
+"""Micro-benchmark for LegalPatternExtractor.analyze_text.
+
+Analyzes a long complaint narrative and compares it with the per-pattern
+implementation it replaced, which ran every registered legal term pattern as
+its own ``finditer`` pass and rescanned the text once per keyword for
+categorization and protected classes.
+
+Usage:
+    pytest benchmarks/bench_legal_pattern_extractor.py -v -s
+    PYTHONPATH=. python benchmarks/bench_legal_pattern_extractor.py
+"""
+
+import random
+from typing import Any, Dict, List
+
+from benchmarks._harness import BENCHMARK_MARKS, assert_same, report, speedup, timed
+from complaint_analysis.keywords import _global_registry, get_type_specific_keywords
+from complaint_analysis.legal_patterns import (
+    DEFAULT_KEYWORD_MATCH_THRESHOLD,
+    MIN_KEYWORDS_FOR_THRESHOLD,
+    LegalPatternExtractor,
+    _LEGACY_CATEGORY_KEYWORDS,
+    _PROTECTED_CLASS_KEYWORDS,
+)
+
+
+TEXT_WORDS = 40_000
+
+pytestmark = BENCHMARK_MARKS
+
+_SENTENCES = [
+    "The tenant asked the landlord for a reasonable accommodation after the injury.",
+    "Management ignored the request and raised the rent the following month.",
+    "My supervisor said the schedule change was final and refused to discuss it.",
+    "I reported the missing overtime pay to human resources in writing.",
+    "Two weeks later I received a written warning and my hours were cut.",
+    "The housing authority never answered my letters about the section 8 voucher.",
+    "Neighbors heard the manager make comments about my religion and national origin.",
+    "I kept copies of every email, text message and pay stub as evidence.",
+]
+
+
+def _narrative(words: int = TEXT_WORDS, seed: int = 5) -> str:
+    rng = random.Random(seed)
+    sentences: List[str] = []
+    count = 0
+    while count < words:
+        sentence = rng.choice(_SENTENCES)
+        sentences.append(sentence)
+        count += len(sentence.split())
+    return " ".join(sentences)
+
+
+def _legacy_analyze(extractor: LegalPatternExtractor, text: str, context_chars: int = 200) -> Dict[str, Any]:
+    provisions = []
+    terms_found = set()
+    for pattern in extractor.patterns:
+        for match in pattern.finditer(text):
+            start = max(0, match.start() - context_chars)
+            end = min(len(text), match.end() + context_chars)
+            term = match.group(0)
+            terms_found.add(term.lower())
+            provisions.append({
+                'term': term,
+                'context': ' '.join(text[start:end].split()),
+                'position': match.start(),
+                'pattern': pattern.pattern,
+            })
+    provisions.sort(key=lambda x: x['position'])
+
+    text_lower = text.lower()
+    categories = []
+    for complaint_type in _global_registry.get_complaint_types():
+        type_keywords = get_type_specific_keywords('complaint', complaint_type)
+        matches = sum(1 for kw in type_keywords if kw.lower() in text_lower)
+        threshold = (DEFAULT_KEYWORD_MATCH_THRESHOLD
+                     if len(type_keywords) > MIN_KEYWORDS_FOR_THRESHOLD
+                     else 1)
+        if matches >= threshold:
+            categories.append(complaint_type)
+    for category, keywords in _LEGACY_CATEGORY_KEYWORDS.items():
+        if any(keyword in text_lower for keyword in keywords) and category not in categories:
+            categories.append(category)
+
+    protected_classes = [
+        class_name
+        for class_name, keywords in _PROTECTED_CLASS_KEYWORDS.items()
+        if any(keyword in text_lower for keyword in keywords)
+    ]
+    return {
+        'provisions': provisions,
+        'terms_found': sorted(terms_found),
+        'categories': categories or ['general'],
+        'protected_classes': protected_classes,
+    }
+
+
+def run_benchmark() -> Dict[str, float]:
+    """Return legacy and precompiled analysis times in milliseconds."""
+    extractor = LegalPatternExtractor()
+    text = _narrative()
+    extractor.analyze_text("warm up the compiled matchers")
+
+    legacy, legacy_ms = timed(lambda: _legacy_analyze(extractor, text))
+    result, compiled_ms = timed(lambda: extractor.analyze_text(text))
+    assert_same(
+        legacy,
+        {
+            'provisions': result['provisions']['provisions'],
+            'terms_found': sorted(result['provisions']['terms_found']),
+            'categories': result['categories'],
+            'protected_classes': result['protected_classes'],
+        },
+        "precompiled legal pattern analysis",
+    )
+    return {
+        "legacy_ms": legacy_ms,
+        "compiled_ms": compiled_ms,
+        "provisions": len(legacy['provisions']),
+        "speedup": speedup(legacy_ms, compiled_ms),
+    }
+
+
+def test_precompiled_matcher_matches_per_pattern_scan():
+    report(f"{TEXT_WORDS} words", run_benchmark())
+
+
+if __name__ == "__main__":
+    report(f"{TEXT_WORDS} words", run_benchmark())
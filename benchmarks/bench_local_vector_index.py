@@ -0,0 +1,77 @@
+"""Benchmark for the memory-mapped LocalVectorIndex.
+
+Compares a query against the segmented index with the previous search path,
+which re-read every record, recomputed every norm and ran a full argsort.
+
+Usage:
+    pytest benchmarks/bench_local_vector_index.py -v -s
+    PYTHONPATH=. python benchmarks/bench_local_vector_index.py
+"""
+
+import json
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from benchmarks._harness import BENCHMARK_MARKS, assert_same, report, speedup, timed
+from integrations.ipfs_datasets.vector_index import LocalVectorIndex
+
+
+pytestmark = BENCHMARK_MARKS
+
+
+RECORD_COUNT = 50_000
+DIMENSION = 384
+QUERIES = 20
+TOP_K = 10
+
+
+def _legacy_search(index_dir: Path, index_name: str, query_vector, top_k: int):
+    manifest = json.loads(LocalVectorIndex.manifest_path(index_dir, index_name).read_text(encoding="utf-8"))
+    vectors = np.load(manifest["vectors_path"])
+    records = [
+        json.loads(line)
+        for line in Path(manifest["records_path"]).read_text(encoding="utf-8").splitlines()
+        if line.strip()
+    ]
+    norms = np.linalg.norm(vectors, axis=1)
+    scores = vectors @ query_vector / np.maximum(norms * max(np.linalg.norm(query_vector), 1e-12), 1e-12)
+    return [records[index]["id"] for index in np.argsort(-scores)[:top_k]]
+
+
+def _mmap_search(index_dir: Path, index_name: str, query_vector, top_k: int) -> List[str]:
+    index = LocalVectorIndex.open(index_dir, index_name)
+    try:
+        return [result["id"] for result in index.search(query_vector, top_k)]
+    finally:
+        index.close()
+
+
+def run_benchmark() -> Dict[str, float]:
+    """Return per-query latency in milliseconds for both search paths."""
+    rng = np.random.default_rng(7)
+    vectors = rng.standard_normal((RECORD_COUNT, DIMENSION)).astype(np.float32)
+    documents = [{"id": f"doc-{index}", "text": f"evidence snippet {index}", "metadata": {}} for index in range(RECORD_COUNT)]
+    queries = rng.standard_normal((QUERIES, DIMENSION)).astype(np.float32)
+    with tempfile.TemporaryDirectory() as tmp:
+        index_dir = Path(tmp)
+        LocalVectorIndex.create(index_dir, "bench", documents, vectors).close()
+
+        legacy, legacy_ms = timed(lambda: [_legacy_search(index_dir, "bench", query, TOP_K) for query in queries[:3]])
+        mmap, mmap_ms = timed(lambda: [_mmap_search(index_dir, "bench", query, TOP_K) for query in queries])
+        assert_same(legacy, mmap[:3], "memory-mapped index search")
+    legacy_ms /= 3
+    mmap_ms /= QUERIES
+    return {"legacy_ms": legacy_ms, "mmap_ms": mmap_ms, "speedup": speedup(legacy_ms, mmap_ms)}
+
+
+def test_mmap_index_query_matches_full_reload():
+    report(f"{RECORD_COUNT} records, per query", run_benchmark())
+
+
+if __name__ == "__main__":
+    report(f"{RECORD_COUNT} records, per query", run_benchmark())
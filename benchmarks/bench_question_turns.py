@@ -0,0 +1,98 @@
+"""Turn-latency benchmark for question candidate collection.
+
+Replays a 200-turn synthetic intake the way ``Mediator.process_denoising_answer``
+drives the denoiser: apply the answer, collect question candidates, then
+generate the questions to ask. The legacy turn runs outside a question turn,
+so ``generate_questions`` repeats the collection; the scoped turn shares one
+candidate snapshot.
+
+Usage:
+    pytest benchmarks/bench_question_turns.py -v -s
+    PYTHONPATH=. python benchmarks/bench_question_turns.py
+"""
+
+import contextlib
+import statistics
+from typing import Any, Dict, List
+
+from benchmarks._harness import BENCHMARK_MARKS, assert_same, report, timed
+from complaint_phases import (
+    ComplaintDenoiser,
+    DependencyGraphBuilder,
+    KnowledgeGraphBuilder,
+)
+
+
+TURNS = 200
+
+pytestmark = BENCHMARK_MARKS
+
+_COMPLAINT = (
+    "My employer fired me on January 20, 2026 after I complained about "
+    "discrimination to human resources. My supervisor said I was a "
+    "troublemaker. I have emails and a termination letter, and I lost wages."
+)
+
+_CLAIMS = [
+    {"name": "Retaliation", "type": "retaliation"},
+    {"name": "Employment discrimination", "type": "employment_discrimination"},
+]
+
+_ANSWERS = [
+    "It happened on February 3, 2026 and my manager Sam Lee made the decision.",
+    "I have an email from HR dated March 1, 2026 confirming my complaint.",
+    "I lost $4,000 in wages and I want reinstatement.",
+    "The director Jane Roe told me the complaint was the reason.",
+    "I reported it in writing on January 10, 2026.",
+    "I don't remember the exact date.",
+]
+
+
+def _turn(denoiser: ComplaintDenoiser, kg, dg, question: Dict[str, Any], answer: str, scoped: bool):
+    with denoiser.question_turn() if scoped else contextlib.nullcontext():
+        denoiser.process_answer(question, answer, kg, dg)
+        denoiser.collect_question_candidates(kg, dg, max_questions=5)
+        return denoiser.generate_questions(kg, dg, max_questions=5)
+
+
+def _run_intake(scoped: bool) -> Dict[str, Any]:
+    denoiser = ComplaintDenoiser()
+    kg = KnowledgeGraphBuilder().build_from_text(_COMPLAINT)
+    dg = DependencyGraphBuilder().build_from_claims(_CLAIMS, {})
+    questions = denoiser.generate_questions(kg, dg, max_questions=5)
+    latencies: List[float] = []
+    asked: List[Any] = []
+    before = denoiser.get_candidate_snapshot_stats()['collections']
+    for turn in range(TURNS):
+        question = questions[turn % len(questions)] if questions else {'type': 'clarification', 'question': '', 'context': {}}
+        questions, turn_ms = timed(
+            lambda: _turn(denoiser, kg, dg, question, _ANSWERS[turn % len(_ANSWERS)], scoped)
+        )
+        latencies.append(turn_ms)
+        asked.append(questions)
+    collections = denoiser.get_candidate_snapshot_stats()['collections'] - before
+    return {
+        "mean_ms": statistics.fmean(latencies),
+        "p95_ms": sorted(latencies)[int(len(latencies) * 0.95) - 1],
+        "collections_per_turn": collections / TURNS,
+        "questions": asked,
+    }
+
+
+def run_benchmark() -> Dict[str, Dict[str, float]]:
+    """Return turn latency and collections per turn for both turn shapes."""
+    legacy = _run_intake(scoped=False)
+    scoped = _run_intake(scoped=True)
+    assert_same(legacy.pop("questions"), scoped.pop("questions"), "scoped question turn")
+    return {"legacy": legacy, "scoped": scoped}
+
+
+def test_question_turn_collects_candidates_once():
+    result = run_benchmark()
+    report(f"{TURNS} turns", result)
+    assert result["legacy"]["collections_per_turn"] == 2
+    assert result["scoped"]["collections_per_turn"] == 1
+
+
+if __name__ == "__main__":
+    report(f"{TURNS} turns", run_benchmark())
@@ -36,9 +36,12 @@ from .legal_patterns import (
 )
 from .keywords import (
     KeywordRegistry,
+    KeywordMatcher,
+    KeywordScan,
     get_keywords,
     get_type_specific_keywords,
     register_keywords,
+    scan_keywords,
     COMPLAINT_KEYWORDS,
     EVIDENCE_KEYWORDS,
     LEGAL_AUTHORITY_KEYWORDS,
@@ -115,6 +118,8 @@ __all__ = [
     'LegalPatternExtractor',
     'ComplaintLegalPatternExtractor',  # Backward compatibility alias
     'KeywordRegistry',
+    'KeywordMatcher',
+    'KeywordScan',
     'ComplaintRiskScorer',
     'DEIRiskScorer',  # DEI-specific risk scorer
     'DEIProvisionExtractor',  # DEI provision extractor
@@ -158,6 +163,7 @@ __all__ = [
     'get_keywords',
     'get_type_specific_keywords',
     'register_keywords',
+    'scan_keywords',
     'register_legal_terms',
     'get_legal_terms',
     
@@ -13,7 +13,14 @@ Risk Scoring Methodology (0-3 scale):
 """
 
 from typing import Dict, List, Optional, Any
-from .keywords import get_keywords
+from .keywords import KeywordScan, get_keywords, scan_keywords
+
+# Keyword scopes counted by calculate_risk, scanned together in one pass
+DEI_KEYWORD_SCOPES = (
+    ('complaint', 'dei'),
+    ('dei_proxy', 'dei'),
+    ('binding', 'dei'),
+)
 
 
 class DEIRiskScorer:
@@ -63,15 +70,16 @@ class DEIRiskScorer:
             - recommendations: Suggested actions
             - flagged_keywords: Keywords that triggered the score
         """
-        # Count keyword occurrences
-        dei_count = self._count_keywords(text, self.dei_keywords)
-        proxy_count = self._count_keywords(text, self.proxy_keywords)
-        binding_count = self._count_keywords(text, self.binding_keywords)
+        # Count keyword occurrences from a single pass over the text
+        scan = scan_keywords(text, DEI_KEYWORD_SCOPES)
+        dei_count = self._count_keywords(scan, self.dei_keywords)
+        proxy_count = self._count_keywords(scan, self.proxy_keywords)
+        binding_count = self._count_keywords(scan, self.binding_keywords)
         
         # Track which keywords were found
-        flagged_dei = self._extract_keywords(text, self.dei_keywords)
-        flagged_proxy = self._extract_keywords(text, self.proxy_keywords)
-        flagged_binding = self._extract_keywords(text, self.binding_keywords)
+        flagged_dei = self._extract_keywords(scan, self.dei_keywords)
+        flagged_proxy = self._extract_keywords(scan, self.proxy_keywords)
+        flagged_binding = self._extract_keywords(scan, self.binding_keywords)
         
         # Calculate risk score using HACC algorithm
         score = self._calculate_score(dei_count, proxy_count, binding_count)
@@ -126,23 +134,13 @@ class DEIRiskScorer:
             return 1  # Possible issue: DEI language but weak enforcement
         return 0  # Compliant: No problematic DEI language
     
-    def _count_keywords(self, text: str, keywords: List[str]) -> int:
-        """Count occurrences of keywords in text (case-insensitive)."""
-        text_lower = text.lower()
-        count = 0
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                count += 1
-        return count
+    def _count_keywords(self, scan: KeywordScan, keywords: List[str]) -> int:
+        """Count occurrences of keywords in the scanned text (case-insensitive)."""
+        return scan.count(keywords)
     
-    def _extract_keywords(self, text: str, keywords: List[str]) -> List[str]:
-        """Extract keywords that are found in text."""
-        found = []
-        text_lower = text.lower()
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                found.append(keyword)
-        return list(set(found))  # deduplicate
+    def _extract_keywords(self, scan: KeywordScan, keywords: List[str]) -> List[str]:
+        """Extract keywords that are found in the scanned text."""
+        return list(set(scan.matches(keywords)))  # deduplicate
     
     def _identify_issues(self, dei_count: int, proxy_count: int, binding_count: int,
                         flagged_dei: List[str], flagged_proxy: List[str], 
@@ -337,8 +335,6 @@ class DEIRiskScorer:
         
         Based on HACC's applicability tagging from index_and_tag.py.
         """
-        from .keywords import get_keywords
-        
         applicability_areas = [
             'housing', 'employment', 'public_accommodation',
             'lending', 'education', 'government_services',
@@ -346,15 +342,13 @@ class DEIRiskScorer:
         ]
         
         tags = []
-        text_lower = text.lower()
+        scan = scan_keywords(text, [(f'applicability_{area}', 'dei') for area in applicability_areas])
         
         for area in applicability_areas:
             area_keywords = get_keywords(f'applicability_{area}', complaint_type='dei')
             # Check if any keywords for this area are present
-            for keyword in area_keywords:
-                if keyword.lower() in text_lower:
-                    tags.append(area)
-                    break  # Only tag once per area
+            if any(scan.contains(keyword) for keyword in area_keywords):
+                tags.append(area)
         
         return tags
     
@@ -10,21 +10,132 @@ This provides the best of both approaches:
 - Combined relevance scoring
 """
 
+import asyncio
+import inspect
+import json
 import logging
-from typing import Dict, List, Optional, Any
+import os
+import threading
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 
 from integrations.ipfs_datasets.vector_store import (
+    DEFAULT_EMBEDDING_PROVIDER,
     EMBEDDINGS_AVAILABLE,
     EmbeddingsRouter,
+    get_embedding_cache,
 )
 
 logger = logging.getLogger(__name__)
 
-from .keywords import get_keywords, get_type_specific_keywords
+from .keywords import KeywordScan, get_keywords, get_type_specific_keywords, scan_keywords
 from .legal_patterns import LegalPatternExtractor
 from .risk_scoring import ComplaintRiskScorer
 
+# Complaint types tagged by _tag_applicability
+APPLICABILITY_COMPLAINT_TYPES = ['housing', 'employment', 'civil_rights', 'consumer', 'healthcare']
+
+# Keyword scopes read by index_document, scanned together in one pass
+INDEX_KEYWORD_SCOPES = (
+    ('complaint', None),
+    ('evidence', None),
+    ('legal', None),
+    ('binding', None),
+) + tuple(('complaint', ctype) for ctype in APPLICABILITY_COMPLAINT_TYPES)
+
+INDEX_HISTORY_LIMIT_ENV = "COMPLAINT_GENERATOR_INDEX_HISTORY_LIMIT"
+DEFAULT_INDEX_HISTORY_LIMIT = 1000
+DEFAULT_INDEX_BATCH_SIZE = 32
+
+
+class IndexHistory:
+    """
+    Bounded record of indexed documents with running aggregates.
+
+    Keeps the most recent ``limit`` results in memory and, when
+    ``spill_path`` is set, appends every result (without its embedding) to
+    that JSONL file. The aggregates behind the indexer statistics cover
+    every recorded document, so memory stays flat however many are indexed.
+    ``len()`` counts all recorded documents; iteration yields only the
+    retained ones.
+    """
+
+    def __init__(self, limit: Optional[int] = None, spill_path: Optional[str] = None):
+        if limit is None:
+            try:
+                limit = int(os.getenv(INDEX_HISTORY_LIMIT_ENV, "") or DEFAULT_INDEX_HISTORY_LIMIT)
+            except ValueError:
+                limit = DEFAULT_INDEX_HISTORY_LIMIT
+        self.limit = max(0, limit)
+        self.spill_path = spill_path
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=self.limit)
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget retained documents and reset the aggregates."""
+        self._recent.clear()
+        self.count = 0
+        self.risk_levels: Dict[Any, int] = {}
+        self.applicability_tags: Dict[str, int] = {}
+        self.applicability_documents: Dict[str, int] = {}
+        self.relevance_total = 0
+        self.relevance_max: Optional[float] = None
+        self.provision_total = 0
+        self.embedded = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        return iter(self._recent)
+
+    def append(self, document: Dict[str, Any]) -> None:
+        self.count += 1
+        level = document.get('risk_level')
+        self.risk_levels[level] = self.risk_levels.get(level, 0) + 1
+        tags = document.get('applicability', [])
+        for tag in tags:
+            self.applicability_tags[tag] = self.applicability_tags.get(tag, 0) + 1
+        for tag in dict.fromkeys(tags):
+            self.applicability_documents[tag] = self.applicability_documents.get(tag, 0) + 1
+        relevance = document.get('relevance_score', 0)
+        self.relevance_total += relevance
+        if self.relevance_max is None or relevance > self.relevance_max:
+            self.relevance_max = relevance
+        self.provision_total += document.get('legal_provisions', {}).get('provision_count', 0)
+        if document.get('embedding_available', False):
+            self.embedded += 1
+
+        if self.limit:
+            self._recent.append(document)
+        if self.spill_path:
+            record = {key: value for key, value in document.items() if key != 'embedding'}
+            with open(self.spill_path, 'a', encoding='utf-8') as handle:
+                handle.write(json.dumps(record, default=str) + "\n")
+
+    def extend(self, documents: Iterable[Dict[str, Any]]) -> None:
+        for document in documents:
+            self.append(document)
+
+
+# One analysis indexer per worker thread: with ``max_workers=0`` the texts are
+# analysed on the event loop's thread pool, whose threads must not share one.
+_worker_state = threading.local()
+
+
+def _analyze_in_worker(text: str) -> Dict[str, Any]:
+    """Process-pool entry point: keyword, pattern and risk analysis for one text."""
+    indexer = getattr(_worker_state, 'indexer', None)
+    if indexer is None:
+        indexer = _worker_state.indexer = HybridDocumentIndexer(enable_embeddings=False)
+    try:
+        return indexer._analyze(text)
+    finally:
+        # Workers only compute results; the parent keeps the history
+        indexer.risk_scorer._assessment_history.clear()
+
 
 class HybridDocumentIndexer:
     """
@@ -43,14 +154,22 @@ class HybridDocumentIndexer:
         >>> print(f"Risk: {result['risk_score']}, Keywords: {result['keywords']}")
     """
     
-    def __init__(self, enable_embeddings: bool = True):
+    def __init__(self, enable_embeddings: bool = True, embedding_cache=None,
+                 history_limit: Optional[int] = None,
+                 history_spill_path: Optional[str] = None):
         """
         Initialize the hybrid indexer.
         
         Args:
             enable_embeddings: Whether to enable vector embeddings (requires ipfs_datasets_py)
+            embedding_cache: Optional EmbeddingCache; defaults to the process-wide cache
+                shared with the document optimizer and local vector indexes
+            history_limit: Indexed results kept in memory (default 1000, or
+                COMPLAINT_GENERATOR_INDEX_HISTORY_LIMIT)
+            history_spill_path: Optional JSONL file receiving every indexed result
         """
         self.enable_embeddings = enable_embeddings and EMBEDDINGS_AVAILABLE
+        self.embedding_cache = embedding_cache
         
         # Initialize ipfs_datasets_py components
         if self.enable_embeddings:
@@ -68,7 +187,7 @@ class HybridDocumentIndexer:
         self.risk_scorer = ComplaintRiskScorer()
         
         # Batch 218: Track indexed documents
-        self._indexed_documents: List[Dict[str, Any]] = []
+        self._indexed_documents = IndexHistory(history_limit, history_spill_path)
     
     async def index_document(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -96,7 +215,7 @@ class HybridDocumentIndexer:
         # Generate vector embedding (ipfs_datasets_py)
         if self.enable_embeddings and self.embeddings_router:
             try:
-                embedding = await self.embeddings_router.embed_text(text)
+                embedding = await self._embed_text(text)
                 result['embedding'] = embedding
                 result['embedding_available'] = True
             except Exception as e:
@@ -105,11 +224,149 @@ class HybridDocumentIndexer:
         else:
             result['embedding_available'] = False
         
-        # Extract keywords (using new function)
-        complaint_keywords = self._extract_keywords(text, get_keywords('complaint'))
-        evidence_keywords = self._extract_keywords(text, get_keywords('evidence'))
-        legal_keywords = self._extract_keywords(text, get_keywords('legal'))
-        binding_keywords = self._extract_keywords(text, get_keywords('binding'))
+        result.update(self._analyze(text))
+        
+        # Calculate combined relevance score
+        result['relevance_score'] = self._calculate_relevance(result)
+        
+        # Batch 218: Track indexed document
+        self._indexed_documents.append(result)
+        
+        return result
+    
+    async def index_documents(
+        self,
+        documents: Iterable[Any],
+        *,
+        batch_size: int = DEFAULT_INDEX_BATCH_SIZE,
+        max_workers: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Index many documents, yielding results in input order as batches finish.
+
+        Each batch is embedded with one ``embed_texts_batched`` call (cached
+        vectors are reused) while its keyword, legal pattern and risk analysis
+        runs on a process pool. The next batch is started before the current
+        one is yielded, so at most two batches are held in memory.
+
+        Args:
+            documents: Texts, or ``(text, metadata)`` pairs
+            batch_size: Documents per embedding call
+            max_workers: Analysis processes (default: CPU count); 0 runs the
+                analysis on a thread in this process instead
+
+        Yields:
+            The same result dictionaries ``index_document`` returns
+        """
+        batch_size = max(1, batch_size)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 0 else None
+        batches = self._iter_batches(documents, batch_size)
+        pending: Optional[asyncio.Future] = None
+        following: Optional[asyncio.Future] = None
+        try:
+            batch = next(batches, None)
+            if batch is not None:
+                pending = asyncio.ensure_future(self._index_batch(batch, executor))
+            while pending is not None:
+                upcoming = next(batches, None)
+                following = (
+                    asyncio.ensure_future(self._index_batch(upcoming, executor))
+                    if upcoming is not None else None
+                )
+                results = await pending
+                pending = following
+                for result in results:
+                    # Batch 218: Track indexed document
+                    self._indexed_documents.append(result)
+                    yield result
+        finally:
+            # ``following`` is still running when ``await pending`` raised.
+            for task in (pending, following):
+                if task is not None:
+                    task.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _iter_batches(documents: Iterable[Any], batch_size: int):
+        batch: List[Tuple[str, Dict[str, Any]]] = []
+        for document in documents:
+            if isinstance(document, (tuple, list)):
+                text, metadata = document[0], document[1] if len(document) > 1 else None
+            else:
+                text, metadata = document, None
+            batch.append((text, metadata or {}))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def _index_batch(
+        self,
+        batch: List[Tuple[str, Dict[str, Any]]],
+        executor: Optional[Executor],
+    ) -> List[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        texts = [text for text, _metadata in batch]
+        analyses = [loop.run_in_executor(executor, _analyze_in_worker, text) for text in texts]
+
+        embeddings: Optional[List[List[float]]] = None
+        embedding_available = False
+        if self.enable_embeddings and self.embeddings_router:
+            try:
+                embeddings = await self._embed_texts(texts)
+                embedding_available = True
+            except Exception as e:
+                logger.warning("Embedding failed: %s", e)
+
+        results = []
+        indexed_date = datetime.now().isoformat()
+        for index, ((text, metadata), analysis) in enumerate(zip(batch, await asyncio.gather(*analyses))):
+            result = {
+                'text_length': len(text),
+                'metadata': metadata,
+                'indexed_date': indexed_date,
+            }
+            if embedding_available:
+                result['embedding'] = embeddings[index]
+            result['embedding_available'] = embedding_available
+            result.update(analysis)
+            result['relevance_score'] = self._calculate_relevance(result)
+            results.append(result)
+        return results
+
+    async def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch, calling the router once for the texts not yet cached."""
+        cache = self.embedding_cache or get_embedding_cache()
+        cached = cache.get_many(texts, provider=DEFAULT_EMBEDDING_PROVIDER)
+        missing = list(dict.fromkeys(text for text, vector in zip(texts, cached) if vector is None))
+        if missing:
+            vectors = await asyncio.to_thread(self.embeddings_router.embed_texts_batched, missing)
+            if inspect.isawaitable(vectors):
+                vectors = await vectors
+            vectors = [list(vector) for vector in vectors]
+            if len(vectors) != len(missing):
+                raise ValueError(
+                    f"Embedding backend returned {len(vectors)} vectors for {len(missing)} texts"
+                )
+            cache.put_many(missing, vectors, provider=DEFAULT_EMBEDDING_PROVIDER)
+            by_text = dict(zip(missing, vectors))
+            cached = [vector if vector is not None else by_text[text] for text, vector in zip(texts, cached)]
+        return cached
+
+    def _analyze(self, text: str) -> Dict[str, Any]:
+        """Keyword, applicability, legal provision and risk fields for one text."""
+        result: Dict[str, Any] = {}
+
+        # Extract keywords from a single pass over the text
+        scan = scan_keywords(text, INDEX_KEYWORD_SCOPES)
+        complaint_keywords = self._extract_keywords(scan, get_keywords('complaint'))
+        evidence_keywords = self._extract_keywords(scan, get_keywords('evidence'))
+        legal_keywords = self._extract_keywords(scan, get_keywords('legal'))
+        binding_keywords = self._extract_keywords(scan, get_keywords('binding'))
         
         result['keywords'] = {
             'complaint': complaint_keywords,
@@ -119,7 +376,7 @@ class HybridDocumentIndexer:
         }
         
         # Tag applicability (HACC)
-        applicability = self._tag_applicability(text)
+        applicability = self._tag_applicability(scan)
         result['applicability'] = applicability
         
         # Extract legal provisions (HACC)
@@ -131,25 +388,23 @@ class HybridDocumentIndexer:
         result['risk_score'] = risk_result['score']
         result['risk_level'] = risk_result['level']
         result['risk_factors'] = risk_result['factors']
-        
-        # Calculate combined relevance score
-        result['relevance_score'] = self._calculate_relevance(result)
-        
-        # Batch 218: Track indexed document
-        self._indexed_documents.append(result)
-        
         return result
+
+    async def _embed_text(self, text: str) -> List[float]:
+        """Embed text, reusing vectors from the shared embedding cache."""
+        cache = self.embedding_cache or get_embedding_cache()
+        cached = cache.get(text, provider=DEFAULT_EMBEDDING_PROVIDER)
+        if cached is not None:
+            return cached
+        embedding = await self.embeddings_router.embed_text(text)
+        cache.put(text, embedding, provider=DEFAULT_EMBEDDING_PROVIDER)
+        return embedding
     
-    def _extract_keywords(self, text: str, keyword_list: List[str]) -> List[str]:
-        """Extract keywords from text (case-insensitive)."""
-        found = []
-        text_lower = text.lower()
-        for kw in keyword_list:
-            if kw.lower() in text_lower:
-                found.append(kw)
-        return list(set(found))  # dedupe
+    def _extract_keywords(self, scan: KeywordScan, keyword_list: List[str]) -> List[str]:
+        """Extract keywords from the scanned text (case-insensitive)."""
+        return list(set(scan.matches(keyword_list)))  # dedupe
     
-    def _tag_applicability(self, text: str) -> List[str]:
+    def _tag_applicability(self, scan: KeywordScan) -> List[str]:
         """
         Tag document with applicability areas.
         
@@ -157,18 +412,16 @@ class HybridDocumentIndexer:
         global keywords that appear in all complaint types.
         """
         tags = []
-        text_lower = text.lower()
         
         # Check for different complaint types using type-specific keywords only
-        complaint_types = ['housing', 'employment', 'civil_rights', 'consumer', 'healthcare']
-        for ctype in complaint_types:
+        for ctype in APPLICABILITY_COMPLAINT_TYPES:
             # Use type-specific keywords to avoid false positives
             keywords = get_type_specific_keywords('complaint', ctype)
             if not keywords:
                 continue
             
             # Require multiple matches for confidence
-            matches = sum(1 for kw in keywords if kw.lower() in text_lower)
+            matches = scan.count(keywords)
             if matches >= 2:  # Require at least 2 type-specific keywords
                 tags.append(ctype)
         
@@ -294,8 +547,7 @@ class HybridDocumentIndexer:
         Returns:
             Count of documents with that risk level
         """
-        return sum(1 for doc in self._indexed_documents 
-                  if doc.get('risk_level') == level)
+        return self._indexed_documents.risk_levels.get(level, 0)
     
     def risk_level_distribution(self) -> Dict[str, int]:
         """
@@ -305,23 +557,22 @@ class HybridDocumentIndexer:
             Dict mapping risk level to count
         """
         dist = {}
-        for doc in self._indexed_documents:
-            level = doc.get('risk_level', 'minimal')
-            dist[level] = dist.get(level, 0) + 1
+        for level, count in self._indexed_documents.risk_levels.items():
+            level = 'minimal' if level is None else level
+            dist[level] = dist.get(level, 0) + count
         return dist
     
     def average_relevance_score(self) -> float:
         """Return average relevance score across all indexed documents."""
         if not self._indexed_documents:
             return 0.0
-        total = sum(doc.get('relevance_score', 0) for doc in self._indexed_documents)
-        return total / len(self._indexed_documents)
+        return self._indexed_documents.relevance_total / len(self._indexed_documents)
     
     def maximum_relevance_score(self) -> float:
         """Return the maximum relevance score among all indexed documents."""
         if not self._indexed_documents:
             return 0.0
-        return max(doc.get('relevance_score', 0) for doc in self._indexed_documents)
+        return self._indexed_documents.relevance_max
     
     def documents_by_applicability(self, tag: str) -> int:
         """
@@ -333,8 +584,7 @@ class HybridDocumentIndexer:
         Returns:
             Count of documents with that tag
         """
-        return sum(1 for doc in self._indexed_documents 
-                  if tag in doc.get('applicability', []))
+        return self._indexed_documents.applicability_documents.get(tag, 0)
     
     def applicability_distribution(self) -> Dict[str, int]:
         """
@@ -343,19 +593,13 @@ class HybridDocumentIndexer:
         Returns:
             Dict mapping applicability tag to count
         """
-        dist = {}
-        for doc in self._indexed_documents:
-            for tag in doc.get('applicability', []):
-                dist[tag] = dist.get(tag, 0) + 1
-        return dist
+        return dict(self._indexed_documents.applicability_tags)
     
     def average_legal_provisions(self) -> float:
         """Return average number of legal provisions per document."""
         if not self._indexed_documents:
             return 0.0
-        total = sum(doc.get('legal_provisions', {}).get('provision_count', 0) 
-                   for doc in self._indexed_documents)
-        return total / len(self._indexed_documents)
+        return self._indexed_documents.provision_total / len(self._indexed_documents)
     
     def high_risk_documents_percentage(self) -> float:
         """Return percentage of documents classified as high risk."""
@@ -366,5 +610,4 @@ class HybridDocumentIndexer:
     
     def documents_with_embeddings(self) -> int:
         """Return count of documents that have embeddings available."""
-        return sum(1 for doc in self._indexed_documents 
-                  if doc.get('embedding_available', False))
+        return self._indexed_documents.embedded
@@ -6,9 +6,121 @@ complaint types and categories. Keywords can be registered dynamically for
 new complaint types.
 """
 
-from typing import List, Dict, Optional, Set
+import re
+from typing import Any, Iterable, List, Dict, Optional, Set, Tuple
 from .base import BaseKeywordRegistry
 
+# Below this many keywords a substring check per keyword beats a regex pass
+# over every character of the text
+TRIE_MIN_KEYWORDS = 150
+
+
+class KeywordMatcher:
+    """
+    Find which of a set of keywords occur as substrings of a text.
+
+    The keywords are lowercased and deduplicated once, so each is checked at
+    most once per text no matter how many categories share it. Large sets
+    are compiled into a trie-shaped lookahead regex that reports the longest
+    keyword starting at each position in a single pass; shorter keywords
+    sharing that start are prefixes of it and are filled in from a
+    precomputed table. Matching is case-insensitive in the same way as
+    ``kw.lower() in text.lower()``.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        words = sorted({keyword.lower() for keyword in keywords} - {''})
+        self._words = frozenset(words)
+        self._prefixes: Dict[str, Tuple[str, ...]] = {}
+        self._regex = None
+        if len(words) >= TRIE_MIN_KEYWORDS:
+            self._prefixes = {
+                word: tuple(word[:end] for end in range(1, len(word) + 1) if word[:end] in self._words)
+                for word in words
+            }
+            self._regex = re.compile('(?=(' + self._trie_pattern(words) + '))')
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword == '' or keyword in self._words
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    @staticmethod
+    def _trie_pattern(words: List[str]) -> str:
+        trie: Dict[str, Any] = {}
+        for word in words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[''] = {}
+
+        def build(node: Dict[str, Any]) -> str:
+            branches = [re.escape(char) + build(node[char]) for char in sorted(node) if char]
+            if not branches:
+                return ''
+            body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+            return '(?:' + body + ')?' if '' in node else body
+
+        return build(trie)
+
+    def find(self, text_lower: str) -> Set[str]:
+        """Return the keywords (lowercased) that occur in ``text_lower``."""
+        found: Set[str] = {''}
+        if self._regex is None:
+            found.update(filter(text_lower.__contains__, self._words))
+            return found
+        longest = {match.group(1) for match in self._regex.finditer(text_lower)}
+        for word in longest:
+            if word:
+                found.update(self._prefixes[word])
+        return found
+
+    def scan(self, text: str) -> 'KeywordScan':
+        """Scan ``text`` once and return the result for repeated lookups."""
+        return KeywordScan(self, text)
+
+
+class KeywordScan:
+    """
+    Keywords found in one text by a single ``KeywordMatcher`` pass.
+
+    Any number of keyword lists can then be counted against the text with
+    set lookups. Keywords the matcher was not built with fall back to a
+    substring check, so results never depend on which matcher was used.
+    """
+
+    __slots__ = ('text_lower', 'found', '_matcher')
+
+    def __init__(self, matcher: KeywordMatcher, text: str):
+        self.text_lower = text.lower()
+        self.found = matcher.find(self.text_lower)
+        self._matcher = matcher
+
+    def contains(self, keyword: str) -> bool:
+        """Return True if ``keyword`` occurs in the text (case-insensitive)."""
+        return bool(self.matches((keyword,)))
+
+    def matches(self, keywords: Iterable[str]) -> List[str]:
+        """Return the keywords from ``keywords`` that occur in the text, in order."""
+        found = self.found
+        vocabulary = self._matcher._words
+        text_lower = self.text_lower
+        hits = []
+        for keyword in keywords:
+            if keyword in found:
+                hits.append(keyword)
+            elif keyword not in vocabulary:
+                # Not an already-lowercased keyword the matcher scanned for
+                lowered = keyword.lower()
+                if lowered in found or (lowered not in vocabulary and lowered in text_lower):
+                    hits.append(keyword)
+        return hits
+
+    def count(self, keywords: Iterable[str]) -> int:
+        """Count the keywords from ``keywords`` that occur in the text."""
+        return len(self.matches(keywords))
+
 
 class KeywordRegistry(BaseKeywordRegistry):
     """
@@ -29,6 +141,15 @@ class KeywordRegistry(BaseKeywordRegistry):
         # Structure: {category: {complaint_type: [keywords]}}
         # complaint_type=None means global keywords
         self._registry: Dict[str, Dict[Optional[str], Set[str]]] = {}
+        # Bumped on every registration so callers can cache derived matchers
+        self._version = 0
+        # Sorted keyword lists and the shared matcher for the current version
+        self._cache: Dict[Any, Any] = {}
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever keywords are registered."""
+        return self._version
     
     def register_keywords(self, category: str, keywords: List[str], 
                          complaint_type: Optional[str] = None) -> None:
@@ -47,6 +168,8 @@ class KeywordRegistry(BaseKeywordRegistry):
             self._registry[category][complaint_type] = set()
         
         self._registry[category][complaint_type].update(keywords)
+        self._version += 1
+        self._cache.clear()
     
     def get_keywords(self, category: str, 
                      complaint_type: Optional[str] = None) -> List[str]:
@@ -60,6 +183,11 @@ class KeywordRegistry(BaseKeywordRegistry):
         Returns:
             List of keywords (includes global + type-specific if type is specified)
         """
+        cache_key = ('all', category, complaint_type)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         if category not in self._registry:
             return []
         
@@ -73,7 +201,8 @@ class KeywordRegistry(BaseKeywordRegistry):
         if complaint_type and complaint_type in self._registry[category]:
             keywords.update(self._registry[category][complaint_type])
         
-        return sorted(list(keywords))
+        self._cache[cache_key] = sorted(keywords)
+        return list(self._cache[cache_key])
     
     def get_type_specific_keywords(self, category: str, 
                                    complaint_type: str) -> List[str]:
@@ -96,7 +225,46 @@ class KeywordRegistry(BaseKeywordRegistry):
         if complaint_type not in self._registry[category]:
             return []
         
-        return sorted(list(self._registry[category][complaint_type]))
+        cache_key = ('specific', category, complaint_type)
+        if cache_key not in self._cache:
+            self._cache[cache_key] = sorted(self._registry[category][complaint_type])
+        return list(self._cache[cache_key])
+
+    def get_matcher(self, scopes: Optional[Iterable[Tuple[str, Optional[str]]]] = None) -> KeywordMatcher:
+        """
+        Get a matcher for the keywords of several categories at once.
+
+        Args:
+            scopes: ``(category, complaint_type)`` pairs, resolved like
+                ``get_keywords``; None covers every registered keyword
+
+        Returns:
+            A matcher built on first use and rebuilt after new keywords are
+            registered, so one scan of a text serves all the scopes.
+        """
+        cache_key = ('matcher', None if scopes is None else tuple(scopes))
+        matcher = self._cache.get(cache_key)
+        if matcher is None:
+            if scopes is None:
+                keywords = [
+                    keyword
+                    for types in self._registry.values()
+                    for type_keywords in types.values()
+                    for keyword in type_keywords
+                ]
+            else:
+                keywords = [
+                    keyword
+                    for category, complaint_type in cache_key[1]
+                    for keyword in self.get_keywords(category, complaint_type)
+                ]
+            matcher = KeywordMatcher(keywords)
+            self._cache[cache_key] = matcher
+        return matcher
+
+    def scan(self, text: str, scopes: Optional[Iterable[Tuple[str, Optional[str]]]] = None) -> KeywordScan:
+        """Scan ``text`` once for the keywords of ``scopes`` (default: all)."""
+        return self.get_matcher(scopes).scan(text)
     
     def get_all_categories(self, complaint_type: Optional[str] = None) -> List[str]:
         """
@@ -291,6 +459,12 @@ def get_keywords(category: str, complaint_type: Optional[str] = None) -> List[st
     return _global_registry.get_keywords(category, complaint_type)
 
 
+def scan_keywords(text: str,
+                  scopes: Optional[Iterable[Tuple[str, Optional[str]]]] = None) -> KeywordScan:
+    """Scan text once for the keywords of ``scopes`` in the global registry."""
+    return _global_registry.scan(text, scopes)
+
+
 def get_type_specific_keywords(category: str, complaint_type: str) -> List[str]:
     """
     Get only type-specific keywords (excluding global keywords) from the global registry.
@@ -15,7 +15,8 @@ New complaint types can be added by registering additional patterns.
 """
 
 import re
-from typing import List, Dict, Optional, Any
+from functools import lru_cache
+from typing import List, Dict, FrozenSet, Optional, Any, Set, Tuple
 from datetime import datetime
 from .base import BaseLegalPatternExtractor
 
@@ -29,6 +30,8 @@ MIN_KEYWORDS_FOR_THRESHOLD = 10
 
 # Registry for legal term patterns by category
 LEGAL_TERMS_REGISTRY: Dict[str, List[str]] = {}
+# Bumped by register_legal_terms so extractors rebuild their compiled matchers
+_legal_terms_version = 0
 
 
 def register_legal_terms(category: str, patterns: List[str]) -> None:
@@ -39,9 +42,11 @@ def register_legal_terms(category: str, patterns: List[str]) -> None:
         category: Category name (e.g., 'housing', 'employment', 'civil_rights')
         patterns: List of regex patterns
     """
+    global _legal_terms_version
     if category not in LEGAL_TERMS_REGISTRY:
         LEGAL_TERMS_REGISTRY[category] = []
     LEGAL_TERMS_REGISTRY[category].extend(patterns)
+    _legal_terms_version += 1
 
 
 def get_legal_terms(category: Optional[str] = None) -> List[str]:
@@ -246,6 +251,255 @@ register_legal_terms('federal_law', [
 ])
 
 
+# Protected classes and the substrings that indicate them
+_PROTECTED_CLASS_KEYWORDS: Dict[str, List[str]] = {
+    'race': ['race', 'racial'],
+    'color': ['color'],
+    'national_origin': ['national origin', 'nationality'],
+    'religion': ['religion', 'religious', 'creed'],
+    'sex': ['sex', 'gender'],
+    'familial_status': ['familial status', 'family status', 'children'],
+    'disability': ['disability', 'disabled', 'handicap'],
+    'age': ['age', 'elderly', 'senior'],
+    'sexual_orientation': ['sexual orientation', 'lgbt', 'gay', 'lesbian'],
+    'gender_identity': ['gender identity', 'transgender'],
+    'source_of_income': ['source of income', 'section 8', 'voucher'],
+}
+
+# Legacy categories applied on top of the keyword registry
+_LEGACY_CATEGORY_KEYWORDS: Dict[str, List[str]] = {
+    'disability': ['disability', 'ada', 'reasonable accommodation'],
+    'discrimination': ['discrimination', 'discriminate'],
+    'harassment': ['harassment', 'hostile environment'],
+    'retaliation': ['retaliation', 'retaliate'],
+}
+
+_WORD_RE = re.compile(r'\w+')
+# Non-ASCII characters that IGNORECASE matching treats as ASCII letters
+_ASCII_CASE_FOLDS = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k'})
+# Upper bound on the strings a single pattern may expand to before it is
+# treated as opaque and always run
+_MAX_PATTERN_EXPANSIONS = 64
+
+
+def _product(heads: List[str], tails: List[str]) -> Optional[List[str]]:
+    combined = [head + tail for head in heads for tail in tails]
+    return combined if len(combined) <= _MAX_PATTERN_EXPANSIONS else None
+
+
+def _scan_alternation(source: str, pos: int) -> Tuple[Optional[List[str]], int]:
+    """Expand ``a|b|...`` starting at ``pos``; stops before ``)`` or the end."""
+    options: List[str] = []
+    while True:
+        branch, pos = _scan_sequence(source, pos)
+        if branch is None:
+            return None, pos
+        options.extend(branch)
+        if len(options) > _MAX_PATTERN_EXPANSIONS:
+            return None, pos
+        if pos < len(source) and source[pos] == '|':
+            pos += 1
+            continue
+        return options, pos
+
+
+def _scan_sequence(source: str, pos: int) -> Tuple[Optional[List[str]], int]:
+    results = ['']
+    while pos < len(source) and source[pos] not in '|)':
+        options, pos = _scan_atom(source, pos)
+        if options is None:
+            return None, pos
+        if pos < len(source) and source[pos] == '?':
+            options = [''] + options
+            pos += 1
+            if pos < len(source) and source[pos] == '?':
+                pos += 1
+        if pos < len(source) and source[pos] in '*+{':
+            return None, pos
+        results = _product(results, options)
+        if results is None:
+            return None, pos
+    return results, pos
+
+
+def _scan_atom(source: str, pos: int) -> Tuple[Optional[List[str]], int]:
+    char = source[pos]
+    if char == '(':
+        if source.startswith('(?:', pos):
+            pos += 3
+        elif source.startswith('(?', pos):
+            return None, pos
+        else:
+            pos += 1
+        options, pos = _scan_alternation(source, pos)
+        if options is None or pos >= len(source) or source[pos] != ')':
+            return None, pos
+        return options, pos + 1
+    if char == '[':
+        return _scan_class(source, pos + 1)
+    if char == '\\':
+        escaped = source[pos + 1:pos + 2]
+        # Letter and digit escapes are classes, anchors or backreferences
+        if not escaped or escaped.isalnum() or escaped == '_':
+            return None, pos
+        return [escaped], pos + 2
+    if char in '.^$*+?{}':
+        return None, pos
+    return [char], pos + 1
+
+
+def _scan_class(source: str, pos: int) -> Tuple[Optional[List[str]], int]:
+    """Expand a ``[...]`` class of literals and short ranges opened before ``pos``."""
+    if source.startswith('^', pos):
+        return None, pos
+    members: List[str] = []
+    first = True
+    while pos < len(source) and (source[pos] != ']' or first):
+        first = False
+        char, pos = _scan_class_char(source, pos)
+        if char is None:
+            return None, pos
+        if source.startswith('-', pos) and pos + 1 < len(source) and source[pos + 1] != ']':
+            end, pos = _scan_class_char(source, pos + 1)
+            if end is None or not 0 <= ord(end) - ord(char) < 16:
+                return None, pos
+            members.extend(chr(code) for code in range(ord(char), ord(end) + 1))
+        else:
+            members.append(char)
+    if pos >= len(source):
+        return None, pos
+    return members, pos + 1
+
+
+def _scan_class_char(source: str, pos: int) -> Tuple[Optional[str], int]:
+    char = source[pos]
+    if char == '[':
+        return None, pos
+    if char != '\\':
+        return char, pos + 1
+    escaped = source[pos + 1:pos + 2]
+    if not escaped or escaped.isalnum() or escaped == '_':
+        return None, pos
+    return escaped, pos + 2
+
+
+def _expand_literals(source: str) -> Optional[List[str]]:
+    """
+    Enumerate the finite set of strings a regex source matches, or None.
+
+    Only the subset legal term patterns are written in is understood:
+    literals, escaped punctuation, groups, alternation, ``?`` and classes of
+    literals or short ranges. Anything else makes the pattern opaque.
+    """
+    try:
+        options, pos = _scan_alternation(source, 0)
+    except RecursionError:
+        return None
+    if options is None or pos != len(source):
+        return None
+    return options
+
+
+@lru_cache(maxsize=4096)
+def _required_token_sets(pattern: str) -> Optional[Tuple[FrozenSet[str], ...]]:
+    """
+    Word tokens a ``\\b(...)\\b`` pattern needs to be present in the text.
+
+    Returns one token set per literal the pattern can match. Because the
+    pattern is anchored on word boundaries, every ``\\w+`` run of a match is a
+    whole word of the text, so a pattern whose literals all need a token the
+    text lacks cannot match. Returns None for patterns that cannot be reduced
+    this way; those are always run.
+    """
+    boundary = '\\b'
+    if len(pattern) <= 2 * len(boundary) or not (pattern.startswith(boundary) and pattern.endswith(boundary)):
+        return None
+    literals = _expand_literals(pattern[len(boundary):-len(boundary)])
+    if not literals:
+        return None
+    token_sets = []
+    for literal in literals:
+        # Case folding is only mirrored for ASCII literals
+        if not literal.isascii():
+            return None
+        tokens = frozenset(_WORD_RE.findall(literal.lower()))
+        if not tokens:
+            return None
+        token_sets.append(tokens)
+    return tuple(token_sets)
+
+
+class _ProvisionMatcher:
+    """
+    Token prefilter over a fixed list of compiled legal term patterns.
+
+    Tokenizing the text once tells which patterns can possibly match, so
+    only those are run instead of a full ``finditer`` pass per pattern.
+    Candidates keep the original pattern order, which keeps the extracted
+    provisions identical to running every pattern.
+    """
+
+    def __init__(self, patterns: List[re.Pattern]):
+        self.patterns = list(patterns)
+        self._requirements: List[Optional[Tuple[FrozenSet[str], ...]]] = []
+        for pattern in self.patterns:
+            token_sets = None
+            if pattern.flags & ~re.UNICODE == re.IGNORECASE:
+                token_sets = _required_token_sets(pattern.pattern)
+            self._requirements.append(token_sets)
+
+    def candidates(self, text: str) -> List[re.Pattern]:
+        """Return the patterns that may match ``text``, in registration order."""
+        if not text.isascii():
+            text = text.translate(_ASCII_CASE_FOLDS)
+        tokens = set(_WORD_RE.findall(text.lower()))
+        return [
+            pattern
+            for pattern, token_sets in zip(self.patterns, self._requirements)
+            if token_sets is None or any(required <= tokens for required in token_sets)
+        ]
+
+
+_keyword_plan_cache: Dict[str, Any] = {}
+
+
+def _complaint_keyword_plan() -> Tuple[List[Tuple[str, List[str], int]], Any]:
+    """
+    Per-type keyword lists and thresholds plus a matcher covering them.
+
+    Built from the global keyword registry and rebuilt whenever its version
+    changes. The matcher also covers the legacy category and protected class
+    keywords so one scan serves categorization and protected class lookup.
+    """
+    # Import here to avoid circular dependency issues during module initialization
+    from .keywords import KeywordMatcher, get_type_specific_keywords, _global_registry
+
+    version = _global_registry.version
+    cached = _keyword_plan_cache.get('plan')
+    if cached is not None and cached[0] == version:
+        return cached[1], cached[2]
+
+    type_rules = []
+    all_keywords: List[str] = []
+    for complaint_type in _global_registry.get_complaint_types():
+        type_keywords = get_type_specific_keywords('complaint', complaint_type)
+        # Use lower threshold for types with fewer keywords to avoid being too strict
+        threshold = (DEFAULT_KEYWORD_MATCH_THRESHOLD
+                     if len(type_keywords) > MIN_KEYWORDS_FOR_THRESHOLD
+                     else 1)
+        lowered = [keyword.lower() for keyword in type_keywords]
+        type_rules.append((complaint_type, lowered, threshold))
+        all_keywords.extend(lowered)
+    for keywords in _LEGACY_CATEGORY_KEYWORDS.values():
+        all_keywords.extend(keywords)
+    for keywords in _PROTECTED_CLASS_KEYWORDS.values():
+        all_keywords.extend(keywords)
+
+    matcher = KeywordMatcher(all_keywords)
+    _keyword_plan_cache['plan'] = (version, type_rules, matcher)
+    return type_rules, matcher
+
+
 class LegalPatternExtractor(BaseLegalPatternExtractor):
     """
     Extensible legal pattern extractor for complaints.
@@ -273,10 +527,21 @@ class LegalPatternExtractor(BaseLegalPatternExtractor):
             categories: List of pattern categories to use (None = all registered)
             custom_patterns: Optional additional regex patterns to include
         """
+        self._categories = list(categories) if categories else None
+        self._custom_patterns = list(custom_patterns) if custom_patterns else None
+        self._build_patterns()
+
+        # Batch 215: Analysis tracking
+        self._analysis_history: List[Dict[str, Any]] = []
+        self._protected_class_frequency: Dict[str, int] = {}
+        self._complaint_type_frequency: Dict[str, int] = {}
+    
+    def _build_patterns(self) -> None:
+        """Compile the pattern list from the registry and reset the matcher."""
         # Get patterns from specified categories or all if None
-        if categories:
+        if self._categories:
             patterns = []
-            for category in categories:
+            for category in self._categories:
                 patterns.extend(get_legal_terms(category))
         else:
             patterns = get_legal_terms()  # All patterns
@@ -287,13 +552,29 @@ class LegalPatternExtractor(BaseLegalPatternExtractor):
         
         self.patterns = [re.compile(p, re.IGNORECASE) for p in patterns]
         
-        if custom_patterns:
-            self.patterns.extend([re.compile(p, re.IGNORECASE) for p in custom_patterns])
+        if self._custom_patterns:
+            self.patterns.extend([re.compile(p, re.IGNORECASE) for p in self._custom_patterns])
 
-        # Batch 215: Analysis tracking
-        self._analysis_history: List[Dict[str, Any]] = []
-        self._protected_class_frequency: Dict[str, int] = {}
-        self._complaint_type_frequency: Dict[str, int] = {}
+        self._legal_terms_version = _legal_terms_version
+        self._provision_matcher = _ProvisionMatcher(self.patterns)
+
+    def _current_provision_matcher(self) -> _ProvisionMatcher:
+        """
+        Return the compiled matcher, rebuilding it if the patterns changed.
+
+        Registering new legal terms rebuilds the pattern list, unless the
+        caller has replaced or edited ``self.patterns`` directly, in which
+        case the matcher is rebuilt around the edited list.
+        """
+        matcher = self._provision_matcher
+        unchanged = len(matcher.patterns) == len(self.patterns) and all(
+            a is b for a, b in zip(matcher.patterns, self.patterns)
+        )
+        if unchanged and self._legal_terms_version != _legal_terms_version:
+            self._build_patterns()
+        elif not unchanged:
+            self._provision_matcher = _ProvisionMatcher(self.patterns)
+        return self._provision_matcher
     
     def extract_provisions(self, text: str, context_chars: int = 200) -> Dict[str, Any]:
         """
@@ -313,7 +594,7 @@ class LegalPatternExtractor(BaseLegalPatternExtractor):
         provisions = []
         terms_found = set()
         
-        for pattern in self.patterns:
+        for pattern in self._current_provision_matcher().candidates(text):
             for match in pattern.finditer(text):
                 # Extract context around the match
                 start = max(0, match.start() - context_chars)
@@ -390,52 +671,30 @@ class LegalPatternExtractor(BaseLegalPatternExtractor):
         Returns:
             List of applicable complaint categories
         """
-        # Import here to avoid circular dependency issues during module initialization
-        from .keywords import get_type_specific_keywords, _global_registry
-        
-        text_lower = text.lower()
+        type_rules, matcher = _complaint_keyword_plan()
+        return self._categories_from_keywords(type_rules, matcher.find(text.lower()))
+
+    @staticmethod
+    def _categories_from_keywords(
+        type_rules: List[Tuple[str, List[str], int]],
+        found: Set[str],
+    ) -> List[str]:
+        """Apply the per-type thresholds and legacy rules to matched keywords."""
         categories = []
         
         # Check each registered complaint type
-        complaint_types = _global_registry.get_complaint_types()
-        
-        for complaint_type in complaint_types:
-            # Get type-specific keywords (excluding global keywords)
-            type_keywords = get_type_specific_keywords('complaint', complaint_type)
-            
+        for complaint_type, type_keywords, threshold in type_rules:
             # Check if any type-specific keywords appear in text
             # Use a threshold to avoid false positives
-            matches = sum(1 for kw in type_keywords if kw.lower() in text_lower)
-            
-            # If at least threshold keywords match, include this type
-            # Use lower threshold for types with fewer keywords to avoid being too strict
-            threshold = (DEFAULT_KEYWORD_MATCH_THRESHOLD 
-                        if len(type_keywords) > MIN_KEYWORDS_FOR_THRESHOLD 
-                        else 1)
+            matches = sum(1 for kw in type_keywords if kw in found)
             if matches >= threshold:
                 categories.append(complaint_type)
         
         # Legacy categorization for backward compatibility
-        # Disability
-        if ('disability' in text_lower or 'ada' in text_lower or
-                'reasonable accommodation' in text_lower):
-            if 'disability' not in categories:
-                categories.append('disability')
-        
-        # Discrimination type
-        if 'discrimination' in text_lower or 'discriminate' in text_lower:
-            if 'discrimination' not in categories:
-                categories.append('discrimination')
-        
-        # Harassment
-        if 'harassment' in text_lower or 'hostile environment' in text_lower:
-            if 'harassment' not in categories:
-                categories.append('harassment')
-        
-        # Retaliation
-        if 'retaliation' in text_lower or 'retaliate' in text_lower:
-            if 'retaliation' not in categories:
-                categories.append('retaliation')
+        for category, keywords in _LEGACY_CATEGORY_KEYWORDS.items():
+            if any(keyword in found for keyword in keywords):
+                if category not in categories:
+                    categories.append(category)
         
         return categories or ['general']
     
@@ -449,25 +708,19 @@ class LegalPatternExtractor(BaseLegalPatternExtractor):
         Returns:
             List of protected classes found
         """
-        protected_classes = {
-            'race': ['race', 'racial'],
-            'color': ['color'],
-            'national_origin': ['national origin', 'nationality'],
-            'religion': ['religion', 'religious', 'creed'],
-            'sex': ['sex', 'gender'],
-            'familial_status': ['familial status', 'family status', 'children'],
-            'disability': ['disability', 'disabled', 'handicap'],
-            'age': ['age', 'elderly', 'senior'],
-            'sexual_orientation': ['sexual orientation', 'lgbt', 'gay', 'lesbian'],
-            'gender_identity': ['gender identity', 'transgender'],
-            'source_of_income': ['source of income', 'section 8', 'voucher'],
-        }
-        
-        text_lower = text.lower()
+        return self._protected_classes_in(text.lower())
+
+    @staticmethod
+    def _protected_classes_in(haystack) -> List[str]:
+        """List protected classes with a keyword in ``haystack``.
+
+        ``haystack`` is either the lowercased text or the set of keywords
+        already matched in it; both answer ``keyword in haystack``.
+        """
         found_classes = []
         
-        for class_name, keywords in protected_classes.items():
-            if any(keyword in text_lower for keyword in keywords):
+        for class_name, keywords in _PROTECTED_CLASS_KEYWORDS.items():
+            if any(keyword in haystack for keyword in keywords):
                 found_classes.append(class_name)
         
         return found_classes
@@ -485,8 +738,11 @@ class LegalPatternExtractor(BaseLegalPatternExtractor):
         """
         provisions = self.extract_provisions(text, context_chars=context_chars)
         citations = self.extract_citations(text)
-        categories = self.categorize_complaint_type(text)
-        protected_classes = self.find_protected_classes(text)
+        # One keyword scan serves both categorization and protected classes
+        type_rules, matcher = _complaint_keyword_plan()
+        found_keywords = matcher.find(text.lower())
+        categories = self._categories_from_keywords(type_rules, found_keywords)
+        protected_classes = self._protected_classes_in(found_keywords)
 
         self._record_analysis(
             provisions=provisions,
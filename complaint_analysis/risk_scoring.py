@@ -6,9 +6,17 @@ Calculates risk scores based on keyword presence and legal patterns.
 """
 
 from typing import Dict, List, Optional, Any
-from .keywords import get_keywords
+from .keywords import KeywordScan, get_keywords, scan_keywords
 from .legal_patterns import LegalPatternExtractor
 
+# Keyword scopes counted by calculate_risk, scanned together in one pass
+RISK_KEYWORD_SCOPES = (
+    ('complaint', None),
+    ('binding', None),
+    ('severity_high', None),
+    ('severity_medium', None),
+)
+
 
 class ComplaintRiskScorer:
     """
@@ -53,11 +61,12 @@ class ComplaintRiskScorer:
             extraction_result = self.legal_extractor.extract_provisions(text)
             legal_provisions = extraction_result['provisions']
         
-        # Count different keyword types
-        complaint_count = self._count_keywords(text, get_keywords('complaint'))
-        binding_count = self._count_keywords(text, get_keywords('binding'))
-        severity_high = self._count_keywords(text, get_keywords('severity_high'))
-        severity_medium = self._count_keywords(text, get_keywords('severity_medium'))
+        # Count different keyword types from a single pass over the text
+        scan = scan_keywords(text, RISK_KEYWORD_SCOPES)
+        complaint_count = self._count_keywords(scan, get_keywords('complaint'))
+        binding_count = self._count_keywords(scan, get_keywords('binding'))
+        severity_high = self._count_keywords(scan, get_keywords('severity_high'))
+        severity_medium = self._count_keywords(scan, get_keywords('severity_medium'))
         
         # Count legal provisions
         provision_count = len(legal_provisions)
@@ -115,14 +124,9 @@ class ComplaintRiskScorer:
         
         return result
     
-    def _count_keywords(self, text: str, keywords: List[str]) -> int:
-        """Count occurrences of keywords in text (case-insensitive)."""
-        text_lower = text.lower()
-        count = 0
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                count += 1
-        return count
+    def _count_keywords(self, scan: KeywordScan, keywords: List[str]) -> int:
+        """Count occurrences of keywords in the scanned text (case-insensitive)."""
+        return scan.count(keywords)
     
     def _generate_recommendations(self, score: int, factors: List[str]) -> List[str]:
         """Generate action recommendations based on risk score."""
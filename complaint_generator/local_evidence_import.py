@@ -3,13 +3,19 @@ from __future__ import annotations
 import mailbox
 import json
 import mimetypes
+import os
 import re
+import shutil
+import time
 import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from email import policy
 from email.generator import BytesGenerator
+from functools import partial
 from io import BytesIO
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Iterable, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional, Sequence
 
 if TYPE_CHECKING:
     from applications.complaint_workspace import ComplaintWorkspaceService
@@ -89,24 +95,47 @@ def _default_evidence_root(workspace_root: Path) -> Path:
     return workspace_root / "evidence"
 
 
-def _iter_files(paths: Sequence[Path]) -> list[Path]:
-    files: list[Path] = []
+def _walk_sorted(directory: Path) -> Iterator[Path]:
+    """Yield files under ``directory`` in ``sorted(rglob("*"))`` order without listing the whole tree."""
+    try:
+        entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+    except OSError:
+        return
+    for entry in entries:
+        child = Path(entry.path)
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_sorted(child)
+        elif child.is_file():
+            yield child
+
+
+def _iter_files(paths: Sequence[Path]) -> Iterator[Path]:
     seen: set[str] = set()
     for path in paths:
         if path.is_file():
             lookup = str(path.resolve())
             if lookup not in seen:
-                files.append(path)
                 seen.add(lookup)
+                yield path
             continue
         if path.is_dir():
-            for child in sorted(candidate for candidate in path.rglob("*") if candidate.is_file()):
+            for child in _walk_sorted(path):
                 lookup = str(child.resolve())
                 if lookup in seen:
                     continue
-                files.append(child)
                 seen.add(lookup)
-    return files
+                yield child
+
+
+def _copy_file(source: Path, destination: Path, *, reuse_existing: bool = False) -> None:
+    if reuse_existing and destination.is_file() and destination.stat().st_size == source.stat().st_size:
+        return
+    shutil.copyfile(source, destination)
+
+
+def _source_fingerprint(path: Path) -> str:
+    stat = path.stat()
+    return f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
 
 
 def _extract_text_preview(path: Path, max_chars: int = 4000) -> str:
@@ -115,7 +144,13 @@ def _extract_text_preview(path: Path, max_chars: int = 4000) -> str:
     if suffix not in text_like_suffixes:
         return ""
     try:
-        raw = path.read_bytes()
+        if suffix == ".rtf":
+            raw = path.read_bytes()
+        else:
+            # Only the first ``max_chars`` characters are kept; read enough
+            # bytes for worst-case UTF-8 plus leading whitespace, not the file.
+            with path.open("rb") as handle:
+                raw = handle.read(max_chars * 4 + 4096)
     except Exception:
         return ""
     if suffix == ".rtf":
@@ -148,26 +183,184 @@ def _write_json(path: Path, payload: dict[str, Any]) -> None:
     path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
 
 
-def _save_workspace_artifact(
-    *,
-    service: "ComplaintWorkspaceService",
-    user_id: str,
-    kind: str,
-    claim_element_id: str,
-    title: str,
-    summary_lines: Sequence[str],
-    source: str,
-    attachment_names: Sequence[str],
-) -> dict[str, Any]:
-    return service.save_evidence(
-        user_id,
-        kind=kind,
-        claim_element_id=claim_element_id,
-        title=title,
-        content="\n".join(str(line) for line in summary_lines if str(line).strip()).strip(),
-        source=source,
-        attachment_names=list(attachment_names),
-    )
+# Imported records are written to the workspace in batches of this size so a
+# large archive costs a handful of session writes instead of one per message.
+_WORKSPACE_SAVE_BATCH_SIZE = 500
+# Progress callbacks fire after this many imported units.
+_PROGRESS_REPORT_INTERVAL = 100
+_IMPORT_MANIFEST_NAME = "import_manifest.jsonl"
+
+# A unit of import work: returns the result entry and the workspace evidence
+# fields to save for it.
+_ImportTask = Callable[[], "tuple[dict[str, Any], dict[str, Any]]"]
+
+
+class _WorkspaceEvidenceBatch:
+    """Collects imported artifacts and saves them to the workspace in bulk.
+
+    When a ``manifest_path`` is given, each flushed unit's resume key is
+    appended to it after the workspace save succeeds, so an interrupted
+    import can skip exactly the units that were committed.
+    """
+
+    def __init__(self, service: "ComplaintWorkspaceService", user_id: str, manifest_path: Optional[Path] = None) -> None:
+        self.service = service
+        self.user_id = user_id
+        self.manifest_path = manifest_path
+        self._items: list[dict[str, Any]] = []
+        self._entries: list[dict[str, Any]] = []
+        self._resume_keys: list[Optional[str]] = []
+
+    def add(
+        self,
+        entry: dict[str, Any],
+        *,
+        kind: str,
+        claim_element_id: str,
+        title: str,
+        summary_lines: Sequence[str],
+        source: str,
+        attachment_names: Sequence[str],
+        resume_key: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Queue ``entry``'s workspace record; ``workspace_evidence_id`` is set on flush."""
+        entry["workspace_evidence_id"] = None
+        self._items.append(
+            {
+                "kind": kind,
+                "claim_element_id": claim_element_id,
+                "title": title,
+                "content": "\n".join(str(line) for line in summary_lines if str(line).strip()).strip(),
+                "source": source,
+                "attachment_names": list(attachment_names),
+            }
+        )
+        self._entries.append(entry)
+        self._resume_keys.append(resume_key)
+        if len(self._items) >= _WORKSPACE_SAVE_BATCH_SIZE:
+            self.flush()
+        return entry
+
+    def flush(self) -> None:
+        if not self._items:
+            return
+        save_many = getattr(self.service, "save_evidence_many", None)
+        if callable(save_many):
+            saved = list(save_many(self.user_id, self._items).get("saved") or [])
+        else:
+            saved = [self.service.save_evidence(self.user_id, **item).get("saved") or {} for item in self._items]
+        for entry, record in zip(self._entries, saved):
+            entry["workspace_evidence_id"] = (record or {}).get("id")
+        if self.manifest_path is not None:
+            lines = "".join(
+                json.dumps({"key": key, "workspace_evidence_id": entry.get("workspace_evidence_id")}, sort_keys=True) + "\n"
+                for key, entry in zip(self._resume_keys, self._entries)
+                if key
+            )
+            with self.manifest_path.open("a", encoding="utf-8") as handle:
+                handle.write(lines)
+        self._items = []
+        self._entries = []
+        self._resume_keys = []
+
+
+def _load_import_manifest(manifest_path: Path) -> set[str]:
+    completed: set[str] = set()
+    try:
+        with manifest_path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    key = json.loads(line).get("key")
+                except (json.JSONDecodeError, AttributeError):
+                    continue
+                if key:
+                    completed.add(str(key))
+    except FileNotFoundError:
+        pass
+    return completed
+
+
+class _ImportProgress:
+    def __init__(self, callback: Optional[Callable[[dict[str, Any]], None]]) -> None:
+        self.callback = callback
+        self.started_at = time.perf_counter()
+        self.processed = 0
+        self.resumed = 0
+        self.bytes = 0
+
+    def advance(self, size: int, source: str) -> None:
+        self.processed += 1
+        self.bytes += max(0, int(size))
+        if self.callback is not None and self.processed % _PROGRESS_REPORT_INTERVAL == 0:
+            self.callback(self.snapshot(source))
+
+    def snapshot(self, source: str = "", *, done: bool = False) -> dict[str, Any]:
+        elapsed = max(time.perf_counter() - self.started_at, 1e-9)
+        return {
+            "done": done,
+            "current_source": source,
+            "processed_count": self.processed,
+            "resumed_skip_count": self.resumed,
+            "bytes_processed": self.bytes,
+            "elapsed_seconds": round(elapsed, 3),
+            "items_per_second": round(self.processed / elapsed, 2),
+            "bytes_per_second": round(self.bytes / elapsed, 2),
+        }
+
+
+class _ImportPipeline:
+    """Runs import tasks on a worker pool and commits results in submission order.
+
+    At most ``max_workers * 4`` tasks are in flight, so memory stays bounded
+    however large the archive is, and workspace evidence ids follow the same
+    deterministic order as a serial import.
+    """
+
+    def __init__(
+        self,
+        batch: _WorkspaceEvidenceBatch,
+        progress: _ImportProgress,
+        *,
+        max_workers: int,
+        completed_keys: set[str],
+    ) -> None:
+        self.batch = batch
+        self.progress = progress
+        self.completed_keys = completed_keys
+        self.imported: list[dict[str, Any]] = []
+        self._window = max(1, max_workers) * 4
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="local-evidence-import")
+        self._pending: deque[tuple[str, int, str, Future]] = deque()
+
+    def submit(self, resume_key: str, size: int, source: str, task: _ImportTask) -> None:
+        if resume_key in self.completed_keys:
+            self.progress.resumed += 1
+            return
+        self._pending.append((resume_key, size, source, self._executor.submit(task)))
+        while len(self._pending) > self._window:
+            self._collect_next()
+
+    def drain(self) -> None:
+        while self._pending:
+            self._collect_next()
+
+    def abandon(self) -> None:
+        """Cancel queued tasks and wait for running ones, discarding their results."""
+        pending = [future for _, _, _, future in self._pending]
+        self._pending.clear()
+        for future in pending:
+            future.cancel()
+        wait(pending)
+
+    def close(self) -> None:
+        self.abandon()
+        self._executor.shutdown(wait=True)
+
+    def _collect_next(self) -> None:
+        resume_key, size, source, future = self._pending.popleft()
+        entry, record = future.result()
+        self.imported.append(self.batch.add(entry, resume_key=resume_key, **record))
+        self.progress.advance(size, source)
 
 
 def _import_regular_file(
@@ -175,17 +368,15 @@ def _import_regular_file(
     original_resolved: Path,
     artifact_root: Path,
     index: int,
-    service: "ComplaintWorkspaceService",
-    user_id: str,
     claim_element_id: str,
     kind: str,
-) -> dict[str, Any]:
+) -> tuple[dict[str, Any], dict[str, Any]]:
     file_fragment = _slugify_fragment(original_resolved.name, fallback=f"artifact-{index}")
     artifact_dir = artifact_root / f"{index:04d}_{file_fragment}"
     artifact_dir.mkdir(parents=True, exist_ok=True)
 
     copied_path = artifact_dir / original_resolved.name
-    copied_path.write_bytes(original_resolved.read_bytes())
+    _copy_file(original_resolved, copied_path)
 
     media_type = mimetypes.guess_type(str(original_resolved))[0] or "application/octet-stream"
     preview_text = _extract_text_preview(original_resolved)
@@ -193,13 +384,14 @@ def _import_regular_file(
     suggested_claim_element_id, suggestion_scores = _suggest_claim_element_id(original_resolved.name, str(original_resolved), preview_text)
     effective_claim_element_id = suggested_claim_element_id if claim_element_id in {"auto", "suggested"} else claim_element_id
 
+    size = int(original_resolved.stat().st_size)
     metadata_payload = {
         "original_path": str(original_resolved),
         "copied_path": str(copied_path),
         "filename": original_resolved.name,
         "suffix": original_resolved.suffix.lower(),
         "media_type": media_type,
-        "size": int(original_resolved.stat().st_size),
+        "size": size,
         "preview_text": preview_text,
         "artifact_dir": str(artifact_dir),
         "import_strategy": "file_copy",
@@ -216,7 +408,7 @@ def _import_regular_file(
         f"File: {original_resolved.name}",
         f"Original path: {original_resolved}",
         f"Media type: {media_type}",
-        f"Size: {int(original_resolved.stat().st_size)} bytes",
+        f"Size: {size} bytes",
         f"Suggested claim element: {suggested_claim_element_id}",
         f"Saved claim element: {effective_claim_element_id}",
         f"Artifact directory: {artifact_dir}",
@@ -224,18 +416,7 @@ def _import_regular_file(
     if preview_text:
         summary_lines.extend(["", preview_text])
 
-    workspace_record = _save_workspace_artifact(
-        service=service,
-        user_id=user_id,
-        kind=kind,
-        claim_element_id=effective_claim_element_id,
-        title=f"Local import: {original_resolved.name}",
-        summary_lines=summary_lines,
-        source=f"local_artifact_import:{original_resolved}",
-        attachment_names=[copied_path.name, metadata_path.name],
-    )
-
-    return {
+    entry = {
         "original_path": str(original_resolved),
         "artifact_dir": str(artifact_dir),
         "copied_path": str(copied_path),
@@ -245,7 +426,90 @@ def _import_regular_file(
         "import_origin_label": "file",
         "suggested_claim_element_id": suggested_claim_element_id,
         "effective_claim_element_id": effective_claim_element_id,
-        "workspace_evidence_id": ((workspace_record.get("saved") or {}).get("id")),
+    }
+    return entry, {
+        "kind": kind,
+        "claim_element_id": effective_claim_element_id,
+        "title": f"Local import: {original_resolved.name}",
+        "summary_lines": summary_lines,
+        "source": f"local_artifact_import:{original_resolved}",
+        "attachment_names": [copied_path.name, metadata_path.name],
+    }
+
+
+def _import_zip_member(
+    *,
+    archive: zipfile.ZipFile,
+    member: zipfile.ZipInfo,
+    member_index: int,
+    archive_path: Path,
+    archive_copy_path: Path,
+    base_dir: Path,
+    claim_element_id: str,
+    kind: str,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    member_name = member.filename
+    member_fragment = _slugify_fragment(Path(member_name).name or member_name, fallback=f"member-{member_index}")
+    member_dir = base_dir / f"member-{member_index:04d}_{member_fragment}"
+    member_dir.mkdir(parents=True, exist_ok=True)
+    extracted_path = base_dir / "extracted" / member_name
+    extracted_path.parent.mkdir(parents=True, exist_ok=True)
+    with archive.open(member) as source, extracted_path.open("wb") as destination:
+        shutil.copyfileobj(source, destination)
+
+    media_type = mimetypes.guess_type(member_name)[0] or "application/octet-stream"
+    preview_text = _extract_text_preview(extracted_path)
+    suggested_claim_element_id, suggestion_scores = _suggest_claim_element_id(archive_path.name, member_name, preview_text)
+    effective_claim_element_id = suggested_claim_element_id if claim_element_id in {"auto", "suggested"} else claim_element_id
+    metadata_payload = {
+        "archive_path": str(archive_path),
+        "archive_copy_path": str(archive_copy_path),
+        "member_name": member_name,
+        "extracted_path": str(extracted_path),
+        "media_type": media_type,
+        "size": int(extracted_path.stat().st_size),
+        "preview_text": preview_text,
+        "artifact_dir": str(member_dir),
+        "import_strategy": "zip_member_extraction",
+        "import_origin_label": "zip_member",
+        "requested_claim_element_id": claim_element_id,
+        "effective_claim_element_id": effective_claim_element_id,
+        "suggested_claim_element_id": suggested_claim_element_id,
+        "suggested_claim_element_scores": suggestion_scores,
+    }
+    metadata_path = member_dir / "metadata.json"
+    _write_json(metadata_path, metadata_payload)
+
+    entry = {
+        "original_path": str(archive_path),
+        "archive_path": str(archive_path),
+        "archive_member": member_name,
+        "artifact_dir": str(member_dir),
+        "copied_path": str(extracted_path),
+        "filename": Path(member_name).name,
+        "media_type": media_type,
+        "preview_text": preview_text,
+        "import_origin_label": "zip_member",
+        "suggested_claim_element_id": suggested_claim_element_id,
+        "effective_claim_element_id": effective_claim_element_id,
+    }
+    return entry, {
+        "kind": kind,
+        "claim_element_id": effective_claim_element_id,
+        "title": f"Archive import: {archive_path.name} :: {member_name}",
+        "summary_lines": [
+            f"Archive: {archive_path}",
+            f"Archive copy: {archive_copy_path}",
+            f"Member: {member_name}",
+            f"Media type: {media_type}",
+            f"Suggested claim element: {suggested_claim_element_id}",
+            f"Saved claim element: {effective_claim_element_id}",
+            f"Artifact directory: {member_dir}",
+            "",
+            preview_text,
+        ],
+        "source": f"local_archive_import:{archive_path}!{member_name}",
+        "attachment_names": [archive_copy_path.name, extracted_path.name, metadata_path.name],
     }
 
 
@@ -254,89 +518,44 @@ def _import_zip_archive(
     archive_path: Path,
     artifact_root: Path,
     index: int,
-    service: "ComplaintWorkspaceService",
-    user_id: str,
+    pipeline: _ImportPipeline,
     claim_element_id: str,
     kind: str,
-) -> list[dict[str, Any]]:
-    imported: list[dict[str, Any]] = []
+    resume: bool = False,
+) -> None:
     archive_fragment = _slugify_fragment(archive_path.name, fallback=f"archive-{index}")
     base_dir = artifact_root / f"{index:04d}_{archive_fragment}"
     base_dir.mkdir(parents=True, exist_ok=True)
     archive_copy_path = base_dir / archive_path.name
-    archive_copy_path.write_bytes(archive_path.read_bytes())
+    _copy_file(archive_path, archive_copy_path, reuse_existing=resume)
+    fingerprint = _source_fingerprint(archive_path)
 
-    extracted_root = base_dir / "extracted"
     with zipfile.ZipFile(archive_path) as archive:
-        member_names = [name for name in archive.namelist() if not name.endswith("/")]
-        for member_index, member_name in enumerate(member_names, start=1):
-            member_fragment = _slugify_fragment(Path(member_name).name or member_name, fallback=f"member-{member_index}")
-            member_dir = base_dir / f"member-{member_index:04d}_{member_fragment}"
-            member_dir.mkdir(parents=True, exist_ok=True)
-            extracted_path = extracted_root / member_name
-            extracted_path.parent.mkdir(parents=True, exist_ok=True)
-            extracted_path.write_bytes(archive.read(member_name))
-
-            media_type = mimetypes.guess_type(member_name)[0] or "application/octet-stream"
-            preview_text = _extract_text_preview(extracted_path)
-            suggested_claim_element_id, suggestion_scores = _suggest_claim_element_id(archive_path.name, member_name, preview_text)
-            effective_claim_element_id = suggested_claim_element_id if claim_element_id in {"auto", "suggested"} else claim_element_id
-            metadata_payload = {
-                "archive_path": str(archive_path),
-                "archive_copy_path": str(archive_copy_path),
-                "member_name": member_name,
-                "extracted_path": str(extracted_path),
-                "media_type": media_type,
-                "size": int(extracted_path.stat().st_size),
-                "preview_text": preview_text,
-                "artifact_dir": str(member_dir),
-                "import_strategy": "zip_member_extraction",
-                "import_origin_label": "zip_member",
-                "requested_claim_element_id": claim_element_id,
-                "effective_claim_element_id": effective_claim_element_id,
-                "suggested_claim_element_id": suggested_claim_element_id,
-                "suggested_claim_element_scores": suggestion_scores,
-            }
-            metadata_path = member_dir / "metadata.json"
-            _write_json(metadata_path, metadata_payload)
-
-            workspace_record = _save_workspace_artifact(
-                service=service,
-                user_id=user_id,
-                kind=kind,
-                claim_element_id=effective_claim_element_id,
-                title=f"Archive import: {archive_path.name} :: {member_name}",
-                summary_lines=[
-                    f"Archive: {archive_path}",
-                    f"Archive copy: {archive_copy_path}",
-                    f"Member: {member_name}",
-                    f"Media type: {media_type}",
-                    f"Suggested claim element: {suggested_claim_element_id}",
-                    f"Saved claim element: {effective_claim_element_id}",
-                    f"Artifact directory: {member_dir}",
-                    "",
-                    preview_text,
-                ],
-                source=f"local_archive_import:{archive_path}!{member_name}",
-                attachment_names=[archive_copy_path.name, extracted_path.name, metadata_path.name],
-            )
-            imported.append(
-                {
-                    "original_path": str(archive_path),
-                    "archive_path": str(archive_path),
-                    "archive_member": member_name,
-                    "artifact_dir": str(member_dir),
-                    "copied_path": str(extracted_path),
-                    "filename": Path(member_name).name,
-                    "media_type": media_type,
-                    "preview_text": preview_text,
-                    "import_origin_label": "zip_member",
-                    "suggested_claim_element_id": suggested_claim_element_id,
-                    "effective_claim_element_id": effective_claim_element_id,
-                    "workspace_evidence_id": ((workspace_record.get("saved") or {}).get("id")),
-                }
-            )
-    return imported
+        members = (info for info in archive.infolist() if not info.filename.endswith("/"))
+        try:
+            for member_index, member in enumerate(members, start=1):
+                pipeline.submit(
+                    f"zip:{fingerprint}!{member.filename}",
+                    member.file_size,
+                    f"{archive_path}!{member.filename}",
+                    partial(
+                        _import_zip_member,
+                        archive=archive,
+                        member=member,
+                        member_index=member_index,
+                        archive_path=archive_path,
+                        archive_copy_path=archive_copy_path,
+                        base_dir=base_dir,
+                        claim_element_id=claim_element_id,
+                        kind=kind,
+                    ),
+                )
+            pipeline.drain()
+        except BaseException:
+            # Members read from the open archive; none may still be running
+            # when it closes.
+            pipeline.abandon()
+            raise
 
 
 def _message_bytes(message: mailbox.mboxMessage) -> bytes:
@@ -346,96 +565,128 @@ def _message_bytes(message: mailbox.mboxMessage) -> bytes:
     return buffer.getvalue()
 
 
+def _import_mbox_message(
+    *,
+    raw_message: bytes,
+    message_index: int,
+    archive_path: Path,
+    archive_copy_path: Path,
+    base_dir: Path,
+    claim_element_id: str,
+    kind: str,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    message = mailbox.mboxMessage(raw_message)
+    subject = str(message.get("subject") or "Untitled email").strip()
+    sender = str(message.get("from") or "").strip()
+    recipient = str(message.get("to") or "").strip()
+    body_text = message.get_payload()
+    if isinstance(body_text, list):
+        body_text = "\n".join(str(part.get_payload(decode=False) or "") for part in body_text)
+    body_text = str(body_text or "").strip()[:4000]
+
+    message_fragment = _slugify_fragment(subject, fallback=f"message-{message_index}")
+    message_dir = base_dir / f"message-{message_index:04d}_{message_fragment}"
+    message_dir.mkdir(parents=True, exist_ok=True)
+    eml_path = message_dir / "message.eml"
+    eml_path.write_bytes(_message_bytes(message))
+
+    suggested_claim_element_id, suggestion_scores = _suggest_claim_element_id(archive_path.name, subject, sender, recipient, body_text)
+    effective_claim_element_id = suggested_claim_element_id if claim_element_id in {"auto", "suggested"} else claim_element_id
+    metadata_payload = {
+        "archive_path": str(archive_path),
+        "archive_copy_path": str(archive_copy_path),
+        "subject": subject,
+        "from": sender,
+        "to": recipient,
+        "artifact_dir": str(message_dir),
+        "eml_path": str(eml_path),
+        "preview_text": body_text,
+        "import_strategy": "mbox_message_extraction",
+        "import_origin_label": "mbox_message",
+        "requested_claim_element_id": claim_element_id,
+        "effective_claim_element_id": effective_claim_element_id,
+        "suggested_claim_element_id": suggested_claim_element_id,
+        "suggested_claim_element_scores": suggestion_scores,
+    }
+    metadata_path = message_dir / "metadata.json"
+    _write_json(metadata_path, metadata_payload)
+
+    entry = {
+        "original_path": str(archive_path),
+        "archive_path": str(archive_path),
+        "artifact_dir": str(message_dir),
+        "copied_path": str(eml_path),
+        "filename": eml_path.name,
+        "media_type": "message/rfc822",
+        "preview_text": body_text,
+        "import_origin_label": "mbox_message",
+        "suggested_claim_element_id": suggested_claim_element_id,
+        "effective_claim_element_id": effective_claim_element_id,
+    }
+    return entry, {
+        "kind": kind,
+        "claim_element_id": effective_claim_element_id,
+        "title": f"Mailbox import: {subject}",
+        "summary_lines": [
+            f"Mailbox: {archive_path}",
+            f"Archive copy: {archive_copy_path}",
+            f"From: {sender}",
+            f"To: {recipient}",
+            f"Suggested claim element: {suggested_claim_element_id}",
+            f"Saved claim element: {effective_claim_element_id}",
+            f"Artifact directory: {message_dir}",
+            "",
+            body_text,
+        ],
+        "source": f"local_mbox_import:{archive_path}",
+        "attachment_names": [archive_copy_path.name, eml_path.name, metadata_path.name],
+    }
+
+
 def _import_mbox_archive(
     *,
     archive_path: Path,
     artifact_root: Path,
     index: int,
-    service: "ComplaintWorkspaceService",
-    user_id: str,
+    pipeline: _ImportPipeline,
     claim_element_id: str,
     kind: str,
-) -> list[dict[str, Any]]:
-    imported: list[dict[str, Any]] = []
+    resume: bool = False,
+) -> None:
     archive_fragment = _slugify_fragment(archive_path.name, fallback=f"mbox-{index}")
     base_dir = artifact_root / f"{index:04d}_{archive_fragment}"
     base_dir.mkdir(parents=True, exist_ok=True)
     archive_copy_path = base_dir / archive_path.name
-    archive_copy_path.write_bytes(archive_path.read_bytes())
-
-    message_box = mailbox.mbox(str(archive_path))
-    for message_index, message in enumerate(message_box, start=1):
-        subject = str(message.get("subject") or "Untitled email").strip()
-        sender = str(message.get("from") or "").strip()
-        recipient = str(message.get("to") or "").strip()
-        body_text = message.get_payload()
-        if isinstance(body_text, list):
-            body_text = "\n".join(str(part.get_payload(decode=False) or "") for part in body_text)
-        body_text = str(body_text or "").strip()[:4000]
-
-        message_fragment = _slugify_fragment(subject, fallback=f"message-{message_index}")
-        message_dir = base_dir / f"message-{message_index:04d}_{message_fragment}"
-        message_dir.mkdir(parents=True, exist_ok=True)
-        eml_path = message_dir / "message.eml"
-        eml_path.write_bytes(_message_bytes(message))
-
-        suggested_claim_element_id, suggestion_scores = _suggest_claim_element_id(archive_path.name, subject, sender, recipient, body_text)
-        effective_claim_element_id = suggested_claim_element_id if claim_element_id in {"auto", "suggested"} else claim_element_id
-        metadata_payload = {
-            "archive_path": str(archive_path),
-            "archive_copy_path": str(archive_copy_path),
-            "subject": subject,
-            "from": sender,
-            "to": recipient,
-            "artifact_dir": str(message_dir),
-            "eml_path": str(eml_path),
-            "preview_text": body_text,
-            "import_strategy": "mbox_message_extraction",
-            "import_origin_label": "mbox_message",
-            "requested_claim_element_id": claim_element_id,
-            "effective_claim_element_id": effective_claim_element_id,
-            "suggested_claim_element_id": suggested_claim_element_id,
-            "suggested_claim_element_scores": suggestion_scores,
-        }
-        metadata_path = message_dir / "metadata.json"
-        _write_json(metadata_path, metadata_payload)
-
-        workspace_record = _save_workspace_artifact(
-            service=service,
-            user_id=user_id,
-            kind=kind,
-            claim_element_id=effective_claim_element_id,
-            title=f"Mailbox import: {subject}",
-            summary_lines=[
-                f"Mailbox: {archive_path}",
-                f"Archive copy: {archive_copy_path}",
-                f"From: {sender}",
-                f"To: {recipient}",
-                f"Suggested claim element: {suggested_claim_element_id}",
-                f"Saved claim element: {effective_claim_element_id}",
-                f"Artifact directory: {message_dir}",
-                "",
-                body_text,
-            ],
-            source=f"local_mbox_import:{archive_path}",
-            attachment_names=[archive_copy_path.name, eml_path.name, metadata_path.name],
-        )
-        imported.append(
-            {
-                "original_path": str(archive_path),
-                "archive_path": str(archive_path),
-                "artifact_dir": str(message_dir),
-                "copied_path": str(eml_path),
-                "filename": eml_path.name,
-                "media_type": "message/rfc822",
-                "preview_text": body_text,
-                "import_origin_label": "mbox_message",
-                "suggested_claim_element_id": suggested_claim_element_id,
-                "effective_claim_element_id": effective_claim_element_id,
-                "workspace_evidence_id": ((workspace_record.get("saved") or {}).get("id")),
-            }
-        )
-    return imported
+    _copy_file(archive_path, archive_copy_path, reuse_existing=resume)
+    fingerprint = _source_fingerprint(archive_path)
+
+    # The mailbox only keeps a table of message offsets; each message's bytes
+    # are read here and parsed on a worker.
+    message_box = mailbox.mbox(str(archive_path), create=False)
+    try:
+        for message_index, key in enumerate(message_box.iterkeys(), start=1):
+            resume_key = f"mbox:{fingerprint}#{message_index}"
+            if resume_key in pipeline.completed_keys:
+                pipeline.progress.resumed += 1
+                continue
+            raw_message = message_box.get_bytes(key)
+            pipeline.submit(
+                resume_key,
+                len(raw_message),
+                f"{archive_path}#{message_index}",
+                partial(
+                    _import_mbox_message,
+                    raw_message=raw_message,
+                    message_index=message_index,
+                    archive_path=archive_path,
+                    archive_copy_path=archive_copy_path,
+                    base_dir=base_dir,
+                    claim_element_id=claim_element_id,
+                    kind=kind,
+                ),
+            )
+    finally:
+        message_box.close()
 
 
 def _import_pst_container(
@@ -443,17 +694,13 @@ def _import_pst_container(
     archive_path: Path,
     artifact_root: Path,
     index: int,
-    service: "ComplaintWorkspaceService",
-    user_id: str,
     claim_element_id: str,
     kind: str,
-) -> dict[str, Any]:
-    container_import = _import_regular_file(
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    container_import, record = _import_regular_file(
         original_resolved=archive_path,
         artifact_root=artifact_root,
         index=index,
-        service=service,
-        user_id=user_id,
         claim_element_id=claim_element_id,
         kind=kind,
     )
@@ -464,7 +711,7 @@ def _import_pst_container(
     metadata_payload["import_origin_label"] = "pst_container"
     _write_json(metadata_path, metadata_payload)
     container_import["import_origin_label"] = "pst_container"
-    return container_import
+    return container_import, record
 
 
 def import_local_evidence(
@@ -476,7 +723,21 @@ def import_local_evidence(
     workspace_root: str | Path = ".complaint_workspace/sessions",
     evidence_root: str | Path | None = None,
     service: "ComplaintWorkspaceService" | None = None,
+    max_workers: Optional[int] = None,
+    resume: bool = False,
+    progress_callback: Optional[Callable[[dict[str, Any]], None]] = None,
 ) -> dict[str, Any]:
+    """Import local files, directories, zip archives and mailboxes as workspace evidence.
+
+    Directories and archives are streamed: files are copied in chunks, archive
+    members and mbox messages are produced lazily and parsed on
+    ``max_workers`` threads, and workspace records are committed in batches.
+    With ``resume=True`` every committed unit is recorded in
+    ``import_manifest.jsonl`` under the user's import directory and units
+    already recorded there are skipped, so an interrupted import can be
+    re-run with ``resume=True`` to pick up where it stopped. When given,
+    ``progress_callback`` receives throughput snapshots as the import runs.
+    """
     normalized_paths = _normalize_paths(paths)
     if not normalized_paths:
         raise ValueError("At least one local file or directory path is required")
@@ -490,74 +751,74 @@ def import_local_evidence(
 
     artifact_root = evidence_root_path / _slugify_fragment(user_id, fallback="anonymous-user") / "local-import"
     artifact_root.mkdir(parents=True, exist_ok=True)
-
-    resolved_files = _iter_files(normalized_paths)
-    imported: list[dict[str, Any]] = []
+    manifest_path = artifact_root / _IMPORT_MANIFEST_NAME
+
+    progress = _ImportProgress(progress_callback)
+    batch = _WorkspaceEvidenceBatch(service, user_id, manifest_path=manifest_path if resume else None)
+    pipeline = _ImportPipeline(
+        batch,
+        progress,
+        max_workers=max_workers or min(8, (os.cpu_count() or 1) + 4),
+        completed_keys=_load_import_manifest(manifest_path) if resume else set(),
+    )
     skipped: list[dict[str, Any]] = []
+    scanned_file_count = 0
 
-    for index, original_path in enumerate(resolved_files, start=1):
-        try:
-            original_resolved = original_path.resolve()
-        except Exception:
-            skipped.append({"path": str(original_path), "reason": "path could not be resolved"})
-            continue
-        if not original_resolved.exists() or not original_resolved.is_file():
-            skipped.append({"path": str(original_path), "reason": "file not found"})
-            continue
-
-        suffix = original_resolved.suffix.lower()
-        if suffix == ".zip":
-            imported.extend(
-                _import_zip_archive(
-                    archive_path=original_resolved,
-                    artifact_root=artifact_root,
-                    index=index,
-                    service=service,
-                    user_id=user_id,
-                    claim_element_id=claim_element_id,
-                    kind=kind,
-                )
-            )
-            continue
-        if suffix in {".mbox", ".mbx"}:
-            imported.extend(
-                _import_mbox_archive(
-                    archive_path=original_resolved,
-                    artifact_root=artifact_root,
-                    index=index,
-                    service=service,
-                    user_id=user_id,
-                    claim_element_id=claim_element_id,
-                    kind=kind,
-                )
-            )
-            continue
-        if suffix == ".pst":
-            imported.append(
-                _import_pst_container(
-                    archive_path=original_resolved,
-                    artifact_root=artifact_root,
-                    index=index,
-                    service=service,
-                    user_id=user_id,
-                    claim_element_id=claim_element_id,
-                    kind=kind,
-                )
-            )
-            continue
-
-        imported.append(
-            _import_regular_file(
-                original_resolved=original_resolved,
-                artifact_root=artifact_root,
-                index=index,
-                service=service,
-                user_id=user_id,
-                claim_element_id=claim_element_id,
-                kind=kind,
+    try:
+        for index, original_path in enumerate(_iter_files(normalized_paths), start=1):
+            scanned_file_count += 1
+            try:
+                original_resolved = original_path.resolve()
+            except Exception:
+                skipped.append({"path": str(original_path), "reason": "path could not be resolved"})
+                continue
+            if not original_resolved.exists() or not original_resolved.is_file():
+                skipped.append({"path": str(original_path), "reason": "file not found"})
+                continue
+
+            suffix = original_resolved.suffix.lower()
+            archive_options = {
+                "archive_path": original_resolved,
+                "artifact_root": artifact_root,
+                "index": index,
+                "pipeline": pipeline,
+                "claim_element_id": claim_element_id,
+                "kind": kind,
+                "resume": resume,
+            }
+            if suffix == ".zip":
+                _import_zip_archive(**archive_options)
+                continue
+            if suffix in {".mbox", ".mbx"}:
+                _import_mbox_archive(**archive_options)
+                continue
+
+            file_options = {
+                "artifact_root": artifact_root,
+                "index": index,
+                "claim_element_id": claim_element_id,
+                "kind": kind,
+            }
+            if suffix == ".pst":
+                task = partial(_import_pst_container, archive_path=original_resolved, **file_options)
+            else:
+                task = partial(_import_regular_file, original_resolved=original_resolved, **file_options)
+            pipeline.submit(
+                f"file:{_source_fingerprint(original_resolved)}",
+                original_resolved.stat().st_size,
+                str(original_resolved),
+                task,
             )
-        )
-
+        pipeline.drain()
+    finally:
+        pipeline.close()
+        # Commit whatever finished so a resumable run can pick up here.
+        batch.flush()
+
+    imported = pipeline.imported
+    throughput = progress.snapshot(done=True)
+    if progress_callback is not None:
+        progress_callback(throughput)
     return {
         "status": "success",
         "user_id": user_id,
@@ -566,11 +827,13 @@ def import_local_evidence(
         "workspace_root": str(workspace_root_path),
         "evidence_root": str(evidence_root_path),
         "requested_paths": [str(path) for path in normalized_paths],
-        "scanned_file_count": len(resolved_files),
+        "scanned_file_count": scanned_file_count,
         "imported_count": len(imported),
         "skipped_count": len(skipped),
+        "resumed_skip_count": progress.resumed,
         "imported": imported,
         "skipped": skipped,
+        "throughput": throughput,
     }
 
 
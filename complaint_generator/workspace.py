@@ -178,6 +178,8 @@ def import_local_evidence(
     evidence_root: Optional[str | Path] = None,
     service: Optional[ComplaintWorkspaceService] = None,
     root_dir: Optional[str | Path] = None,
+    max_workers: Optional[int] = None,
+    resume: bool = False,
 ) -> dict[str, Any]:
     return _resolve_service(service, root_dir=root_dir).import_local_evidence(
         user_id,
@@ -185,6 +187,8 @@ def import_local_evidence(
         claim_element_id=claim_element_id,
         kind=kind,
         evidence_root=str(evidence_root) if evidence_root is not None else None,
+        max_workers=max_workers,
+        resume=resume,
     )
 
 
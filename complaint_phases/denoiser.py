@@ -8,7 +8,8 @@ noise/ambiguity in the complaint information.
 import hashlib
 import logging
 import re
-from typing import Dict, List, Any, Optional, Tuple, Set
+from contextlib import contextmanager
+from typing import Dict, List, Any, Iterator, Optional, Tuple, Set
 import os
 import random
 from .knowledge_graph import KnowledgeGraph, Entity, Relationship
@@ -65,6 +66,15 @@ class ComplaintDenoiser:
         self._type_gain_ema: Dict[str, float] = {}
         self._recent_gains: List[float] = []
 
+        # Normalized asked-question texts and per-type counts, extended as
+        # ``questions_asked`` grows instead of rescanned per lookup.
+        self._asked_index: Dict[str, Any] = {'source': None, 'size': 0, 'texts': set(), 'type_counts': {}}
+
+        # Turn-scoped question-candidate snapshot (see ``question_turn``).
+        self._question_turn_depth = 0
+        self._candidate_snapshot: Optional[Tuple[Tuple[Any, ...], List[Dict[str, Any]]]] = None
+        self._candidate_snapshot_stats = {'collections': 0, 'reuses': 0}
+
 
     def _env_bool(self, key: str, default: bool) -> bool:
         raw = os.getenv(key)
@@ -949,32 +959,17 @@ class ComplaintDenoiser:
 
 
     def _find_entity(self, knowledge_graph: KnowledgeGraph, etype: str, name: str) -> Optional[Entity]:
-        etype_norm = (etype or "").strip().lower()
-        name_norm = (name or "").strip().lower()
-        if not etype_norm or not name_norm:
+        if not (etype or "").strip() or not (name or "").strip():
             return None
-        for entity in knowledge_graph.entities.values():
-            if entity.type.lower() == etype_norm and entity.name.strip().lower() == name_norm:
-                return entity
-        return None
+        return knowledge_graph.find_entity(etype, name)
 
 
     def _next_entity_id(self, knowledge_graph: KnowledgeGraph) -> str:
-        max_id = 0
-        for entity_id in knowledge_graph.entities.keys():
-            match = re.match(r"entity_(\d+)$", str(entity_id))
-            if match:
-                max_id = max(max_id, int(match.group(1)))
-        return f"entity_{max_id + 1}"
+        return knowledge_graph.next_entity_id('entity')
 
 
     def _next_relationship_id(self, knowledge_graph: KnowledgeGraph) -> str:
-        max_id = 0
-        for rel_id in knowledge_graph.relationships.keys():
-            match = re.match(r"rel_(\d+)$", str(rel_id))
-            if match:
-                max_id = max(max_id, int(match.group(1)))
-        return f"rel_{max_id + 1}"
+        return knowledge_graph.next_relationship_id('rel')
 
 
     def _add_entity_if_missing(self,
@@ -1006,8 +1001,8 @@ class ComplaintDenoiser:
                                     confidence: float) -> Tuple[Optional[Relationship], bool]:
         if not (source_id and target_id and relation_type):
             return None, False
-        for rel in knowledge_graph.relationships.values():
-            if rel.source_id == source_id and rel.target_id == target_id and rel.relation_type == relation_type:
+        for rel in knowledge_graph.get_relationships_for_entity(source_id, direction='outgoing'):
+            if rel.target_id == target_id and rel.relation_type == relation_type:
                 return rel, False
         relationship = Relationship(
             id=self._next_relationship_id(knowledge_graph),
@@ -1126,17 +1121,29 @@ class ComplaintDenoiser:
     def _normalize_question_text(self, text: str) -> str:
         return (text or "").strip().lower()
 
-    def _already_asked(self, question_text: str) -> bool:
-        norm = self._normalize_question_text(question_text)
-        for item in self.questions_asked:
+    def _asked_history_index(self) -> Dict[str, Any]:
+        """Return normalized asked texts and per-type counts for ``questions_asked``."""
+        index = self._asked_index
+        asked = self.questions_asked
+        if index['source'] is not asked or index['size'] > len(asked):
+            index = {'source': asked, 'size': 0, 'texts': set(), 'type_counts': {}}
+            self._asked_index = index
+        for item in asked[index['size']:]:
+            if not isinstance(item, dict):
+                continue
             q = item.get('question') or {}
             if isinstance(q, dict):
-                asked_text = q.get('question', '')
+                index['texts'].add(self._normalize_question_text(q.get('question', '')))
             else:
-                asked_text = str(q)
-            if self._normalize_question_text(asked_text) == norm:
-                return True
-        return False
+                index['texts'].add(self._normalize_question_text(str(q)))
+            if isinstance(item.get('question'), dict):
+                qtype = str(item['question'].get('type') or '').strip().lower()
+                index['type_counts'][qtype] = index['type_counts'].get(qtype, 0) + 1
+        index['size'] = len(asked)
+        return index
+
+    def _already_asked(self, question_text: str) -> bool:
+        return self._normalize_question_text(question_text) in self._asked_history_index()['texts']
 
     def _with_empathy(self, question_text: str, question_type: str) -> str:
         # Keep this lightweight so we improve tone without bloating prompts.
@@ -2381,6 +2388,31 @@ class ComplaintDenoiser:
 
         return questions[:max_questions]
 
+    @contextmanager
+    def question_turn(self) -> Iterator['ComplaintDenoiser']:
+        """
+        Share one question-candidate collection across a denoising turn.
+
+        Inside the turn, ``collect_question_candidates`` (and therefore
+        ``generate_questions``) reuses the first collection made for the same
+        graphs, graph revisions, case file, question budget and asked-question
+        history. Callers get their own copies of the candidate dicts. The
+        snapshot is dropped when the outermost turn exits, because entity
+        attributes can be edited in place between turns without bumping the
+        graph revision.
+        """
+        self._question_turn_depth += 1
+        try:
+            yield self
+        finally:
+            self._question_turn_depth -= 1
+            if self._question_turn_depth == 0:
+                self._candidate_snapshot = None
+
+    def get_candidate_snapshot_stats(self) -> Dict[str, int]:
+        """Return how many candidate collections ran and how many were reused."""
+        return dict(self._candidate_snapshot_stats)
+
     def collect_question_candidates(
         self,
         knowledge_graph: KnowledgeGraph,
@@ -2389,6 +2421,45 @@ class ComplaintDenoiser:
         intake_case_file: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         """Collect ranked question candidates before final rendering/exploration."""
+        if not self._question_turn_depth:
+            self._candidate_snapshot_stats['collections'] += 1
+            return self._collect_question_candidates(
+                knowledge_graph,
+                dependency_graph,
+                max_questions=max_questions,
+                intake_case_file=intake_case_file,
+            )
+        snapshot_key = (
+            id(knowledge_graph),
+            getattr(knowledge_graph, 'revision', None),
+            id(dependency_graph),
+            getattr(dependency_graph, 'revision', None),
+            id(intake_case_file),
+            max_questions,
+            len(self.questions_asked),
+        )
+        if self._candidate_snapshot is not None and self._candidate_snapshot[0] == snapshot_key:
+            self._candidate_snapshot_stats['reuses'] += 1
+        else:
+            self._candidate_snapshot_stats['collections'] += 1
+            self._candidate_snapshot = (
+                snapshot_key,
+                self._collect_question_candidates(
+                    knowledge_graph,
+                    dependency_graph,
+                    max_questions=max_questions,
+                    intake_case_file=intake_case_file,
+                ),
+            )
+        return [dict(candidate) for candidate in self._candidate_snapshot[1]]
+
+    def _collect_question_candidates(
+        self,
+        knowledge_graph: KnowledgeGraph,
+        dependency_graph: DependencyGraph,
+        max_questions: int = 10,
+        intake_case_file: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
         questions: List[Dict[str, Any]] = []
 
         contradiction_questions = self._build_contradiction_questions(dependency_graph, max_questions)
@@ -2637,13 +2708,7 @@ class ComplaintDenoiser:
         score += float(self.question_quality_weight) * float(self._question_quality_bonus_candidate(candidate))
         score += float(self.empathy_weight) * float(self._empathy_bonus_candidate(candidate))
 
-        asked_count_for_type = sum(
-            1
-            for asked in self.questions_asked
-            if isinstance(asked, dict)
-            and isinstance(asked.get('question'), dict)
-            and str(asked.get('question', {}).get('type') or '').strip().lower() == qtype
-        )
+        asked_count_for_type = self._asked_history_index()['type_counts'].get(qtype, 0)
         if asked_count_for_type == 0:
             score += 0.75
         elif asked_count_for_type >= 3:
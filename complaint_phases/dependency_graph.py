@@ -8,7 +8,8 @@ Used to ensure all elements of a claim are properly supported.
 import json
 import logging
 import re
-from typing import Dict, List, Optional, Any
+import weakref
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, UTC
 from enum import Enum
@@ -42,6 +43,42 @@ def _utc_now_isoformat() -> str:
     return datetime.now(UTC).isoformat()
 
 
+def _read_only(self, *args: Any, **kwargs: Any) -> None:
+    raise TypeError(f"cached readiness data is read-only; copy.deepcopy() it to edit ({type(self).__name__})")
+
+
+class _FrozenDict(dict):
+    """Read-only dict nested inside cached readiness records."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # Copies and pickles come back as ordinary, editable dicts.
+        return (dict, (dict(self),))
+
+
+class _FrozenList(list):
+    """Read-only list nested inside cached readiness records."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def _freeze(value: Any) -> Any:
+    """Return ``value`` with every nested dict and list made read-only."""
+    if isinstance(value, dict):
+        return _FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return _FrozenList(_freeze(item) for item in value)
+    return value
+
+
 class NodeType(Enum):
     """Types of nodes in the dependency graph."""
     CLAIM = "claim"
@@ -63,9 +100,119 @@ class DependencyType(Enum):
     OVERLAPS = "overlaps"
 
 
+class _TrackedAttributes(dict):
+    """``attributes`` dict of a node that belongs to a graph.
+
+    Writes through the dict's own methods (``node.attributes['key'] = ...``,
+    ``update``, ``pop`` and so on) invalidate the owning graphs like a field
+    reassignment does. Edits inside nested values are not seen; reassign the
+    key (or ``attributes`` itself) after changing one.
+    """
+
+    __slots__ = ('_node',)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._node = None
+
+    @classmethod
+    def bound_to(cls, node: '_GraphTracked', value: Dict[str, Any]) -> '_TrackedAttributes':
+        if isinstance(value, cls) and value._node is node:
+            return value
+        tracked = cls(value)
+        tracked._node = node
+        return tracked
+
+    def __reduce__(self):
+        # Copies and pickles are plain dicts until a graph binds them again.
+        return (dict, (dict(self),))
+
+    def _changed(self) -> None:
+        if self._node is not None:
+            self._node._notify_owners('attributes', self)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other: Any) -> '_TrackedAttributes':
+        super().update(other)
+        self._changed()
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        super().__setitem__(key, default)
+        self._changed()
+        return default
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        present = key in self
+        value = super().pop(key, *default)
+        if present:
+            self._changed()
+        return value
+
+    def popitem(self) -> Tuple[Any, Any]:
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+
+class _GraphTracked:
+    """Notify owning graphs when a tracked dataclass field is reassigned.
+
+    Graphs register themselves in ``_owners`` on insertion so in-place edits
+    such as ``node.satisfied = True`` invalidate cached readiness without the
+    caller having to go through a graph method. A bound node's
+    ``attributes`` is a :class:`_TrackedAttributes`, so writing one key also
+    counts.
+    """
+
+    _tracked_fields: frozenset = frozenset()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        owners = self.__dict__.get('_owners')
+        if not owners or name not in self._tracked_fields:
+            object.__setattr__(self, name, value)
+            return
+        if name == 'attributes' and isinstance(value, dict):
+            value = _TrackedAttributes.bound_to(self, value)
+        previous = self.__dict__.get(name)
+        object.__setattr__(self, name, value)
+        # ``attributes`` is commonly mutated in place and then reassigned, so
+        # any reassignment counts as a change.
+        if name == 'attributes' or previous != value:
+            self._notify_owners(name, previous)
+
+    def _notify_owners(self, name: str, previous: Any) -> None:
+        for graph in list(self.__dict__.get('_owners') or ()):
+            graph._on_tracked_change(self, name, previous)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        state.pop('_owners', None)
+        return state
+
+
 @dataclass
-class DependencyNode:
+class DependencyNode(_GraphTracked):
     """Represents a node in the dependency graph."""
+    _tracked_fields = frozenset({'node_type', 'name', 'description', 'satisfied', 'confidence', 'attributes'})
+
     id: str
     node_type: NodeType
     name: str
@@ -77,12 +224,15 @@ class DependencyNode:
     def to_dict(self) -> dict:
         data = asdict(self)
         data['node_type'] = self.node_type.value
+        data['attributes'] = dict(data['attributes'])
         return data
 
 
 @dataclass
-class Dependency:
+class Dependency(_GraphTracked):
     """Represents a dependency edge in the graph."""
+    _tracked_fields = frozenset({'source_id', 'target_id', 'dependency_type', 'required'})
+
     id: str
     source_id: str
     target_id: str
@@ -112,10 +262,170 @@ class DependencyGraph:
             'last_updated': _utc_now_isoformat(),
             'version': '1.0'
         }
-    
+        self._revision = 0
+        self._readiness_stats: Dict[str, int] = {}
+        self.reset_readiness_cache_stats()
+        self._reset_indexes()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # Copied/unpickled nodes do not carry owner references; re-register.
+        self.__dict__.update(state)
+        for node in self.nodes.values():
+            self._bind(node)
+        for dep in self.dependencies.values():
+            self._bind(dep)
+
+    def _reset_indexes(self) -> None:
+        """Clear the adjacency, type and name indexes and the readiness caches."""
+        # Each index maps a key to an insertion-ordered dict of ids so lookups
+        # stay O(degree) while preserving the order of ``self.dependencies``.
+        self._outgoing_index: Dict[str, Dict[str, None]] = {}
+        self._incoming_index: Dict[str, Dict[str, None]] = {}
+        self._type_index: Dict[NodeType, Dict[str, None]] = {}
+        self._name_index: Dict[Tuple[NodeType, str], Dict[str, None]] = {}
+        self._node_order: Dict[str, int] = {}
+        self._node_sequence = 0
+        self._dependency_order: Dict[str, int] = {}
+        self._dependency_sequence = 0
+        # Incremental readiness: per-node check_satisfaction results and
+        # per-claim readiness records, recomputed only when dirty.
+        self._satisfaction_cache: Dict[str, Dict[str, Any]] = {}
+        self._unsatisfied_node_ids: set = set()
+        self._claim_readiness_cache: Dict[str, Dict[str, Any]] = {}
+        self._dirty_satisfaction: set = set()
+        self._dirty_readiness: set = set()
+
+    def rebuild_indexes(self) -> None:
+        """Rebuild all lookup indexes from ``nodes`` and ``dependencies``.
+
+        Only needed when the underlying dicts were mutated directly instead of
+        through ``add_*``/``remove_*``. Every cached satisfaction and
+        readiness result is invalidated.
+        """
+        self._reset_indexes()
+        for node_id, node in self.nodes.items():
+            self._bind(node)
+            self._index_node(node_id, node)
+        for dep_id, dep in self.dependencies.items():
+            self._bind(dep)
+            self._index_dependency(dep_id, dep)
+        for node_id in self.nodes:
+            self._mark_dirty(node_id)
+
+    def _bind(self, item: _GraphTracked) -> None:
+        owners = item.__dict__.get('_owners')
+        if owners is None:
+            owners = weakref.WeakSet()
+            item.__dict__['_owners'] = owners
+        owners.add(self)
+        attributes = item.__dict__.get('attributes')
+        if isinstance(attributes, dict):
+            item.__dict__['attributes'] = _TrackedAttributes.bound_to(item, attributes)
+
+    def _unbind(self, item: _GraphTracked) -> None:
+        owners = item.__dict__.get('_owners')
+        if owners is not None:
+            owners.discard(self)
+
+    def _on_tracked_change(self, item: _GraphTracked, field_name: str, previous: Any) -> None:
+        """Keep indexes and readiness caches in sync with an in-place edit."""
+        if isinstance(item, DependencyNode):
+            if self.nodes.get(item.id) is not item:
+                return
+            if field_name in ('node_type', 'name'):
+                old_type = previous if field_name == 'node_type' else item.node_type
+                old_name = previous if field_name == 'name' else item.name
+                self._unindex_node(item.id, old_type, old_name)
+                self._index_node(item.id, item)
+                if field_name == 'node_type':
+                    self._claim_readiness_cache.pop(item.id, None)
+                    self._dirty_readiness.discard(item.id)
+            self._mark_downstream_dirty(item.id)
+        elif isinstance(item, Dependency):
+            if self.dependencies.get(item.id) is not item:
+                return
+            if field_name in ('source_id', 'target_id'):
+                old_source = previous if field_name == 'source_id' else item.source_id
+                old_target = previous if field_name == 'target_id' else item.target_id
+                self._unindex_dependency(item.id, old_source, old_target, keep_order=True)
+                self._index_dependency(item.id, item)
+                self._mark_dirty(old_target)
+            self._mark_dirty(item.target_id)
+        self._update_metadata()
+
+    def _mark_dirty(self, node_id: str) -> None:
+        self._readiness_stats['invalidations'] += 1
+        self._dirty_satisfaction.add(node_id)
+        node = self.nodes.get(node_id)
+        if node is not None and node.node_type == NodeType.CLAIM:
+            self._dirty_readiness.add(node_id)
+
+    def _mark_downstream_dirty(self, node_id: str) -> None:
+        """Invalidate a node and every node that lists it as a requirement."""
+        # Satisfaction only looks at direct sources' ``satisfied`` flags, so
+        # a change never propagates further than one hop.
+        self._mark_dirty(node_id)
+        for dep_id in self._outgoing_index.get(node_id, {}):
+            self._mark_dirty(self.dependencies[dep_id].target_id)
+
+    @staticmethod
+    def _normalize_name(value: Any) -> str:
+        return str(value or '').strip().lower()
+
+    def _index_node(self, node_id: str, node: DependencyNode) -> None:
+        if node_id not in self._node_order:
+            self._node_sequence += 1
+            self._node_order[node_id] = self._node_sequence
+        self._type_index.setdefault(node.node_type, {})[node_id] = None
+        name_key = (node.node_type, self._normalize_name(node.name))
+        self._name_index.setdefault(name_key, {})[node_id] = None
+
+    def _unindex_node(self, node_id: str, node_type: NodeType, name: str) -> None:
+        for index, key in (
+            (self._type_index, node_type),
+            (self._name_index, (node_type, self._normalize_name(name))),
+        ):
+            bucket = index.get(key)
+            if bucket is None:
+                continue
+            bucket.pop(node_id, None)
+            if not bucket:
+                del index[key]
+
+    def _index_dependency(self, dep_id: str, dep: Dependency) -> None:
+        if dep_id not in self._dependency_order:
+            self._dependency_sequence += 1
+            self._dependency_order[dep_id] = self._dependency_sequence
+        self._outgoing_index.setdefault(dep.source_id, {})[dep_id] = None
+        self._incoming_index.setdefault(dep.target_id, {})[dep_id] = None
+
+    def _unindex_dependency(self, dep_id: str, source_id: str, target_id: str,
+                            keep_order: bool = False) -> None:
+        for index, key in (
+            (self._outgoing_index, source_id),
+            (self._incoming_index, target_id),
+        ):
+            bucket = index.get(key)
+            if bucket is None:
+                continue
+            bucket.pop(dep_id, None)
+            if not bucket:
+                del index[key]
+        if not keep_order:
+            self._dependency_order.pop(dep_id, None)
+
     def add_node(self, node: DependencyNode) -> str:
         """Add a node to the graph."""
+        existing = self.nodes.get(node.id)
+        if existing is not None:
+            self._unbind(existing)
+            self._unindex_node(node.id, existing.node_type, existing.name)
+            self._claim_readiness_cache.pop(node.id, None)
+            self._dirty_readiness.discard(node.id)
         self.nodes[node.id] = node
+        self._bind(node)
+        self._index_node(node.id, node)
+        self._mark_downstream_dirty(node.id)
         self._update_metadata()
         return node.id
     
@@ -126,9 +436,49 @@ class DependencyGraph:
         if dependency.target_id not in self.nodes:
             raise ValueError(f"Target node {dependency.target_id} not found")
         
+        existing = self.dependencies.get(dependency.id)
+        if existing is not None:
+            self._unbind(existing)
+            self._unindex_dependency(dependency.id, existing.source_id, existing.target_id, keep_order=True)
+            self._mark_dirty(existing.target_id)
         self.dependencies[dependency.id] = dependency
+        self._bind(dependency)
+        self._index_dependency(dependency.id, dependency)
+        self._mark_dirty(dependency.target_id)
         self._update_metadata()
         return dependency.id
+
+    def remove_dependency(self, dependency_id: str) -> Optional[Dependency]:
+        """Remove a dependency from the graph and return it, if present."""
+        dep = self.dependencies.pop(dependency_id, None)
+        if dep is None:
+            return None
+        self._unbind(dep)
+        self._unindex_dependency(dependency_id, dep.source_id, dep.target_id)
+        self._mark_dirty(dep.target_id)
+        self._update_metadata()
+        return dep
+
+    def remove_node(self, node_id: str) -> Optional[DependencyNode]:
+        """Remove a node and every dependency touching it.
+
+        Returns the removed node, or None if it was not in the graph.
+        """
+        node = self.nodes.pop(node_id, None)
+        if node is None:
+            return None
+        self._unbind(node)
+        self._unindex_node(node_id, node.node_type, node.name)
+        self._node_order.pop(node_id, None)
+        for dep in self.get_dependencies_for_node(node_id):
+            self.remove_dependency(dep.id)
+        self._satisfaction_cache.pop(node_id, None)
+        self._dirty_satisfaction.discard(node_id)
+        self._unsatisfied_node_ids.discard(node_id)
+        self._claim_readiness_cache.pop(node_id, None)
+        self._dirty_readiness.discard(node_id)
+        self._update_metadata()
+        return node
     
     def get_node(self, node_id: str) -> Optional[DependencyNode]:
         """Get a node by ID."""
@@ -143,27 +493,46 @@ class DependencyGraph:
             node_id: Node ID
             direction: 'incoming', 'outgoing', or 'both'
         """
-        deps = []
-        for dep in self.dependencies.values():
-            if direction in ['incoming', 'both'] and dep.target_id == node_id:
-                deps.append(dep)
-            if direction in ['outgoing', 'both'] and dep.source_id == node_id:
-                deps.append(dep)
-        return deps
+        dep_ids: List[str] = []
+        if direction in ['incoming', 'both']:
+            dep_ids.extend(self._incoming_index.get(node_id, {}))
+        if direction in ['outgoing', 'both']:
+            dep_ids.extend(self._outgoing_index.get(node_id, {}))
+        # Stable sort restores global insertion order and keeps a self-loop's
+        # incoming entry ahead of its outgoing one.
+        dep_ids.sort(key=self._dependency_order.__getitem__)
+        return [self.dependencies[dep_id] for dep_id in dep_ids]
     
     def get_nodes_by_type(self, node_type: NodeType) -> List[DependencyNode]:
         """Get all nodes of a specific type."""
-        return [n for n in self.nodes.values() if n.node_type == node_type]
+        return [self.nodes[nid] for nid in self._type_index.get(node_type, {})]
+
+    def find_nodes_by_name(self, node_type: NodeType, name: str) -> List[DependencyNode]:
+        """Get nodes matching a type and name, case- and whitespace-insensitively."""
+        key = (node_type, self._normalize_name(name))
+        return [self.nodes[nid] for nid in self._name_index.get(key, {})]
+
+    def find_node(self, node_type: NodeType, name: str) -> Optional[DependencyNode]:
+        """Get the first node matching a type and normalized name."""
+        key = (node_type, self._normalize_name(name))
+        for nid in self._name_index.get(key, {}):
+            return self.nodes[nid]
+        return None
     
     def check_satisfaction(self, node_id: str) -> Dict[str, Any]:
         """
         Check if a node's requirements are satisfied.
         
         Returns information about satisfaction status and missing dependencies.
+        Results are cached per node and recomputed only after the node or one
+        of its direct requirements changed.
         """
-        node = self.get_node(node_id)
-        if not node:
+        if node_id not in self.nodes:
             return {'error': 'Node not found'}
+        return self._copy_satisfaction(self._cached_satisfaction(node_id))
+
+    def _compute_satisfaction(self, node_id: str) -> Dict[str, Any]:
+        node = self.nodes[node_id]
         
         # Get all requirements (incoming dependencies)
         requirements = self.get_dependencies_for_node(node_id, direction='incoming')
@@ -196,17 +565,84 @@ class DependencyGraph:
             'total_required': total_required,
             'missing_dependencies': missing
         }
+
+    def _cached_satisfaction(self, node_id: str) -> Dict[str, Any]:
+        check = self._satisfaction_cache.get(node_id)
+        if check is not None and node_id not in self._dirty_satisfaction:
+            self._readiness_stats['satisfaction_cache_hits'] += 1
+            return check
+        check = self._compute_satisfaction(node_id)
+        self._readiness_stats['satisfaction_recomputes'] += 1
+        self._satisfaction_cache[node_id] = check
+        self._dirty_satisfaction.discard(node_id)
+        if not check['satisfied'] and check['total_required'] > 0:
+            self._unsatisfied_node_ids.add(node_id)
+        else:
+            self._unsatisfied_node_ids.discard(node_id)
+        return check
+
+    @staticmethod
+    def _copy_satisfaction(check: Dict[str, Any]) -> Dict[str, Any]:
+        copied = dict(check)
+        copied['missing_dependencies'] = [dict(item) for item in check['missing_dependencies']]
+        return copied
     
     def find_unsatisfied_requirements(self) -> List[Dict[str, Any]]:
-        """Find all nodes with unsatisfied requirements."""
-        unsatisfied = []
-        
-        for node in self.nodes.values():
-            check = self.check_satisfaction(node.id)
-            if not check.get('satisfied', False) and check.get('total_required', 0) > 0:
-                unsatisfied.append(check)
-        
-        return unsatisfied
+        """Find all nodes with unsatisfied requirements.
+
+        Only nodes marked dirty since the previous call are re-checked.
+        """
+        for node_id in list(self._dirty_satisfaction):
+            if node_id in self.nodes:
+                self._cached_satisfaction(node_id)
+            else:
+                self._dirty_satisfaction.discard(node_id)
+        ordered_ids = sorted(self._unsatisfied_node_ids, key=self._node_order.__getitem__)
+        return [self._copy_satisfaction(self._satisfaction_cache[node_id]) for node_id in ordered_ids]
+
+    def _cached_claim_record(self, claim_id: str, compute) -> Dict[str, Any]:
+        record = self._claim_readiness_cache.get(claim_id)
+        if record is not None and claim_id not in self._dirty_readiness:
+            self._readiness_stats['claim_readiness_cache_hits'] += 1
+            self._readiness_stats['last_readiness_reused_claims'] += 1
+            return record
+        record = compute(self.nodes[claim_id])
+        # Shared by every later call until the claim changes, so nothing
+        # handed out may be edited in place.
+        record['entry'] = _freeze(record['entry'])
+        record['recommended_gap'] = _freeze(record['recommended_gap'])
+        self._readiness_stats['claim_readiness_recomputes'] += 1
+        self._readiness_stats['last_readiness_recomputed_claims'] += 1
+        self._claim_readiness_cache[claim_id] = record
+        self._dirty_readiness.discard(claim_id)
+        return record
+
+    def readiness_cache_stats(self) -> Dict[str, int]:
+        """Return dirty-tracking counters for the incremental readiness caches.
+
+        ``last_readiness_recomputed_claims`` staying flat while the graph grows
+        shows that a turn only pays for the claims its edits touched.
+        """
+        return {
+            **self._readiness_stats,
+            'pending_dirty_nodes': len(self._dirty_satisfaction),
+            'pending_dirty_claims': len(self._dirty_readiness),
+            'cached_nodes': len(self._satisfaction_cache),
+            'cached_claims': len(self._claim_readiness_cache),
+        }
+
+    def reset_readiness_cache_stats(self) -> None:
+        """Zero the counters reported by ``readiness_cache_stats``."""
+        self._readiness_stats = {
+            'invalidations': 0,
+            'satisfaction_recomputes': 0,
+            'satisfaction_cache_hits': 0,
+            'claim_readiness_recomputes': 0,
+            'claim_readiness_cache_hits': 0,
+            'readiness_calls': 0,
+            'last_readiness_recomputed_claims': 0,
+            'last_readiness_reused_claims': 0,
+        }
     
     def get_claim_readiness(self) -> Dict[str, Any]:
         """
@@ -647,36 +1083,39 @@ class DependencyGraph:
 
         claims = self.get_nodes_by_type(NodeType.CLAIM)
         nodes_by_id = self.nodes
-        incoming_required_by_target: Dict[str, List[Dependency]] = {}
-        for dep in self.dependencies.values():
-            if dep.required:
-                incoming_required_by_target.setdefault(dep.target_id, []).append(dep)
-        
-        ready_claims = []
-        incomplete_claims = []
-        total_missing_dependencies = 0
-        total_satisfaction_ratio = 0.0
-        recommended_next_gaps = []
-        total_required_dependencies = 0
-        total_satisfied_required_dependencies = 0
-        underspecified_claims = 0
-        weak_claim_gap_count = 0
-        weak_modality_gap_count = 0
-        structured_required_dependencies = 0
-        structured_satisfied_dependencies = 0
-        deterministic_gap_targets = 0
-        deterministic_gap_targets_satisfied = 0
-        core_structured_gap_count = 0
-        core_structured_single_turn_closable = 0
-        single_turn_closure_candidate_count = 0
-        deterministic_field_update_total = 0
-        deterministic_field_update_ready = 0
-        concrete_gap_candidates = 0
-        weak_modality_precision_field_total = 0
-        weak_modality_precision_field_ready = 0
-
-        for claim in claims:
-            required_deps = incoming_required_by_target.get(claim.id, [])
+        self._readiness_stats['readiness_calls'] += 1
+        self._readiness_stats['last_readiness_recomputed_claims'] = 0
+        self._readiness_stats['last_readiness_reused_claims'] = 0
+
+        def _compute_claim_record(claim: DependencyNode) -> Dict[str, Any]:
+            # Everything below depends only on the claim node, its incoming
+            # required dependencies and their source nodes, which is exactly
+            # the set _mark_downstream_dirty invalidates.
+            total_missing_dependencies = 0
+            total_satisfaction_ratio = 0.0
+            total_required_dependencies = 0
+            total_satisfied_required_dependencies = 0
+            underspecified_claims = 0
+            weak_claim_gap_count = 0
+            weak_modality_gap_count = 0
+            structured_required_dependencies = 0
+            structured_satisfied_dependencies = 0
+            deterministic_gap_targets = 0
+            deterministic_gap_targets_satisfied = 0
+            core_structured_gap_count = 0
+            core_structured_single_turn_closable = 0
+            single_turn_closure_candidate_count = 0
+            deterministic_field_update_total = 0
+            deterministic_field_update_ready = 0
+            concrete_gap_candidates = 0
+            weak_modality_precision_field_total = 0
+            weak_modality_precision_field_ready = 0
+            recommended_gap = None
+
+            required_deps = [
+                dep for dep in self.get_dependencies_for_node(claim.id, direction='incoming')
+                if dep.required
+            ]
             satisfied_count = 0
             missing_dependencies = []
             for dep in required_deps:
@@ -956,7 +1395,7 @@ class DependencyGraph:
             total_satisfaction_ratio += claim_satisfaction_ratio
             next_gap = ranked_missing_dependencies[0] if ranked_missing_dependencies else None
             if claim_is_satisfied:
-                ready_claims.append({
+                claim_entry = {
                     'claim_id': claim.id,
                     'claim_name': claim.name,
                     'confidence': claim.confidence,
@@ -968,9 +1407,9 @@ class DependencyGraph:
                     'structured_satisfied_count': claim_structured_satisfied_count,
                     'deterministic_target_count': claim_deterministic_target_count,
                     'deterministic_target_satisfied_count': claim_deterministic_target_satisfied_count,
-                })
+                }
             else:
-                incomplete_claims.append({
+                claim_entry = {
                     'claim_id': claim.id,
                     'claim_name': claim.name,
                     'claim_type': claim_type,
@@ -985,16 +1424,77 @@ class DependencyGraph:
                     'structured_satisfied_count': claim_structured_satisfied_count,
                     'deterministic_target_count': claim_deterministic_target_count,
                     'deterministic_target_satisfied_count': claim_deterministic_target_satisfied_count,
-                })
+                }
                 if next_gap:
-                    recommended_next_gaps.append(
-                        {
-                            'claim_id': claim.id,
-                            'claim_name': claim.name,
-                            'claim_type': claim_type,
-                            **next_gap,
-                        }
-                    )
+                    recommended_gap = {
+                        'claim_id': claim.id,
+                        'claim_name': claim.name,
+                        'claim_type': claim_type,
+                        **next_gap,
+                    }
+
+            return {
+                'ready': claim_is_satisfied,
+                'entry': claim_entry,
+                'recommended_gap': recommended_gap,
+                'counters': {
+                    'total_missing_dependencies': total_missing_dependencies,
+                    'total_satisfaction_ratio': total_satisfaction_ratio,
+                    'total_required_dependencies': total_required_dependencies,
+                    'total_satisfied_required_dependencies': total_satisfied_required_dependencies,
+                    'underspecified_claims': underspecified_claims,
+                    'weak_claim_gap_count': weak_claim_gap_count,
+                    'weak_modality_gap_count': weak_modality_gap_count,
+                    'structured_required_dependencies': structured_required_dependencies,
+                    'structured_satisfied_dependencies': structured_satisfied_dependencies,
+                    'deterministic_gap_targets': deterministic_gap_targets,
+                    'deterministic_gap_targets_satisfied': deterministic_gap_targets_satisfied,
+                    'core_structured_gap_count': core_structured_gap_count,
+                    'core_structured_single_turn_closable': core_structured_single_turn_closable,
+                    'single_turn_closure_candidate_count': single_turn_closure_candidate_count,
+                    'deterministic_field_update_total': deterministic_field_update_total,
+                    'deterministic_field_update_ready': deterministic_field_update_ready,
+                    'concrete_gap_candidates': concrete_gap_candidates,
+                    'weak_modality_precision_field_total': weak_modality_precision_field_total,
+                    'weak_modality_precision_field_ready': weak_modality_precision_field_ready,
+                },
+            }
+
+        ready_claims = []
+        incomplete_claims = []
+        recommended_next_gaps = []
+        claim_counters: Dict[str, float] = {}
+        for claim in claims:
+            record = self._cached_claim_record(claim.id, _compute_claim_record)
+            # Each call gets its own top-level dicts; nested values are read-only.
+            entry = dict(record['entry'])
+            if record['ready']:
+                ready_claims.append(entry)
+            else:
+                incomplete_claims.append(entry)
+            if record['recommended_gap']:
+                recommended_next_gaps.append(dict(record['recommended_gap']))
+            for name, value in record['counters'].items():
+                claim_counters[name] = claim_counters.get(name, 0) + value
+        total_missing_dependencies = claim_counters.get('total_missing_dependencies', 0)
+        total_satisfaction_ratio = claim_counters.get('total_satisfaction_ratio', 0.0)
+        total_required_dependencies = claim_counters.get('total_required_dependencies', 0)
+        total_satisfied_required_dependencies = claim_counters.get('total_satisfied_required_dependencies', 0)
+        underspecified_claims = claim_counters.get('underspecified_claims', 0)
+        weak_claim_gap_count = claim_counters.get('weak_claim_gap_count', 0)
+        weak_modality_gap_count = claim_counters.get('weak_modality_gap_count', 0)
+        structured_required_dependencies = claim_counters.get('structured_required_dependencies', 0)
+        structured_satisfied_dependencies = claim_counters.get('structured_satisfied_dependencies', 0)
+        deterministic_gap_targets = claim_counters.get('deterministic_gap_targets', 0)
+        deterministic_gap_targets_satisfied = claim_counters.get('deterministic_gap_targets_satisfied', 0)
+        core_structured_gap_count = claim_counters.get('core_structured_gap_count', 0)
+        core_structured_single_turn_closable = claim_counters.get('core_structured_single_turn_closable', 0)
+        single_turn_closure_candidate_count = claim_counters.get('single_turn_closure_candidate_count', 0)
+        deterministic_field_update_total = claim_counters.get('deterministic_field_update_total', 0)
+        deterministic_field_update_ready = claim_counters.get('deterministic_field_update_ready', 0)
+        concrete_gap_candidates = claim_counters.get('concrete_gap_candidates', 0)
+        weak_modality_precision_field_total = claim_counters.get('weak_modality_precision_field_total', 0)
+        weak_modality_precision_field_ready = claim_counters.get('weak_modality_precision_field_ready', 0)
 
         claim_level_satisfaction = (
             total_satisfaction_ratio / len(claims) if claims else 0.0
@@ -1232,6 +1732,7 @@ class DependencyGraph:
             dep = Dependency(**ddata)
             graph.dependencies[did] = dep
         
+        graph.rebuild_indexes()
         return graph
     
     @classmethod
@@ -1243,8 +1744,14 @@ class DependencyGraph:
         return cls.from_dict(data)
     
     def _update_metadata(self):
-        """Update last_updated timestamp."""
+        """Update last_updated timestamp and bump the graph revision."""
         self.metadata['last_updated'] = _utc_now_isoformat()
+        self._revision = self.revision + 1
+
+    @property
+    def revision(self) -> int:
+        """Counter bumped by every change made through the graph's methods."""
+        return self.__dict__.get('_revision', 0)
     
     def summary(self) -> Dict[str, Any]:
         """Get a summary of the dependency graph."""
@@ -2977,14 +3484,8 @@ class DependencyGraphBuilder:
             if isinstance(node.attributes, dict) and node.attributes.get('timeline_fact_node')
         ]
         if temporal_node_ids:
-            temporal_node_id_set = set(temporal_node_ids)
-            graph.dependencies = {
-                dep_id: dep
-                for dep_id, dep in graph.dependencies.items()
-                if dep.source_id not in temporal_node_id_set and dep.target_id not in temporal_node_id_set
-            }
             for node_id in temporal_node_ids:
-                graph.nodes.pop(node_id, None)
+                graph.remove_node(node_id)
 
         claim_nodes = graph.get_nodes_by_type(NodeType.CLAIM)
         claim_nodes_by_type = {
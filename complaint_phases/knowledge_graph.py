@@ -9,7 +9,7 @@ import json
 import logging
 import re
 import os
-from typing import Dict, List, Optional, Any, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, UTC
 
@@ -19,6 +19,144 @@ def _utc_now_isoformat() -> str:
 
 logger = logging.getLogger(__name__)
 
+_GAP_DATE_SIGNAL = re.compile(r"\b(?:19|20)\d{2}\b|\b\d{1,2}/\d{1,2}/\d{2,4}\b|\b\d{4}-\d{2}-\d{2}\b")
+_GAP_EXACT_DATE_SIGNAL = re.compile(
+    (
+        r"\b(?:jan|january|feb|february|mar|march|apr|april|may|jun|june|"
+        r"jul|july|aug|august|sep|sept|september|oct|october|nov|november|"
+        r"dec|december)\s+\d{1,2},\s+\d{4}\b"
+        r"|\b\d{1,2}/\d{1,2}/\d{2,4}\b"
+        r"|\b\d{4}-\d{2}-\d{2}\b"
+    ),
+    flags=re.IGNORECASE,
+)
+_GAP_YEAR_SIGNAL = re.compile(r"\b(?:19|20)\d{2}\b")
+_ID_SUFFIX = re.compile(r"(.*)_(\d+)$")
+_TIMELINE_RELATION_TYPES = ('occurred_on', 'has_timeline_detail')
+_CAUSATION_RELATION_TYPES = ('caused_by', 'causal_link', 'follows_protected_activity', 'occurred_after')
+_RESPONDENT_ROLES = {'respondent', 'manager', 'supervisor', 'employer', 'owner', 'landlord'}
+_DECISION_TIMELINE_TERMS = (
+    "decision", "decided", "approved", "denied", "terminated", "disciplined",
+    "evicted", "notice", "email", "letter", "message",
+)
+_NOTICE_TERMS = ("notice", "letter", "email", "message", "termination letter", "denial notice")
+_HEARING_TERMS = ("hearing", "grievance", "appeal")
+_RESPONSE_TERMS = ("respond", "response", "replied", "reply", "denied", "approved", "ignored", "no response")
+_TIMELINE_ACTION_TERMS = ("decided", "decision", "denied", "approved", "terminated", "disciplined", "evicted", "notice", "letter", "email")
+_PROTECTED_ACTIVITY_TERMS = ("protected activity", "complained", "reported", "grievance", "requested accommodation")
+_ADVERSE_ACTION_TERMS = ("fired", "terminated", "demoted", "disciplined", "suspended", "reduced")
+
+
+def _entity_gap_text(entity: 'Entity') -> str:
+    attributes = entity.attributes if isinstance(entity.attributes, dict) else {}
+    parts = [
+        str(entity.name or ""),
+        str(attributes.get("description") or ""),
+        str(attributes.get("event_label") or ""),
+        str(attributes.get("event_date_or_range") or ""),
+    ]
+    return " ".join(part.strip() for part in parts if str(part).strip()).lower()
+
+
+def _entity_gap_fingerprint(entity: 'Entity') -> tuple:
+    """Every entity field ``find_gaps`` reads, compared to detect in-place edits."""
+    attributes = entity.attributes if isinstance(entity.attributes, dict) else {}
+    return (
+        entity.id,
+        entity.type,
+        entity.name,
+        entity.confidence,
+        attributes.get("description"),
+        attributes.get("event_label"),
+        attributes.get("event_date_or_range"),
+        attributes.get("fact_type"),
+        attributes.get("role"),
+        attributes.get("claim_type"),
+    )
+
+
+def _entity_gap_flags(entity: 'Entity') -> FrozenSet[str]:
+    """Per-entity facts that the graph-level gap checks aggregate."""
+    attributes = entity.attributes if isinstance(entity.attributes, dict) else {}
+    entity_type = entity.type
+    text_value = _entity_gap_text(entity)
+    has_date_signal = bool(text_value and _GAP_DATE_SIGNAL.search(text_value))
+    fact_type = attributes.get('fact_type')
+    role = attributes.get('role', '')
+    flags = set()
+
+    if entity_type in ('person', 'organization'):
+        flags.add('person_or_organization')
+    if entity_type == 'date':
+        flags.add('date')
+    if entity_type == 'organization':
+        flags.add('organization')
+    if entity_type == 'fact':
+        if fact_type == 'timeline':
+            flags.add('timeline_fact')
+            if has_date_signal and any(term in text_value for term in _DECISION_TIMELINE_TERMS):
+                flags.add('decision_timeline_detail')
+        elif fact_type == 'impact':
+            flags.add('impact_fact')
+        elif fact_type == 'remedy':
+            flags.add('remedy_fact')
+    if entity_type == 'person':
+        if isinstance(role, str) and role.lower() in _RESPONDENT_ROLES:
+            flags.add('respondent_person')
+        if attributes.get('role'):
+            flags.add('staff_role')
+        if len((entity.name or "").split()) >= 2:
+            flags.add('named_staff')
+            if not str(attributes.get('role') or '').strip():
+                flags.add('staff_missing_title')
+
+    if any(term in text_value for term in _NOTICE_TERMS):
+        flags.add('notice_reference')
+        if entity_type == 'evidence':
+            flags.add('notice_evidence')
+    if any(term in text_value for term in _HEARING_TERMS):
+        flags.add('hearing_reference')
+        if entity_type == 'date' or _GAP_YEAR_SIGNAL.search(text_value):
+            flags.add('hearing_dated')
+    if any(term in text_value for term in _RESPONSE_TERMS):
+        flags.add('response_reference')
+        if has_date_signal or entity_type == 'date':
+            flags.add('response_dated')
+    if (
+        entity_type in {'fact', 'claim', 'evidence'}
+        and any(term in text_value for term in _TIMELINE_ACTION_TERMS)
+        and not (text_value and _GAP_EXACT_DATE_SIGNAL.search(text_value))
+    ):
+        flags.add('action_without_exact_date')
+
+    if str(attributes.get('claim_type') or '').strip().lower() == 'retaliation':
+        flags.add('retaliation_claim_type')
+    if entity_type == 'fact' and any(term in text_value for term in _PROTECTED_ACTIVITY_TERMS):
+        flags.add('protected_activity_fact')
+    if entity_type in {'fact', 'claim'} and any(term in text_value for term in _ADVERSE_ACTION_TERMS):
+        flags.add('adverse_action_fact')
+    if entity_type == 'fact':
+        if 'protected' in text_value and has_date_signal:
+            flags.add('protected_activity_date')
+        if has_date_signal and any(term in text_value for term in _ADVERSE_ACTION_TERMS + ('adverse',)):
+            flags.add('adverse_action_date')
+        if 'because' in text_value or 'after' in text_value or 'soon after' in text_value:
+            flags.add('causation_fact')
+    return frozenset(flags)
+
+
+def _low_confidence_gap(entity: 'Entity') -> Optional[Dict[str, Any]]:
+    if not entity.confidence < 0.7:
+        return None
+    return {
+        'type': 'low_confidence_entity',
+        'entity_id': entity.id,
+        'entity_type': entity.type,
+        'entity_name': entity.name,
+        'confidence': entity.confidence,
+        'suggested_question': f"Can you provide more details about {entity.name}?"
+    }
+
 
 @dataclass
 class Entity:
@@ -65,103 +203,232 @@ class KnowledgeGraph:
             'last_updated': _utc_now_isoformat(),
             'version': '1.0'
         }
-    
+        self._revision = 0
+        self.reset_gap_cache_stats()
+        self._reset_indexes()
+
+    def _reset_indexes(self) -> None:
+        """Clear the adjacency, type and name indexes."""
+        # Each index maps a key to an insertion-ordered dict of ids so lookups
+        # stay O(degree) while preserving the order of ``self.relationships``.
+        self._outgoing_index: Dict[str, Dict[str, None]] = {}
+        self._incoming_index: Dict[str, Dict[str, None]] = {}
+        self._type_index: Dict[str, Dict[str, None]] = {}
+        self._name_index: Dict[Tuple[str, str], Dict[str, None]] = {}
+        self._relationship_order: Dict[str, int] = {}
+        self._relationship_sequence = 0
+        # Highest numeric suffix seen per id prefix, e.g. {'entity': 12}.
+        self._entity_id_high_water: Dict[str, int] = {}
+        self._relationship_id_high_water: Dict[str, int] = {}
+        # Incremental gap detection: per-entity fingerprints and gap flags,
+        # flag counters across entities and relation-type counters.
+        self._entity_gap_profiles: Dict[str, Tuple[tuple, FrozenSet[str], Optional[Dict[str, Any]]]] = {}
+        self._entity_gap_counts: Dict[str, int] = {}
+        self._relationship_gap_profiles: Dict[str, str] = {}
+        self._relation_type_counts: Dict[str, int] = {}
+
+    def rebuild_indexes(self) -> None:
+        """Rebuild all lookup indexes from ``entities`` and ``relationships``.
+
+        Only needed when the underlying dicts were mutated directly instead of
+        through ``add_*``/``remove_*``.
+        """
+        self._reset_indexes()
+        for entity_id, entity in self.entities.items():
+            self._index_entity(entity_id, entity)
+        for rel_id, rel in self.relationships.items():
+            self._index_relationship(rel_id, rel)
+
+    @staticmethod
+    def _normalize_type(value: Any) -> str:
+        return str(value or '').strip().lower()
+
+    @staticmethod
+    def _normalize_name(value: Any) -> str:
+        return str(value or '').strip().lower()
+
+    def _name_key(self, entity: Entity) -> Tuple[str, str]:
+        return (self._normalize_type(entity.type), self._normalize_name(entity.name))
+
+    @staticmethod
+    def _record_id_suffix(high_water: Dict[str, int], item_id: str) -> None:
+        match = _ID_SUFFIX.match(str(item_id))
+        if match:
+            prefix, number = match.group(1), int(match.group(2))
+            if number > high_water.get(prefix, 0):
+                high_water[prefix] = number
+
+    def _index_entity(self, entity_id: str, entity: Entity) -> None:
+        self._record_id_suffix(self._entity_id_high_water, entity_id)
+        self._type_index.setdefault(entity.type, {})[entity_id] = None
+        self._name_index.setdefault(self._name_key(entity), {})[entity_id] = None
+
+    def _unindex_entity(self, entity_id: str, entity: Entity) -> None:
+        for index, key in (
+            (self._type_index, entity.type),
+            (self._name_index, self._name_key(entity)),
+        ):
+            bucket = index.get(key)
+            if bucket is None:
+                continue
+            bucket.pop(entity_id, None)
+            if not bucket:
+                del index[key]
+
+    def _index_relationship(self, rel_id: str, rel: Relationship) -> None:
+        if rel_id not in self._relationship_order:
+            self._relationship_sequence += 1
+            self._relationship_order[rel_id] = self._relationship_sequence
+        self._outgoing_index.setdefault(rel.source_id, {})[rel_id] = None
+        self._incoming_index.setdefault(rel.target_id, {})[rel_id] = None
+        self._record_id_suffix(self._relationship_id_high_water, rel_id)
+
+    def _unindex_relationship(self, rel_id: str, rel: Relationship, keep_order: bool = False) -> None:
+        for index, key in (
+            (self._outgoing_index, rel.source_id),
+            (self._incoming_index, rel.target_id),
+        ):
+            bucket = index.get(key)
+            if bucket is None:
+                continue
+            bucket.pop(rel_id, None)
+            if not bucket:
+                del index[key]
+        if not keep_order:
+            self._relationship_order.pop(rel_id, None)
+
+    def next_entity_id(self, prefix: str = 'entity') -> str:
+        """Return ``<prefix>_<n>`` past the highest entity id seen with that prefix.
+
+        Ids freed by ``remove_entity`` are not handed out again until the
+        indexes are rebuilt.
+        """
+        return f"{prefix}_{self._entity_id_high_water.get(prefix, 0) + 1}"
+
+    def next_relationship_id(self, prefix: str = 'rel') -> str:
+        """Return ``<prefix>_<n>`` past the highest relationship id seen with that prefix."""
+        return f"{prefix}_{self._relationship_id_high_water.get(prefix, 0) + 1}"
+
     def add_entity(self, entity: Entity) -> str:
         """Add an entity to the graph."""
+        existing = self.entities.get(entity.id)
+        if existing is not None:
+            self._unindex_entity(entity.id, existing)
         self.entities[entity.id] = entity
+        self._index_entity(entity.id, entity)
         self._update_metadata()
         return entity.id
-    
+
     def add_relationship(self, relationship: Relationship) -> str:
         """Add a relationship to the graph."""
+        existing = self.relationships.get(relationship.id)
+        if existing is not None:
+            self._unindex_relationship(relationship.id, existing, keep_order=True)
+            self._forget_relationship_gap_profile(relationship.id)
         self.relationships[relationship.id] = relationship
+        self._index_relationship(relationship.id, relationship)
         self._update_metadata()
         return relationship.id
-    
+
+    def remove_relationship(self, relationship_id: str) -> Optional[Relationship]:
+        """Remove a relationship from the graph and return it, if present."""
+        rel = self.relationships.pop(relationship_id, None)
+        if rel is None:
+            return None
+        self._unindex_relationship(relationship_id, rel)
+        self._forget_relationship_gap_profile(relationship_id)
+        self._update_metadata()
+        return rel
+
+    def remove_entity(self, entity_id: str) -> Optional[Entity]:
+        """Remove an entity and every relationship touching it.
+
+        Returns the removed entity, or None if it was not in the graph.
+        """
+        entity = self.entities.pop(entity_id, None)
+        if entity is None:
+            return None
+        self._unindex_entity(entity_id, entity)
+        self._forget_entity_gap_profile(entity_id)
+        for rel in self.get_relationships_for_entity(entity_id):
+            self.remove_relationship(rel.id)
+        self._update_metadata()
+        return entity
+
     def get_entity(self, entity_id: str) -> Optional[Entity]:
         """Get an entity by ID."""
         return self.entities.get(entity_id)
-    
-    def get_relationships_for_entity(self, entity_id: str) -> List[Relationship]:
-        """Get all relationships involving an entity."""
-        return [
-            rel for rel in self.relationships.values()
-            if rel.source_id == entity_id or rel.target_id == entity_id
-        ]
-    
+
+    def get_relationships_for_entity(self, entity_id: str,
+                                     direction: str = 'both') -> List[Relationship]:
+        """
+        Get all relationships involving an entity.
+
+        Args:
+            entity_id: Entity ID
+            direction: 'incoming', 'outgoing', or 'both'
+        """
+        rel_ids: Dict[str, None] = {}
+        if direction in ('outgoing', 'both'):
+            rel_ids.update(self._outgoing_index.get(entity_id, {}))
+        if direction in ('incoming', 'both'):
+            rel_ids.update(self._incoming_index.get(entity_id, {}))
+        ordered_ids = sorted(rel_ids, key=self._relationship_order.__getitem__)
+        return [self.relationships[rel_id] for rel_id in ordered_ids]
+
     def get_entities_by_type(self, entity_type: str) -> List[Entity]:
         """Get all entities of a specific type."""
-        return [e for e in self.entities.values() if e.type == entity_type]
+        return [self.entities[eid] for eid in self._type_index.get(entity_type, {})]
+
+    def find_entities_by_name(self, entity_type: str, name: str) -> List[Entity]:
+        """Get entities matching a type and name, case- and whitespace-insensitively."""
+        key = (self._normalize_type(entity_type), self._normalize_name(name))
+        return [self.entities[eid] for eid in self._name_index.get(key, {})]
+
+    def find_entity(self, entity_type: str, name: str) -> Optional[Entity]:
+        """Get the first entity matching a type and normalized name."""
+        key = (self._normalize_type(entity_type), self._normalize_name(name))
+        for eid in self._name_index.get(key, {}):
+            return self.entities[eid]
+        return None
     
     def find_gaps(self) -> List[Dict[str, Any]]:
         """
         Identify gaps in the knowledge graph that need more information.
         
         Returns a list of gaps with suggested questions.
+
+        Each entity's text checks are cached under a fingerprint of the
+        fields they read, so a call re-profiles only entities whose type,
+        name, confidence or gap-relevant attributes changed since the
+        previous call (including in-place attribute edits). Graph-level gaps
+        are decided from counters over those profiles.
         """
-        gaps = []
-
-        def _entity_text(entity: Entity) -> str:
-            attributes = entity.attributes if isinstance(entity.attributes, dict) else {}
-            parts = [
-                str(entity.name or ""),
-                str(attributes.get("description") or ""),
-                str(attributes.get("event_label") or ""),
-                str(attributes.get("event_date_or_range") or ""),
-            ]
-            return " ".join(part.strip() for part in parts if str(part).strip()).lower()
-
-        def _has_date_signal(text_value: str) -> bool:
-            if not text_value:
-                return False
-            return bool(
-                re.search(
-                    r"\b(?:19|20)\d{2}\b|\b\d{1,2}/\d{1,2}/\d{2,4}\b|\b\d{4}-\d{2}-\d{2}\b",
-                    text_value,
-                )
-            )
+        self._gap_stats['gap_calls'] += 1
+        self._gap_stats['last_gaps_recomputed_entities'] = 0
+        self._refresh_gap_profiles()
+        counts = self._entity_gap_counts
+        gaps: List[Dict[str, Any]] = []
 
-        def _has_exact_date_signal(text_value: str) -> bool:
-            if not text_value:
-                return False
-            return bool(
-                re.search(
-                    (
-                        r"\b(?:jan|january|feb|february|mar|march|apr|april|may|jun|june|"
-                        r"jul|july|aug|august|sep|sept|september|oct|october|nov|november|"
-                        r"dec|december)\s+\d{1,2},\s+\d{4}\b"
-                        r"|\b\d{1,2}/\d{1,2}/\d{2,4}\b"
-                        r"|\b\d{4}-\d{2}-\d{2}\b"
-                    ),
-                    text_value,
-                    flags=re.IGNORECASE,
-                )
-            )
-        
         # Check for entities with low confidence
-        for entity in self.entities.values():
-            if entity.confidence < 0.7:
-                gaps.append({
-                    'type': 'low_confidence_entity',
-                    'entity_id': entity.id,
-                    'entity_type': entity.type,
-                    'entity_name': entity.name,
-                    'confidence': entity.confidence,
-                    'suggested_question': f"Can you provide more details about {entity.name}?"
-                })
-        
-        # Check for incomplete relationships
-        for entity in self.entities.values():
-            rels = self.get_relationships_for_entity(entity.id)
-            if len(rels) == 0 and entity.type in ['person', 'organization']:
-                gaps.append({
+        isolated_gaps: List[Dict[str, Any]] = []
+        for entity_id, entity in self.entities.items():
+            profile = self._entity_gap_profiles[entity_id]
+            if profile[2] is not None:
+                gaps.append(dict(profile[2]))
+            # Check for incomplete relationships
+            if 'person_or_organization' in profile[1] and not (
+                self._outgoing_index.get(entity.id) or self._incoming_index.get(entity.id)
+            ):
+                isolated_gaps.append({
                     'type': 'isolated_entity',
                     'entity_id': entity.id,
                     'entity_type': entity.type,
                     'entity_name': entity.name,
                     'suggested_question': f"What is the relationship between {entity.name} and the complaint?"
                 })
-        
+        gaps.extend(isolated_gaps)
+
         # Check for claims without evidence
         claims = self.get_entities_by_type('claim')
         for claim in claims:
@@ -178,44 +445,17 @@ class KnowledgeGraph:
                 })
 
         # Check for missing timeline details
-        has_dates = any(e.type == 'date' for e in self.entities.values())
         has_timeline_rel = any(
-            rel.relation_type in {'occurred_on', 'has_timeline_detail'}
-            for rel in self.relationships.values()
-        )
-        has_timeline_fact = any(
-            e.type == 'fact' and e.attributes.get('fact_type') == 'timeline'
-            for e in self.entities.values()
+            self._relation_type_counts.get(relation_type)
+            for relation_type in _TIMELINE_RELATION_TYPES
         )
-        if not has_dates and not has_timeline_rel and not has_timeline_fact:
+        if not counts.get('date') and not has_timeline_rel and not counts.get('timeline_fact'):
             gaps.append({
                 'type': 'missing_timeline',
                 'suggested_question': "When did the key events happen? Please share dates or a brief timeline."
             })
 
-        timeline_fact_texts = [
-            _entity_text(entity)
-            for entity in self.entities.values()
-            if entity.type == "fact" and (entity.attributes or {}).get("fact_type") == "timeline"
-        ]
-        decision_timeline_terms = (
-            "decision",
-            "decided",
-            "approved",
-            "denied",
-            "terminated",
-            "disciplined",
-            "evicted",
-            "notice",
-            "email",
-            "letter",
-            "message",
-        )
-        has_decision_timeline_detail = any(
-            any(term in text_value for term in decision_timeline_terms) and _has_date_signal(text_value)
-            for text_value in timeline_fact_texts
-        )
-        if not has_decision_timeline_detail:
+        if not counts.get('decision_timeline_detail'):
             gaps.append({
                 'type': 'missing_decision_timeline',
                 'suggested_question': (
@@ -225,26 +465,15 @@ class KnowledgeGraph:
             })
 
         # Check for missing responsible party (no orgs or respondent roles captured)
-        has_org = any(e.type == 'organization' for e in self.entities.values())
-        has_respondent_person = any(
-            e.type == 'person' and e.attributes.get('role', '').lower() in {'respondent', 'manager', 'supervisor', 'employer', 'owner', 'landlord'}
-            for e in self.entities.values()
-        )
-        if not has_org and not has_respondent_person:
+        if not counts.get('organization') and not counts.get('respondent_person'):
             gaps.append({
                 'type': 'missing_responsible_party',
                 'suggested_question': "Who is the person or organization you believe is responsible (e.g., employer, manager, agency)?"
             })
 
         # Check for missing impact/remedy details
-        has_impact = any(
-            e.type == 'fact' and e.attributes.get('fact_type') == 'impact'
-            for e in self.entities.values()
-        )
-        has_remedy = any(
-            e.type == 'fact' and e.attributes.get('fact_type') == 'remedy'
-            for e in self.entities.values()
-        )
+        has_impact = bool(counts.get('impact_fact'))
+        has_remedy = bool(counts.get('remedy_fact'))
         if not has_impact or not has_remedy:
             gaps.append({
                 'type': 'missing_impact_remedy',
@@ -254,76 +483,31 @@ class KnowledgeGraph:
             })
 
         # Blocker checks: written notices, hearing request dates, and identifiable staff actors.
-        all_entity_text = " ".join(_entity_text(entity) for entity in self.entities.values())
-        notice_terms = ("notice", "letter", "email", "message", "termination letter", "denial notice")
-        has_notice_reference = any(term in all_entity_text for term in notice_terms)
-        has_notice_evidence = any(
-            entity.type == "evidence" and any(term in _entity_text(entity) for term in notice_terms)
-            for entity in self.entities.values()
-        )
-        if has_notice_reference and not has_notice_evidence:
+        if counts.get('notice_reference') and not counts.get('notice_evidence'):
             gaps.append({
                 'type': 'missing_written_notice',
                 'suggested_question': "What written notice, letter, email, or message did you receive, who sent it, and what date is on it?"
             })
 
-        hearing_terms = ("hearing", "grievance", "appeal")
-        has_hearing_reference = any(term in all_entity_text for term in hearing_terms)
-        hearing_has_date = False
-        for entity in self.entities.values():
-            text_value = _entity_text(entity)
-            if not any(term in text_value for term in hearing_terms):
-                continue
-            if entity.type == "date":
-                hearing_has_date = True
-                break
-            if re.search(r"\b(?:19|20)\d{2}\b", text_value):
-                hearing_has_date = True
-                break
-        if has_hearing_reference and not hearing_has_date:
+        if counts.get('hearing_reference') and not counts.get('hearing_dated'):
             gaps.append({
                 'type': 'missing_hearing_request_date',
                 'suggested_question': "When did you request a hearing, grievance, or appeal, and when (if ever) did they respond?"
             })
 
-        response_terms = ("respond", "response", "replied", "reply", "denied", "approved", "ignored", "no response")
-        has_response_reference = any(term in all_entity_text for term in response_terms)
-        has_response_date = False
-        for entity in self.entities.values():
-            text_value = _entity_text(entity)
-            if not any(term in text_value for term in response_terms):
-                continue
-            if _has_date_signal(text_value):
-                has_response_date = True
-                break
-            if entity.type == "date":
-                has_response_date = True
-                break
-        if has_response_reference and not has_response_date:
+        if counts.get('response_reference') and not counts.get('response_dated'):
             gaps.append({
                 'type': 'missing_response_dates',
                 'suggested_question': "When did each response occur (including any non-response), who gave it, and what exactly did they say?"
             })
 
-        named_staff_entities = [
-            entity for entity in self.entities.values()
-            if entity.type == "person" and len((entity.name or "").split()) >= 2
-        ]
-        has_staff_role = any(
-            entity.type == "person" and (entity.attributes or {}).get("role")
-            for entity in self.entities.values()
-        )
-        if has_staff_role and not named_staff_entities:
+        if counts.get('staff_role') and not counts.get('named_staff'):
             gaps.append({
                 'type': 'missing_staff_identity',
                 'suggested_question': "Who specifically took the action (full name, role, and team/department if known)?"
             })
 
-        staff_missing_title = [
-            entity for entity in named_staff_entities
-            if not str((entity.attributes or {}).get("role") or "").strip()
-        ]
-        if staff_missing_title:
+        if counts.get('staff_missing_title'):
             gaps.append({
                 'type': 'missing_staff_title',
                 'suggested_question': (
@@ -332,14 +516,7 @@ class KnowledgeGraph:
                 ),
             })
 
-        timeline_action_terms = ("decided", "decision", "denied", "approved", "terminated", "disciplined", "evicted", "notice", "letter", "email")
-        has_action_without_exact_date = any(
-            entity.type in {"fact", "claim", "evidence"}
-            and any(term in _entity_text(entity) for term in timeline_action_terms)
-            and not _has_exact_date_signal(_entity_text(entity))
-            for entity in self.entities.values()
-        )
-        if has_action_without_exact_date:
+        if counts.get('action_without_exact_date'):
             gaps.append({
                 'type': 'missing_exact_action_dates',
                 'suggested_question': (
@@ -348,53 +525,20 @@ class KnowledgeGraph:
                 ),
             })
 
-        retaliation_claims = [
-            entity for entity in claims
-            if str((entity.attributes or {}).get("claim_type") or "").strip().lower() == "retaliation"
-        ]
-        if retaliation_claims:
-            has_protected_activity_fact = any(
-                entity.type == "fact"
-                and any(
-                    token in _entity_text(entity)
-                    for token in ("protected activity", "complained", "reported", "grievance", "requested accommodation")
-                )
-                for entity in self.entities.values()
-            )
-            has_adverse_action_fact = any(
-                entity.type in {"fact", "claim"}
-                and any(
-                    token in _entity_text(entity)
-                    for token in ("fired", "terminated", "demoted", "disciplined", "suspended", "reduced")
-                )
-                for entity in self.entities.values()
-            )
-            has_retaliation_timeline = any(
-                rel.relation_type in {"occurred_on", "has_timeline_detail"}
-                for rel in self.relationships.values()
-            ) or any(entity.type == "date" for entity in self.entities.values())
-            has_protected_activity_date = any(
-                entity.type == "fact"
-                and "protected" in _entity_text(entity)
-                and _has_date_signal(_entity_text(entity))
-                for entity in self.entities.values()
-            )
-            has_adverse_action_date = any(
-                entity.type == "fact"
-                and any(token in _entity_text(entity) for token in ("fired", "terminated", "demoted", "disciplined", "suspended", "reduced", "adverse"))
-                and _has_date_signal(_entity_text(entity))
-                for entity in self.entities.values()
-            )
+        has_retaliation_claim = any(
+            'retaliation_claim_type' in self._entity_gap_profiles[entity_id][1]
+            for entity_id in self._type_index.get('claim', {})
+        )
+        if has_retaliation_claim:
+            has_protected_activity_fact = bool(counts.get('protected_activity_fact'))
+            has_adverse_action_fact = bool(counts.get('adverse_action_fact'))
+            has_retaliation_timeline = has_timeline_rel or bool(counts.get('date'))
+            has_protected_activity_date = bool(counts.get('protected_activity_date'))
+            has_adverse_action_date = bool(counts.get('adverse_action_date'))
             has_causation_link_signal = any(
-                rel.relation_type in {"caused_by", "causal_link", "follows_protected_activity", "occurred_after"}
-                for rel in self.relationships.values()
-            ) or any(
-                "because" in _entity_text(entity)
-                or "after" in _entity_text(entity)
-                or "soon after" in _entity_text(entity)
-                for entity in self.entities.values()
-                if entity.type == "fact"
-            )
+                self._relation_type_counts.get(relation_type)
+                for relation_type in _CAUSATION_RELATION_TYPES
+            ) or bool(counts.get('causation_fact'))
             if not (
                 has_protected_activity_fact
                 and has_adverse_action_fact
@@ -426,6 +570,75 @@ class KnowledgeGraph:
                 })
         
         return gaps
+
+    def _refresh_gap_profiles(self) -> None:
+        """Re-profile entities and relationships whose gap-relevant fields changed."""
+        profiles = self._entity_gap_profiles
+        counts = self._entity_gap_counts
+        for entity_id, entity in self.entities.items():
+            fingerprint = _entity_gap_fingerprint(entity)
+            cached = profiles.get(entity_id)
+            if cached is not None and cached[0] == fingerprint:
+                self._gap_stats['entity_profile_cache_hits'] += 1
+                continue
+            if cached is not None:
+                for flag in cached[1]:
+                    counts[flag] -= 1
+            flags = _entity_gap_flags(entity)
+            for flag in flags:
+                counts[flag] = counts.get(flag, 0) + 1
+            profiles[entity_id] = (fingerprint, flags, _low_confidence_gap(entity))
+            self._gap_stats['entity_profile_recomputes'] += 1
+            self._gap_stats['last_gaps_recomputed_entities'] += 1
+        if len(profiles) > len(self.entities):
+            for entity_id in [eid for eid in profiles if eid not in self.entities]:
+                self._forget_entity_gap_profile(entity_id)
+
+        relationship_profiles = self._relationship_gap_profiles
+        relation_counts = self._relation_type_counts
+        for rel_id, rel in self.relationships.items():
+            previous = relationship_profiles.get(rel_id)
+            if previous == rel.relation_type:
+                continue
+            if previous is not None:
+                relation_counts[previous] -= 1
+            relation_counts[rel.relation_type] = relation_counts.get(rel.relation_type, 0) + 1
+            relationship_profiles[rel_id] = rel.relation_type
+        if len(relationship_profiles) > len(self.relationships):
+            for rel_id in [rid for rid in relationship_profiles if rid not in self.relationships]:
+                self._forget_relationship_gap_profile(rel_id)
+
+    def _forget_entity_gap_profile(self, entity_id: str) -> None:
+        cached = self._entity_gap_profiles.pop(entity_id, None)
+        if cached is not None:
+            for flag in cached[1]:
+                self._entity_gap_counts[flag] -= 1
+
+    def _forget_relationship_gap_profile(self, rel_id: str) -> None:
+        relation_type = self._relationship_gap_profiles.pop(rel_id, None)
+        if relation_type is not None:
+            self._relation_type_counts[relation_type] -= 1
+
+    def gap_cache_stats(self) -> Dict[str, int]:
+        """Return counters for the incremental ``find_gaps`` profiles.
+
+        ``last_gaps_recomputed_entities`` tracks the size of the change since
+        the previous call rather than the size of the graph.
+        """
+        return {
+            **self._gap_stats,
+            'cached_entities': len(self._entity_gap_profiles),
+            'cached_relationships': len(self._relationship_gap_profiles),
+        }
+
+    def reset_gap_cache_stats(self) -> None:
+        """Zero the counters reported by ``gap_cache_stats``."""
+        self._gap_stats = {
+            'gap_calls': 0,
+            'entity_profile_recomputes': 0,
+            'entity_profile_cache_hits': 0,
+            'last_gaps_recomputed_entities': 0,
+        }
     
     def merge_with(self, other_graph: 'KnowledgeGraph'):
         """Merge another knowledge graph into this one."""
@@ -471,6 +684,7 @@ class KnowledgeGraph:
             rel = Relationship(**rdata)
             graph.relationships[rid] = rel
         
+        graph.rebuild_indexes()
         return graph
     
     @classmethod
@@ -482,8 +696,14 @@ class KnowledgeGraph:
         return cls.from_dict(data)
     
     def _update_metadata(self):
-        """Update last_updated timestamp."""
+        """Update last_updated timestamp and bump the graph revision."""
         self.metadata['last_updated'] = _utc_now_isoformat()
+        self._revision = self.revision + 1
+
+    @property
+    def revision(self) -> int:
+        """Counter bumped by every change made through the graph's methods."""
+        return self.__dict__.get('_revision', 0)
     
     def summary(self) -> Dict[str, Any]:
         """Get a summary of the knowledge graph."""
@@ -5,8 +5,9 @@ Manages the three-phase complaint process and transitions between phases.
 """
 
 import logging
+from contextlib import contextmanager
 from enum import Enum
-from typing import Dict, Any, Callable, List
+from typing import Dict, Any, Callable, FrozenSet, Iterator, List
 from datetime import datetime, UTC
 
 logger = logging.getLogger(__name__)
@@ -94,6 +95,93 @@ class PhaseManager:
         ComplaintPhase.EVIDENCE: '_is_evidence_complete',
         ComplaintPhase.FORMALIZATION: '_is_formalization_complete',
     }
+
+    # Only the most recent iterations are kept in ``loss_history``; counts,
+    # totals and minimum cover every recorded iteration.
+    LOSS_HISTORY_LIMIT = 500
+
+    # Derived views are merged into their phase data on read. A write marks a
+    # view dirty only when it touches one of the view's inputs or outputs.
+    _DERIVED_VIEW_BUILDERS = {
+        ComplaintPhase.INTAKE: '_build_intake_readiness',
+        ComplaintPhase.EVIDENCE: '_build_evidence_packet_summary',
+    }
+
+    _DERIVED_VIEW_INPUTS: Dict[ComplaintPhase, FrozenSet[str]] = {
+        ComplaintPhase.INTAKE: frozenset({
+            'knowledge_graph',
+            'dependency_graph',
+            'remaining_gaps',
+            'denoising_converged',
+            'intake_gap_types',
+            'current_gaps',
+            'intake_contradictions',
+            'intake_case_file',
+            'contradictions_unresolved',
+            'contradictions_resolved',
+            'intake_blockers',
+        }),
+        ComplaintPhase.EVIDENCE: frozenset({
+            'claim_support_packets',
+            'alignment_evidence_tasks',
+            'temporal_issue_registry',
+        }),
+    }
+
+    _DERIVED_VIEW_OUTPUTS: Dict[ComplaintPhase, FrozenSet[str]] = {
+        ComplaintPhase.INTAKE: frozenset({
+            'intake_readiness_score',
+            'intake_readiness_blockers',
+            'intake_readiness_criteria',
+            'intake_ready',
+            'ready_to_advance',
+            'remaining_gap_count',
+            'intake_contradiction_count',
+            'intake_contradictions',
+            'intake_sections',
+            'candidate_claim_count',
+            'canonical_fact_count',
+            'proof_lead_count',
+            'blocking_contradictions',
+            'escalated_blocking_contradictions',
+            'complainant_summary_confirmation',
+            'intake_chronology_readiness',
+            'intake_chronology_failure_reasons',
+        }),
+        ComplaintPhase.EVIDENCE: frozenset({
+            'claim_support_packet_count',
+            'claim_support_element_count',
+            'claim_support_explicit_status_count',
+            'claim_support_unsupported_count',
+            'claim_support_blocking_contradictions',
+            'claim_support_recommended_actions',
+            'supported_blocking_element_ratio',
+            'credible_support_ratio',
+            'draft_ready_element_ratio',
+            'high_quality_parse_ratio',
+            'reviewable_escalation_ratio',
+            'claim_support_reviewable_escalation_count',
+            'claim_support_unresolved_without_review_path_count',
+            'claim_support_unresolved_temporal_issue_count',
+            'claim_support_unresolved_temporal_issue_ids',
+            'temporal_gap_task_count',
+            'temporal_gap_targeted_task_count',
+            'temporal_missing_anchor_task_count',
+            'temporal_missing_predicate_count',
+            'temporal_required_provenance_kind_count',
+            'temporal_rule_status_counts',
+            'temporal_rule_blocking_reason_counts',
+            'temporal_resolution_status_counts',
+            'chronology_anchor_coverage_ratio',
+            'chronology_predicate_coverage_ratio',
+            'chronology_provenance_coverage_ratio',
+            'chronology_readiness_score',
+            'chronology_ready_for_formalization',
+            'chronology_failure_reasons',
+            'proof_readiness_score',
+            'evidence_completion_ready',
+        }),
+    }
     
     def __init__(self, mediator=None):
         self.mediator = mediator
@@ -105,7 +193,9 @@ class PhaseManager:
             ComplaintPhase.FORMALIZATION: {}
         }
         self.iteration_count = 0
-        self.loss_history = []  # Track loss/noise over iterations
+        self.loss_history = []  # Track loss/noise over recent iterations
+        self.loss_history_limit = self.LOSS_HISTORY_LIMIT
+        self._loss_summary = self._new_loss_summary(self.loss_history)
         self._phase_action_getters: Dict[ComplaintPhase, Callable[[], Dict[str, Any]]] = {
             ComplaintPhase.INTAKE: self._get_intake_action,
             ComplaintPhase.EVIDENCE: self._get_evidence_action,
@@ -116,6 +206,10 @@ class PhaseManager:
             ComplaintPhase.EVIDENCE: self._is_evidence_complete,
             ComplaintPhase.FORMALIZATION: self._is_formalization_complete,
         }
+        self._dirty_views = set()
+        self._computed_views = set()
+        self._batch_depth = 0
+        self._derived_state_stats = self._new_derived_state_stats()
 
     def _extract_intake_gap_types(self, data: Dict[str, Any]) -> List[str]:
         """Collect normalized intake gap types from stored phase state."""
@@ -497,16 +591,89 @@ class PhaseManager:
         }
 
     def _refresh_phase_derived_state(self, phase: ComplaintPhase):
-        """Refresh derived readiness state after phase data changes."""
-        if phase == ComplaintPhase.INTAKE:
-            self.phase_data[phase].update(self._build_intake_readiness(self.phase_data[phase]))
-        elif phase == ComplaintPhase.EVIDENCE:
-            self.phase_data[phase].update(self._build_evidence_packet_summary(self.phase_data[phase]))
+        """Recompute the derived view for ``phase`` and merge it into its data."""
+        method_name = self._DERIVED_VIEW_BUILDERS.get(phase)
+        self._dirty_views.discard(phase)
+        if method_name is None:
+            return
+        self.phase_data[phase].update(getattr(self, method_name)(self.phase_data[phase]))
+        self._computed_views.add(phase)
+        stats = self._derived_state_stats
+        stats['recomputes'][phase.value] = stats['recomputes'].get(phase.value, 0) + 1
+        stats['current_batch_recomputes'] += 1
+
+    def _mark_derived_view_dirty(self, phase: ComplaintPhase, key: str) -> bool:
+        """Mark the derived view for ``phase`` dirty when ``key`` feeds it."""
+        if phase not in self._DERIVED_VIEW_BUILDERS:
+            return False
+        if (
+            phase in self._computed_views
+            and key not in self._DERIVED_VIEW_INPUTS[phase]
+            and key not in self._DERIVED_VIEW_OUTPUTS[phase]
+        ):
+            return False
+        self._dirty_views.add(phase)
+        return True
+
+    def _derived_phase_data(self, phase: ComplaintPhase) -> Dict[str, Any]:
+        """Return phase data with its derived view brought up to date."""
+        if phase in self._dirty_views:
+            self._refresh_phase_derived_state(phase)
+        return self.phase_data[phase]
+
+    def _new_derived_state_stats(self) -> Dict[str, Any]:
+        return {
+            'writes': 0,
+            'dirty_writes': 0,
+            'recomputes': {phase.value: 0 for phase in self._DERIVED_VIEW_BUILDERS},
+            'batches': 0,
+            'current_batch_recomputes': 0,
+            'last_batch_recomputes': 0,
+            'max_batch_recomputes': 0,
+        }
+
+    @contextmanager
+    def batch_updates(self) -> Iterator['PhaseManager']:
+        """
+        Group the phase-data writes of one turn.
+
+        Derived views are only recomputed when read, so a turn that writes
+        several keys and then reads readiness recomputes each view once.
+        The batch scopes the per-turn recompute counters reported by
+        ``get_derived_state_stats``; nested batches count as one.
+        """
+        stats = self._derived_state_stats
+        if self._batch_depth == 0:
+            stats['current_batch_recomputes'] = 0
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                stats['batches'] += 1
+                stats['last_batch_recomputes'] = stats['current_batch_recomputes']
+                stats['max_batch_recomputes'] = max(stats['max_batch_recomputes'], stats['current_batch_recomputes'])
+
+    def get_derived_state_stats(self) -> Dict[str, Any]:
+        """Return write, recompute and per-batch recompute counters for derived views."""
+        stats = self._derived_state_stats
+        return {
+            'writes': stats['writes'],
+            'dirty_writes': stats['dirty_writes'],
+            'recomputes': dict(stats['recomputes']),
+            'total_recomputes': sum(stats['recomputes'].values()),
+            'batches': stats['batches'],
+            'last_batch_recomputes': stats['last_batch_recomputes'],
+            'max_batch_recomputes': stats['max_batch_recomputes'],
+            'dirty_views': sorted(phase.value for phase in self._dirty_views),
+        }
 
     def get_intake_readiness(self) -> Dict[str, Any]:
         """Return derived intake readiness state."""
-        self._refresh_phase_derived_state(ComplaintPhase.INTAKE)
-        data = self.phase_data[ComplaintPhase.INTAKE]
+        if ComplaintPhase.INTAKE not in self._computed_views:
+            self._dirty_views.add(ComplaintPhase.INTAKE)
+        data = self._derived_phase_data(ComplaintPhase.INTAKE)
         return {
             'score': data.get('intake_readiness_score', 0.0),
             'blockers': list(data.get('intake_readiness_blockers', [])),
@@ -1125,7 +1292,7 @@ class PhaseManager:
         - Knowledge graph has been enhanced with evidence
         - Critical evidence gaps are below threshold
         """
-        data = self.phase_data[ComplaintPhase.EVIDENCE]
+        data = self._derived_phase_data(ComplaintPhase.EVIDENCE)
         
         evidence_gathered = data.get('evidence_count', 0) > 0
         kg_enhanced = data.get('knowledge_graph_enhanced', False)
@@ -1177,12 +1344,16 @@ class PhaseManager:
     def update_phase_data(self, phase: ComplaintPhase, key: str, value: Any):
         """Update data for a specific phase."""
         self.phase_data[phase][key] = value
-        self._refresh_phase_derived_state(phase)
+        self._derived_state_stats['writes'] += 1
+        if self._mark_derived_view_dirty(phase, key):
+            self._derived_state_stats['dirty_writes'] += 1
         logger.debug("Updated %s data: %s = %s", phase.value, key, value)
     
     def get_phase_data(self, phase: ComplaintPhase, key: str = None) -> Any:
         """Get data for a specific phase."""
-        data = self.phase_data[phase]
+        if key and key not in self._DERIVED_VIEW_OUTPUTS.get(phase, ()):
+            return self.phase_data[phase].get(key)
+        data = self._derived_phase_data(phase)
         if key:
             return data.get(key)
         return data
@@ -1197,13 +1368,20 @@ class PhaseManager:
         """
         self.iteration_count += 1
         phase_value = self.current_phase.value
-        self.loss_history.append({
+        entry = {
             'iteration': self.iteration_count,
             'loss': loss,
             'phase': phase_value,
             'metrics': metrics,
             'timestamp': _utc_now_isoformat()
-        })
+        }
+        summary = self._loss_aggregates()
+        self._fold_loss_entry(summary, entry)
+        self.loss_history.append(entry)
+        overflow = len(self.loss_history) - max(1, int(self.loss_history_limit))
+        if overflow > 0:
+            del self.loss_history[:overflow]
+        summary['size'] = len(self.loss_history)
         logger.info(
             "Iteration %s: loss=%.4f, phase=%s",
             self.iteration_count,
@@ -1211,6 +1389,43 @@ class PhaseManager:
             phase_value,
         )
     
+    @staticmethod
+    def _new_loss_summary(history: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {'source': history, 'size': 0, 'count': 0, 'total': 0.0, 'min': None, 'by_phase': {}}
+
+    @staticmethod
+    def _fold_loss_entry(summary: Dict[str, Any], entry: Dict[str, Any]) -> None:
+        summary['count'] += 1
+        summary['total'] += entry.get('loss', 0.0)
+        loss = entry.get('loss', float('inf'))
+        if summary['min'] is None or loss < summary['min']:
+            summary['min'] = loss
+        phase_value = entry.get('phase')
+        summary['by_phase'][phase_value] = summary['by_phase'].get(phase_value, 0) + 1
+
+    def _loss_aggregates(self) -> Dict[str, Any]:
+        """Return running loss aggregates, catching up with direct edits to ``loss_history``."""
+        summary = self._loss_summary
+        history = self.loss_history
+        if summary['source'] is not history or summary['size'] > len(history):
+            summary = self._new_loss_summary(history)
+            self._loss_summary = summary
+        for entry in history[summary['size']:]:
+            self._fold_loss_entry(summary, entry)
+        summary['size'] = len(history)
+        return summary
+
+    def get_loss_summary(self) -> Dict[str, Any]:
+        """Return iteration count, mean and minimum loss over every recorded iteration."""
+        summary = self._loss_aggregates()
+        return {
+            'count': summary['count'],
+            'total': summary['total'],
+            'min': summary['min'],
+            'by_phase': dict(summary['by_phase']),
+            'retained': len(self.loss_history),
+        }
+
     def has_converged(self, window: int = 5, threshold: float = 0.01) -> bool:
         """
         Check if iterations have converged.
@@ -1246,7 +1461,7 @@ class PhaseManager:
     
     def _get_intake_action(self) -> Dict[str, Any]:
         """Get next action for intake phase."""
-        data = self.phase_data[ComplaintPhase.INTAKE]
+        data = self._derived_phase_data(ComplaintPhase.INTAKE)
 
         readiness = self.get_intake_readiness()
 
@@ -1315,7 +1530,7 @@ class PhaseManager:
     
     def _get_evidence_action(self) -> Dict[str, Any]:
         """Get next action for evidence phase."""
-        data = self.phase_data[ComplaintPhase.EVIDENCE]
+        data = self._derived_phase_data(ComplaintPhase.EVIDENCE)
         packets = data.get('claim_support_packets')
         prioritized_alignment_tasks = self._get_actionable_alignment_tasks(data)
         evidence_workflow_action_queue = (
@@ -1431,10 +1646,11 @@ class PhaseManager:
             'current_phase': self.current_phase.value,
             'phase_history': self.phase_history,
             'phase_data': {
-                phase.value: data for phase, data in self.phase_data.items()
+                phase.value: self._derived_phase_data(phase) for phase in self.phase_data
             },
             'iteration_count': self.iteration_count,
-            'loss_history': self.loss_history
+            'loss_history': self.loss_history,
+            'loss_summary': self.get_loss_summary(),
         }
     
     @classmethod
@@ -1447,8 +1663,23 @@ class PhaseManager:
             ComplaintPhase(phase_str): phase_data 
             for phase_str, phase_data in data['phase_data'].items()
         }
+        manager._dirty_views = {
+            phase for phase, phase_data in manager.phase_data.items()
+            if phase_data and phase in cls._DERIVED_VIEW_BUILDERS
+        }
+        manager._computed_views = set(manager._dirty_views)
         manager.iteration_count = data['iteration_count']
         manager.loss_history = data['loss_history']
+        loss_summary = data.get('loss_summary')
+        if isinstance(loss_summary, dict):
+            manager._loss_summary = {
+                'source': manager.loss_history,
+                'size': len(manager.loss_history),
+                'count': loss_summary.get('count', 0),
+                'total': loss_summary.get('total', 0.0),
+                'min': loss_summary.get('min'),
+                'by_phase': dict(loss_summary.get('by_phase') or {}),
+            }
         return manager
 
     # ============================================================================
@@ -1515,8 +1746,7 @@ class PhaseManager:
         Returns:
             Number of iterations in this phase.
         """
-        phase_value = phase.value
-        return sum(1 for h in self.loss_history if h.get('phase') == phase_value)
+        return self._loss_aggregates()['by_phase'].get(phase.value, 0)
     
     def average_loss(self) -> float:
         """Calculate the average loss across all recorded iterations.
@@ -1524,10 +1754,10 @@ class PhaseManager:
         Returns:
             Mean loss value, or 0.0 if no iterations.
         """
-        if not self.loss_history:
+        summary = self._loss_aggregates()
+        if not summary['count']:
             return 0.0
-        total_loss = sum(entry.get('loss', 0.0) for entry in self.loss_history)
-        return total_loss / len(self.loss_history)
+        return summary['total'] / summary['count']
     
     def minimum_loss(self) -> float:
         """Find the minimum loss value across all iterations.
@@ -1535,9 +1765,10 @@ class PhaseManager:
         Returns:
             Minimum loss achieved, or float('inf') if no iterations.
         """
-        if not self.loss_history:
+        summary = self._loss_aggregates()
+        if summary['min'] is None:
             return float('inf')
-        return min(entry.get('loss', float('inf')) for entry in self.loss_history)
+        return summary['min']
     
     def has_phase_data_key(self, phase: ComplaintPhase, key: str) -> bool:
         """Check if a specific data key exists for a phase.
@@ -1549,6 +1780,8 @@ class PhaseManager:
         Returns:
             True if the key exists in phase data, False otherwise.
         """
+        if key in self._DERIVED_VIEW_OUTPUTS.get(phase, ()) and phase in self.phase_data:
+            return key in self._derived_phase_data(phase)
         return key in self.phase_data.get(phase, {})
     
     def phase_data_coverage(self) -> float:
@@ -16,6 +16,11 @@ from intake_status import (
 from complaint_phases import ComplaintPhase
 from claim_support_review import summarize_claim_reasoning_review
 
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - depends on optional install state
+    np = None
+
 try:
     from integrations.ipfs_datasets.llm import generate_text_with_metadata
 except Exception:
@@ -38,6 +43,12 @@ except Exception:
     def get_embeddings_router(*args, **kwargs):
         return None
 
+try:
+    from integrations.ipfs_datasets.embedding_cache import get_embedding_cache
+except Exception:
+    def get_embedding_cache():
+        return None
+
 try:
     from integrations.ipfs_datasets.loader import import_attr_optional
 except Exception:
@@ -1179,6 +1190,8 @@ class AgenticDocumentOptimizer:
         self.llm_config: Dict[str, Any] = {"timeout": DEFAULT_OPTIMIZER_LLM_TIMEOUT_SECONDS}
         self._embeddings_router = None
         self._embedding_cache: Dict[str, List[float]] = {}
+        self._embedding_rows: Dict[str, int] = {}
+        self._embedding_matrix: Any = None
         self._upstream_llm_router = None
         self._router_usage: Dict[str, Any] = {}
         self._stage_provider_selection: Dict[str, Dict[str, Any]] = {}
@@ -2132,6 +2145,8 @@ class AgenticDocumentOptimizer:
     def _reset_runtime_state(self) -> None:
         self._embeddings_router = None
         self._embedding_cache = {}
+        self._embedding_rows = {}
+        self._embedding_matrix = None
         self._upstream_llm_router = None
         self._stage_provider_selection = {}
         self._router_usage = {
@@ -2141,6 +2156,9 @@ class AgenticDocumentOptimizer:
             "embedding_requests": 0,
             "embedding_cache_hits": 0,
             "embedding_rankings": 0,
+            "embedding_shared_cache_hits": 0,
+            "embedding_batches": 0,
+            "embedding_batch_sizes": [],
             "ranked_candidate_count": 0,
             "ipfs_store_attempted": False,
             "ipfs_store_succeeded": False,
@@ -4435,13 +4453,12 @@ class AgenticDocumentOptimizer:
                 ranked.append({**row, "score": lexical_score, "lexical_score": lexical_score, "ranking_method": "lexical_fallback"})
             return sorted(ranked, key=lambda row: row.get("score", 0.0), reverse=True)
 
-        query_vector = self._embed_text(router, query)
+        texts = [str(row.get("text") or "") for row in candidates]
+        vectors = self._embed_texts(router, [query, *texts])
         self._router_usage["embedding_rankings"] = int(self._router_usage.get("embedding_rankings") or 0) + 1
+        semantic_scores = self._semantic_scores(query, vectors[0], texts, vectors[1:])
         ranked = []
-        for row in candidates:
-            text = str(row.get("text") or "")
-            candidate_vector = self._embed_text(router, text)
-            semantic_score = self._cosine_similarity(query_vector, candidate_vector)
+        for row, text, semantic_score in zip(candidates, texts, semantic_scores):
             lexical_score = self._lexical_overlap_score(query_terms, text)
             score = _clamp((semantic_score * 0.8) + (lexical_score * 0.2), 0.0, 1.0)
             ranked.append(
@@ -4455,6 +4472,161 @@ class AgenticDocumentOptimizer:
             )
         return sorted(ranked, key=lambda row: row.get("score", 0.0), reverse=True)
 
+    def _semantic_scores(
+        self,
+        query: str,
+        query_vector: List[float],
+        texts: List[str],
+        vectors: List[List[float]],
+    ) -> List[float]:
+        """Score every candidate against the query with one matrix-vector product.
+
+        Rows live pre-normalized in ``_embedding_matrix``; candidates whose
+        vectors are missing from the matrix (no NumPy, empty or mismatched
+        dimensions) fall back to the pure-Python cosine.
+        """
+        query_row = self._embedding_rows.get(query)
+        if np is None or query_row is None:
+            return [self._cosine_similarity(query_vector, vector) for vector in vectors]
+        row_indexes = [self._embedding_rows.get(text, -1) for text in texts]
+        matched = [position for position, row_index in enumerate(row_indexes) if row_index >= 0]
+        scores = [0.0] * len(texts)
+        if matched:
+            matrix = self._embedding_matrix
+            products = matrix[[row_indexes[position] for position in matched]] @ matrix[query_row]
+            for position, value in zip(matched, products.tolist()):
+                scores[position] = float(value)
+        for position, row_index in enumerate(row_indexes):
+            if row_index < 0:
+                scores[position] = self._cosine_similarity(query_vector, vectors[position])
+        return scores
+
+    def _embed_texts(self, router: Any, texts: List[str]) -> List[List[float]]:
+        """Embed ``texts`` in order, sending every uncached text in one batch call.
+
+        Routers without ``embed_texts_batched``/``embed_texts``, or whose batch
+        call fails or returns the wrong number of vectors, fall back to
+        :meth:`_embed_text` one text at a time.
+        """
+        keys = [str(text or "") for text in texts]
+        pending: List[str] = []
+        seen: set[str] = set()
+        for key in keys:
+            if key in self._embedding_cache:
+                self._router_usage["embedding_cache_hits"] = int(self._router_usage.get("embedding_cache_hits") or 0) + 1
+            elif key not in seen:
+                seen.add(key)
+                pending.append(key)
+        shared_cache = get_embedding_cache() if pending else None
+        namespace = self._embedding_namespace(router)
+        if shared_cache is not None:
+            for key, vector in zip(pending, shared_cache.get_many(pending, **namespace)):
+                if vector:
+                    self._router_usage["embedding_shared_cache_hits"] = int(self._router_usage.get("embedding_shared_cache_hits") or 0) + 1
+                    self._store_embedding(key, vector)
+            pending = [key for key in pending if key not in self._embedding_cache]
+        if pending:
+            batch_vectors = self._embed_batch(router, pending)
+            if batch_vectors is None:
+                for key in pending:
+                    self._embed_text(router, key)
+            else:
+                for key, vector in zip(pending, batch_vectors):
+                    self._store_embedding(key, vector)
+            if shared_cache is not None:
+                embedded = [key for key in pending if self._embedding_cache.get(key)]
+                shared_cache.put_many(embedded, [self._embedding_cache[key] for key in embedded], **namespace)
+        return [list(self._embedding_cache.get(key) or []) for key in keys]
+
+    def _embedding_namespace(self, router: Any) -> Dict[str, str]:
+        """Return the shared-cache namespace (provider, model) for ``router``.
+
+        Routers built from the embeddings config share vectors with the local
+        vector index; any other router object gets its own namespace.
+        """
+        embeddings_config = self.llm_config.get("embeddings") if isinstance(self.llm_config.get("embeddings"), dict) else None
+        if embeddings_config is None and isinstance(self.llm_config.get("embeddings_config"), dict):
+            embeddings_config = self.llm_config.get("embeddings_config")
+        embeddings_config = embeddings_config or {}
+        router_type = type(router)
+        if router_type.__name__ == "EmbeddingsRouter":
+            provider = str(embeddings_config.get("provider") or "ipfs_datasets_py.auto")
+        else:
+            provider = str(embeddings_config.get("provider") or f"{router_type.__module__}.{router_type.__qualname__}")
+        return {"provider": provider, "model_name": str(embeddings_config.get("model_name") or embeddings_config.get("model") or "")}
+
+    def _embed_batch(self, router: Any, texts: List[str]) -> Optional[List[List[float]]]:
+        for method_name in ("embed_texts_batched", "embed_texts"):
+            method = getattr(router, method_name, None)
+            if not callable(method):
+                continue
+            try:
+                self._router_usage["embedding_requests"] = int(self._router_usage.get("embedding_requests") or 0) + 1
+                result = method(list(texts))
+            except Exception:
+                continue
+            if isinstance(result, dict):
+                for key in ("embeddings", "vectors", "values"):
+                    if result.get(key) is not None:
+                        result = result.get(key)
+                        break
+            if hasattr(result, "tolist"):
+                result = result.tolist()
+            if not isinstance(result, (list, tuple)) or len(result) != len(texts):
+                continue
+            vectors = [self._coerce_embedding(item) for item in result]
+            if any(vector is None for vector in vectors):
+                continue
+            self._router_usage["embedding_batches"] = int(self._router_usage.get("embedding_batches") or 0) + 1
+            self._router_usage.setdefault("embedding_batch_sizes", []).append(len(texts))
+            return vectors
+        return None
+
+    def _coerce_embedding(self, vector: Any) -> Optional[List[float]]:
+        if isinstance(vector, dict):
+            for key in ("embedding", "vector", "values"):
+                if isinstance(vector.get(key), (list, tuple)) or hasattr(vector.get(key), "tolist"):
+                    vector = vector.get(key)
+                    break
+        if hasattr(vector, "tolist") and not isinstance(vector, (list, tuple)):
+            vector = vector.tolist()
+        if isinstance(vector, (list, tuple)):
+            try:
+                return [float(value) for value in vector]
+            except (TypeError, ValueError):
+                return None
+        return None
+
+    def _store_embedding(self, key: str, vector: List[float]) -> None:
+        self._embedding_cache[key] = vector
+        if np is None or not vector or key in self._embedding_rows:
+            return
+        matrix = self._embedding_matrix
+        if matrix is not None and matrix.shape[1] != len(vector):
+            return
+        row = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(row))
+        if norm > 0.0:
+            row = row / norm
+        row_count = len(self._embedding_rows)
+        if matrix is None:
+            matrix = np.zeros((16, len(vector)), dtype=np.float32)
+        elif row_count >= matrix.shape[0]:
+            grown = np.zeros((matrix.shape[0] * 2, matrix.shape[1]), dtype=np.float32)
+            grown[:row_count] = matrix[:row_count]
+            matrix = grown
+        matrix[row_count] = row
+        self._embedding_matrix = matrix
+        self._embedding_rows[key] = row_count
+
+    def _embedding_cache_hit_rate(self) -> float:
+        local_hits = int(self._router_usage.get("embedding_cache_hits") or 0)
+        shared_hits = int(self._router_usage.get("embedding_shared_cache_hits") or 0)
+        requested = local_hits + len(self._embedding_cache)
+        if requested <= 0:
+            return 0.0
+        return round((local_hits + shared_hits) / requested, 4)
+
     def _get_embeddings_router(self) -> Any:
         if not EMBEDDINGS_AVAILABLE:
             return None
@@ -4485,18 +4657,9 @@ class AgenticDocumentOptimizer:
                     vector = method(text)
                 except Exception:
                     continue
-                if isinstance(vector, dict):
-                    for key in ("embedding", "vector", "values"):
-                        if isinstance(vector.get(key), (list, tuple)):
-                            vector = vector.get(key)
-                            break
-                if isinstance(vector, list):
-                    normalized = [float(value) for value in vector]
-                    self._embedding_cache[cache_key] = normalized
-                    return list(normalized)
-                if isinstance(vector, tuple):
-                    normalized = [float(value) for value in vector]
-                    self._embedding_cache[cache_key] = normalized
+                normalized = self._coerce_embedding(vector)
+                if normalized is not None:
+                    self._store_embedding(cache_key, normalized)
                     return list(normalized)
         return []
 
@@ -4546,6 +4709,10 @@ class AgenticDocumentOptimizer:
             "embedding_requests": int(self._router_usage.get("embedding_requests") or 0),
             "embedding_cache_hits": int(self._router_usage.get("embedding_cache_hits") or 0),
             "embedding_rankings": int(self._router_usage.get("embedding_rankings") or 0),
+            "embedding_shared_cache_hits": int(self._router_usage.get("embedding_shared_cache_hits") or 0),
+            "embedding_batches": int(self._router_usage.get("embedding_batches") or 0),
+            "embedding_batch_sizes": list(self._router_usage.get("embedding_batch_sizes") or []),
+            "embedding_cache_hit_rate": self._embedding_cache_hit_rate(),
             "ranked_candidate_count": int(self._router_usage.get("ranked_candidate_count") or 0),
             "ipfs_store_attempted": bool(self._router_usage.get("ipfs_store_attempted")),
             "ipfs_store_succeeded": bool(self._router_usage.get("ipfs_store_succeeded")),
@@ -39,6 +39,12 @@ from .search import (
 	search_brave_web,
 	search_multi_engine_web,
 )
+from .http_cache import (
+	CachedHttpSession,
+	HttpResponseCache,
+	get_http_session,
+	set_http_session,
+)
 from .documents import (
 	DOCUMENTS_AVAILABLE,
 	DOCUMENTS_ERROR,
@@ -75,6 +81,14 @@ from .storage import (
 	set_default_ipfs_backend,
 )
 from .vector_store import (
+	EmbeddingCache,
+	LocalVectorIndex,
+	VectorIndexHandle,
+	append_to_vector_index,
+	clear_vector_index_handles,
+	delete_from_vector_index,
+	get_vector_index_handle,
+	search_vector_index_many,
 	EMBEDDINGS_AVAILABLE,
 	EMBEDDINGS_ERROR,
 	VECTOR_STORE_AVAILABLE,
@@ -83,6 +97,7 @@ from .vector_store import (
 	embeddings_backend_status,
 	vector_index_backend_status,
 	create_vector_index,
+	get_embedding_cache,
 	get_embeddings_router,
 	search_vector_index,
 )
@@ -145,6 +160,10 @@ __all__ = [
 	"recover_manifest_downloads",
 	"search_brave_web",
 	"search_multi_engine_web",
+	"CachedHttpSession",
+	"HttpResponseCache",
+	"get_http_session",
+	"set_http_session",
 	"extract_text_content",
 	"DOCUMENTS_AVAILABLE",
 	"DOCUMENTS_ERROR",
@@ -161,4 +180,13 @@ __all__ = [
 	"create_vector_index",
 	"search_vector_index",
 	"get_embeddings_router",
+	"EmbeddingCache",
+	"get_embedding_cache",
+	"LocalVectorIndex",
+	"append_to_vector_index",
+	"delete_from_vector_index",
+	"VectorIndexHandle",
+	"get_vector_index_handle",
+	"clear_vector_index_handles",
+	"search_vector_index_many",
 ]
@@ -0,0 +1,463 @@
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import re
+import threading
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_MAX_DISK_BYTES = 256 * 1024 * 1024
+EMBEDDING_CACHE_DIR_ENV = "COMPLAINT_GENERATOR_EMBEDDING_CACHE_DIR"
+
+_DIGEST_SIZE = 32
+_FLOAT_SIZE = array("f").itemsize
+
+
+def _namespace(model_name: Optional[str], provider: Optional[str]) -> Tuple[str, str]:
+    return (str(provider or "").strip(), str(model_name or "").strip())
+
+
+def embedding_cache_key(text: str, *, model_name: Optional[str] = None, provider: Optional[str] = None) -> str:
+    """Return the content hash used to cache ``text`` for one provider/model."""
+    provider_name, model = _namespace(model_name, provider)
+    payload = "\x00".join((provider_name, model, str(text or "")))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _DiskVectorStore:
+    """Append-only file of fixed-size ``digest + float32[dimension]`` records.
+
+    The file is memory-mapped for reads and only appended to, so several
+    processes can share one store; readers pick up new records whenever the
+    file grows. When the store would exceed ``max_bytes`` it rotates to a new
+    generation file. The ``.dim`` header records the dimension and the current
+    generation and is swapped with ``os.replace``, so a data file is never
+    truncated or rewritten while another process has it mapped.
+
+    Appends and rotations hold the store lock (an ``flock`` on the ``.lock``
+    file where available), and a writer re-reads the generation under it, so
+    nobody appends to a file that was just rotated away. A data file whose
+    size is not a whole number of records was torn by an interrupted append;
+    its complete records are copied into a new generation instead of being
+    read at shifted offsets.
+    """
+
+    _thread_locks: Dict[str, threading.Lock] = {}
+    _thread_locks_guard = threading.Lock()
+
+    def __init__(self, path: Path, *, max_bytes: int) -> None:
+        self.path = path
+        self.max_bytes = max(0, int(max_bytes))
+        self.dimension = 0
+        self.generation = 0
+        self._header_signature: Optional[Tuple[int, int, int]] = None
+        self._rows: Dict[bytes, int] = {}
+        self._indexed_bytes = 0
+        self._mapped_size = 0
+        self._mmap: Optional[mmap.mmap] = None
+        self._handle: Any = None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._refresh()
+
+    @property
+    def record_size(self) -> int:
+        return _DIGEST_SIZE + self.dimension * _FLOAT_SIZE
+
+    @property
+    def header_path(self) -> Path:
+        return self.path.with_suffix(".dim")
+
+    @property
+    def lock_path(self) -> Path:
+        return self.path.with_suffix(".lock")
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._thread_locks_guard:
+            thread_lock = self._thread_locks.setdefault(str(self.path), threading.Lock())
+        with thread_lock:
+            if fcntl is None:
+                yield
+                return
+            with self.lock_path.open("a") as handle:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _data_path(self, generation: int) -> Path:
+        if not generation:
+            return self.path
+        return self.path.with_name(f"{self.path.stem}.{generation}{self.path.suffix}")
+
+    def _close_map(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        self._mapped_size = 0
+
+    def _reset_rows(self) -> None:
+        self._close_map()
+        self._rows = {}
+        self._indexed_bytes = 0
+
+    def _sync_header(self) -> None:
+        """Follow a generation rotated by this or another process."""
+        try:
+            stat = self.header_path.stat()
+        except FileNotFoundError:
+            stat = None
+        signature = (stat.st_ino, stat.st_size, stat.st_mtime_ns) if stat is not None else None
+        if signature == self._header_signature:
+            return
+        self._header_signature = signature
+        dimension, generation = self._read_header()
+        if dimension:
+            self.dimension = dimension
+        if generation != self.generation:
+            self.generation = generation
+            self._reset_rows()
+
+    def _read_header(self) -> Tuple[int, int]:
+        try:
+            fields = self.header_path.read_text(encoding="utf-8").split()
+            return int(fields[0]) if fields else 0, int(fields[1]) if len(fields) > 1 else 0
+        except (FileNotFoundError, ValueError):
+            return 0, 0
+
+    def _write_header(self, generation: int) -> None:
+        temp_path = self.header_path.with_name(
+            f"{self.header_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        temp_path.write_text(f"{self.dimension} {generation}", encoding="utf-8")
+        os.replace(temp_path, self.header_path)
+        self._sync_header()
+
+    def _refresh(self) -> None:
+        self._sync_header()
+        try:
+            size = self._data_path(self.generation).stat().st_size
+        except FileNotFoundError:
+            self._reset_rows()
+            return
+        if self.dimension and size % self.record_size:
+            self._repair_torn_file()
+            self._sync_header()
+            try:
+                size = self._data_path(self.generation).stat().st_size
+            except FileNotFoundError:
+                self._reset_rows()
+                return
+        if size < self._mapped_size:
+            self._reset_rows()
+        if size == self._mapped_size or size <= _DIGEST_SIZE or not self.dimension:
+            return
+        self._close_map()
+        self._handle = self._data_path(self.generation).open("rb")
+        self._mmap = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._mapped_size = size
+        record_size = self.record_size
+        # ``range`` stops at the last whole record, in case another append
+        # tore the file since it was measured.
+        for offset in range(self._indexed_bytes, size - record_size + 1, record_size):
+            self._rows.setdefault(self._mmap[offset:offset + _DIGEST_SIZE], offset // record_size)
+            self._indexed_bytes = offset + record_size
+
+    def get(self, digest: bytes) -> Optional[List[float]]:
+        self._sync_header()
+        row = self._rows.get(digest)
+        if row is None:
+            self._refresh()
+            row = self._rows.get(digest)
+            if row is None:
+                return None
+        start = row * self.record_size + _DIGEST_SIZE
+        stop = start + self.dimension * _FLOAT_SIZE
+        if self._mmap is None or stop > self._mapped_size:
+            return None
+        values = array("f")
+        values.frombytes(self._mmap[start:stop])
+        return values.tolist()
+
+    def put(self, digest: bytes, vector: Sequence[float]) -> bool:
+        if not vector:
+            return False
+        with self._locked():
+            # Re-read the generation under the lock: another writer may have
+            # rotated since this one last looked.
+            self._sync_header()
+            if not self.dimension:
+                self.dimension = len(vector)
+                self._write_header(self.generation)
+            if len(vector) != self.dimension or digest in self._rows:
+                return False
+            record = digest + array("f", vector).tobytes()
+            data_path = self._data_path(self.generation)
+            current_size = data_path.stat().st_size if data_path.exists() else 0
+            if current_size % self.record_size:
+                self._rotate(self._whole_records(data_path, current_size) + record)
+            elif self.max_bytes and current_size + len(record) > self.max_bytes:
+                self._rotate(record)
+            else:
+                with data_path.open("ab") as handle:
+                    handle.write(record)
+        return True
+
+    def _whole_records(self, data_path: Path, size: int) -> bytes:
+        with data_path.open("rb") as handle:
+            return handle.read(size - size % self.record_size)
+
+    def _repair_torn_file(self) -> None:
+        with self._locked():
+            self._sync_header()
+            data_path = self._data_path(self.generation)
+            try:
+                size = data_path.stat().st_size
+            except FileNotFoundError:
+                return
+            if size % self.record_size:
+                self._rotate(self._whole_records(data_path, size))
+
+    def _rotate(self, records: bytes) -> None:
+        """Start the next generation with ``records``; call with the store lock held."""
+        previous = self._data_path(self.generation)
+        generation = self.generation + 1
+        with self._data_path(generation).open("wb") as handle:
+            handle.write(records)
+        self._write_header(generation)
+        try:
+            # Readers that still map the old generation keep their pages.
+            previous.unlink()
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        self._reset_rows()
+        paths = [self.path, self.header_path, *self.path.parent.glob(f"{self.path.stem}.*{self.path.suffix}")]
+        for path in paths:
+            if path.exists():
+                path.unlink()
+        self.dimension = 0
+        self.generation = 0
+        self._header_signature = None
+
+    def close(self) -> None:
+        self._close_map()
+
+
+class EmbeddingCache:
+    """Content-hash keyed embedding cache with an LRU bound.
+
+    Entries are namespaced by ``(provider, model_name)`` so vectors from
+    different embedding models never mix. When ``cache_dir`` is set, every
+    namespace is also persisted to a memory-mapped append-only store so
+    repeated runs over the same corpus skip the embedding calls.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        cache_dir: Optional[str] = None,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_disk_bytes = int(max_disk_bytes)
+        self._entries: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._stores: Dict[Tuple[str, str], _DiskVectorStore] = {}
+        self._lock = threading.RLock()
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def _store_for(self, namespace: Tuple[str, str]) -> Optional[_DiskVectorStore]:
+        if self.cache_dir is None:
+            return None
+        store = self._stores.get(namespace)
+        if store is None:
+            provider_name, model = namespace
+            label = re.sub(r"[^A-Za-z0-9_.-]+", "_", f"{provider_name or 'default'}__{model or 'default'}")[:80]
+            suffix = hashlib.sha256("\x00".join(namespace).encode("utf-8")).hexdigest()[:12]
+            store = _DiskVectorStore(self.cache_dir / f"{label}-{suffix}.vectors", max_bytes=self.max_disk_bytes)
+            self._stores[namespace] = store
+        return store
+
+    def _remember(self, key: str, vector: List[float]) -> None:
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def get(self, text: str, *, model_name: Optional[str] = None, provider: Optional[str] = None) -> Optional[List[float]]:
+        return self.get_many([text], model_name=model_name, provider=provider)[0]
+
+    def get_many(
+        self,
+        texts: Iterable[str],
+        *,
+        model_name: Optional[str] = None,
+        provider: Optional[str] = None,
+    ) -> List[Optional[List[float]]]:
+        """Return cached vectors for ``texts`` in order, ``None`` for misses."""
+        namespace = _namespace(model_name, provider)
+        results: List[Optional[List[float]]] = []
+        with self._lock:
+            store = self._store_for(namespace)
+            for text in texts:
+                key = embedding_cache_key(text, model_name=model_name, provider=provider)
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                elif store is not None:
+                    vector = store.get(bytes.fromhex(key))
+                    if vector is not None:
+                        self._stats["disk_hits"] += 1
+                        self._remember(key, vector)
+                if vector is None:
+                    self._stats["misses"] += 1
+                results.append(list(vector) if vector is not None else None)
+        return results
+
+    def put(
+        self,
+        text: str,
+        vector: Sequence[float],
+        *,
+        model_name: Optional[str] = None,
+        provider: Optional[str] = None,
+    ) -> None:
+        self.put_many([text], [vector], model_name=model_name, provider=provider)
+
+    def put_many(
+        self,
+        texts: Iterable[str],
+        vectors: Iterable[Sequence[float]],
+        *,
+        model_name: Optional[str] = None,
+        provider: Optional[str] = None,
+    ) -> None:
+        namespace = _namespace(model_name, provider)
+        with self._lock:
+            store = self._store_for(namespace)
+            for text, vector in zip(texts, vectors):
+                try:
+                    values = [float(value) for value in vector]
+                except (TypeError, ValueError):
+                    continue
+                if not values:
+                    continue
+                key = embedding_cache_key(text, model_name=model_name, provider=provider)
+                self._remember(key, values)
+                self._stats["stores"] += 1
+                if store is not None:
+                    try:
+                        store.put(bytes.fromhex(key), values)
+                    except OSError:
+                        pass
+
+    def embed_many(
+        self,
+        texts: Sequence[str],
+        embed_missing: Callable[[List[str]], Sequence[Sequence[float]]],
+        *,
+        model_name: Optional[str] = None,
+        provider: Optional[str] = None,
+    ) -> List[List[float]]:
+        """Return vectors for ``texts``, calling ``embed_missing`` once for cache misses.
+
+        ``embed_missing`` receives the unique uncached texts in first-seen
+        order and must return one vector per text.
+        """
+        texts = [str(text or "") for text in texts]
+        cached = self.get_many(texts, model_name=model_name, provider=provider)
+        missing: List[str] = []
+        for text, vector in zip(texts, cached):
+            if vector is None and text not in missing:
+                missing.append(text)
+        if missing:
+            embedded = [list(vector) for vector in embed_missing(list(missing))]
+            if len(embedded) != len(missing):
+                raise ValueError(
+                    f"Embedding backend returned {len(embedded)} vectors for {len(missing)} texts"
+                )
+            self.put_many(missing, embedded, model_name=model_name, provider=provider)
+            by_text = dict(zip(missing, embedded))
+            cached = [vector if vector is not None else list(by_text[text]) for text, vector in zip(texts, cached)]
+        return [list(vector or []) for vector in cached]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["disk_hits"] + self._stats["misses"]
+            hits = self._stats["hits"] + self._stats["disk_hits"]
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "persistent": self.cache_dir is not None,
+                "cache_dir": str(self.cache_dir) if self.cache_dir is not None else "",
+            }
+
+    def clear(self, *, include_disk: bool = False) -> None:
+        with self._lock:
+            self._entries.clear()
+            for key in self._stats:
+                self._stats[key] = 0
+            if include_disk:
+                for store in self._stores.values():
+                    store.clear()
+            for store in self._stores.values():
+                store.close()
+            self._stores = {}
+
+
+_shared_cache: Optional[EmbeddingCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Return the process-wide embedding cache.
+
+    The cache is persisted under ``$COMPLAINT_GENERATOR_EMBEDDING_CACHE_DIR``
+    when that variable is set and kept in memory only otherwise.
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = EmbeddingCache(cache_dir=os.environ.get(EMBEDDING_CACHE_DIR_ENV) or None)
+        return _shared_cache
+
+
+def set_embedding_cache(cache: Optional[EmbeddingCache]) -> None:
+    """Replace the process-wide embedding cache (``None`` rebuilds it lazily)."""
+    global _shared_cache
+    with _shared_cache_lock:
+        _shared_cache = cache
+
+
+__all__ = [
+    "DEFAULT_MAX_DISK_BYTES",
+    "DEFAULT_MAX_ENTRIES",
+    "EMBEDDING_CACHE_DIR_ENV",
+    "EmbeddingCache",
+    "embedding_cache_key",
+    "get_embedding_cache",
+    "set_embedding_cache",
+]
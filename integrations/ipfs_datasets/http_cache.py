@@ -0,0 +1,438 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+DEFAULT_TTL_SECONDS = 6 * 60 * 60
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+DEFAULT_POOL_MAXSIZE = 8
+DEFAULT_POOL_CONNECTIONS = 32
+HTTP_CACHE_DIR_ENV = "COMPLAINT_GENERATOR_HTTP_CACHE_DIR"
+
+_STORED_HEADERS = ("content-type", "etag", "last-modified", "vary")
+# Request headers that select a different representation of the same URL.
+_KEY_HEADERS = ("accept", "accept-language")
+# Requests carrying credentials are never answered from or stored in the
+# shared cache.
+_PRIVATE_HEADERS = ("authorization", "proxy-authorization", "cookie")
+
+
+def http_cache_key(
+    url: str,
+    params: Optional[Mapping[str, Any]] = None,
+    *,
+    method: str = "GET",
+    headers: Optional[Mapping[str, str]] = None,
+) -> str:
+    """Return the cache key for a request.
+
+    The key hashes the method, the canonical URL and the ``Accept`` and
+    ``Accept-Language`` request headers.
+    """
+    ordered = sorted((str(key), value) for key, value in (params or {}).items())
+    prepared = requests.Request(method.upper(), url, params=ordered).prepare()
+    request_headers = CaseInsensitiveDict(headers or {})
+    selected = "\x00".join(f"{name}={request_headers.get(name, '')}" for name in _KEY_HEADERS)
+    return hashlib.sha256(f"{method.upper()}\x00{prepared.url}\x00{selected}".encode("utf-8")).hexdigest()
+
+
+def _vary_names(response_headers: Mapping[str, str]) -> Tuple[str, ...]:
+    vary = str(CaseInsensitiveDict(response_headers or {}).get("vary") or "")
+    return tuple(sorted({name.strip().lower() for name in vary.split(",") if name.strip()}))
+
+
+class CachedResponse:
+    """Response served from the cache, with the parts of ``requests.Response`` callers use."""
+
+    from_cache = True
+
+    def __init__(self, entry: Dict[str, Any], content: bytes, *, revalidated: bool = False) -> None:
+        self.url = str(entry.get("url") or "")
+        self.status_code = int(entry.get("status_code") or 200)
+        self.headers = CaseInsensitiveDict(entry.get("headers") or {})
+        self.content = content
+        self.encoding = entry.get("encoding") or "utf-8"
+        self.revalidated = revalidated
+        self.ok = self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self, **kwargs: Any) -> Any:
+        return json.loads(self.text, **kwargs)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+class HttpResponseCache:
+    """Size-bounded response cache with content-addressed bodies.
+
+    Entries are keyed by ``http_cache_key`` and point at a body stored under
+    its own sha256, so identical payloads fetched through different URLs are
+    kept once. An entry whose response named request headers in ``Vary`` is
+    only served to requests sending the same values for them, and responses
+    with ``Vary: *`` are not stored. With ``cache_dir`` the entries and bodies live on disk and are
+    shared by every process using that directory; otherwise they are kept in
+    memory. Least recently used entries are evicted once the stored bodies
+    exceed ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._bodies: Dict[str, bytes] = {}
+        self._body_sizes: Dict[str, int] = {}
+        self._stored_bytes = 0
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "stale": 0,
+            "revalidated": 0,
+            "stores": 0,
+            "evictions": 0,
+        }
+        if self.cache_dir is not None:
+            (self.cache_dir / "entries").mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / "bodies").mkdir(parents=True, exist_ok=True)
+            self._load_index()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / "entries" / f"{key}.json"
+
+    def _body_path(self, digest: str) -> Path:
+        return self.cache_dir / "bodies" / digest
+
+    def _load_index(self) -> None:
+        entries = []
+        for path in (self.cache_dir / "entries").glob("*.json"):
+            try:
+                entries.append((path.stem, json.loads(path.read_text(encoding="utf-8"))))
+            except (OSError, ValueError):
+                continue
+        for key, entry in sorted(entries, key=lambda item: float(item[1].get("accessed_at") or 0.0)):
+            self._entries[key] = entry
+            self._track_body(str(entry.get("body_sha256") or ""), int(entry.get("size") or 0))
+
+    def _track_body(self, digest: str, size: int) -> None:
+        if digest and digest not in self._body_sizes:
+            self._body_sizes[digest] = size
+            self._stored_bytes += size
+
+    def _write_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        if self.cache_dir is None:
+            return
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None and self.cache_dir is not None:
+            try:
+                entry = json.loads(self._entry_path(key).read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return None
+            self._entries[key] = entry
+            self._track_body(str(entry.get("body_sha256") or ""), int(entry.get("size") or 0))
+        return entry
+
+    def _read_body(self, digest: str) -> Optional[bytes]:
+        if self.cache_dir is None:
+            return self._bodies.get(digest)
+        try:
+            return self._body_path(digest).read_bytes()
+        except OSError:
+            return None
+
+    def get(
+        self,
+        key: str,
+        request_headers: Optional[Mapping[str, str]] = None,
+    ) -> Optional[Tuple[Dict[str, Any], bytes, bool]]:
+        """Return ``(entry, body, fresh)`` for ``key`` or ``None`` on a miss."""
+        request_headers = CaseInsensitiveDict(request_headers or {})
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is not None and any(
+                request_headers.get(name, "") != value for name, value in (entry.get("vary") or {}).items()
+            ):
+                entry = None
+            body = self._read_body(str(entry.get("body_sha256") or "")) if entry is not None else None
+            if entry is None or body is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            entry["accessed_at"] = time.time()
+            fresh = time.time() - float(entry.get("stored_at") or 0.0) <= self.ttl_seconds
+            self._stats["hits" if fresh else "stale"] += 1
+            return entry, body, fresh
+
+    def put(
+        self,
+        key: str,
+        response: Any,
+        request_headers: Optional[Mapping[str, str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Store a successful response and return its cache entry.
+
+        ``request_headers`` supplies the values recorded for the header names
+        the response lists in ``Vary``. Returns ``None`` for ``Vary: *``.
+        """
+        vary_names = _vary_names(response.headers)
+        if "*" in vary_names:
+            return None
+        request_headers = CaseInsensitiveDict(request_headers or {})
+        content = bytes(response.content or b"")
+        digest = hashlib.sha256(content).hexdigest()
+        now = time.time()
+        entry = {
+            "url": str(getattr(response, "url", "") or ""),
+            "status_code": int(getattr(response, "status_code", 200) or 200),
+            "headers": {
+                name: value
+                for name in _STORED_HEADERS
+                if (value := (response.headers or {}).get(name))
+            },
+            "vary": {name: request_headers.get(name, "") for name in vary_names},
+            "encoding": getattr(response, "encoding", None) or "utf-8",
+            "body_sha256": digest,
+            "size": len(content),
+            "stored_at": now,
+            "accessed_at": now,
+        }
+        with self._lock:
+            if digest not in self._body_sizes:
+                if self.cache_dir is None:
+                    self._bodies[digest] = content
+                else:
+                    body_path = self._body_path(digest)
+                    if not body_path.exists():
+                        tmp_path = body_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+                        tmp_path.write_bytes(content)
+                        os.replace(tmp_path, body_path)
+                self._track_body(digest, len(content))
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._write_entry(key, entry)
+            self._stats["stores"] += 1
+            self._evict()
+        return entry
+
+    def mark_revalidated(self, key: str) -> None:
+        """Restart the TTL of ``key`` after the server answered ``304 Not Modified``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry["stored_at"] = entry["accessed_at"] = time.time()
+            self._write_entry(key, entry)
+            self._stats["revalidated"] += 1
+
+    def _evict(self) -> None:
+        while self._entries and self._stored_bytes > self.max_bytes:
+            key, entry = self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+            if self.cache_dir is not None:
+                try:
+                    self._entry_path(key).unlink()
+                except OSError:
+                    pass
+            digest = str(entry.get("body_sha256") or "")
+            if any(other.get("body_sha256") == digest for other in self._entries.values()):
+                continue
+            self._stored_bytes -= self._body_sizes.pop(digest, 0)
+            self._bodies.pop(digest, None)
+            if self.cache_dir is not None:
+                try:
+                    self._body_path(digest).unlink()
+                except OSError:
+                    pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["stale"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "stored_bytes": self._stored_bytes,
+                "max_bytes": self.max_bytes,
+                "hit_rate": round((self._stats["hits"] + self._stats["revalidated"]) / lookups, 4) if lookups else 0.0,
+                "persistent": self.cache_dir is not None,
+                "cache_dir": str(self.cache_dir) if self.cache_dir is not None else "",
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            if self.cache_dir is not None:
+                for path in [*self.cache_dir.glob("entries/*"), *self.cache_dir.glob("bodies/*")]:
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+            self._entries.clear()
+            self._bodies.clear()
+            self._body_sizes.clear()
+            self._stored_bytes = 0
+            for key in self._stats:
+                self._stats[key] = 0
+
+
+class CachedHttpSession:
+    """Pooled ``requests.Session`` that serves GETs through an ``HttpResponseCache``.
+
+    Connections are kept alive and limited to ``pool_maxsize`` per host.
+    Fresh entries are returned without touching the network. Stale entries
+    are revalidated with ``If-None-Match``/``If-Modified-Since`` when the
+    server sent an ETag or Last-Modified header. Requests with credentials
+    (an ``Authorization``, ``Proxy-Authorization`` or ``Cookie`` header, or
+    an ``auth`` argument) bypass the cache. Pass ``cache=None`` to pool
+    connections without caching.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[HttpResponseCache] = None,
+        *,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        self.cache = cache
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=max(1, int(pool_connections)),
+            pool_maxsize=max(1, int(pool_maxsize)),
+            pool_block=True,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if headers:
+            self.session.headers.update(headers)
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "network_requests": 0, "not_modified": 0}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def get(
+        self,
+        url: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: float = 30,
+        use_cache: bool = True,
+        **kwargs: Any,
+    ) -> Any:
+        """GET ``url``, answering from the cache when possible.
+
+        Returns a ``requests.Response`` for network fetches and a
+        ``CachedResponse`` for cache hits; both expose ``from_cache``.
+        """
+        self._count("requests")
+        request_headers = dict(headers or {})
+        effective_headers = CaseInsensitiveDict(self.session.headers)
+        effective_headers.update(request_headers)
+        cache = self.cache if use_cache else None
+        if kwargs.get("auth") is not None or self.session.auth is not None or any(
+            effective_headers.get(name) for name in _PRIVATE_HEADERS
+        ):
+            cache = None
+        key = http_cache_key(url, params, headers=effective_headers) if cache is not None else ""
+        cached = cache.get(key, effective_headers) if cache is not None else None
+        if cached is not None:
+            entry, body, fresh = cached
+            if fresh:
+                return CachedResponse(entry, body)
+            validators = entry.get("headers") or {}
+            if validators.get("etag"):
+                request_headers["If-None-Match"] = validators["etag"]
+            if validators.get("last-modified"):
+                request_headers["If-Modified-Since"] = validators["last-modified"]
+
+        self._count("network_requests")
+        response = self.session.get(url, params=params, headers=request_headers, timeout=timeout, **kwargs)
+        if cached is not None and response.status_code == 304:
+            self._count("not_modified")
+            cache.mark_revalidated(key)
+            return CachedResponse(cached[0], cached[1], revalidated=True)
+        response.from_cache = False
+        if cache is not None and response.status_code == 200:
+            cache.put(key, response, effective_headers)
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+        stats["cache"] = self.cache.stats() if self.cache is not None else None
+        return stats
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_shared_session: Optional[CachedHttpSession] = None
+_shared_session_lock = threading.Lock()
+
+
+def get_http_session() -> CachedHttpSession:
+    """Return the process-wide pooled, caching HTTP session.
+
+    Responses are persisted under ``$COMPLAINT_GENERATOR_HTTP_CACHE_DIR``
+    when that variable is set and kept in memory only otherwise.
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = CachedHttpSession(
+                HttpResponseCache(cache_dir=os.environ.get(HTTP_CACHE_DIR_ENV) or None)
+            )
+        return _shared_session
+
+
+def set_http_session(session: Optional[CachedHttpSession]) -> None:
+    """Replace the process-wide HTTP session (``None`` rebuilds it lazily)."""
+    global _shared_session
+    with _shared_session_lock:
+        previous, _shared_session = _shared_session, session
+    if previous is not None and previous is not session:
+        previous.close()
+
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "DEFAULT_POOL_MAXSIZE",
+    "DEFAULT_TTL_SECONDS",
+    "HTTP_CACHE_DIR_ENV",
+    "CachedHttpSession",
+    "CachedResponse",
+    "HttpResponseCache",
+    "get_http_session",
+    "http_cache_key",
+    "set_http_session",
+]
@@ -16,6 +16,7 @@ from urllib.parse import urlparse
 
 import requests
 
+from .http_cache import CachedHttpSession, get_http_session
 from .loader import import_attr_optional, run_async_compat
 from .types import with_adapter_metadata
 
@@ -156,7 +157,7 @@ def score_archive_url(url: str, terms: list[str]) -> int:
     return score
 
 
-def fetch_commoncrawl_latest_index(session: requests.Session) -> str:
+def fetch_commoncrawl_latest_index(session: CachedHttpSession) -> str:
     response = session.get("https://index.commoncrawl.org/collinfo.json", timeout=30)
     response.raise_for_status()
     indexes = response.json()
@@ -165,7 +166,7 @@ def fetch_commoncrawl_latest_index(session: requests.Session) -> str:
     return str(indexes[0]["cdx-api"])
 
 
-def fetch_commoncrawl_index_candidates(session: requests.Session) -> list[str]:
+def fetch_commoncrawl_index_candidates(session: CachedHttpSession) -> list[str]:
     response = session.get("https://index.commoncrawl.org/collinfo.json", timeout=30)
     response.raise_for_status()
     indexes = response.json()
@@ -181,7 +182,7 @@ def fetch_commoncrawl_index_candidates(session: requests.Session) -> list[str]:
     return candidates
 
 
-def commoncrawl_list_urls(session: requests.Session, cdx_api: str, site: str, limit: int) -> list[dict[str, Any]]:
+def commoncrawl_list_urls(session: CachedHttpSession, cdx_api: str, site: str, limit: int) -> list[dict[str, Any]]:
     response = session.get(cdx_api, params={"url": f"{site}/*", "output": "json", "limit": int(limit)}, timeout=60)
     response.raise_for_status()
     rows: list[dict[str, Any]] = []
@@ -196,7 +197,7 @@ def commoncrawl_list_urls(session: requests.Session, cdx_api: str, site: str, li
     return rows
 
 
-def fetch_archive_text(session: requests.Session, url: str) -> str:
+def fetch_archive_text(session: CachedHttpSession, url: str) -> str:
     response = session.get(url, timeout=30, headers={"User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36"})
     response.raise_for_status()
     html = response.text or ""
@@ -242,7 +243,7 @@ def discover_seeded_commoncrawl(
             deduped.append(term)
         site_terms[site] = deduped[:200]
 
-    session = requests.Session()
+    session = get_http_session()
     cdx_api_candidates = fetch_commoncrawl_index_candidates(session)
     cdx_api = cdx_api_candidates[0]
     candidates: Dict[str, Any] = {
@@ -0,0 +1,469 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - depends on optional install state
+    np = None
+
+
+INDEX_FORMAT_VERSION = 2
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("numpy is required for local vector persistence")
+
+
+def _normalize_rows(vectors: Any) -> Any:
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1) if matrix.size else matrix.reshape(0, 0)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True) if matrix.size else np.zeros((len(matrix), 1), dtype=np.float32)
+    return (matrix / np.maximum(norms, 1e-12)).astype(np.float32, copy=False)
+
+
+def _write_json_atomic(path: Path, payload: Dict[str, Any]) -> None:
+    temp_path = _staging_path(path)
+    temp_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def _staging_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.{uuid.uuid4().hex[:8]}.tmp")
+
+
+def _remove_files(paths: Iterable[Path]) -> None:
+    for path in paths:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            # Still mapped by an open index on a platform that forbids
+            # deleting open files; the next generation swap retries.
+            pass
+
+
+def _scan_line_offsets(records_path: Path) -> List[int]:
+    offsets = [0]
+    position = 0
+    with records_path.open("rb") as handle:
+        for line in handle:
+            position += len(line)
+            if line.strip():
+                offsets.append(position)
+            else:
+                offsets[-1] = position
+    return offsets
+
+
+class _Segment:
+    """One immutable batch of pre-normalized vectors plus its JSONL records.
+
+    Every file is mapped or opened when the segment loads, so a warm segment
+    keeps reading the files it was opened with even after :meth:`create`
+    moves the index to a new generation and deletes them.
+    """
+
+    def __init__(self, index_dir: Path, entry: Dict[str, Any], *, normalized: bool) -> None:
+        self.entry = entry
+        self.vectors_path = index_dir / entry["vectors_file"]
+        self.records_path = index_dir / entry["records_file"]
+        self.offsets_path = index_dir / entry["offsets_file"] if entry.get("offsets_file") else None
+        self.ids_path = index_dir / entry["ids_file"] if entry.get("ids_file") else None
+        self.deleted_rows = set(int(row) for row in entry.get("deleted_rows") or [])
+        if normalized:
+            self.vectors = np.load(self.vectors_path, mmap_mode="r")
+        else:
+            self.vectors = _normalize_rows(np.load(self.vectors_path))
+        if self.offsets_path is not None and self.offsets_path.exists():
+            self.offsets = np.load(self.offsets_path, mmap_mode="r")
+        else:
+            self.offsets = np.asarray(_scan_line_offsets(self.records_path), dtype=np.int64)
+        self._ids: Optional[List[str]] = None
+        self._records_handle: Any = self.records_path.open("rb")
+        self._ids_handle: Any = None
+        if self.ids_path is not None and self.ids_path.exists():
+            self._ids_handle = self.ids_path.open("rb")
+
+    @property
+    def count(self) -> int:
+        return int(len(self.vectors))
+
+    def ids(self) -> List[str]:
+        if self._ids is None:
+            if self._ids_handle is not None:
+                self._ids_handle.seek(0)
+                self._ids = [str(value) for value in json.loads(self._ids_handle.read().decode("utf-8"))]
+            else:
+                self._ids = [str(self.read_record(row).get("id")) for row in range(self.count)]
+        return self._ids
+
+    def read_record(self, row: int) -> Dict[str, Any]:
+        if self._records_handle is None:
+            self._records_handle = self.records_path.open("rb")
+        start = int(self.offsets[row])
+        end = int(self.offsets[row + 1])
+        self._records_handle.seek(start)
+        return json.loads(self._records_handle.read(end - start).decode("utf-8"))
+
+    def close(self) -> None:
+        for handle in (self._records_handle, self._ids_handle):
+            if handle is not None:
+                handle.close()
+        self._records_handle = None
+        self._ids_handle = None
+
+
+class LocalVectorIndex:
+    """Segmented local vector index with memory-mapped, pre-normalized vectors.
+
+    Every file belongs to a generation and is named after it
+    (``<name>.<generation>.vectors.npy``); only the manifest says which
+    generation is current, so replacing the manifest commits a rewrite in one
+    step. Indexes written before generations existed keep their
+    ``<name>.vectors.npy`` files until they are next rewritten. :meth:`append`
+    adds further segments and :meth:`delete` records tombstones, so new
+    evidence never forces a rebuild. Records are decoded only for the rows a
+    query returns, using the per-segment byte-offset table.
+    """
+
+    def __init__(self, index_dir: Path, index_name: str, manifest: Dict[str, Any]) -> None:
+        _require_numpy()
+        self.index_dir = Path(index_dir)
+        self.index_name = index_name
+        self.manifest = manifest
+        normalized = bool(manifest.get("normalized"))
+        self.segments = [_Segment(self.index_dir, entry, normalized=normalized) for entry in self._segment_entries()]
+        self._id_locations: Optional[Dict[str, Tuple[int, int]]] = None
+        self._rebuild_layout()
+
+    @staticmethod
+    def manifest_path(index_dir: Path, index_name: str) -> Path:
+        return Path(index_dir) / f"{index_name}.manifest.json"
+
+    @classmethod
+    def exists(cls, index_dir: Any, index_name: str) -> bool:
+        """Return whether ``index_dir`` holds an index named ``index_name``."""
+        index_dir = Path(index_dir)
+        return cls.manifest_path(index_dir, index_name).exists() or (
+            (index_dir / f"{index_name}.vectors.npy").exists()
+            and (index_dir / f"{index_name}.records.jsonl").exists()
+        )
+
+    @classmethod
+    def open(cls, index_dir: Any, index_name: str) -> "LocalVectorIndex":
+        """Open an index written by :meth:`create` or by older ``create_vector_index`` builds."""
+        index_dir = Path(index_dir)
+        manifest_path = cls.manifest_path(index_dir, index_name)
+        if manifest_path.exists():
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        else:
+            manifest = {"index_name": index_name}
+        return cls(index_dir, index_name, manifest)
+
+    @classmethod
+    def create(
+        cls,
+        index_dir: Any,
+        index_name: str,
+        documents: Sequence[Dict[str, Any]],
+        vectors: Any,
+        *,
+        model_name: Optional[str] = None,
+        provider: Optional[str] = None,
+    ) -> "LocalVectorIndex":
+        """Write a fresh single-segment index, replacing any previous one.
+
+        The new index is written as a new generation whose file names no
+        other index uses, so readers of the old manifest never see a mix of
+        old and new files. The manifest swap commits it, and only then are
+        the previous generation's files removed.
+        """
+        _require_numpy()
+        index_dir = Path(index_dir)
+        index_dir.mkdir(parents=True, exist_ok=True)
+        generation = uuid.uuid4().hex[:12]
+        entry = cls._write_segment(index_dir, index_name, generation, 0, documents, vectors)
+        manifest = {
+            "index_name": index_name,
+            "format_version": INDEX_FORMAT_VERSION,
+            "normalized": True,
+            "document_count": len(documents),
+            "dimension": int(np.asarray(vectors).shape[1]) if len(documents) else 0,
+            "provider": provider or "",
+            "model_name": model_name or "",
+            "vectors_path": str(index_dir / entry["vectors_file"]),
+            "records_path": str(index_dir / entry["records_file"]),
+            "segments": [entry],
+            "generation": generation,
+            "next_segment": 1,
+        }
+        previous = cls._manifest_files(index_dir, index_name)
+        _write_json_atomic(cls.manifest_path(index_dir, index_name), manifest)
+        _remove_files(previous)
+        return cls(index_dir, index_name, manifest)
+
+    @classmethod
+    def _manifest_files(cls, index_dir: Path, index_name: str) -> List[Path]:
+        """Return the data files the index's current manifest points to."""
+        try:
+            manifest = json.loads(cls.manifest_path(index_dir, index_name).read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            manifest = {}
+        return [
+            index_dir / entry[key]
+            for entry in cls._entries_from(manifest, index_name)
+            for key in ("vectors_file", "records_file", "offsets_file", "ids_file")
+            if entry.get(key) and Path(entry[key]).name == entry[key]
+        ]
+
+    @staticmethod
+    def _segment_prefix(index_name: str, generation: Optional[str], segment_number: int) -> str:
+        prefix = f"{index_name}.{generation}" if generation else index_name
+        return prefix if segment_number == 0 else f"{prefix}.seg{segment_number}"
+
+    @classmethod
+    def _write_segment(
+        cls,
+        index_dir: Path,
+        index_name: str,
+        generation: Optional[str],
+        segment_number: int,
+        documents: Sequence[Dict[str, Any]],
+        vectors: Any,
+    ) -> Dict[str, Any]:
+        prefix = cls._segment_prefix(index_name, generation, segment_number)
+        entry = {
+            "segment": segment_number,
+            "vectors_file": f"{prefix}.vectors.npy",
+            "records_file": f"{prefix}.records.jsonl",
+            "offsets_file": f"{prefix}.offsets.npy",
+            "ids_file": f"{prefix}.ids.json",
+            "count": len(documents),
+            "deleted_rows": [],
+        }
+        staged = {
+            key: _staging_path(index_dir / entry[key])
+            for key in ("vectors_file", "records_file", "offsets_file", "ids_file")
+        }
+        with staged["vectors_file"].open("wb") as handle:
+            np.save(handle, _normalize_rows(vectors))
+        offsets = [0]
+        with staged["records_file"].open("wb") as handle:
+            for document in documents:
+                line = (json.dumps(document, ensure_ascii=False) + "\n").encode("utf-8")
+                handle.write(line)
+                offsets.append(offsets[-1] + len(line))
+        with staged["offsets_file"].open("wb") as handle:
+            np.save(handle, np.asarray(offsets, dtype=np.int64))
+        staged["ids_file"].write_text(
+            json.dumps([str(document.get("id")) for document in documents]),
+            encoding="utf-8",
+        )
+        for key, temp_path in staged.items():
+            os.replace(temp_path, index_dir / entry[key])
+        return entry
+
+    def _segment_entries(self) -> List[Dict[str, Any]]:
+        return self._entries_from(self.manifest, self.index_name)
+
+    @staticmethod
+    def _entries_from(manifest: Dict[str, Any], index_name: str) -> List[Dict[str, Any]]:
+        entries = manifest.get("segments")
+        if entries:
+            return [dict(entry) for entry in entries]
+        return [
+            {
+                "segment": 0,
+                "vectors_file": f"{index_name}.vectors.npy",
+                "records_file": f"{index_name}.records.jsonl",
+                "count": manifest.get("document_count"),
+                "deleted_rows": [],
+            }
+        ]
+
+    def _rebuild_layout(self) -> None:
+        counts = [segment.count for segment in self.segments]
+        self._starts = np.cumsum([0, *counts]).astype(np.int64)
+        self._live_mask: Any = None
+        if any(segment.deleted_rows for segment in self.segments):
+            mask = np.ones(int(self._starts[-1]), dtype=bool)
+            for start, segment in zip(self._starts, self.segments):
+                rows = np.fromiter(segment.deleted_rows, dtype=np.int64)
+                mask[int(start) + rows] = False
+            self._live_mask = mask
+
+    @property
+    def dimension(self) -> int:
+        for segment in self.segments:
+            if segment.count:
+                return int(segment.vectors.shape[1])
+        return int(self.manifest.get("dimension") or 0)
+
+    @property
+    def document_count(self) -> int:
+        return int(self._starts[-1]) - sum(len(segment.deleted_rows) for segment in self.segments)
+
+    def _locations(self) -> Dict[str, Tuple[int, int]]:
+        if self._id_locations is None:
+            locations: Dict[str, Tuple[int, int]] = {}
+            for segment_index, segment in enumerate(self.segments):
+                for row, record_id in enumerate(segment.ids()):
+                    if row not in segment.deleted_rows:
+                        locations[record_id] = (segment_index, row)
+            self._id_locations = locations
+        return self._id_locations
+
+    def _save_manifest(self) -> None:
+        self.manifest["segments"] = [segment.entry for segment in self.segments]
+        self.manifest["document_count"] = self.document_count
+        self.manifest["format_version"] = INDEX_FORMAT_VERSION
+        _write_json_atomic(self.manifest_path(self.index_dir, self.index_name), self.manifest)
+        _remove_files(self.__dict__.pop("_superseded", ()))
+
+    def _ensure_segmented(self) -> None:
+        """Upgrade an index written before segments existed, in place."""
+        if self.manifest.get("format_version") == INDEX_FORMAT_VERSION:
+            return
+        base = self.segments[0]
+        documents = [base.read_record(row) for row in range(base.count)]
+        vectors = np.asarray(base.vectors)
+        base.close()
+        generation = uuid.uuid4().hex[:12]
+        entry = self._write_segment(self.index_dir, self.index_name, generation, 0, documents, vectors)
+        self.manifest.update({"normalized": True, "generation": generation, "next_segment": 1})
+        self.manifest["vectors_path"] = str(self.index_dir / entry["vectors_file"])
+        self.manifest["records_path"] = str(self.index_dir / entry["records_file"])
+        self.segments = [_Segment(self.index_dir, entry, normalized=True)]
+        # Removed once the upgraded manifest is saved.
+        self._superseded = [base.vectors_path, base.records_path]
+
+    def append(self, documents: Sequence[Dict[str, Any]], vectors: Any) -> Dict[str, Any]:
+        """Add ``documents`` as a new segment; existing ids are replaced."""
+        documents = list(documents)
+        if not documents:
+            return {"appended": 0, "replaced": 0}
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2 or len(matrix) != len(documents):
+            raise ValueError("append requires one vector per document")
+        if self.dimension and matrix.shape[1] != self.dimension:
+            raise ValueError(f"Vector dimension {matrix.shape[1]} does not match index dimension {self.dimension}")
+        self._ensure_segmented()
+        replaced = self._mark_deleted(str(document.get("id")) for document in documents)
+        segment_number = int(self.manifest.get("next_segment") or len(self.segments))
+        entry = self._write_segment(
+            self.index_dir, self.index_name, self.manifest.get("generation"), segment_number, documents, matrix
+        )
+        self.segments.append(_Segment(self.index_dir, entry, normalized=True))
+        self.manifest["next_segment"] = segment_number + 1
+        self.manifest["dimension"] = self.dimension
+        self._id_locations = None
+        self._rebuild_layout()
+        self._save_manifest()
+        return {"appended": len(documents), "replaced": replaced, "segment": segment_number}
+
+    def _mark_deleted(self, ids: Iterable[str]) -> int:
+        locations = self._locations()
+        deleted = 0
+        for record_id in ids:
+            location = locations.pop(str(record_id), None)
+            if location is None:
+                continue
+            segment = self.segments[location[0]]
+            segment.deleted_rows.add(location[1])
+            segment.entry["deleted_rows"] = sorted(segment.deleted_rows)
+            deleted += 1
+        return deleted
+
+    def delete(self, ids: Iterable[str]) -> int:
+        """Tombstone the records with ``ids``; returns how many were live."""
+        self._ensure_segmented()
+        deleted = self._mark_deleted(ids)
+        if deleted:
+            self._rebuild_layout()
+            self._save_manifest()
+        return deleted
+
+    def live_rows(self) -> Tuple[List[Dict[str, Any]], Any]:
+        """Return every live record and its normalized vector, in index order."""
+        documents: List[Dict[str, Any]] = []
+        rows: List[Any] = []
+        for segment in self.segments:
+            live = [row for row in range(segment.count) if row not in segment.deleted_rows]
+            documents.extend(segment.read_record(row) for row in live)
+            if live:
+                rows.append(np.asarray(segment.vectors[live]))
+        vectors = np.concatenate(rows) if rows else np.zeros((0, self.dimension), dtype=np.float32)
+        return documents, vectors
+
+    def compact(self) -> None:
+        """Rewrite all live rows into a single base segment."""
+        documents, vectors = self.live_rows()
+        self.close()
+        compacted = self.create(
+            self.index_dir,
+            self.index_name,
+            documents,
+            vectors,
+            model_name=self.manifest.get("model_name"),
+            provider=self.manifest.get("provider"),
+        )
+        self.__dict__.update(compacted.__dict__)
+
+    def search_matrix(self, query_vectors: Any, top_k: int) -> List[List[Dict[str, Any]]]:
+        """Return the ``top_k`` records for each row of ``query_vectors``."""
+        queries = _normalize_rows(query_vectors)
+        limit = max(0, int(top_k))
+        total = int(self._starts[-1])
+        if not len(queries):
+            return []
+        limit = min(limit, self.document_count)
+        if limit == 0:
+            return [[] for _ in range(len(queries))]
+        scores = np.concatenate(
+            [segment.vectors @ queries.T for segment in self.segments if segment.count],
+            axis=0,
+        ).T
+        if self._live_mask is not None:
+            scores[:, ~self._live_mask] = -np.inf
+        if limit < total:
+            candidates = np.argpartition(-scores, limit - 1, axis=1)[:, :limit]
+        else:
+            candidates = np.tile(np.arange(total), (len(queries), 1))
+        results = []
+        for query_scores, query_candidates in zip(scores, candidates):
+            ordered = query_candidates[np.lexsort((query_candidates, -query_scores[query_candidates]))]
+            results.append([self._result(int(position), float(query_scores[position])) for position in ordered])
+        return results
+
+    def search(self, query_vector: Any, top_k: int = 10) -> List[Dict[str, Any]]:
+        return self.search_matrix(np.asarray(query_vector, dtype=np.float32).reshape(1, -1), top_k)[0]
+
+    def _result(self, position: int, score: float) -> Dict[str, Any]:
+        segment_index = int(np.searchsorted(self._starts, position, side="right")) - 1
+        segment = self.segments[segment_index]
+        record = segment.read_record(position - int(self._starts[segment_index]))
+        return {
+            "id": record["id"],
+            "text": record["text"],
+            "metadata": record.get("metadata", {}),
+            "score": score,
+        }
+
+    def close(self) -> None:
+        for segment in self.segments:
+            segment.close()
+
+
+__all__ = [
+    "INDEX_FORMAT_VERSION",
+    "LocalVectorIndex",
+]
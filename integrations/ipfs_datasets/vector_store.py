@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import json
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 try:
     import numpy as np
@@ -12,8 +14,10 @@ except ModuleNotFoundError as exc:
 else:
     _numpy_error = ""
 
+from .embedding_cache import EmbeddingCache, get_embedding_cache
 from .loader import import_attr_optional, import_module_optional, import_failure_message
 from .types import with_adapter_metadata
+from .vector_index import LocalVectorIndex
 
 try:
     import numpy as np
@@ -254,6 +258,37 @@ def vector_index_backend_status(
     )
 
 
+DEFAULT_EMBEDDING_PROVIDER = "ipfs_datasets_py.auto"
+
+
+def _embed_texts_cached(
+    texts: List[str],
+    *,
+    provider: Optional[str],
+    model_name: Optional[str],
+    cache: Optional[EmbeddingCache] = None,
+    **kwargs: Any,
+) -> List[List[float]]:
+    """Embed ``texts`` through the shared embedding cache.
+
+    Only cache misses reach ``embed_texts_batched``. If cached vectors turn
+    out to have a different dimension than freshly embedded ones (the
+    provider's default model changed), every text is re-embedded.
+    """
+    cache = cache or get_embedding_cache()
+    namespace = {"provider": provider or DEFAULT_EMBEDDING_PROVIDER, "model_name": model_name}
+
+    def _embed(batch: List[str]) -> List[List[float]]:
+        vectors = embed_texts_batched(batch, provider=provider, model_name=model_name, **kwargs)
+        return [list(vector) for vector in vectors]
+
+    vectors = cache.embed_many(texts, _embed, **namespace)
+    if len({len(vector) for vector in vectors}) > 1:
+        vectors = _embed(list(texts))
+        cache.put_many(texts, vectors, **namespace)
+    return vectors
+
+
 def _normalize_documents(documents: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
     normalized: List[Dict[str, Any]] = []
     for index, document in enumerate(documents):
@@ -282,31 +317,19 @@ def _write_index_payload(
     if np is None:
         raise RuntimeError("numpy is required for local vector persistence")
 
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    vectors_path = output_dir / f"{index_name}.vectors.npy"
-    records_path = output_dir / f"{index_name}.records.jsonl"
-    manifest_path = output_dir / f"{index_name}.manifest.json"
-
-    np.save(vectors_path, np.asarray(vectors, dtype=np.float32))
-    with records_path.open("w", encoding="utf-8") as handle:
-        for document in documents:
-            handle.write(json.dumps(document, ensure_ascii=False) + "\n")
-
-    manifest = {
-        "index_name": index_name,
-        "document_count": len(documents),
-        "dimension": len(vectors[0]) if vectors else 0,
-        "provider": provider or "ipfs_datasets_py.auto",
-        "model_name": model_name or "",
-        "vectors_path": str(vectors_path),
-        "records_path": str(records_path),
-    }
-    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    index = LocalVectorIndex.create(
+        output_dir,
+        index_name,
+        documents,
+        vectors,
+        model_name=model_name,
+        provider=provider or DEFAULT_EMBEDDING_PROVIDER,
+    )
+    index.close()
     return {
-        "vectors_path": str(vectors_path),
-        "records_path": str(records_path),
-        "manifest_path": str(manifest_path),
+        "vectors_path": index.manifest["vectors_path"],
+        "records_path": index.manifest["records_path"],
+        "manifest_path": str(LocalVectorIndex.manifest_path(output_dir, index_name)),
     }
 
 
@@ -353,7 +376,7 @@ def create_vector_index(
 
     texts = [document["text"] for document in document_list]
     try:
-        vectors = embed_texts_batched(
+        vectors = _embed_texts_cached(
             texts,
             batch_size=batch_size,
             provider=provider,
@@ -380,7 +403,7 @@ def create_vector_index(
         "index_name": resolved_index_name,
         "document_count": len(document_list),
         "dimension": len(vectors[0]) if vectors else 0,
-        "provider": provider or "ipfs_datasets_py.auto",
+        "provider": provider or DEFAULT_EMBEDDING_PROVIDER,
         "model_name": model_name or "",
     }
     if output_dir:
@@ -411,6 +434,122 @@ def create_vector_index(
     )
 
 
+DEFAULT_VECTOR_INDEX_HANDLES = 8
+
+
+class VectorIndexHandle:
+    """Warm, reusable handle on one local vector index.
+
+    The :class:`LocalVectorIndex` stays open between queries and is reopened
+    only when the index manifest changes on disk. :meth:`search_many` embeds
+    every query in one batch and scores them with a single matrix multiply.
+    """
+
+    def __init__(self, index_dir: Any, index_name: str = "vector_index") -> None:
+        self.index_dir = Path(index_dir)
+        self.index_name = index_name
+        self._index: Optional[LocalVectorIndex] = None
+        self._signature: Any = None
+        self._lock = threading.RLock()
+        self.stats = {"loads": 0, "queries": 0, "batches": 0}
+
+    def _disk_signature(self) -> Any:
+        for path in (
+            LocalVectorIndex.manifest_path(self.index_dir, self.index_name),
+            self.index_dir / f"{self.index_name}.vectors.npy",
+        ):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            return (str(path), stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        return None
+
+    def index(self) -> LocalVectorIndex:
+        """Return the open index, reloading it if the manifest changed."""
+        with self._lock:
+            signature = self._disk_signature()
+            if self._index is None or signature != self._signature:
+                if self._index is not None:
+                    self._index.close()
+                self._index = LocalVectorIndex.open(self.index_dir, self.index_name)
+                self._signature = signature
+                self.stats["loads"] += 1
+            return self._index
+
+    def search_many(
+        self,
+        queries: Sequence[str],
+        top_k: int = 10,
+        *,
+        provider: Optional[str] = None,
+        model_name: Optional[str] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        queries = [str(query) for query in queries]
+        if not queries:
+            return []
+        query_vectors = _embed_texts_cached(
+            queries,
+            batch_size=max(1, len(queries)),
+            provider=provider,
+            model_name=model_name,
+        )
+        with self._lock:
+            results = self.index().search_matrix(query_vectors, top_k)
+            self.stats["queries"] += len(queries)
+            self.stats["batches"] += 1
+        return results
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        *,
+        provider: Optional[str] = None,
+        model_name: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        return self.search_many([query], top_k, provider=provider, model_name=model_name)[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._index is not None:
+                self._index.close()
+            self._index = None
+            self._signature = None
+
+
+_vector_index_handles: "OrderedDict[Tuple[str, str], VectorIndexHandle]" = OrderedDict()
+_vector_index_handles_lock = threading.Lock()
+
+
+def get_vector_index_handle(
+    index_dir: Any,
+    index_name: Optional[str] = None,
+    *,
+    max_handles: int = DEFAULT_VECTOR_INDEX_HANDLES,
+) -> VectorIndexHandle:
+    """Return a cached :class:`VectorIndexHandle`, evicting the least recently used."""
+    resolved_index_name = index_name or "vector_index"
+    key = (str(Path(index_dir).resolve()), resolved_index_name)
+    with _vector_index_handles_lock:
+        handle = _vector_index_handles.get(key)
+        if handle is None:
+            handle = VectorIndexHandle(index_dir, resolved_index_name)
+            _vector_index_handles[key] = handle
+        _vector_index_handles.move_to_end(key)
+        while len(_vector_index_handles) > max(1, int(max_handles)):
+            _, evicted = _vector_index_handles.popitem(last=False)
+            evicted.close()
+        return handle
+
+
+def clear_vector_index_handles() -> None:
+    with _vector_index_handles_lock:
+        for handle in _vector_index_handles.values():
+            handle.close()
+        _vector_index_handles.clear()
+
+
 def search_vector_index(
     query: str,
     *,
@@ -464,9 +603,7 @@ def search_vector_index(
         )
 
     base_dir = Path(index_dir)
-    vectors_path = base_dir / f"{resolved_index_name}.vectors.npy"
-    records_path = base_dir / f"{resolved_index_name}.records.jsonl"
-    if not vectors_path.exists() or not records_path.exists():
+    if not LocalVectorIndex.exists(base_dir, resolved_index_name):
         return with_adapter_metadata(
             {
                 "status": "error",
@@ -482,21 +619,8 @@ def search_vector_index(
         )
 
     try:
-        vectors = np.load(vectors_path)
-        records = [
-            json.loads(line)
-            for line in records_path.read_text(encoding="utf-8").splitlines()
-            if line.strip()
-        ]
-        query_vector = np.asarray(
-            embed_texts_batched(
-                [query],
-                batch_size=1,
-                provider=provider,
-                model_name=model_name,
-            )[0],
-            dtype=np.float32,
-        )
+        handle = get_vector_index_handle(base_dir, resolved_index_name)
+        results = handle.search(query, top_k, provider=provider, model_name=model_name)
     except Exception as exc:
         return with_adapter_metadata(
             {
@@ -512,25 +636,6 @@ def search_vector_index(
             implementation_status="error",
         )
 
-    vector_norms = np.linalg.norm(vectors, axis=1)
-    query_norm = np.linalg.norm(query_vector)
-    safe_denominator = np.maximum(vector_norms * max(query_norm, 1e-12), 1e-12)
-    scores = np.dot(vectors, query_vector) / safe_denominator
-    ranked_indices = np.argsort(-scores)[: max(0, int(top_k))]
-
-    results = []
-    for idx in ranked_indices:
-        if idx >= len(records):
-            continue
-        results.append(
-            {
-                "id": records[idx]["id"],
-                "text": records[idx]["text"],
-                "metadata": records[idx].get("metadata", {}),
-                "score": float(scores[idx]),
-            }
-        )
-
     return with_adapter_metadata(
         {
             "status": "success",
@@ -545,16 +650,175 @@ def search_vector_index(
     )
 
 
+def search_vector_index_many(
+    queries: Sequence[str],
+    *,
+    index_name: Optional[str] = None,
+    index_dir: Optional[str] = None,
+    top_k: int = 10,
+    provider: Optional[str] = None,
+    model_name: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Search one index for several queries with a single embedding batch."""
+    resolved_index_name = index_name or "vector_index"
+    query_list = [str(query) for query in queries]
+    base_payload = {"index_name": resolved_index_name, "queries": query_list, "top_k": top_k}
+    if np is None or embed_texts_batched is None:
+        return with_adapter_metadata(
+            {"status": "unavailable", **base_payload, "results": []},
+            operation="search_vector_index_many",
+            backend_available=False,
+            degraded_reason=VECTOR_STORE_ERROR,
+            implementation_status="unavailable",
+        )
+    if not index_dir or not LocalVectorIndex.exists(index_dir, resolved_index_name):
+        return with_adapter_metadata(
+            {
+                "status": "error",
+                **base_payload,
+                "results": [],
+                "error": f"Missing index files for {resolved_index_name} in {index_dir}",
+            },
+            operation="search_vector_index_many",
+            backend_available=True,
+            implementation_status="error",
+        )
+    try:
+        handle = get_vector_index_handle(index_dir, resolved_index_name)
+        results = handle.search_many(query_list, top_k, provider=provider, model_name=model_name)
+    except Exception as exc:
+        return with_adapter_metadata(
+            {"status": "error", **base_payload, "results": [], "error": str(exc)},
+            operation="search_vector_index_many",
+            backend_available=True,
+            implementation_status="error",
+        )
+    return with_adapter_metadata(
+        {"status": "success", **base_payload, "results": results},
+        operation="search_vector_index_many",
+        backend_available=True,
+        implementation_status="implemented",
+        extra_metadata={"batch_size": len(query_list)},
+    )
+
+
+def append_to_vector_index(
+    documents: Iterable[Dict[str, Any]],
+    *,
+    index_name: Optional[str] = None,
+    index_dir: Optional[str] = None,
+    batch_size: int = 32,
+    provider: Optional[str] = None,
+    model_name: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Embed ``documents`` and add them to an existing index as a new segment.
+
+    Documents whose ids are already indexed replace the older rows.
+    """
+    document_list = _normalize_documents(documents)
+    resolved_index_name = index_name or "vector_index"
+    base_payload = {"index_name": resolved_index_name, "document_count": len(document_list)}
+    if np is None or embed_texts_batched is None:
+        return with_adapter_metadata(
+            {"status": "unavailable", **base_payload},
+            operation="append_to_vector_index",
+            backend_available=False,
+            degraded_reason=VECTOR_STORE_ERROR,
+            implementation_status="unavailable",
+        )
+    if not index_dir or not LocalVectorIndex.manifest_path(Path(index_dir), resolved_index_name).exists():
+        return with_adapter_metadata(
+            {"status": "error", **base_payload, "error": f"No vector index named {resolved_index_name} in {index_dir}"},
+            operation="append_to_vector_index",
+            backend_available=True,
+            implementation_status="error",
+        )
+    try:
+        index = LocalVectorIndex.open(index_dir, resolved_index_name)
+        try:
+            vectors = _embed_texts_cached(
+                [document["text"] for document in document_list],
+                batch_size=batch_size,
+                provider=provider or index.manifest.get("provider") or None,
+                model_name=model_name or index.manifest.get("model_name") or None,
+            )
+            summary = index.append(document_list, vectors)
+            total = index.document_count
+        finally:
+            index.close()
+    except Exception as exc:
+        return with_adapter_metadata(
+            {"status": "error", **base_payload, "error": str(exc)},
+            operation="append_to_vector_index",
+            backend_available=True,
+            implementation_status="error",
+        )
+    return with_adapter_metadata(
+        {"status": "success", **base_payload, **summary, "total_document_count": total},
+        operation="append_to_vector_index",
+        backend_available=True,
+        implementation_status="implemented",
+    )
+
+
+def delete_from_vector_index(
+    ids: Iterable[str],
+    *,
+    index_name: Optional[str] = None,
+    index_dir: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Tombstone records by id without rewriting the index."""
+    resolved_index_name = index_name or "vector_index"
+    if np is None:
+        unavailable = _numpy_required_error("delete_from_vector_index")
+        unavailable["index_name"] = resolved_index_name
+        return unavailable
+    if not index_dir or not LocalVectorIndex.manifest_path(Path(index_dir), resolved_index_name).exists():
+        return with_adapter_metadata(
+            {
+                "status": "error",
+                "index_name": resolved_index_name,
+                "deleted": 0,
+                "error": f"No vector index named {resolved_index_name} in {index_dir}",
+            },
+            operation="delete_from_vector_index",
+            backend_available=True,
+            implementation_status="error",
+        )
+    index = LocalVectorIndex.open(index_dir, resolved_index_name)
+    try:
+        deleted = index.delete(str(record_id) for record_id in ids)
+        total = index.document_count
+    finally:
+        index.close()
+    return with_adapter_metadata(
+        {"status": "success", "index_name": resolved_index_name, "deleted": deleted, "total_document_count": total},
+        operation="delete_from_vector_index",
+        backend_available=True,
+        implementation_status="implemented",
+    )
+
+
 __all__ = [
+    "DEFAULT_EMBEDDING_PROVIDER",
+    "EmbeddingCache",
     "EmbeddingsRouter",
     "EMBEDDINGS_AVAILABLE",
     "EMBEDDINGS_ERROR",
     "VECTOR_STORE_AVAILABLE",
     "VECTOR_STORE_ERROR",
     "get_embeddings_router",
+    "get_embedding_cache",
     "create_vector_store_async",
     "embeddings_backend_status",
     "vector_index_backend_status",
     "create_vector_index",
     "search_vector_index",
+    "search_vector_index_many",
+    "VectorIndexHandle",
+    "get_vector_index_handle",
+    "clear_vector_index_handles",
+    "append_to_vector_index",
+    "delete_from_vector_index",
+    "LocalVectorIndex",
 ]
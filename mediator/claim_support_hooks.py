@@ -8,7 +8,7 @@ import hashlib
 from collections import Counter
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from integrations.ipfs_datasets.graphrag import build_ontology, validate_ontology
 from integrations.ipfs_datasets.logic import check_contradictions, prove_claim_elements, run_hybrid_reasoning
@@ -22,8 +22,10 @@ except ImportError:
     DUCKDB_AVAILABLE = False
     duckdb = None
 
+from .duckdb_pool import DuckDBConnectionMixin, default_db_path
 
-class ClaimSupportHook:
+
+class ClaimSupportHook(DuckDBConnectionMixin):
     """Track which evidence and authorities support each claim type."""
 
     _CONTENT_ORIGIN_ARTIFACT_FAMILY = {
@@ -40,21 +42,29 @@ class ClaimSupportHook:
         'legal_authority_reference': 'legal_authority',
     }
 
+    _CONTRADICTION_EXCLUDED_TERMS = frozenset({
+        'employee', 'employees', 'employer', 'employers', 'person', 'people',
+        'claim', 'claims', 'fact', 'facts', 'evidence', 'authority', 'there',
+        'their', 'them', 'they', 'then', 'when', 'with', 'without', 'against',
+        'about', 'from', 'into', 'after', 'before', 'because', 'that', 'this',
+        'was', 'were', 'did', 'does', 'have', 'has', 'had', 'been', 'being',
+        'not', 'never', 'denied', 'deny', 'refused', 'refuse', 'lack', 'lacked',
+        'absent',
+    })
+
     def __init__(self, mediator, db_path: Optional[str] = None):
         self.mediator = mediator
         self.db_path = db_path or self._get_default_db_path()
         self._memory_requirements: Dict[str, List[Dict[str, Any]]] = {}
         self._memory_support_links: List[Dict[str, Any]] = []
+        self._memory_versions: Dict[str, int] = {}
         self._check_duckdb_availability()
         if DUCKDB_AVAILABLE:
             self._prepare_duckdb_path()
             self._initialize_schema()
 
     def _get_default_db_path(self) -> str:
-        state_dir = Path(__file__).parent.parent / 'statefiles'
-        if not state_dir.exists():
-            state_dir = Path('.')
-        return str(state_dir / 'claim_support.duckdb')
+        return default_db_path('claim_support.duckdb')
 
     def _with_intake_summary_handoff(self, payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         normalized_payload = dict(payload or {})
@@ -96,7 +106,7 @@ class ClaimSupportHook:
 
     def _initialize_schema(self):
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             conn.execute("""
                 CREATE SEQUENCE IF NOT EXISTS claim_support_id_seq START 1
             """)
@@ -176,6 +186,15 @@ class ClaimSupportHook:
                     timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS claim_support_version (
+                    user_id VARCHAR NOT NULL,
+                    claim_type VARCHAR NOT NULL,
+                    version BIGINT NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (user_id, claim_type)
+                )
+            """)
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_claim_support_user_claim
                 ON claim_support(user_id, claim_type)
@@ -2909,19 +2928,49 @@ class ClaimSupportHook:
             return 'negative'
         return 'affirmative'
 
-    def _fact_overlap_terms(self, left: Optional[str], right: Optional[str]) -> List[str]:
-        excluded = {
-            'employee', 'employees', 'employer', 'employers', 'person', 'people',
-            'claim', 'claims', 'fact', 'facts', 'evidence', 'authority', 'there',
-            'their', 'them', 'they', 'then', 'when', 'with', 'without', 'against',
-            'about', 'from', 'into', 'after', 'before', 'because', 'that', 'this',
-            'was', 'were', 'did', 'does', 'have', 'has', 'had', 'been', 'being',
-            'not', 'never', 'denied', 'deny', 'refused', 'refuse', 'lack', 'lacked',
-            'absent',
+    def _fact_terms(self, text: Optional[str]) -> Set[str]:
+        return {
+            term for term in self._tokenize_text(text)
+            if term not in self._CONTRADICTION_EXCLUDED_TERMS
         }
-        left_terms = {term for term in self._tokenize_text(left) if term not in excluded}
-        right_terms = {term for term in self._tokenize_text(right) if term not in excluded}
-        return sorted(left_terms & right_terms)
+
+    def _fact_overlap_terms(self, left: Optional[str], right: Optional[str]) -> List[str]:
+        return sorted(self._fact_terms(left) & self._fact_terms(right))
+
+    def _find_contradiction_pairs(
+        self,
+        support_facts: List[Dict[str, Any]],
+        *,
+        min_overlap: int = 2,
+    ) -> List[Tuple[int, int, List[str]]]:
+        """Return ``(left_index, right_index, overlap_terms)`` for opposite-polarity facts.
+
+        Polarity and term sets are computed once per fact. Affirmative facts
+        are indexed by term, so each negative fact only meets the facts it
+        shares a term with instead of every other fact. Pairs come back in the
+        same ``left < right`` order as a full pairwise scan.
+        """
+        polarities = [self._fact_polarity(fact.get('text')) for fact in support_facts]
+        terms = [self._fact_terms(fact.get('text')) for fact in support_facts]
+        postings: Dict[str, List[int]] = {}
+        for index, polarity in enumerate(polarities):
+            if polarity == 'affirmative':
+                for term in terms[index]:
+                    postings.setdefault(term, []).append(index)
+
+        pairs: List[Tuple[int, int, List[str]]] = []
+        for index, polarity in enumerate(polarities):
+            if polarity == 'affirmative':
+                continue
+            shared = Counter()
+            for term in terms[index]:
+                shared.update(postings.get(term, ()))
+            for other, count in shared.items():
+                if count >= min_overlap:
+                    left, right = (index, other) if index < other else (other, index)
+                    pairs.append((left, right, sorted(terms[index] & terms[other])))
+        pairs.sort(key=lambda pair: (pair[0], pair[1]))
+        return pairs
 
     def _normalize_required_support_kinds(
         self,
@@ -2970,7 +3019,7 @@ class ClaimSupportHook:
 
         required_kinds_json = json.dumps(normalized_kinds, default=str)
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             rows = conn.execute(
                 """
                 SELECT id
@@ -3009,91 +3058,65 @@ class ClaimSupportHook:
                 'error': str(exc),
             }
 
+    def _bump_claim_support_version(self, conn, user_id: Optional[str], claim_type: str) -> int:
+        row = conn.execute(
+            """
+            INSERT INTO claim_support_version (user_id, claim_type, version, updated_at)
+            VALUES (?, ?, 1, now())
+            ON CONFLICT (user_id, claim_type) DO UPDATE
+            SET version = claim_support_version.version + 1, updated_at = EXCLUDED.updated_at
+            RETURNING version
+            """,
+            [str(user_id or ''), str(claim_type or '')],
+        ).fetchone()
+        return int(row[0]) if row else 0
+
+    def bump_claim_support_version(self, user_id: Optional[str], claim_type: str) -> int:
+        """Advance the write sequence for a claim so cached diagnostics go stale.
+
+        Every write path in this hook bumps the sequence itself, inside the
+        transaction that performs the write; call this after changing data the
+        claim's support depends on through some other store.
+        """
+        if not DUCKDB_AVAILABLE:
+            key = f'{user_id or ""}:{claim_type or ""}'
+            self._memory_versions[key] = self._memory_versions.get(key, 0) + 1
+            return self._memory_versions[key]
+        try:
+            with self.connection_session(transaction=True) as conn:
+                return self._bump_claim_support_version(conn, user_id, claim_type)
+        except Exception as exc:
+            self.mediator.log('claim_support_version_error', error=str(exc), claim_type=claim_type)
+            return -1
+
+    def get_claim_support_version(self, user_id: Optional[str], claim_type: str) -> int:
+        """Return the write sequence for ``(user_id, claim_type)``; 0 before any write."""
+        if not DUCKDB_AVAILABLE:
+            return self._memory_versions.get(f'{user_id or ""}:{claim_type or ""}', 0)
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT version FROM claim_support_version WHERE user_id = ? AND claim_type = ?",
+                [str(user_id or ''), str(claim_type or '')],
+            ).fetchone()
+            conn.close()
+            return int(row[0]) if row else 0
+        except Exception as exc:
+            self.mediator.log('claim_support_version_error', error=str(exc), claim_type=claim_type)
+            return -1
+
     def _build_claim_support_state_token(
         self,
         user_id: str,
         claim_type: str,
         required_support_kinds: Optional[List[str]] = None,
-    ) -> str:
+    ) -> Optional[str]:
+        """Return the freshness token for a claim, or ``None`` if its version is unreadable."""
         normalized_kinds = self._normalize_required_support_kinds(required_support_kinds)
-        requirements = self.get_claim_requirements(user_id, claim_type).get(claim_type, [])
-        links = [
-            self._enrich_support_link(link)
-            for link in self.get_support_links(user_id, claim_type)
-        ]
-        facts = self.get_claim_support_facts(user_id, claim_type)
-
-        requirement_rows = [
-            {
-                'element_id': item.get('element_id'),
-                'element_text': item.get('element_text'),
-                'element_index': item.get('element_index'),
-            }
-            for item in requirements
-            if isinstance(item, dict)
-        ]
-        link_rows = [
-            {
-                'id': link.get('id'),
-                'claim_element_id': link.get('claim_element_id'),
-                'claim_element_text': link.get('claim_element_text'),
-                'support_kind': link.get('support_kind'),
-                'support_ref': link.get('support_ref'),
-                'source_table': link.get('source_table'),
-                'fact_count': link.get('fact_count', 0),
-                'graph_summary': link.get('graph_summary', {}),
-                'graph_trace_summary': self._summarize_graph_traces([link]),
-            }
-            for link in links
-            if isinstance(link, dict)
-        ]
-        fact_rows = [
-            {
-                'fact_id': fact.get('fact_id'),
-                'text': fact.get('text'),
-                'claim_element_id': fact.get('claim_element_id'),
-                'claim_element_text': fact.get('claim_element_text'),
-                'support_kind': fact.get('support_kind'),
-                'support_ref': fact.get('support_ref'),
-                'source_table': fact.get('source_table'),
-            }
-            for fact in facts
-            if isinstance(fact, dict)
-        ]
-        payload = {
-            'claim_type': claim_type,
-            'required_support_kinds': normalized_kinds,
-            'requirements': sorted(
-                requirement_rows,
-                key=lambda item: (
-                    str(item.get('element_index') or ''),
-                    str(item.get('element_id') or ''),
-                    str(item.get('element_text') or ''),
-                ),
-            ),
-            'links': sorted(
-                link_rows,
-                key=lambda item: (
-                    str(item.get('id') or ''),
-                    str(item.get('claim_element_id') or ''),
-                    str(item.get('support_kind') or ''),
-                    str(item.get('support_ref') or ''),
-                ),
-            ),
-            'facts': sorted(
-                fact_rows,
-                key=lambda item: (
-                    str(item.get('fact_id') or ''),
-                    str(item.get('claim_element_id') or ''),
-                    str(item.get('support_kind') or ''),
-                    str(item.get('support_ref') or ''),
-                    str(item.get('text') or ''),
-                ),
-            ),
-        }
-        return hashlib.sha256(
-            json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
-        ).hexdigest()
+        version = self.get_claim_support_version(user_id, claim_type)
+        if version < 0:
+            return None
+        return f"v{version}:{','.join(normalized_kinds)}"
 
     def _normalize_query_text(self, query_text: str) -> str:
         return ' '.join((query_text or '').strip().lower().split())
@@ -3196,47 +3219,48 @@ class ClaimSupportHook:
                         }
                     )
                 self._memory_requirements[f'{user_id}:{claim_type}'] = rows
+                self.bump_claim_support_version(user_id, claim_type)
                 registered[claim_type] = rows
             return registered
 
         registered: Dict[str, List[Dict[str, Any]]] = {}
         try:
-            conn = duckdb.connect(self.db_path)
-            for claim_type, elements in requirements.items():
-                conn.execute(
-                    "DELETE FROM claim_requirements WHERE user_id = ? AND claim_type = ?",
-                    [user_id, claim_type],
-                )
-                registered[claim_type] = []
-                for element_index, element_text in enumerate(elements, start=1):
-                    element_id = self._make_element_id(claim_type, element_index)
+            with self.connection_session(transaction=True) as conn:
+                for claim_type, elements in requirements.items():
                     conn.execute(
-                        """
-                        INSERT INTO claim_requirements (
-                            user_id, complaint_id, claim_type, element_id,
-                            element_index, element_text, metadata
-                        )
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        [
-                            user_id,
-                            complaint_id,
-                            claim_type,
-                            element_id,
-                            element_index,
-                            element_text,
-                            json.dumps(requirement_metadata),
-                        ],
+                        "DELETE FROM claim_requirements WHERE user_id = ? AND claim_type = ?",
+                        [user_id, claim_type],
                     )
-                    registered[claim_type].append(
-                        {
-                            'claim_type': claim_type,
-                            'element_id': element_id,
-                            'element_index': element_index,
-                            'element_text': element_text,
-                        }
-                    )
-            conn.close()
+                    registered[claim_type] = []
+                    for element_index, element_text in enumerate(elements, start=1):
+                        element_id = self._make_element_id(claim_type, element_index)
+                        conn.execute(
+                            """
+                            INSERT INTO claim_requirements (
+                                user_id, complaint_id, claim_type, element_id,
+                                element_index, element_text, metadata
+                            )
+                            VALUES (?, ?, ?, ?, ?, ?, ?)
+                            """,
+                            [
+                                user_id,
+                                complaint_id,
+                                claim_type,
+                                element_id,
+                                element_index,
+                                element_text,
+                                json.dumps(requirement_metadata),
+                            ],
+                        )
+                        registered[claim_type].append(
+                            {
+                                'claim_type': claim_type,
+                                'element_id': element_id,
+                                'element_index': element_index,
+                                'element_text': element_text,
+                            }
+                        )
+                    self._bump_claim_support_version(conn, user_id, claim_type)
             self.mediator.log('claim_requirements_registered', claims=list(registered.keys()))
             return registered
         except Exception as exc:
@@ -3260,7 +3284,7 @@ class ClaimSupportHook:
             return grouped
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             if claim_type:
                 rows = conn.execute(
                     """
@@ -3372,6 +3396,7 @@ class ClaimSupportHook:
                 ),
                 None,
             )
+            self.bump_claim_support_version(user_id, claim_type)
             if existing is not None:
                 return {'record_id': int(existing.get('id') or -1), 'created': False, 'reused': True}
             record_id = len(self._memory_support_links) + 1
@@ -3410,40 +3435,69 @@ class ClaimSupportHook:
         claim_element_text = claim_element_text or resolved_element['claim_element_text']
 
         try:
-            conn = duckdb.connect(self.db_path)
-            if claim_element_id:
-                existing = conn.execute(
-                    """
-                    SELECT id
-                    FROM claim_support
-                    WHERE user_id = ?
-                      AND claim_type = ?
-                      AND support_kind = ?
-                      AND support_ref = ?
-                      AND COALESCE(claim_element_id, '') = COALESCE(?, '')
-                    ORDER BY id ASC
-                    LIMIT 1
-                    """,
-                    [user_id, claim_type, support_kind, support_ref, claim_element_id],
-                ).fetchone()
-            else:
-                existing = conn.execute(
-                    """
-                    SELECT id
-                    FROM claim_support
-                    WHERE user_id = ?
-                      AND claim_type = ?
-                      AND support_kind = ?
-                      AND support_ref = ?
-                      AND COALESCE(claim_element_text, '') = COALESCE(?, '')
-                    ORDER BY id ASC
-                    LIMIT 1
-                    """,
-                    [user_id, claim_type, support_kind, support_ref, claim_element_text],
-                ).fetchone()
+            with self.connection_session(transaction=True) as conn:
+                if claim_element_id:
+                    existing = conn.execute(
+                        """
+                        SELECT id
+                        FROM claim_support
+                        WHERE user_id = ?
+                          AND claim_type = ?
+                          AND support_kind = ?
+                          AND support_ref = ?
+                          AND COALESCE(claim_element_id, '') = COALESCE(?, '')
+                        ORDER BY id ASC
+                        LIMIT 1
+                        """,
+                        [user_id, claim_type, support_kind, support_ref, claim_element_id],
+                    ).fetchone()
+                else:
+                    existing = conn.execute(
+                        """
+                        SELECT id
+                        FROM claim_support
+                        WHERE user_id = ?
+                          AND claim_type = ?
+                          AND support_kind = ?
+                          AND support_ref = ?
+                          AND COALESCE(claim_element_text, '') = COALESCE(?, '')
+                        ORDER BY id ASC
+                        LIMIT 1
+                        """,
+                        [user_id, claim_type, support_kind, support_ref, claim_element_text],
+                    ).fetchone()
+                if existing:
+                    record_id = existing[0]
+                else:
+                    result = conn.execute(
+                        """
+                        INSERT INTO claim_support (
+                            user_id, complaint_id, claim_type, claim_element_id, claim_element_text, support_kind,
+                            support_ref, support_label, source_table, support_strength, metadata
+                        )
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        RETURNING id
+                        """,
+                        [
+                            user_id,
+                            complaint_id,
+                            claim_type,
+                            claim_element_id,
+                            claim_element_text,
+                            support_kind,
+                            support_ref,
+                            support_label,
+                            source_table,
+                            support_strength,
+                            json.dumps(normalized_metadata or {}),
+                        ],
+                    ).fetchone()
+                    record_id = result[0]
+                # A reused link still bumps the version: callers re-upsert a link
+                # right after re-upserting the evidence or authority behind it,
+                # whose facts and graph summary feed the claim's support state.
+                self._bump_claim_support_version(conn, user_id, claim_type)
             if existing:
-                conn.close()
-                record_id = existing[0]
                 self.mediator.log(
                     'claim_support_link_duplicate',
                     record_id=record_id,
@@ -3454,31 +3508,6 @@ class ClaimSupportHook:
                 )
                 return {'record_id': record_id, 'created': False, 'reused': True}
 
-            result = conn.execute(
-                """
-                INSERT INTO claim_support (
-                    user_id, complaint_id, claim_type, claim_element_id, claim_element_text, support_kind,
-                    support_ref, support_label, source_table, support_strength, metadata
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                RETURNING id
-                """,
-                [
-                    user_id,
-                    complaint_id,
-                    claim_type,
-                    claim_element_id,
-                    claim_element_text,
-                    support_kind,
-                    support_ref,
-                    support_label,
-                    source_table,
-                    support_strength,
-                    json.dumps(normalized_metadata or {}),
-                ],
-            ).fetchone()
-            conn.close()
-            record_id = result[0]
             self.mediator.log(
                 'claim_support_link_added',
                 record_id=record_id,
@@ -3515,7 +3544,7 @@ class ClaimSupportHook:
             ]
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             if claim_type:
                 results = conn.execute(
                     """
@@ -4168,29 +4197,26 @@ class ClaimSupportHook:
                     claim_element_id=element.get('element_id'),
                     claim_element_text=element.get('element_text'),
                 )
-                for index, left in enumerate(support_facts):
-                    for right in support_facts[index + 1:]:
-                        left_polarity = self._fact_polarity(left.get('text'))
-                        right_polarity = self._fact_polarity(right.get('text'))
-                        if left_polarity == right_polarity:
-                            continue
-                        overlap_terms = self._fact_overlap_terms(left.get('text'), right.get('text'))
-                        if len(overlap_terms) < 2:
-                            continue
-                        candidates.append(
-                            {
-                                'claim_element_id': element.get('element_id'),
-                                'claim_element_text': element.get('element_text'),
-                                'fact_ids': [left.get('fact_id'), right.get('fact_id')],
-                                'texts': [left.get('text'), right.get('text')],
-                                'support_refs': [left.get('support_ref'), right.get('support_ref')],
-                                'support_kinds': [left.get('support_kind'), right.get('support_kind')],
-                                'source_tables': [left.get('source_table'), right.get('source_table')],
-                                'polarity': [left_polarity, right_polarity],
-                                'overlap_terms': overlap_terms,
-                                'graph_trace_summary': self._summarize_graph_traces([left, right]),
-                            }
-                        )
+                for left_index, right_index, overlap_terms in self._find_contradiction_pairs(support_facts):
+                    left = support_facts[left_index]
+                    right = support_facts[right_index]
+                    candidates.append(
+                        {
+                            'claim_element_id': element.get('element_id'),
+                            'claim_element_text': element.get('element_text'),
+                            'fact_ids': [left.get('fact_id'), right.get('fact_id')],
+                            'texts': [left.get('text'), right.get('text')],
+                            'support_refs': [left.get('support_ref'), right.get('support_ref')],
+                            'support_kinds': [left.get('support_kind'), right.get('support_kind')],
+                            'source_tables': [left.get('source_table'), right.get('source_table')],
+                            'polarity': [
+                                self._fact_polarity(left.get('text')),
+                                self._fact_polarity(right.get('text')),
+                            ],
+                            'overlap_terms': overlap_terms,
+                            'graph_trace_summary': self._summarize_graph_traces([left, right]),
+                        }
+                    )
 
             candidates.sort(
                 key=lambda item: (
@@ -4280,7 +4306,7 @@ class ClaimSupportHook:
                 if not isinstance(payload, dict) or not payload:
                     continue
                 try:
-                    conn = duckdb.connect(self.db_path)
+                    conn = self._connect()
                     result = conn.execute(
                         """
                         INSERT INTO claim_support_snapshot (
@@ -4372,7 +4398,7 @@ class ClaimSupportHook:
             params.append(json.dumps(normalized_kinds, default=str))
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             rows = conn.execute(
                 f"""
                 SELECT DISTINCT claim_type, snapshot_kind, required_support_kinds
@@ -4443,7 +4469,7 @@ class ClaimSupportHook:
             }
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             if claim_type:
                 rows = conn.execute(
                     """
@@ -4505,7 +4531,13 @@ class ClaimSupportHook:
                 stored_kinds,
             )
             stored_support_state_token = str(metadata.get('support_state_token') or '')
-            is_stale = bool(stored_support_state_token) and stored_support_state_token != current_support_state_token
+            # A snapshot saved, or checked, while the version was unreadable
+            # cannot be proven fresh.
+            is_stale = (
+                current_support_state_token is None
+                or not stored_support_state_token
+                or stored_support_state_token != current_support_state_token
+            )
             if snapshot_kind == 'gaps':
                 claim_entry['gaps'] = payload
             elif snapshot_kind == 'contradictions':
@@ -4535,7 +4567,7 @@ class ClaimSupportHook:
 
         query_hash = self._hash_query_text(query_text)
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             row = conn.execute(
                 """
                 SELECT timestamp
@@ -4577,7 +4609,7 @@ class ClaimSupportHook:
             self.mediator,
         )
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             result = conn.execute(
                 """
                 INSERT INTO claim_follow_up_execution (
@@ -4626,7 +4658,7 @@ class ClaimSupportHook:
         related_entry: Dict[str, Any] = {}
         if related_execution_id is not None:
             try:
-                conn = duckdb.connect(self.db_path)
+                conn = self._connect()
                 row = conn.execute(
                     """
                     SELECT id, claim_type, claim_element_id, claim_element_text, support_kind, status, metadata
@@ -4719,7 +4751,7 @@ class ClaimSupportHook:
 
         query_hash = self._hash_query_text(query_text)
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             row = conn.execute(
                 """
                 SELECT status, metadata, timestamp
@@ -4808,7 +4840,7 @@ class ClaimSupportHook:
 
         parameters.append(normalized_limit)
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             rows = conn.execute(
                 f"""
                 SELECT
@@ -4967,46 +4999,46 @@ class ClaimSupportHook:
         )
 
         try:
-            conn = duckdb.connect(self.db_path)
-            row = conn.execute(
-                """
-                INSERT INTO claim_testimony (
-                    testimony_id,
-                    user_id,
-                    claim_type,
-                    claim_element_id,
-                    claim_element_text,
-                    raw_narrative,
-                    event_date,
-                    actor_name,
-                    act_text,
-                    target_text,
-                    harm_text,
-                    firsthand_status,
-                    source_confidence,
-                    metadata
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                RETURNING id, timestamp
-                """,
-                [
-                    testimony_id,
-                    user_id,
-                    claim_type,
-                    normalized_payload['claim_element_id'] or None,
-                    normalized_payload['claim_element_text'] or None,
-                    normalized_payload['raw_narrative'] or None,
-                    normalized_payload['event_date'] or None,
-                    normalized_payload['actor'] or None,
-                    normalized_payload['act'] or None,
-                    normalized_payload['target'] or None,
-                    normalized_payload['harm'] or None,
-                    normalized_payload['firsthand_status'] or None,
-                    normalized_payload['source_confidence'],
-                    json.dumps(normalized_payload['metadata'], default=str),
-                ],
-            ).fetchone()
-            conn.close()
+            with self.connection_session(transaction=True) as conn:
+                row = conn.execute(
+                    """
+                    INSERT INTO claim_testimony (
+                        testimony_id,
+                        user_id,
+                        claim_type,
+                        claim_element_id,
+                        claim_element_text,
+                        raw_narrative,
+                        event_date,
+                        actor_name,
+                        act_text,
+                        target_text,
+                        harm_text,
+                        firsthand_status,
+                        source_confidence,
+                        metadata
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    RETURNING id, timestamp
+                    """,
+                    [
+                        testimony_id,
+                        user_id,
+                        claim_type,
+                        normalized_payload['claim_element_id'] or None,
+                        normalized_payload['claim_element_text'] or None,
+                        normalized_payload['raw_narrative'] or None,
+                        normalized_payload['event_date'] or None,
+                        normalized_payload['actor'] or None,
+                        normalized_payload['act'] or None,
+                        normalized_payload['target'] or None,
+                        normalized_payload['harm'] or None,
+                        normalized_payload['firsthand_status'] or None,
+                        normalized_payload['source_confidence'],
+                        json.dumps(normalized_payload['metadata'], default=str),
+                    ],
+                ).fetchone()
+                self._bump_claim_support_version(conn, user_id, claim_type)
         except Exception as exc:
             self.mediator.log('claim_testimony_save_error', error=str(exc), claim_type=claim_type)
             return {
@@ -5116,27 +5148,61 @@ class ClaimSupportHook:
             limit_clause = 'LIMIT ?'
             parameters.append(normalized_limit)
 
+        updated_records: List[Dict[str, Any]] = []
         try:
-            conn = duckdb.connect(self.db_path)
-            rows = conn.execute(
-                f"""
-                SELECT
-                    id,
-                    user_id,
-                    testimony_id,
-                    claim_type,
-                    claim_element_id,
-                    claim_element_text,
-                    raw_narrative,
-                    metadata,
-                    timestamp
-                FROM claim_testimony
-                WHERE {' AND '.join(where_clauses)}
-                ORDER BY timestamp DESC, id DESC
-                {limit_clause}
-                """,
-                parameters,
-            ).fetchall()
+            # One transaction covers the link updates and the version bumps,
+            # so a failure cannot leave links changed under an old version.
+            with self.connection_session(transaction=not dry_run) as conn:
+                rows = conn.execute(
+                    f"""
+                    SELECT
+                        id,
+                        user_id,
+                        testimony_id,
+                        claim_type,
+                        claim_element_id,
+                        claim_element_text,
+                        raw_narrative,
+                        metadata,
+                        timestamp
+                    FROM claim_testimony
+                    WHERE {' AND '.join(where_clauses)}
+                    ORDER BY timestamp DESC, id DESC
+                    {limit_clause}
+                    """,
+                    parameters,
+                ).fetchall()
+                for row in rows:
+                    entry_metadata = json.loads(row[7]) if row[7] else {}
+                    resolved = self._resolve_testimony_claim_element(
+                        record_id=row[0],
+                        row_user_id=row[1],
+                        claim_type=row[3],
+                        claim_element_id=row[4],
+                        claim_element_text=row[5],
+                        raw_narrative=row[6],
+                        entry_metadata=entry_metadata,
+                        conn=conn,
+                        persist_updates=not dry_run,
+                    )
+                    if not resolved['backfilled']:
+                        continue
+                    updated_records.append({
+                        'record_id': row[0],
+                        'user_id': row[1],
+                        'testimony_id': row[2],
+                        'claim_type': row[3],
+                        'claim_element_id': resolved['claim_element_id'],
+                        'claim_element_text': resolved['claim_element_text'],
+                        'timestamp': row[8].isoformat() if hasattr(row[8], 'isoformat') else row[8],
+                    })
+
+                if not dry_run:
+                    for record_user_id, record_claim_type in sorted({
+                        (str(record['user_id'] or ''), str(record['claim_type'] or ''))
+                        for record in updated_records
+                    }):
+                        self._bump_claim_support_version(conn, record_user_id, record_claim_type)
         except Exception as exc:
             self.mediator.log('claim_testimony_backfill_error', error=str(exc), claim_type=claim_type)
             return {
@@ -5152,34 +5218,6 @@ class ClaimSupportHook:
                 'error': str(exc),
             }
 
-        updated_records: List[Dict[str, Any]] = []
-        for row in rows:
-            entry_metadata = json.loads(row[7]) if row[7] else {}
-            resolved = self._resolve_testimony_claim_element(
-                record_id=row[0],
-                row_user_id=row[1],
-                claim_type=row[3],
-                claim_element_id=row[4],
-                claim_element_text=row[5],
-                raw_narrative=row[6],
-                entry_metadata=entry_metadata,
-                conn=conn,
-                persist_updates=not dry_run,
-            )
-            if not resolved['backfilled']:
-                continue
-            updated_records.append({
-                'record_id': row[0],
-                'user_id': row[1],
-                'testimony_id': row[2],
-                'claim_type': row[3],
-                'claim_element_id': resolved['claim_element_id'],
-                'claim_element_text': resolved['claim_element_text'],
-                'timestamp': row[8].isoformat() if hasattr(row[8], 'isoformat') else row[8],
-            })
-
-        conn.close()
-
         return {
             'available': True,
             'user_id': user_id,
@@ -5221,7 +5259,7 @@ class ClaimSupportHook:
         parameters.append(normalized_limit)
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             rows = conn.execute(
                 f"""
                 SELECT
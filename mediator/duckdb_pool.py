@@ -0,0 +1,434 @@
+"""Shared DuckDB connections for the mediator storage hooks.
+
+The evidence, claim-support and legal-authority hooks used to open and close
+a fresh ``duckdb.connect(db_path)`` for every call. ``DuckDBConnectionManager``
+keeps one database connection per ``db_path`` open while the hooks are busy
+and hands out per-thread cursors from a bounded idle pool. ``session()`` pins
+a single cursor (optionally inside one transaction) to the current thread so
+a whole mediator turn runs on one connection.
+
+An open DuckDB connection holds the database file's lock, so another process
+cannot open the same file meanwhile. The manager therefore closes the
+connection once nothing has used it for ``idle_timeout`` seconds
+(``COMPLAINT_GENERATOR_DUCKDB_IDLE_SECONDS``, default 30) and reopens it on
+the next ``connect()``. A timeout of 0 keeps it open for the life of the
+process, which is only safe when a single process uses the file.
+
+``bulk_insert`` writes many rows with a single statement, going through an
+Arrow table when ``pyarrow`` is installed and ``executemany`` otherwise.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+    duckdb = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_IDLE_TIMEOUT = 30.0
+
+
+def _default_idle_timeout() -> float:
+    try:
+        return float(os.getenv('COMPLAINT_GENERATOR_DUCKDB_IDLE_SECONDS', DEFAULT_IDLE_TIMEOUT))
+    except ValueError:
+        return DEFAULT_IDLE_TIMEOUT
+
+
+def default_db_path(filename: str) -> str:
+    """Return the default location of a hook database named ``filename``.
+
+    ``COMPLAINT_GENERATOR_DUCKDB_DIR`` overrides the directory; otherwise the
+    repository's ``statefiles`` directory is used when it exists, and the
+    current directory when it does not.
+    """
+    configured = os.getenv('COMPLAINT_GENERATOR_DUCKDB_DIR')
+    if configured:
+        state_dir = Path(configured)
+        state_dir.mkdir(parents=True, exist_ok=True)
+    else:
+        state_dir = Path(__file__).parent.parent / 'statefiles'
+        if not state_dir.exists():
+            state_dir = Path('.')
+    return str(state_dir / filename)
+
+
+class _Scope:
+    __slots__ = ("cursor", "depth", "transaction_depth")
+
+    def __init__(self, cursor: Any) -> None:
+        self.cursor = cursor
+        self.depth = 0
+        self.transaction_depth = 0
+
+
+class PooledConnection:
+    """Cursor lease that behaves like a DuckDB connection.
+
+    ``close()`` hands the cursor back to the manager instead of closing it;
+    inside a ``session()`` it does nothing, so existing
+    ``conn = ...; ...; conn.close()`` call sites keep working unchanged.
+    """
+
+    def __init__(self, manager: "DuckDBConnectionManager", cursor: Any, *, scoped: bool = False) -> None:
+        self._manager = manager
+        self._cursor = cursor
+        self._scoped = scoped
+        self._released = False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    def execute(self, *args: Any, **kwargs: Any) -> Any:
+        return self._cursor.execute(*args, **kwargs)
+
+    def executemany(self, *args: Any, **kwargs: Any) -> Any:
+        return self._cursor.executemany(*args, **kwargs)
+
+    def close(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        if not self._scoped:
+            self._manager._release(self._cursor)
+
+    def __enter__(self) -> "PooledConnection":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _close_if_idle(manager_ref: "weakref.ref[DuckDBConnectionManager]") -> None:
+    manager = manager_ref()
+    if manager is not None:
+        manager._close_if_idle()
+
+
+class DuckDBConnectionManager:
+    """One DuckDB database connection per ``db_path`` with pooled cursors.
+
+    ``idle_timeout`` is how many seconds the connection may sit unused before
+    it is closed to release the file lock; ``None`` reads
+    ``COMPLAINT_GENERATOR_DUCKDB_IDLE_SECONDS`` and 0 never closes it.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        idle_timeout: Optional[float] = None,
+    ) -> None:
+        self.db_path = str(db_path)
+        self.pool_size = max(1, int(pool_size))
+        self.idle_timeout = max(0.0, float(_default_idle_timeout() if idle_timeout is None else idle_timeout))
+        self._root: Any = None
+        self._generation = 0
+        self._active = 0
+        self._last_used = 0.0
+        self._idle_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats = {
+            'database_opens': 0,
+            'cursors_created': 0,
+            'leases': 0,
+            'pooled_reuses': 0,
+            'session_reuses': 0,
+            'sessions': 0,
+            'transactions': 0,
+            'rollbacks': 0,
+            'cursors_discarded': 0,
+            'idle_closes': 0,
+        }
+
+    def _root_connection(self) -> Any:
+        if duckdb is None:
+            raise RuntimeError('duckdb is not installed')
+        with self._lock:
+            if self._root is None:
+                self._root = duckdb.connect(self.db_path)
+                self._stats['database_opens'] += 1
+            return self._root
+
+    def _idle(self) -> List[Any]:
+        idle = getattr(self._local, 'idle', None)
+        if idle is None:
+            idle = []
+            self._local.idle = idle
+        return idle
+
+    def _lease_cursor(self) -> Any:
+        idle = self._idle()
+        with self._lock:
+            self._stats['leases'] += 1
+            self._active += 1
+            while idle:
+                generation, cursor = idle.pop()
+                if generation == self._generation:
+                    self._stats['pooled_reuses'] += 1
+                    return cursor
+        try:
+            cursor = self._root_connection().cursor()
+        except BaseException:
+            with self._lock:
+                self._active -= 1
+            raise
+        with self._lock:
+            self._stats['cursors_created'] += 1
+        return cursor
+
+    def _release(self, cursor: Any) -> None:
+        idle = self._idle()
+        with self._lock:
+            keep = self._root is not None and len(idle) < self.pool_size
+            generation = self._generation
+            if not keep:
+                self._stats['cursors_discarded'] += 1
+            self._active = max(0, self._active - 1)
+            self._last_used = time.monotonic()
+            if self._active == 0:
+                self._schedule_idle_close(self.idle_timeout)
+        if keep:
+            idle.append((generation, cursor))
+        else:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+
+    def _schedule_idle_close(self, delay: float) -> None:
+        # Called with ``_lock`` held. One timer at a time; when it fires early
+        # because the connection was used meanwhile, it reschedules itself.
+        if not self.idle_timeout or self._root is None or self._idle_timer is not None:
+            return
+        timer = threading.Timer(delay, _close_if_idle, args=(weakref.ref(self),))
+        timer.daemon = True
+        self._idle_timer = timer
+        timer.start()
+
+    def _close_if_idle(self) -> None:
+        with self._lock:
+            self._idle_timer = None
+            if self._active or self._root is None:
+                return
+            remaining = self._last_used + self.idle_timeout - time.monotonic()
+            if remaining > 0:
+                self._schedule_idle_close(remaining)
+                return
+            root, self._root = self._root, None
+            self._generation += 1
+            self._stats['idle_closes'] += 1
+        root.close()
+
+    def connect(self) -> PooledConnection:
+        """Lease a cursor; reuses the current thread's session cursor if one is open."""
+        scope = getattr(self._local, 'scope', None)
+        if scope is not None:
+            with self._lock:
+                self._stats['session_reuses'] += 1
+            return PooledConnection(self, scope.cursor, scoped=True)
+        return PooledConnection(self, self._lease_cursor())
+
+    @contextmanager
+    def session(self, *, transaction: bool = False) -> Iterator[PooledConnection]:
+        """Run every ``connect()`` on this thread against one cursor.
+
+        Sessions nest; with ``transaction=True`` the outermost transactional
+        level issues ``BEGIN``/``COMMIT`` (or ``ROLLBACK`` on error).
+        """
+        scope = getattr(self._local, 'scope', None)
+        owns_scope = scope is None
+        if owns_scope:
+            scope = _Scope(self._lease_cursor())
+            self._local.scope = scope
+            with self._lock:
+                self._stats['sessions'] += 1
+        scope.depth += 1
+        begins_transaction = transaction and scope.transaction_depth == 0
+        if transaction:
+            if begins_transaction:
+                scope.cursor.execute('BEGIN TRANSACTION')
+                with self._lock:
+                    self._stats['transactions'] += 1
+            scope.transaction_depth += 1
+        try:
+            yield PooledConnection(self, scope.cursor, scoped=True)
+        except BaseException:
+            if begins_transaction:
+                scope.cursor.execute('ROLLBACK')
+                with self._lock:
+                    self._stats['rollbacks'] += 1
+            raise
+        else:
+            if begins_transaction:
+                scope.cursor.execute('COMMIT')
+        finally:
+            if transaction:
+                scope.transaction_depth -= 1
+            scope.depth -= 1
+            if owns_scope:
+                self._local.scope = None
+                self._release(scope.cursor)
+
+    def transaction(self):
+        """Shorthand for ``session(transaction=True)``."""
+        return self.session(transaction=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats['db_path'] = self.db_path
+        stats['pool_size'] = self.pool_size
+        stats['idle_timeout'] = self.idle_timeout
+        stats['open'] = self._root is not None
+        stats['reuse_count'] = stats['pooled_reuses'] + stats['session_reuses']
+        return stats
+
+    def close(self) -> None:
+        """Close the database connection; the next ``connect()`` reopens it."""
+        with self._lock:
+            root, self._root = self._root, None
+            self._generation += 1
+            timer, self._idle_timer = self._idle_timer, None
+        if timer is not None:
+            timer.cancel()
+        if root is not None:
+            root.close()
+
+
+_bulk_view_ids = itertools.count()
+
+
+def bulk_insert(conn: Any, table: str, columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> int:
+    """Insert ``rows`` into ``table`` with one statement and return the row count.
+
+    Rows are handed to DuckDB as a registered Arrow table so the insert runs
+    as a single columnar scan. Columns Arrow cannot type (mixed Python types)
+    and installs without ``pyarrow`` fall back to ``executemany``.
+    """
+    rows = [list(row) for row in rows]
+    if not rows:
+        return 0
+    column_list = ', '.join(columns)
+    if pa is not None:
+        try:
+            arrow_rows = pa.table({
+                f'c{index}': pa.array([row[index] for row in rows])
+                for index in range(len(columns))
+            })
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            arrow_rows = None
+        if arrow_rows is not None:
+            view_name = f'_bulk_rows_{next(_bulk_view_ids)}'
+            conn.register(view_name, arrow_rows)
+            try:
+                conn.execute(
+                    f'INSERT INTO {table} ({column_list}) '
+                    f'SELECT {", ".join(arrow_rows.column_names)} FROM {view_name}'
+                )
+            finally:
+                conn.unregister(view_name)
+            return len(rows)
+    placeholders = ', '.join('?' for _ in columns)
+    conn.executemany(f'INSERT INTO {table} ({column_list}) VALUES ({placeholders})', rows)
+    return len(rows)
+
+
+_managers: "weakref.WeakValueDictionary[str, DuckDBConnectionManager]" = weakref.WeakValueDictionary()
+_managers_lock = threading.Lock()
+
+
+def _manager_key(db_path: str) -> str:
+    if db_path == ':memory:' or str(db_path).startswith(':memory:'):
+        return str(db_path)
+    return str(Path(db_path).expanduser().resolve())
+
+
+def get_connection_manager(
+    db_path: str,
+    *,
+    pool_size: Optional[int] = None,
+    idle_timeout: Optional[float] = None,
+) -> DuckDBConnectionManager:
+    """Return the shared manager for ``db_path``.
+
+    Managers are kept alive by the hooks that use them, so the database is
+    closed once every hook for that path has been garbage collected, or
+    earlier once it has been idle for the manager's ``idle_timeout``.
+    """
+    key = _manager_key(db_path)
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = DuckDBConnectionManager(
+                db_path,
+                pool_size=pool_size or DEFAULT_POOL_SIZE,
+                idle_timeout=idle_timeout,
+            )
+            _managers[key] = manager
+        else:
+            if pool_size:
+                manager.pool_size = max(1, int(pool_size))
+            if idle_timeout is not None:
+                manager.idle_timeout = max(0.0, float(idle_timeout))
+        return manager
+
+
+class DuckDBConnectionMixin:
+    """Pooled-connection helpers for hooks that persist to ``self.db_path``."""
+
+    duckdb_pool_size: int = DEFAULT_POOL_SIZE
+    duckdb_idle_timeout: Optional[float] = None
+
+    def _connection_manager(self) -> DuckDBConnectionManager:
+        manager = getattr(self, '_duckdb_manager', None)
+        if manager is None or manager.db_path != str(self.db_path):
+            manager = get_connection_manager(
+                self.db_path,
+                pool_size=self.duckdb_pool_size,
+                idle_timeout=self.duckdb_idle_timeout,
+            )
+            self._duckdb_manager = manager
+        return manager
+
+    def _connect(self) -> PooledConnection:
+        return self._connection_manager().connect()
+
+    def connection_session(self, *, transaction: bool = False):
+        """Context manager that keeps one connection for everything inside it."""
+        return self._connection_manager().session(transaction=transaction)
+
+    def connection_stats(self) -> Dict[str, Any]:
+        return self._connection_manager().stats()
+
+
+__all__ = [
+    'DEFAULT_IDLE_TIMEOUT',
+    'DEFAULT_POOL_SIZE',
+    'DuckDBConnectionManager',
+    'DuckDBConnectionMixin',
+    'PooledConnection',
+    'bulk_insert',
+    'default_db_path',
+    'get_connection_manager',
+]
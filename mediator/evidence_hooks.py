@@ -35,6 +35,8 @@ except ImportError:
     DUCKDB_AVAILABLE = False
     duckdb = None
 
+from .duckdb_pool import DuckDBConnectionMixin, bulk_insert, default_db_path
+
 
 _CONTENT_ORIGIN_ARTIFACT_FAMILY = {
     'historical_archive_capture': 'archived_web_page',
@@ -319,7 +321,7 @@ class EvidenceStorageHook:
             raise Exception(f'Failed to retrieve evidence: {str(e)}')
 
 
-class EvidenceStateHook:
+class EvidenceStateHook(DuckDBConnectionMixin):
     """
     Hook for managing evidence state in DuckDB.
     
@@ -357,11 +359,7 @@ class EvidenceStateHook:
     
     def _get_default_db_path(self) -> str:
         """Get default DuckDB database path."""
-        # Use statefiles directory if it exists, otherwise current directory
-        state_dir = Path(__file__).parent.parent / 'statefiles'
-        if not state_dir.exists():
-            state_dir = Path('.')
-        return str(state_dir / 'evidence.duckdb')
+        return default_db_path('evidence.duckdb')
     
     def _check_duckdb_availability(self):
         """Check if DuckDB is available."""
@@ -372,7 +370,7 @@ class EvidenceStateHook:
     def _initialize_schema(self):
         """Initialize DuckDB schema for evidence tracking."""
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             
             # Create sequence for auto-incrementing IDs
             conn.execute("""
@@ -594,14 +592,11 @@ class EvidenceStateHook:
             document_parse,
             default_source=str((document_parse.get('metadata', {}) or {}).get('source', '')),
         )
-        for chunk in chunks:
-            conn.execute(
-                """
-                INSERT INTO evidence_chunks (
-                    evidence_id, chunk_id, chunk_index, start_offset, end_offset, chunk_text, metadata
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
+        bulk_insert(
+            conn,
+            'evidence_chunks',
+            ('evidence_id', 'chunk_id', 'chunk_index', 'start_offset', 'end_offset', 'chunk_text', 'metadata'),
+            [
                 [
                     evidence_id,
                     chunk.get('chunk_id'),
@@ -615,21 +610,20 @@ class EvidenceStateHook:
                         'source': parse_contract.get('source', ''),
                         'input_format': parse_contract.get('summary', {}).get('input_format', ''),
                     }, self.mediator)),
-                ],
-            )
+                ]
+                for chunk in chunks
+            ],
+        )
 
     def _store_document_graph(self, conn, evidence_id: int, document_graph: Dict[str, Any]) -> None:
         entities = document_graph.get('entities', []) or []
         relationships = document_graph.get('relationships', []) or []
 
-        for entity in entities:
-            conn.execute(
-                """
-                INSERT INTO evidence_graph_entities (
-                    evidence_id, entity_id, entity_type, entity_name, confidence, metadata
-                )
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
+        bulk_insert(
+            conn,
+            'evidence_graph_entities',
+            ('evidence_id', 'entity_id', 'entity_type', 'entity_name', 'confidence', 'metadata'),
+            [
                 [
                     evidence_id,
                     entity.get('id'),
@@ -640,17 +634,16 @@ class EvidenceStateHook:
                         entity.get('attributes', {}),
                         self.mediator,
                     )),
-                ],
-            )
+                ]
+                for entity in entities
+            ],
+        )
 
-        for relationship in relationships:
-            conn.execute(
-                """
-                INSERT INTO evidence_graph_relationships (
-                    evidence_id, relationship_id, source_id, target_id, relation_type, confidence, metadata
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
+        bulk_insert(
+            conn,
+            'evidence_graph_relationships',
+            ('evidence_id', 'relationship_id', 'source_id', 'target_id', 'relation_type', 'confidence', 'metadata'),
+            [
                 [
                     evidence_id,
                     relationship.get('id'),
@@ -662,8 +655,10 @@ class EvidenceStateHook:
                         relationship.get('attributes', {}),
                         self.mediator,
                     )),
-                ],
-            )
+                ]
+                for relationship in relationships
+            ],
+        )
 
     def _store_document_facts(self, conn, evidence_id: int, evidence_info: Dict[str, Any], document_graph: Dict[str, Any], document_parse: Dict[str, Any]) -> None:
         entities = document_graph.get('entities', []) or []
@@ -686,6 +681,7 @@ class EvidenceStateHook:
             default_source=str((document_parse.get('metadata', {}) or {}).get('source', '')),
         )
 
+        fact_rows = []
         for entity in entities:
             if entity.get('type') != 'fact':
                 continue
@@ -719,23 +715,21 @@ class EvidenceStateHook:
                     metadata=provenance_metadata,
                 ),
             )
-            conn.execute(
-                """
-                INSERT INTO evidence_facts (
-                    evidence_id, fact_id, fact_text, source_artifact_id, confidence, metadata, provenance
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                [
-                    evidence_id,
-                    fact.fact_id,
-                    fact.text,
-                    fact.source_artifact_id,
-                    fact.confidence,
-                    json.dumps(fact.metadata),
-                    json.dumps(fact.provenance.as_dict()),
-                ],
-            )
+            fact_rows.append([
+                evidence_id,
+                fact.fact_id,
+                fact.text,
+                fact.source_artifact_id,
+                fact.confidence,
+                json.dumps(fact.metadata),
+                json.dumps(fact.provenance.as_dict()),
+            ])
+        bulk_insert(
+            conn,
+            'evidence_facts',
+            ('evidence_id', 'fact_id', 'fact_text', 'source_artifact_id', 'confidence', 'metadata', 'provenance'),
+            fact_rows,
+        )
 
     def _find_existing_evidence_record(
         self,
@@ -984,7 +978,7 @@ class EvidenceStateHook:
             return {'record_id': record_id, 'created': True, 'reused': False}
         
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             normalized_evidence_metadata = _merge_intake_summary_handoff_metadata(
                 evidence_info.get('metadata', {}),
                 self.mediator,
@@ -1080,48 +1074,52 @@ class EvidenceStateHook:
             if not isinstance(username, str) or not username:
                 username = user_id
             
-            result = conn.execute("""
-                INSERT INTO evidence (
-                    user_id, username, evidence_cid, evidence_type, 
-                    evidence_size, metadata, complaint_id, claim_type, description,
-                    content_hash, source_url, acquisition_method, provenance,
-                    claim_element_id, claim_element, parse_status, chunk_count,
-                    parsed_text_preview, parse_metadata, graph_status,
-                    graph_entity_count, graph_relationship_count, graph_metadata
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                RETURNING id
-            """, [
-                user_id,
-                username,
-                evidence_info['cid'],
-                evidence_info['type'],
-                evidence_info['size'],
-                json.dumps(normalized_evidence_metadata),
-                complaint_id,
-                claim_type,
-                description,
-                provenance_payload.get('content_hash'),
-                provenance_payload.get('source_url'),
-                provenance_payload.get('acquisition_method'),
-                json.dumps(provenance_payload),
-                claim_element_id,
-                claim_element,
-                parse_contract.get('status') or parse_metadata.get('status'),
-                parse_contract.get('chunk_count', 0),
-                parsed_text_preview,
-                json.dumps(parse_metadata),
-                document_graph.get('status') or document_graph_summary.get('status'),
-                len(document_graph.get('entities', []) or []),
-                len(document_graph.get('relationships', []) or []),
-                json.dumps(graph_metadata),
-            ]).fetchone()
-            
-            record_id = result[0]
-            self._store_document_chunks(conn, record_id, document_parse)
-            self._store_document_graph(conn, record_id, document_graph)
-            self._store_document_facts(conn, record_id, evidence_info, document_graph, document_parse)
             conn.close()
+
+            # The record and all of its chunk, graph and fact rows are written
+            # in one transaction so a large document commits once.
+            with self.connection_session(transaction=True) as txn:
+                result = txn.execute("""
+                    INSERT INTO evidence (
+                        user_id, username, evidence_cid, evidence_type, 
+                        evidence_size, metadata, complaint_id, claim_type, description,
+                        content_hash, source_url, acquisition_method, provenance,
+                        claim_element_id, claim_element, parse_status, chunk_count,
+                        parsed_text_preview, parse_metadata, graph_status,
+                        graph_entity_count, graph_relationship_count, graph_metadata
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    RETURNING id
+                """, [
+                    user_id,
+                    username,
+                    evidence_info['cid'],
+                    evidence_info['type'],
+                    evidence_info['size'],
+                    json.dumps(normalized_evidence_metadata),
+                    complaint_id,
+                    claim_type,
+                    description,
+                    provenance_payload.get('content_hash'),
+                    provenance_payload.get('source_url'),
+                    provenance_payload.get('acquisition_method'),
+                    json.dumps(provenance_payload),
+                    claim_element_id,
+                    claim_element,
+                    parse_contract.get('status') or parse_metadata.get('status'),
+                    parse_contract.get('chunk_count', 0),
+                    parsed_text_preview,
+                    json.dumps(parse_metadata),
+                    document_graph.get('status') or document_graph_summary.get('status'),
+                    len(document_graph.get('entities', []) or []),
+                    len(document_graph.get('relationships', []) or []),
+                    json.dumps(graph_metadata),
+                ]).fetchone()
+            
+                record_id = result[0]
+                self._store_document_chunks(txn, record_id, document_parse)
+                self._store_document_graph(txn, record_id, document_graph)
+                self._store_document_facts(txn, record_id, evidence_info, document_graph, document_parse)
             
             self.mediator.log('evidence_record_added', 
                 record_id=record_id, cid=evidence_info['cid'])
@@ -1154,7 +1152,7 @@ class EvidenceStateHook:
             ]
         
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             
             results = conn.execute("""
                 SELECT id, user_id, username, evidence_cid, evidence_type,
@@ -1227,7 +1225,7 @@ class EvidenceStateHook:
             return None
         
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             
             result = conn.execute("""
                 SELECT id, user_id, username, evidence_cid, evidence_type,
@@ -1287,7 +1285,7 @@ class EvidenceStateHook:
             return []
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             results = conn.execute(
                 """
                 SELECT chunk_id, chunk_index, start_offset, end_offset, chunk_text, metadata
@@ -1322,7 +1320,7 @@ class EvidenceStateHook:
             return {'status': 'unavailable', 'entities': [], 'relationships': []}
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             entity_rows = conn.execute(
                 """
                 SELECT entity_id, entity_type, entity_name, confidence, metadata
@@ -1376,7 +1374,7 @@ class EvidenceStateHook:
             return [dict(item) for item in list(self._memory_facts.get(int(evidence_id), []))]
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             rows = conn.execute(
                 """
                 SELECT fact_id, fact_text, source_artifact_id, confidence, metadata, provenance
@@ -1409,7 +1407,7 @@ class EvidenceStateHook:
             return {'available': False}
         
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             
             if user_id:
                 result = conn.execute("""
@@ -1465,7 +1463,7 @@ class EvidenceStateHook:
             return {'persisted': False, 'run_id': -1}
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             state = getattr(self.mediator, 'state', None)
             username = getattr(state, 'username', None) if state is not None else None
             if not isinstance(username, str) or not username:
@@ -1609,7 +1607,7 @@ class EvidenceStateHook:
             return []
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             if user_id:
                 rows = conn.execute(
                     """
@@ -1667,7 +1665,7 @@ class EvidenceStateHook:
             return {'available': False}
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             run_row = conn.execute(
                 """
                 SELECT id, user_id, username, claim_type, keywords, domains,
@@ -1787,7 +1785,7 @@ class EvidenceStateHook:
             return {'available': False, 'tactics': []}
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             if user_id:
                 rows = conn.execute(
                     """
@@ -1906,7 +1904,7 @@ class EvidenceStateHook:
             return {'queued': False, 'job_id': -1}
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             state = getattr(self.mediator, 'state', None)
             username = getattr(state, 'username', None) if state is not None else None
             if not isinstance(username, str) or not username:
@@ -1959,7 +1957,7 @@ class EvidenceStateHook:
             return []
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             clauses: List[str] = []
             params: List[Any] = []
             if user_id:
@@ -2000,7 +1998,7 @@ class EvidenceStateHook:
             return {'available': False, 'job_id': job_id}
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             row = conn.execute(
                 """
                 SELECT id, user_id, username, claim_type, keywords, domains,
@@ -2031,7 +2029,7 @@ class EvidenceStateHook:
             return {'claimed': False, 'job': None}
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             for _ in range(3):
                 clauses = ["status = 'queued'", 'available_at <= CURRENT_TIMESTAMP']
                 params: List[Any] = []
@@ -2092,7 +2090,7 @@ class EvidenceStateHook:
             return {'updated': False, 'job_id': job_id}
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             current = conn.execute(
                 """
                 SELECT metadata
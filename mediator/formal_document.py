@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 import re
@@ -371,117 +372,173 @@ def _prioritized_intake_statements(intake_summary: List[Dict[str, str]]) -> List
     return deduped
 
 
+_REPORT_PATTERN = re.compile(r"\b(reported|complained|opposed|informed|notified|told|requested)\b")
+_ADVERSE_ACTION_PATTERN = re.compile(r"\b(terminated|fired|demoted|suspended|disciplined|retaliated|denied)\b")
+_ENDED_EMPLOYMENT_PATTERN = r"\b(end(?:ed|ing))\b[^.]{0,40}\bemployment\b"
+_HARM_TIE_PATTERN = re.compile(r"\b(lost|suffered|experienced)\b")
+_DAMAGES_PATTERN = re.compile(r"\b(lost|damages|harm|injur|suffered|experienced|benefits|wages|salary|income)\b")
+_REPORT_THEN_ADVERSE_PATTERN = re.compile(
+    r"\b(reported|complained|opposed|informed|notified|told|requested)\b.*\b(terminated|fired|demoted|suspended|disciplined|retaliated|denied)\b"
+    r"|\b(terminated|fired|demoted|suspended|disciplined|retaliated|denied)\b.*\b(reported|complained|opposed|informed|notified|told|requested)\b"
+)
+_EXHIBIT_REFERENCE_PATTERN = re.compile(r"\(see exhibit [^)]+\)", re.IGNORECASE)
+_TOKEN_SPLIT_PATTERN = re.compile(r"\W+")
+_ALLEGATION_STOP_TOKENS = frozenset({"plaintiff", "defendant", "exhibit", "after", "those", "this", "that"})
+
+# Category and feature flags are bit positions so two allegations can be
+# compared with a single AND instead of set intersections.
+_ALLEGATION_CATEGORY_PATTERNS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = (
+    ("report", _REPORT_PATTERN),
+    (
+        "adverse",
+        re.compile(
+            r"\b(terminated|fired|demoted|suspended|disciplined|retaliated|denied|removed|stripped)\b"
+            rf"|{_ENDED_EMPLOYMENT_PATTERN}"
+        ),
+    ),
+    ("harm", re.compile(r"\b(lost|suffered|experienced|benefits|wages|salary|income|opportunities)\b")),
+)
+_ALLEGATION_FEATURE_PATTERNS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = (
+    ("report", _REPORT_PATTERN),
+    ("hr", re.compile(r"\b(human resources|hr)\b")),
+    ("management", re.compile(r"\bregional management|management\b")),
+    (
+        "accounts",
+        re.compile(
+            r"\b(key|major)\s+accounts?\b|\b(accounts?)\b[^.]{0,20}\b(removed|stripped|taken away)\b"
+            r"|\b(removed|stripped|took away)\b[^.]{0,20}\baccounts?\b"
+        ),
+    ),
+    ("overtime", re.compile(r"\bovertime\b")),
+    ("shifts", re.compile(r"\bshift(s)?\b")),
+    ("absences", re.compile(r"\b(absences?|attendance|treatment-related absences?)\b")),
+    ("discipline", re.compile(r"\b(disciplined|discipline|wrote me up|write-up|write up)\b")),
+    (
+        "accommodation",
+        re.compile(
+            r"\b(accommodation|accommodate|light duty|schedule flexibility|medical restrictions?|doctor-imposed restrictions?)\b"
+        ),
+    ),
+    ("restrictions", re.compile(r"\b(restrictions?|light duty|schedule flexibility)\b")),
+    ("termination", re.compile(rf"\b(terminated|fired)\b|{_ENDED_EMPLOYMENT_PATTERN}")),
+    ("economic_harm", re.compile(r"\b(wages|pay|salary|income|benefits)\b")),
+    ("opportunities", re.compile(r"\b(career opportunities|future opportunities|opportunities)\b")),
+)
+_CATEGORY_BITS = {name: 1 << index for index, (name, _) in enumerate(_ALLEGATION_CATEGORY_PATTERNS)}
+_FEATURE_BITS = {name: 1 << index for index, (name, _) in enumerate(_ALLEGATION_FEATURE_PATTERNS)}
+
+
+def _pattern_mask(lowered: str, patterns: Tuple[Tuple[str, "re.Pattern[str]"], ...]) -> int:
+    mask = 0
+    for index, (_, pattern) in enumerate(patterns):
+        if pattern.search(lowered):
+            mask |= 1 << index
+    return mask
+
+
+@dataclass(frozen=True)
+class _AllegationProfile:
+    """Tokens and category/feature bitmasks computed once per allegation."""
+
+    tokens: frozenset
+    categories: int
+    features: int
+
+    @classmethod
+    def build(cls, value: str) -> "_AllegationProfile":
+        lowered = value.lower()
+        scrubbed = _EXHIBIT_REFERENCE_PATTERN.sub("", value).lower()
+        return cls(
+            tokens=frozenset(
+                token
+                for token in _TOKEN_SPLIT_PATTERN.split(scrubbed)
+                if len(token) >= 4 and token not in _ALLEGATION_STOP_TOKENS
+            ),
+            categories=_pattern_mask(lowered, _ALLEGATION_CATEGORY_PATTERNS),
+            features=_pattern_mask(lowered, _ALLEGATION_FEATURE_PATTERNS),
+        )
+
+    def duplicates(self, existing: "_AllegationProfile") -> bool:
+        shared_categories = self.categories & existing.categories
+        if not shared_categories:
+            return False
+        overlap = len(self.tokens & existing.tokens) / max(1, min(len(self.tokens), len(existing.tokens)))
+        if overlap >= 0.7:
+            return True
+        shared_features = (self.features & existing.features).bit_count()
+        if shared_categories & _CATEGORY_BITS["adverse"] and shared_features >= 3:
+            return True
+        return bool(
+            shared_categories & _CATEGORY_BITS["report"]
+            and self.features & existing.features & _FEATURE_BITS["accommodation"]
+            and shared_features >= 2
+        )
+
+
 def _prune_subsumed_narrative_clauses(allegations: List[str]) -> List[str]:
     cleaned = [str(item).strip() for item in allegations if str(item).strip()]
     if not cleaned:
         return []
+    lowered_items = [item.lower() for item in cleaned]
 
-    def _pick(pattern: str, *, require_plaintiff: bool = False) -> str:
-        for item in cleaned:
-            lowered = item.lower()
+    def _pick(pattern: "re.Pattern[str]", *, require_plaintiff: bool = False) -> str:
+        for item, lowered in zip(cleaned, lowered_items):
             if require_plaintiff and "plaintiff" not in lowered:
                 continue
-            if re.search(pattern, lowered):
+            if pattern.search(lowered):
                 return item.strip()
         return ""
 
-    report_clause = _pick(r"\b(reported|complained|opposed|informed|notified|told|requested)\b", require_plaintiff=True)
-    adverse_clause = _pick(r"\b(terminated|fired|demoted|suspended|disciplined|retaliated|denied)\b")
+    report_clause = _pick(_REPORT_PATTERN, require_plaintiff=True)
+    adverse_clause = _pick(_ADVERSE_ACTION_PATTERN)
     has_harm_tied_to_adverse_action = any(
-        re.search(r"\b(lost|suffered|experienced)\b", item.lower())
-        and re.search(r"\b(terminated|fired|demoted|suspended|disciplined|retaliated|denied)\b", item.lower())
-        for item in cleaned
+        _HARM_TIE_PATTERN.search(lowered) and _ADVERSE_ACTION_PATTERN.search(lowered)
+        for lowered in lowered_items
     )
     consumed = {item.lower() for item in (report_clause, adverse_clause) if item}
     if has_harm_tied_to_adverse_action:
-        combined_clause = _pick(
-            r"\b(reported|complained|opposed|informed|notified|told|requested)\b.*\b(terminated|fired|demoted|suspended|disciplined|retaliated|denied)\b"
-            r"|\b(terminated|fired|demoted|suspended|disciplined|retaliated|denied)\b.*\b(reported|complained|opposed|informed|notified|told|requested)\b",
-            require_plaintiff=True,
-        )
+        combined_clause = _pick(_REPORT_THEN_ADVERSE_PATTERN, require_plaintiff=True)
         if combined_clause:
             consumed.add(combined_clause.lower())
-    return [item for item in cleaned if item.lower() not in consumed]
+    return [item for item, lowered in zip(cleaned, lowered_items) if lowered not in consumed]
 
 
 def _prune_near_duplicate_allegations(allegations: List[str]) -> List[str]:
-    def _tokens(value: str) -> set[str]:
-        scrubbed = re.sub(r"\(see exhibit [^)]+\)", "", value, flags=re.IGNORECASE)
-        return {
-            token
-            for token in re.split(r"\W+", scrubbed.lower())
-            if len(token) >= 4 and token not in {"plaintiff", "defendant", "exhibit", "after", "those", "this", "that"}
-        }
-
-    def _categories(value: str) -> set[str]:
-        lowered = value.lower()
-        flags = set()
-        if re.search(r"\b(reported|complained|opposed|informed|notified|told|requested)\b", lowered):
-            flags.add("report")
-        if re.search(r"\b(terminated|fired|demoted|suspended|disciplined|retaliated|denied|removed|stripped)\b", lowered) or re.search(r"\b(end(?:ed|ing))\b[^.]{0,40}\bemployment\b", lowered):
-            flags.add("adverse")
-        if re.search(r"\b(lost|suffered|experienced|benefits|wages|salary|income|opportunities)\b", lowered):
-            flags.add("harm")
-        return flags
-
-    def _features(value: str) -> set[str]:
-        lowered = value.lower()
-        flags = set()
-        if re.search(r"\b(reported|complained|opposed|informed|notified|told|requested)\b", lowered):
-            flags.add("report")
-        if re.search(r"\b(human resources|hr)\b", lowered):
-            flags.add("hr")
-        if re.search(r"\bregional management|management\b", lowered):
-            flags.add("management")
-        if re.search(r"\b(key|major)\s+accounts?\b|\b(accounts?)\b[^.]{0,20}\b(removed|stripped|taken away)\b|\b(removed|stripped|took away)\b[^.]{0,20}\baccounts?\b", lowered):
-            flags.add("accounts")
-        if re.search(r"\bovertime\b", lowered):
-            flags.add("overtime")
-        if re.search(r"\bshift(s)?\b", lowered):
-            flags.add("shifts")
-        if re.search(r"\b(absences?|attendance|treatment-related absences?)\b", lowered):
-            flags.add("absences")
-        if re.search(r"\b(disciplined|discipline|wrote me up|write-up|write up)\b", lowered):
-            flags.add("discipline")
-        if re.search(r"\b(accommodation|accommodate|light duty|schedule flexibility|medical restrictions?|doctor-imposed restrictions?)\b", lowered):
-            flags.add("accommodation")
-        if re.search(r"\b(restrictions?|light duty|schedule flexibility)\b", lowered):
-            flags.add("restrictions")
-        if re.search(r"\b(terminated|fired)\b", lowered) or re.search(r"\b(end(?:ed|ing))\b[^.]{0,40}\bemployment\b", lowered):
-            flags.add("termination")
-        if re.search(r"\b(wages|pay|salary|income|benefits)\b", lowered):
-            flags.add("economic_harm")
-        if re.search(r"\b(career opportunities|future opportunities|opportunities)\b", lowered):
-            flags.add("opportunities")
-        return flags
+    """Drop allegations that restate an earlier kept allegation.
 
+    Each allegation is profiled once. Kept allegations are indexed by token
+    and by feature bit, so a candidate is only compared with the kept
+    allegations it could possibly duplicate.
+    """
     kept: List[str] = []
+    kept_profiles: List[_AllegationProfile] = []
+    token_index: Dict[str, List[int]] = {}
+    feature_index: Dict[int, List[int]] = {}
+    profiles: Dict[str, _AllegationProfile] = {}
     for candidate in allegations:
-        candidate_tokens = _tokens(candidate)
-        candidate_categories = _categories(candidate)
-        candidate_features = _features(candidate)
-        skip = False
-        for existing in kept:
-            existing_tokens = _tokens(existing)
-            existing_categories = _categories(existing)
-            existing_features = _features(existing)
-            if not candidate_tokens or not existing_tokens:
+        profile = profiles.get(candidate)
+        if profile is None:
+            profile = profiles[candidate] = _AllegationProfile.build(candidate)
+        if profile.tokens and profile.categories:
+            neighbours = set()
+            for token in profile.tokens:
+                neighbours.update(token_index.get(token, ()))
+            if profile.categories & (_CATEGORY_BITS["adverse"] | _CATEGORY_BITS["report"]):
+                for bit in _FEATURE_BITS.values():
+                    if profile.features & bit:
+                        neighbours.update(feature_index.get(bit, ()))
+            if any(profile.duplicates(kept_profiles[index]) for index in sorted(neighbours)):
                 continue
-            if not (candidate_categories & existing_categories):
-                continue
-            overlap = len(candidate_tokens & existing_tokens) / max(1, min(len(candidate_tokens), len(existing_tokens)))
-            shared_features = candidate_features & existing_features
-            if overlap >= 0.7:
-                skip = True
-                break
-            if "adverse" in candidate_categories and "adverse" in existing_categories and len(shared_features) >= 3:
-                skip = True
-                break
-            if "report" in candidate_categories and "report" in existing_categories and "accommodation" in shared_features and len(shared_features) >= 2:
-                skip = True
-                break
-        if not skip:
-            kept.append(candidate)
+        kept.append(candidate)
+        if not profile.tokens:
+            continue
+        position = len(kept_profiles)
+        kept_profiles.append(profile)
+        for token in profile.tokens:
+            token_index.setdefault(token, []).append(position)
+        for bit in _FEATURE_BITS.values():
+            if profile.features & bit:
+                feature_index.setdefault(bit, []).append(position)
     return kept
 
 
@@ -498,11 +555,11 @@ def _build_factual_allegation_groups(allegations: Sequence[Any]) -> List[Dict[st
         if not text:
             continue
         lowered = text.lower()
-        if re.search(r"\b(reported|complained|opposed|informed|notified|told|requested)\b", lowered):
+        if _REPORT_PATTERN.search(lowered):
             title = "Protected Activity and Complaints"
-        elif re.search(r"\b(terminated|fired|demoted|suspended|disciplined|retaliated|denied)\b", lowered):
+        elif _ADVERSE_ACTION_PATTERN.search(lowered):
             title = "Adverse Action and Retaliatory Conduct"
-        elif re.search(r"\b(lost|damages|harm|injur|suffered|experienced|benefits|wages|salary|income)\b", lowered):
+        elif _DAMAGES_PATTERN.search(lowered):
             title = "Damages and Resulting Harm"
         else:
             title = "Additional Factual Support"
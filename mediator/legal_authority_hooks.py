@@ -3,13 +3,15 @@
 import os
 import json
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from html import unescape
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
-import requests
-
 from integrations.ipfs_datasets.provenance import (
     build_document_parse_contract,
     build_fact_lineage_metadata,
@@ -40,6 +42,7 @@ from integrations.ipfs_datasets.search import (
     COMMON_CRAWL_AVAILABLE as WEB_ARCHIVING_AVAILABLE,
     CommonCrawlSearchEngine,
 )
+from integrations.ipfs_datasets.http_cache import get_http_session
 
 try:
     import duckdb
@@ -48,6 +51,8 @@ except ImportError:
     DUCKDB_AVAILABLE = False
     duckdb = None
 
+from .duckdb_pool import DuckDBConnectionMixin, bulk_insert, default_db_path
+
 
 _CONTENT_ORIGIN_ARTIFACT_FAMILY = {
     'historical_archive_capture': 'archived_web_page',
@@ -297,9 +302,21 @@ class LegalAuthoritySearchHook:
     Uses web archiving tools and legal scrapers to locate statutes,
     regulations, case law, and other legal authorities relevant to the case.
     """
+
+    # ``search_all_sources`` fans the source families out over a bounded
+    # thread pool. Each family gets ``source_deadline_seconds`` (overridable
+    # per family) measured from the start of the fan-out; families that miss
+    # their deadline come back empty and are reported in the diagnostics.
+    search_max_workers = 6
+    source_deadline_seconds = 30.0
+    source_cache_ttl_seconds = 300.0
+    source_cache_max_entries = 128
     
     def __init__(self, mediator):
         self.mediator = mediator
+        self._source_cache: "OrderedDict[Tuple[str, ...], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._source_cache_lock = threading.Lock()
+        self._http_session = get_http_session()
         self._check_availability()
         self._init_web_archiving()
     
@@ -384,8 +401,13 @@ class LegalAuthoritySearchHook:
             diagnostics[bucket_name] = diagnostic
 
         return diagnostics
+
+    def get_http_cache_stats(self) -> Dict[str, Any]:
+        """Report pooled-session request counts and response-cache hit/miss metrics."""
+        return self._http_session.stats()
+
     def _http_get_json(self, url: str, *, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        response = requests.get(
+        response = self._http_session.get(
             url,
             params=params or {},
             timeout=20,
@@ -396,7 +418,7 @@ class LegalAuthoritySearchHook:
         return payload if isinstance(payload, dict) else {}
 
     def _http_get_text(self, url: str) -> str:
-        response = requests.get(
+        response = self._http_session.get(
             url,
             timeout=20,
             headers={'User-Agent': _LEGAL_SEARCH_USER_AGENT},
@@ -1194,16 +1216,121 @@ Return only the search terms, one per line."""
         )
         return programs
     
+    def _cached_source_results(self, cache_key: Tuple[str, ...]) -> Optional[List[Dict[str, Any]]]:
+        with self._source_cache_lock:
+            entry = self._source_cache.get(cache_key)
+            if entry is None:
+                return None
+            stored_at, rows = entry
+            if time.monotonic() - stored_at > self.source_cache_ttl_seconds:
+                del self._source_cache[cache_key]
+                return None
+            self._source_cache.move_to_end(cache_key)
+            return [dict(row) if isinstance(row, dict) else row for row in rows]
+
+    def _store_source_results(self, cache_key: Tuple[str, ...], rows: List[Dict[str, Any]]) -> None:
+        with self._source_cache_lock:
+            self._source_cache[cache_key] = (time.monotonic(), list(rows))
+            self._source_cache.move_to_end(cache_key)
+            while len(self._source_cache) > max(0, int(self.source_cache_max_entries)):
+                self._source_cache.popitem(last=False)
+
+    def clear_source_cache(self) -> None:
+        """Drop memoized per-source results from earlier ``search_all_sources`` calls."""
+        with self._source_cache_lock:
+            self._source_cache.clear()
+
+    def _run_source_searches(
+        self,
+        tasks: Dict[str, Callable[[], List[Dict[str, Any]]]],
+        *,
+        cache_scope: Tuple[str, ...],
+        source_deadlines: Optional[Dict[str, float]] = None,
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Dict[str, Any]]]:
+        """Run source searches concurrently and return whatever finished in time.
+
+        Results are memoized per source for ``source_cache_ttl_seconds``. A
+        source that misses its deadline keeps running in the background and
+        its result is cached when it lands, so the next cycle picks it up.
+        """
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        status: Dict[str, Dict[str, Any]] = {}
+        pending: Dict[Any, str] = {}
+        deadlines = dict(source_deadlines or {})
+        started_at = time.monotonic()
+
+        def _deadline_for(key: str) -> float:
+            family = key.split(':', 1)[0]
+            return float(deadlines.get(key, deadlines.get(family, self.source_deadline_seconds)))
+
+        def _run(key: str, cache_key: Tuple[str, ...]) -> List[Dict[str, Any]]:
+            rows = list(tasks[key]() or [])
+            self._store_source_results(cache_key, rows)
+            return rows
+
+        executor: Optional[ThreadPoolExecutor] = None
+        for key in tasks:
+            cache_key = (key, *cache_scope)
+            cached = self._cached_source_results(cache_key)
+            if cached is not None:
+                results[key] = cached
+                status[key] = {'status': 'cached', 'result_count': len(cached), 'elapsed_ms': 0.0}
+                continue
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=max(1, min(int(self.search_max_workers), len(tasks))),
+                    thread_name_prefix='legal-authority-search',
+                )
+            pending[executor.submit(_run, key, cache_key)] = key
+
+        while pending:
+            now = time.monotonic() - started_at
+            next_deadline = min(_deadline_for(key) for key in pending.values())
+            done, _ = wait(list(pending), timeout=max(0.0, next_deadline - now), return_when=FIRST_COMPLETED)
+            elapsed = time.monotonic() - started_at
+            for future in done:
+                key = pending.pop(future)
+                try:
+                    results[key] = future.result()
+                    status[key] = {'status': 'ok', 'result_count': len(results[key])}
+                except Exception as exc:
+                    results[key] = []
+                    status[key] = {'status': 'error', 'result_count': 0, 'error': str(exc)}
+                    self.mediator.log('legal_authority_search_error', search_type=key, error=str(exc))
+                status[key]['elapsed_ms'] = round(elapsed * 1000, 1)
+            for future, key in list(pending.items()):
+                if elapsed >= _deadline_for(key):
+                    del pending[future]
+                    future.cancel()
+                    results[key] = []
+                    status[key] = {
+                        'status': 'timeout',
+                        'result_count': 0,
+                        'elapsed_ms': round(elapsed * 1000, 1),
+                        'deadline_seconds': _deadline_for(key),
+                    }
+                    self.mediator.log('legal_authority_search_timeout', search_type=key, deadline_seconds=_deadline_for(key))
+
+        if executor is not None:
+            executor.shutdown(wait=False)
+        return results, status
+
     def search_all_sources(self, query: str, claim_type: Optional[str] = None,
                           jurisdiction: Optional[str] = None,
-                          authority_families: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+                          authority_families: Optional[List[str]] = None,
+                          source_deadlines: Optional[Dict[str, float]] = None) -> Dict[str, List[Dict[str, Any]]]:
         """
         Search all available legal sources for authorities.
+
+        Source families run concurrently; the call returns once every family
+        has finished or reached its deadline, with late families left empty.
         
         Args:
             query: Search query
             claim_type: Optional claim type to focus search
             jurisdiction: Optional jurisdiction filter
+            source_deadlines: Optional per-family deadlines in seconds, keyed by
+                result bucket (e.g. ``'case_law'`` or ``'web_archives'``)
             
         Returns:
             Dictionary with results from each source type
@@ -1223,29 +1350,22 @@ Return only the search terms, one per line."""
         )
         state_code = jurisdiction if isinstance(jurisdiction, str) and len(jurisdiction.strip()) == 2 else jurisdiction
 
-        results = {
-            'statutes': [],
-            'state_statutes': [],
-            'regulations': [],
-            'administrative_rules': [],
-            'case_law': [],
-            'web_archives': []
-        }
-
+        tasks: Dict[str, Callable[[], List[Dict[str, Any]]]] = {}
         if include_statutes:
-            results['statutes'] = self.search_us_code(query, max_results=5)
-            results['state_statutes'] = self.search_state_laws(
+            tasks['statutes'] = lambda: (
+                self.search_us_code(query, max_results=5)
+                or self._search_oregon_statutes_fallback(query, max_results=5)
+            )
+            tasks['state_statutes'] = lambda: self.search_state_laws(
                 query,
                 state=state_code,
                 max_results=5,
                 allow_live_scrape_fallback=False,
             )
-            if not results['statutes']:
-                results['statutes'] = self._search_oregon_statutes_fallback(query, max_results=5)
 
         if include_regulations:
-            results['regulations'] = self.search_federal_register(query, max_results=5)
-            results['administrative_rules'] = self.search_administrative_law(
+            tasks['regulations'] = lambda: self.search_federal_register(query, max_results=5)
+            tasks['administrative_rules'] = lambda: self.search_administrative_law(
                 query,
                 state=state_code,
                 max_results=5,
@@ -1253,16 +1373,33 @@ Return only the search terms, one per line."""
             )
 
         if include_case_law:
-            results['case_law'] = self.search_case_law(query, jurisdiction, max_results=5)
+            tasks['case_law'] = lambda: self.search_case_law(query, jurisdiction, max_results=5)
 
+        legal_domains = ['law.cornell.edu', 'law.justia.com', 'findlaw.com']
         if include_web_archives:
-            legal_domains = ['law.cornell.edu', 'law.justia.com', 'findlaw.com']
             for domain in legal_domains:
-                try:
-                    web_results = self.search_web_archives(domain, query=query, max_results=3)
-                    results['web_archives'].extend(web_results)
-                except Exception:
-                    pass
+                tasks[f'web_archives:{domain}'] = (
+                    lambda domain=domain: self.search_web_archives(domain, query=query, max_results=3)
+                )
+
+        source_results, source_status = self._run_source_searches(
+            tasks,
+            cache_scope=(str(query or ''), str(jurisdiction or ''), str(state_code or '')),
+            source_deadlines=source_deadlines,
+        )
+
+        results = {
+            'statutes': source_results.get('statutes', []),
+            'state_statutes': source_results.get('state_statutes', []),
+            'regulations': source_results.get('regulations', []),
+            'administrative_rules': source_results.get('administrative_rules', []),
+            'case_law': source_results.get('case_law', []),
+            'web_archives': [
+                row
+                for domain in legal_domains
+                for row in source_results.get(f'web_archives:{domain}', [])
+            ],
+        }
         
         total_found = sum(len(v) for v in results.values())
         self.mediator.log('legal_authority_search_all',
@@ -1282,11 +1419,12 @@ Return only the search terms, one per line."""
             query=query,
             state=state_code,
         )
+        results['search_diagnostics']['source_status'] = source_status
         
         return results
 
 
-class LegalAuthorityStorageHook:
+class LegalAuthorityStorageHook(DuckDBConnectionMixin):
     """
     Hook for storing legal authorities in DuckDB.
     
@@ -1320,10 +1458,7 @@ class LegalAuthorityStorageHook:
     
     def _get_default_db_path(self) -> str:
         """Get default DuckDB database path."""
-        state_dir = Path(__file__).parent.parent / 'statefiles'
-        if not state_dir.exists():
-            state_dir = Path('.')
-        return str(state_dir / 'legal_authorities.duckdb')
+        return default_db_path('legal_authorities.duckdb')
     
     def _check_duckdb_availability(self):
         """Check if DuckDB is available."""
@@ -1334,7 +1469,7 @@ class LegalAuthorityStorageHook:
     def _initialize_schema(self):
         """Initialize DuckDB schema for legal authorities."""
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             
             # Create sequence for auto-incrementing IDs
             conn.execute("""
@@ -1598,14 +1733,11 @@ class LegalAuthorityStorageHook:
             return
 
         parse_contract = build_document_parse_contract(document_parse, default_source='legal_authority')
-        for chunk in chunks:
-            conn.execute(
-                """
-                INSERT INTO legal_authority_chunks (
-                    authority_id, chunk_id, chunk_index, start_offset, end_offset, chunk_text, metadata
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
+        bulk_insert(
+            conn,
+            'legal_authority_chunks',
+            ('authority_id', 'chunk_id', 'chunk_index', 'start_offset', 'end_offset', 'chunk_text', 'metadata'),
+            [
                 [
                     authority_id,
                     chunk.get('chunk_id'),
@@ -1619,8 +1751,10 @@ class LegalAuthorityStorageHook:
                         'source': parse_contract.get('source', 'legal_authority'),
                         'input_format': parse_contract.get('summary', {}).get('input_format', ''),
                     }, self.mediator)),
-                ],
-            )
+                ]
+                for chunk in chunks
+            ],
+        )
 
     def _store_authority_facts(
         self,
@@ -1631,6 +1765,7 @@ class LegalAuthorityStorageHook:
         document_parse: Dict[str, Any],
     ) -> None:
         parse_contract = build_document_parse_contract(document_parse, default_source='legal_authority')
+        fact_rows = []
         for entity in graph_payload.get('entities', []) or []:
             if entity.get('type') != 'fact':
                 continue
@@ -1655,23 +1790,21 @@ class LegalAuthorityStorageHook:
                 ),
                 provenance=_merge_handoff_into_provenance_record(provenance, self.mediator),
             )
-            conn.execute(
-                """
-                INSERT INTO legal_authority_facts (
-                    authority_id, fact_id, fact_text, source_authority_id, confidence, metadata, provenance
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                [
-                    authority_id,
-                    fact.fact_id,
-                    fact.text,
-                    fact.source_authority_id,
-                    fact.confidence,
-                    json.dumps(fact.metadata),
-                    json.dumps(fact.provenance.as_dict()),
-                ],
-            )
+            fact_rows.append([
+                authority_id,
+                fact.fact_id,
+                fact.text,
+                fact.source_authority_id,
+                fact.confidence,
+                json.dumps(fact.metadata),
+                json.dumps(fact.provenance.as_dict()),
+            ])
+        bulk_insert(
+            conn,
+            'legal_authority_facts',
+            ('authority_id', 'fact_id', 'fact_text', 'source_authority_id', 'confidence', 'metadata', 'provenance'),
+            fact_rows,
+        )
 
     def _extract_authority_graph(
         self,
@@ -1702,14 +1835,11 @@ class LegalAuthorityStorageHook:
         )
 
     def _store_authority_graph(self, conn, authority_id: int, graph_payload: Dict[str, Any]) -> None:
-        for entity in graph_payload.get('entities', []) or []:
-            conn.execute(
-                """
-                INSERT INTO legal_authority_graph_entities (
-                    authority_id, entity_id, entity_type, entity_name, confidence, metadata
-                )
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
+        bulk_insert(
+            conn,
+            'legal_authority_graph_entities',
+            ('authority_id', 'entity_id', 'entity_type', 'entity_name', 'confidence', 'metadata'),
+            [
                 [
                     authority_id,
                     entity.get('id'),
@@ -1720,17 +1850,16 @@ class LegalAuthorityStorageHook:
                         entity.get('attributes', {}),
                         self.mediator,
                     )),
-                ],
-            )
+                ]
+                for entity in graph_payload.get('entities', []) or []
+            ],
+        )
 
-        for relationship in graph_payload.get('relationships', []) or []:
-            conn.execute(
-                """
-                INSERT INTO legal_authority_graph_relationships (
-                    authority_id, relationship_id, source_id, target_id, relation_type, confidence, metadata
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
+        bulk_insert(
+            conn,
+            'legal_authority_graph_relationships',
+            ('authority_id', 'relationship_id', 'source_id', 'target_id', 'relation_type', 'confidence', 'metadata'),
+            [
                 [
                     authority_id,
                     relationship.get('id'),
@@ -1742,8 +1871,10 @@ class LegalAuthorityStorageHook:
                         relationship.get('attributes', {}),
                         self.mediator,
                     )),
-                ],
-            )
+                ]
+                for relationship in graph_payload.get('relationships', []) or []
+            ],
+        )
 
     def _normalize_search_programs(self, authority_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         raw_programs = authority_data.get('search_programs')
@@ -1826,23 +1957,28 @@ class LegalAuthorityStorageHook:
         authority_id: int,
         treatment_records: List[AuthorityTreatmentRecord],
     ) -> None:
-        for record in treatment_records:
-            conn.execute(
-                """
-                DELETE FROM legal_authority_treatments
-                WHERE authority_id = ? AND treatment_id = ?
-                """,
-                [authority_id, record.treatment_id],
-            )
-            conn.execute(
-                """
-                INSERT INTO legal_authority_treatments (
-                    authority_id, treatment_id, treatment_type, treated_by_authority_id,
-                    treated_by_citation, treatment_source, treatment_confidence,
-                    treatment_date, treatment_explanation, metadata, provenance
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+        # Later records replace earlier ones with the same treatment_id, as
+        # the per-record delete-then-insert did.
+        records_by_id = {record.treatment_id: record for record in treatment_records}
+        if not records_by_id:
+            return
+        treatment_ids = list(records_by_id)
+        conn.execute(
+            f"""
+            DELETE FROM legal_authority_treatments
+            WHERE authority_id = ? AND treatment_id IN ({', '.join('?' for _ in treatment_ids)})
+            """,
+            [authority_id, *treatment_ids],
+        )
+        bulk_insert(
+            conn,
+            'legal_authority_treatments',
+            (
+                'authority_id', 'treatment_id', 'treatment_type', 'treated_by_authority_id',
+                'treated_by_citation', 'treatment_source', 'treatment_confidence',
+                'treatment_date', 'treatment_explanation', 'metadata', 'provenance',
+            ),
+            [
                 [
                     authority_id,
                     record.treatment_id,
@@ -1855,8 +1991,10 @@ class LegalAuthorityStorageHook:
                     record.treatment_explanation,
                     json.dumps(record.metadata),
                     json.dumps(record.provenance.as_dict()),
-                ],
-            )
+                ]
+                for record in records_by_id.values()
+            ],
+        )
 
     def _split_rule_candidate_sentences(self, value: str) -> List[str]:
         cleaned = " ".join(str(value or "").split())
@@ -1979,16 +2117,15 @@ class LegalAuthorityStorageHook:
         authority_id: int,
         rule_candidates: List[RuleCandidate],
     ) -> None:
-        for record in rule_candidates:
-            conn.execute(
-                """
-                INSERT INTO legal_authority_rule_candidates (
-                    authority_id, rule_id, rule_text, rule_type, claim_element_id,
-                    claim_element_text, predicate_template, jurisdiction, temporal_scope,
-                    extraction_confidence, metadata, provenance
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+        bulk_insert(
+            conn,
+            'legal_authority_rule_candidates',
+            (
+                'authority_id', 'rule_id', 'rule_text', 'rule_type', 'claim_element_id',
+                'claim_element_text', 'predicate_template', 'jurisdiction', 'temporal_scope',
+                'extraction_confidence', 'metadata', 'provenance',
+            ),
+            [
                 [
                     authority_id,
                     record.rule_id,
@@ -2002,8 +2139,10 @@ class LegalAuthorityStorageHook:
                     record.extraction_confidence,
                     json.dumps(record.metadata),
                     json.dumps(record.provenance.as_dict()),
-                ],
-            )
+                ]
+                for record in rule_candidates
+            ],
+        )
 
     def _get_authority_treatments(self, conn, authority_id: int) -> List[Dict[str, Any]]:
         rows = conn.execute(
@@ -2276,7 +2415,7 @@ class LegalAuthorityStorageHook:
             return {'record_id': -1, 'created': False, 'reused': False}
         
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             claim_element = self._resolve_claim_element(user_id, claim_type, authority_data)
             document_parse = self._parse_authority_text(authority_data)
             parse_contract = build_document_parse_contract(document_parse, default_source='legal_authority')
@@ -2338,12 +2477,13 @@ class LegalAuthorityStorageHook:
                 normalized_authority,
             )
             if existing_record_id is not None:
-                self._store_authority_treatments(
-                    conn,
-                    existing_record_id,
-                    self._build_treatment_records(existing_record_id, authority_data, provenance),
-                )
                 conn.close()
+                with self.connection_session(transaction=True) as txn:
+                    self._store_authority_treatments(
+                        txn,
+                        existing_record_id,
+                        self._build_treatment_records(existing_record_id, authority_data, provenance),
+                    )
                 self.mediator.log(
                     'legal_authority_duplicate',
                     record_id=existing_record_id,
@@ -2354,110 +2494,114 @@ class LegalAuthorityStorageHook:
                 )
                 return {'record_id': existing_record_id, 'created': False, 'reused': True}
             
-            result = conn.execute("""
-                INSERT INTO legal_authorities (
-                    user_id, complaint_id, claim_type, authority_type,
-                    source, citation, title, content, url, metadata,
-                    relevance_score, search_query, jurisdiction,
-                    source_system, provenance, claim_element_id, claim_element,
-                    parse_status, chunk_count, parsed_text_preview, parse_metadata,
-                    graph_status, graph_entity_count, graph_relationship_count, graph_metadata
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                RETURNING id
-            """, [
-                user_id,
-                complaint_id,
-                claim_type,
-                normalized_authority.get('type', 'unknown'),
-                normalized_authority.get('source', 'unknown'),
-                normalized_authority.get('citation'),
-                normalized_authority.get('title'),
-                normalized_authority.get('content'),
-                normalized_authority.get('url'),
-                json.dumps(normalized_authority.get('metadata', {})),
-                normalized_authority.get('relevance_score', 0.5),
-                search_query,
-                provenance.jurisdiction,
-                provenance.source_system,
-                json.dumps(provenance.as_dict()),
-                claim_element.get('claim_element_id'),
-                claim_element.get('claim_element'),
-                parse_contract.get('status'),
-                parse_contract.get('chunk_count', 0),
-                parsed_text_preview,
-                json.dumps(parse_storage_metadata),
-                None,
-                0,
-                0,
-                json.dumps({}),
-            ]).fetchone()
+            conn.close()
+
+            # The record and all of its chunk, graph, fact, treatment and rule
+            # rows are written in one transaction so a document commits once.
+            with self.connection_session(transaction=True) as txn:
+                result = txn.execute("""
+                    INSERT INTO legal_authorities (
+                        user_id, complaint_id, claim_type, authority_type,
+                        source, citation, title, content, url, metadata,
+                        relevance_score, search_query, jurisdiction,
+                        source_system, provenance, claim_element_id, claim_element,
+                        parse_status, chunk_count, parsed_text_preview, parse_metadata,
+                        graph_status, graph_entity_count, graph_relationship_count, graph_metadata
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    RETURNING id
+                """, [
+                    user_id,
+                    complaint_id,
+                    claim_type,
+                    normalized_authority.get('type', 'unknown'),
+                    normalized_authority.get('source', 'unknown'),
+                    normalized_authority.get('citation'),
+                    normalized_authority.get('title'),
+                    normalized_authority.get('content'),
+                    normalized_authority.get('url'),
+                    json.dumps(normalized_authority.get('metadata', {})),
+                    normalized_authority.get('relevance_score', 0.5),
+                    search_query,
+                    provenance.jurisdiction,
+                    provenance.source_system,
+                    json.dumps(provenance.as_dict()),
+                    claim_element.get('claim_element_id'),
+                    claim_element.get('claim_element'),
+                    parse_contract.get('status'),
+                    parse_contract.get('chunk_count', 0),
+                    parsed_text_preview,
+                    json.dumps(parse_storage_metadata),
+                    None,
+                    0,
+                    0,
+                    json.dumps({}),
+                ]).fetchone()
             
-            record_id = result[0]
-            graph_payload = self._extract_authority_graph(
-                record_id,
-                normalized_authority,
-                claim_type,
-                document_parse=document_parse,
-            )
-            conn.execute(
-                """
-                UPDATE legal_authorities
-                SET graph_status = ?,
-                    graph_entity_count = ?,
-                    graph_relationship_count = ?,
-                    graph_metadata = ?
-                WHERE id = ?
-                """,
-                [
-                    graph_payload.get('status'),
-                    len(graph_payload.get('entities', []) or []),
-                    len(graph_payload.get('relationships', []) or []),
-                    json.dumps({
-                        **(graph_payload.get('metadata', {}) or {}),
-                        'graph_snapshot': persist_graph_snapshot(
-                            graph_payload,
-                            graph_changed=bool(graph_payload.get('entities') or graph_payload.get('relationships')),
-                            existing_graph=False,
-                            persistence_metadata=_merge_intake_summary_handoff_metadata(
-                                {
-                                    'record_scope': 'legal_authority',
-                                    'record_key': str(record_id),
-                                },
-                                self.mediator,
-                            ),
-                        ),
-                    }),
-                    record_id,
-                ],
-            )
-            self._store_authority_chunks(conn, record_id, document_parse)
-            self._store_authority_graph(conn, record_id, graph_payload)
-            self._store_authority_facts(
-                conn,
-                record_id,
-                graph_payload,
-                provenance,
-                document_parse,
-            )
-            self._store_authority_treatments(
-                conn,
-                record_id,
-                self._build_treatment_records(record_id, authority_data, provenance),
-            )
-            self._store_authority_rule_candidates(
-                conn,
-                record_id,
-                self._extract_rule_candidates(
+                record_id = result[0]
+                graph_payload = self._extract_authority_graph(
                     record_id,
                     normalized_authority,
                     claim_type,
-                    document_parse,
+                    document_parse=document_parse,
+                )
+                txn.execute(
+                    """
+                    UPDATE legal_authorities
+                    SET graph_status = ?,
+                        graph_entity_count = ?,
+                        graph_relationship_count = ?,
+                        graph_metadata = ?
+                    WHERE id = ?
+                    """,
+                    [
+                        graph_payload.get('status'),
+                        len(graph_payload.get('entities', []) or []),
+                        len(graph_payload.get('relationships', []) or []),
+                        json.dumps({
+                            **(graph_payload.get('metadata', {}) or {}),
+                            'graph_snapshot': persist_graph_snapshot(
+                                graph_payload,
+                                graph_changed=bool(graph_payload.get('entities') or graph_payload.get('relationships')),
+                                existing_graph=False,
+                                persistence_metadata=_merge_intake_summary_handoff_metadata(
+                                    {
+                                        'record_scope': 'legal_authority',
+                                        'record_key': str(record_id),
+                                    },
+                                    self.mediator,
+                                ),
+                            ),
+                        }),
+                        record_id,
+                    ],
+                )
+                self._store_authority_chunks(txn, record_id, document_parse)
+                self._store_authority_graph(txn, record_id, graph_payload)
+                self._store_authority_facts(
+                    txn,
+                    record_id,
+                    graph_payload,
                     provenance,
-                    claim_element,
-                ),
-            )
-            conn.close()
+                    document_parse,
+                )
+                self._store_authority_treatments(
+                    txn,
+                    record_id,
+                    self._build_treatment_records(record_id, authority_data, provenance),
+                )
+                self._store_authority_rule_candidates(
+                    txn,
+                    record_id,
+                    self._extract_rule_candidates(
+                        record_id,
+                        normalized_authority,
+                        claim_type,
+                        document_parse,
+                        provenance,
+                        claim_element,
+                    ),
+                )
             
             self.mediator.log('legal_authority_added',
                 record_id=record_id, citation=authority_data.get('citation'))
@@ -2513,7 +2657,7 @@ class LegalAuthorityStorageHook:
             return []
         
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             
             results = conn.execute("""
                 SELECT id, authority_type, source, citation, title,
@@ -2553,7 +2697,7 @@ class LegalAuthorityStorageHook:
             return []
         
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             
             results = conn.execute("""
                 SELECT id, claim_type, authority_type, source, citation,
@@ -2585,7 +2729,7 @@ class LegalAuthorityStorageHook:
             return None
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             row = conn.execute(
                 """
                 SELECT id, claim_type, authority_type, source, citation,
@@ -2619,7 +2763,7 @@ class LegalAuthorityStorageHook:
             return []
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             records = self._get_authority_treatments(conn, authority_id)
             conn.close()
             return records
@@ -2633,7 +2777,7 @@ class LegalAuthorityStorageHook:
             return []
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             records = self._get_authority_rule_candidates(conn, authority_id)
             conn.close()
             return records
@@ -2647,7 +2791,7 @@ class LegalAuthorityStorageHook:
             return []
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             rows = conn.execute(
                 """
                 SELECT fact_id, fact_text, source_authority_id, confidence, metadata, provenance
@@ -2672,7 +2816,7 @@ class LegalAuthorityStorageHook:
             return []
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             rows = conn.execute(
                 """
                 SELECT chunk_id, chunk_index, start_offset, end_offset, chunk_text, metadata
@@ -2704,7 +2848,7 @@ class LegalAuthorityStorageHook:
             return {'status': 'unavailable', 'entities': [], 'relationships': []}
 
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             entity_rows = conn.execute(
                 """
                 SELECT entity_id, entity_type, entity_name, confidence, metadata
@@ -2766,7 +2910,7 @@ class LegalAuthorityStorageHook:
             return {'available': False}
         
         try:
-            conn = duckdb.connect(self.db_path)
+            conn = self._connect()
             
             if user_id:
                 result = conn.execute("""
@@ -0,0 +1,398 @@
+"""Bounded in-memory event log for the mediator with on-disk payload spill.
+
+``Mediator.log()`` records every backend prompt and response. Over a long
+adversarial session, or for a long-lived server user, those entries used to
+pile up in ``State.log`` forever, and every statefile save serialized all of
+them. ``MediatorLog`` keeps only the most recent ``limit`` entries in memory
+and counts the rest as dropped.
+
+String fields longer than ``spill_threshold`` are compressed and appended to
+segment files. In memory the field is replaced by a small reference dict
+(``{'$spill': {...}}``) that records the segment file name, offset and
+length. Those references are saved with the mediator state, so segments live
+in a durable directory (``statefiles/mediator_log`` unless configured) rather
+than a temporary one. References are resolved only inside the log's own
+spill directory.
+
+Segments do not grow without bound. A log writes through its own writer,
+and once every payload in one of that writer's closed segments has been
+trimmed out of the ring buffer (and no other live log still holds a
+reference into it) the segment is deleted. Segments that only saved state
+refers to are kept; ``max_spill_bytes`` caps the whole directory, removing
+the oldest segments first, so files left by earlier runs are bounded too.
+``read_payload`` and ``iter_entries(resolve=True)`` load spilled payloads
+only when a reader (for example the review UI) asks for them.
+
+``MediatorLog`` subclasses ``list``, so existing callers that append, iterate,
+slice or ``json.dump`` the log keep working unchanged.
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+import re
+import threading
+import uuid
+import weakref
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+
+DEFAULT_LOG_LIMIT = 1000
+DEFAULT_SPILL_THRESHOLD = 2048
+DEFAULT_SEGMENT_BYTES = 16 * 1024 * 1024
+DEFAULT_MAX_SPILL_BYTES = 1024 * 1024 * 1024
+SPILL_KEY = '$spill'
+_PREVIEW_CHARS = 200
+_SEGMENT_NAME_RE = re.compile(r'log-\d+(?:-[0-9a-f]+)?-\d+\.seg')
+# Shared so two logs spilling into the same directory never interleave a
+# record between ``tell()`` and ``write()``.
+_SEGMENT_LOCK = threading.Lock()
+# Every live log, so a segment is never deleted while one still refers to it.
+# Keyed by ``id()`` because a log is a list and cannot be hashed.
+_LIVE_LOGS: "weakref.WeakValueDictionary[int, MediatorLog]" = weakref.WeakValueDictionary()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _default_spill_dir() -> Path:
+    state_dir = Path(__file__).parent.parent / 'statefiles'
+    if not state_dir.exists():
+        state_dir = Path('.')
+    return state_dir / 'mediator_log'
+
+
+def is_spill_ref(value: Any) -> bool:
+    """Return True if ``value`` is a reference to a spilled payload."""
+    return isinstance(value, dict) and isinstance(value.get(SPILL_KEY), dict)
+
+
+def _referenced_segments(entry: Any) -> Iterator[tuple]:
+    if isinstance(entry, dict):
+        for value in entry.values():
+            if is_spill_ref(value):
+                location = value[SPILL_KEY]
+                yield location.get('segment'), location.get('offset')
+
+
+class _SegmentWriter:
+    """Append-only writer for compressed payload segments in one directory.
+
+    Segment names carry a per-writer token, so each segment belongs to one
+    writer, which counts the payloads it wrote there and the ones trimmed
+    since.
+    """
+
+    def __init__(self, directory: Optional[str], segment_bytes: int, max_bytes: int) -> None:
+        self._directory = Path(directory) if directory else _default_spill_dir()
+        self._segment_bytes = max(1, int(segment_bytes))
+        self._max_bytes = max(0, int(max_bytes))
+        self._token = uuid.uuid4().hex[:8]
+        self._segment_index = 0
+        self._segment_size = 0
+        self._written: Dict[str, int] = {}
+        self._released: Dict[str, Set[Any]] = {}
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def _ensure_directory(self) -> Path:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        return self._directory
+
+    def write(self, payload: str) -> Dict[str, Any]:
+        data = zlib.compress(payload.encode('utf-8'))
+        closed = None
+        with _SEGMENT_LOCK:
+            directory = self._ensure_directory()
+            rolled = self._segment_index == 0 or self._segment_size + len(data) > self._segment_bytes
+            if rolled:
+                if self._segment_index:
+                    closed = self._segment_name(self._segment_index)
+                self._segment_index += 1
+                segment = directory / self._segment_name(self._segment_index)
+                self._segment_size = segment.stat().st_size if segment.exists() else 0
+            segment = directory / self._segment_name(self._segment_index)
+            with open(segment, 'ab') as handle:
+                offset = handle.tell()
+                handle.write(data)
+            self._segment_size = offset + len(data)
+            self._written[segment.name] = self._written.get(segment.name, 0) + 1
+        if closed is not None:
+            self._collect(closed)
+        if rolled:
+            self._enforce_cap(segment.name)
+        return {
+            'segment': segment.name,
+            'offset': offset,
+            'length': len(data),
+            'chars': len(payload),
+            'preview': payload[:_PREVIEW_CHARS],
+        }
+
+    def release(self, entries: List[Any]) -> None:
+        """Record that ``entries`` left a log and delete segments nobody needs."""
+        candidates = set()
+        with _SEGMENT_LOCK:
+            for entry in entries:
+                for name, offset in _referenced_segments(entry):
+                    if name in self._written:
+                        self._released.setdefault(name, set()).add(offset)
+                        candidates.add(name)
+        for name in candidates:
+            self._collect(name)
+
+    def _collect(self, name: str) -> None:
+        with _SEGMENT_LOCK:
+            if name == self._segment_name(self._segment_index):
+                return
+            if len(self._released.get(name, ())) < self._written.get(name, 0):
+                return
+            for log in list(_LIVE_LOGS.values()):
+                if any(ref_name == name for entry in list(log) for ref_name, _ in _referenced_segments(entry)):
+                    return
+            self._written.pop(name, None)
+            self._released.pop(name, None)
+            try:
+                (self._directory / name).unlink()
+            except FileNotFoundError:
+                pass
+
+    def _enforce_cap(self, current: str) -> None:
+        if not self._max_bytes:
+            return
+        segments = []
+        for path in self._directory.glob('log-*.seg'):
+            if not _SEGMENT_NAME_RE.fullmatch(path.name) or path.name == current:
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            segments.append((stat.st_mtime_ns, path.name, stat.st_size))
+        total = sum(size for _, _, size in segments)
+        for _, name, size in sorted(segments):
+            if total <= self._max_bytes:
+                break
+            try:
+                (self._directory / name).unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            with _SEGMENT_LOCK:
+                self._written.pop(name, None)
+                self._released.pop(name, None)
+
+    def _segment_name(self, index: int) -> str:
+        return f'log-{os.getpid()}-{self._token}-{index:05d}.seg'
+
+
+class MediatorLog(list):
+    """Ring-buffered list of mediator log entries.
+
+    Args:
+        entries: Initial entries, e.g. a log restored from a statefile.
+        limit: Number of most recent entries kept in memory; ``None`` reads
+            ``COMPLAINT_GENERATOR_LOG_LIMIT``.
+        spill_dir: Directory for payload segments; ``None`` reads
+            ``COMPLAINT_GENERATOR_LOG_SPILL_DIR`` and otherwise uses
+            ``statefiles/mediator_log``. Segments outlive the log because
+            saved state refers to them.
+        spill_threshold: String fields longer than this many characters are
+            spilled; 0 disables spilling.
+        segment_bytes: Compressed bytes per segment file before rolling over.
+        max_spill_bytes: Cap on the segment files in ``spill_dir``; the oldest
+            are deleted when a new segment starts. ``None`` reads
+            ``COMPLAINT_GENERATOR_LOG_SPILL_MAX_BYTES``; 0 disables the cap.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[Any] = (),
+        *,
+        limit: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+        spill_threshold: Optional[int] = None,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        max_spill_bytes: Optional[int] = None,
+    ) -> None:
+        super().__init__()
+        if limit is None:
+            limit = _env_int('COMPLAINT_GENERATOR_LOG_LIMIT', DEFAULT_LOG_LIMIT)
+        if spill_threshold is None:
+            spill_threshold = _env_int('COMPLAINT_GENERATOR_LOG_SPILL_THRESHOLD', DEFAULT_SPILL_THRESHOLD)
+        if max_spill_bytes is None:
+            max_spill_bytes = _env_int('COMPLAINT_GENERATOR_LOG_SPILL_MAX_BYTES', DEFAULT_MAX_SPILL_BYTES)
+        self.limit = max(1, int(limit))
+        self.spill_threshold = max(0, int(spill_threshold))
+        self.dropped = 0
+        self.spilled = 0
+        self._writer = _SegmentWriter(
+            spill_dir or os.getenv('COMPLAINT_GENERATOR_LOG_SPILL_DIR') or None,
+            segment_bytes,
+            max_spill_bytes,
+        )
+        _LIVE_LOGS[id(self)] = self
+        self.extend(entries)
+
+    def _settings(self) -> Dict[str, Any]:
+        return {
+            'limit': self.limit,
+            'spill_dir': str(self._writer.directory),
+            'spill_threshold': self.spill_threshold,
+            'max_spill_bytes': self._writer.max_bytes,
+        }
+
+    def __copy__(self) -> 'MediatorLog':
+        clone = MediatorLog(limit=self.limit, spill_threshold=0)
+        list.extend(clone, self)
+        clone.__dict__.update(self.__dict__)
+        return clone
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'MediatorLog':
+        clone = MediatorLog(limit=self.limit, spill_threshold=0)
+        memo[id(self)] = clone
+        list.extend(clone, (copy.deepcopy(entry, memo) for entry in self))
+        # Segments are append-only, so the copy can keep writing next to them.
+        clone.__dict__.update(self.__dict__)
+        return clone
+
+    def __reduce__(self):
+        return (
+            _restore_log,
+            (list(self), self._settings(), self.dropped, self.spilled),
+        )
+
+    @property
+    def spill_dir(self) -> Path:
+        """Directory holding the payload segments."""
+        return self._writer.directory
+
+    @property
+    def total(self) -> int:
+        """Number of entries ever appended, including dropped ones."""
+        return self.dropped + len(self)
+
+    def append(self, entry: Any) -> None:
+        super().append(self._spill(entry))
+        self._trim()
+
+    def extend(self, entries: Iterable[Any]) -> None:
+        super().extend(self._spill(entry) for entry in entries)
+        self._trim()
+
+    def __iadd__(self, entries: Iterable[Any]) -> 'MediatorLog':
+        self.extend(entries)
+        return self
+
+    def _trim(self) -> None:
+        overflow = len(self) - self.limit
+        if overflow > 0:
+            trimmed = self[:overflow]
+            del self[:overflow]
+            self.dropped += overflow
+            self._writer.release(trimmed)
+
+    def _spill(self, entry: Any) -> Any:
+        if not self.spill_threshold or not isinstance(entry, dict):
+            return entry
+        spilled = None
+        for key, value in entry.items():
+            if isinstance(value, str) and len(value) > self.spill_threshold:
+                if spilled is None:
+                    spilled = dict(entry)
+                spilled[key] = {SPILL_KEY: self._writer.write(value)}
+                self.spilled += 1
+        return entry if spilled is None else spilled
+
+    def _segment_path(self, name: Any) -> Path:
+        # References come back from saved state and API callers, so only a
+        # plain segment file name inside the spill directory is accepted.
+        if not isinstance(name, str) or not _SEGMENT_NAME_RE.fullmatch(name):
+            raise ValueError(f'invalid spill segment name: {name!r}')
+        directory = self.spill_dir.resolve()
+        segment = (directory / name).resolve()
+        if segment.parent != directory:
+            raise ValueError(f'spill segment outside {directory}: {name!r}')
+        return segment
+
+    def read_payload(self, ref: Dict[str, Any]) -> str:
+        """Load one spilled payload from its segment file in ``spill_dir``.
+
+        Raises:
+            ValueError: If the reference names anything but a segment file
+                directly inside ``spill_dir``.
+        """
+        location = ref[SPILL_KEY]
+        segment = self._segment_path(location.get('segment'))
+        with open(segment, 'rb') as handle:
+            handle.seek(location['offset'])
+            data = handle.read(location['length'])
+        return zlib.decompress(data).decode('utf-8')
+
+    def resolve_entry(self, entry: Any) -> Any:
+        """Return a copy of ``entry`` with spilled fields loaded.
+
+        Fields whose segment is no longer readable (for example one removed
+        from the spill directory, or an invalid reference) keep their
+        reference.
+        """
+        if not isinstance(entry, dict):
+            return entry
+        resolved = dict(entry)
+        for key, value in entry.items():
+            if is_spill_ref(value):
+                try:
+                    resolved[key] = self.read_payload(value)
+                except (OSError, KeyError, ValueError, zlib.error):
+                    continue
+        return resolved
+
+    def iter_entries(
+        self,
+        start: int = 0,
+        limit: Optional[int] = None,
+        *,
+        resolve: bool = False,
+    ) -> Iterator[Any]:
+        """Yield retained entries from ``start``, loading payloads only if asked."""
+        stop = len(self) if limit is None else min(len(self), start + max(0, limit))
+        for index in range(max(0, start), stop):
+            entry = self[index]
+            yield self.resolve_entry(entry) if resolve else entry
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'retained': len(self),
+            'dropped': self.dropped,
+            'total': self.total,
+            'limit': self.limit,
+            'spilled_payloads': self.spilled,
+            'spill_dir': str(self.spill_dir),
+        }
+
+
+def _restore_log(entries, settings, dropped, spilled) -> MediatorLog:
+    log = MediatorLog(
+        limit=settings['limit'],
+        spill_dir=settings['spill_dir'],
+        spill_threshold=0,
+        max_spill_bytes=settings.get('max_spill_bytes'),
+    )
+    list.extend(log, entries)
+    log.spill_threshold = settings['spill_threshold']
+    log.dropped = dropped
+    log.spilled = spilled
+    return log
@@ -1,8 +1,10 @@
+from contextlib import ExitStack, contextmanager
 from time import time
 import re
 from typing import List, Optional, Dict, Any
 from .strings import user_prompts
 from .state import State
+from .log_store import MediatorLog
 from .inquiries import Inquiries
 from .complaint import Complaint
 from .exceptions import UserPresentableException
@@ -27,6 +29,7 @@ from .web_evidence_hooks import (
 	WebEvidenceIntegrationHook
 )
 from .claim_support_hooks import ClaimSupportHook
+from .duckdb_pool import DUCKDB_AVAILABLE
 from .formal_document import ComplaintDocumentBuilder
 from integrations.ipfs_datasets.capabilities import (
 	summarize_ipfs_datasets_startup_payload,
@@ -1651,7 +1654,8 @@ class Mediator:
 		self.log('user_input', text=text)
 
 		try:
-			output = self.process(text)
+			with self.storage_session():
+				output = self.process(text)
 			self.log('user_output', text=output)
 		except Exception as exception:
 			self.log('io_error', error=str(exception))
@@ -2308,6 +2312,35 @@ class Mediator:
 		
 		return self.evidence_state.get_user_evidence(user_id)
 
+	def _storage_hooks(self):
+		hooks = []
+		for name in ('evidence_state', 'claim_support', 'legal_authority_storage'):
+			hook = getattr(self, name, None)
+			if callable(getattr(hook, 'connection_session', None)):
+				hooks.append((name, hook))
+		return hooks
+
+	@contextmanager
+	def storage_session(self, transaction: bool = False):
+		"""
+		Keep one pooled DuckDB connection per storage database for a whole turn.
+
+		Every evidence, claim-support and legal-authority query issued inside
+		the block reuses the same cursor; with ``transaction=True`` each
+		database commits once on exit and rolls back if the block raises.
+		"""
+		with ExitStack() as stack:
+			if DUCKDB_AVAILABLE:
+				for _, hook in self._storage_hooks():
+					stack.enter_context(hook.connection_session(transaction=transaction))
+			yield self
+
+	def get_storage_connection_stats(self) -> Dict[str, Any]:
+		"""Report connection reuse counters for each storage hook's database."""
+		if not DUCKDB_AVAILABLE:
+			return {}
+		return {name: hook.connection_stats() for name, hook in self._storage_hooks()}
+
 	def get_evidence_graph(self, evidence_id: int):
 		"""Get stored graph entities and relationships for an evidence record."""
 		return self.evidence_state.get_evidence_graph(evidence_id)
@@ -5590,20 +5623,21 @@ class Mediator:
 			self._build_intake_claim_pressure_map(dg),
 			intake_matching_pressure,
 		)
-		question_candidates = self.denoiser.collect_question_candidates(
-			kg,
-			dg,
-			max_questions=10,
-			intake_case_file=intake_case_file,
-		)
-		self.phase_manager.update_phase_data(ComplaintPhase.INTAKE, 'intake_matching_pressure', intake_matching_pressure)
-		self.phase_manager.update_phase_data(ComplaintPhase.INTAKE, 'intake_workflow_action_queue', intake_workflow_action_queue)
-		questions = self.denoiser.generate_questions(
-			kg,
-			dg,
-			max_questions=10,
-			intake_case_file=intake_case_file,
-		)
+		with self.denoiser.question_turn():
+			question_candidates = self.denoiser.collect_question_candidates(
+				kg,
+				dg,
+				max_questions=10,
+				intake_case_file=intake_case_file,
+			)
+			self.phase_manager.update_phase_data(ComplaintPhase.INTAKE, 'intake_matching_pressure', intake_matching_pressure)
+			self.phase_manager.update_phase_data(ComplaintPhase.INTAKE, 'intake_workflow_action_queue', intake_workflow_action_queue)
+			questions = self.denoiser.generate_questions(
+				kg,
+				dg,
+				max_questions=10,
+				intake_case_file=intake_case_file,
+			)
 		self.phase_manager.update_phase_data(ComplaintPhase.INTAKE, 'question_candidates', question_candidates)
 		self.phase_manager.update_phase_data(ComplaintPhase.INTAKE, 'current_questions', questions)
 		
@@ -6600,6 +6634,10 @@ class Mediator:
 		Returns:
 			Updated status with next questions or phase transition info
 		"""
+		with self.storage_session(), self.phase_manager.batch_updates(), self.denoiser.question_turn():
+			return self._process_denoising_answer(question, answer)
+
+	def _process_denoising_answer(self, question: Dict[str, Any], answer: str) -> Dict[str, Any]:
 		kg = self.phase_manager.get_phase_data(ComplaintPhase.INTAKE, 'knowledge_graph')
 		dg = self.phase_manager.get_phase_data(ComplaintPhase.INTAKE, 'dependency_graph')
 		
@@ -10845,8 +10883,22 @@ class Mediator:
 
 
 	def log(self, event_type, **data):
+		if isinstance(self.state.log, list) and not isinstance(self.state.log, MediatorLog):
+			# Logs restored by assigning a plain list (e.g. local session payloads).
+			self.state.log = MediatorLog(self.state.log)
 		self.state.log.append({
 			'time': int(time()),
 			'type': event_type,
 			**data
 		})
+
+	def read_log(self, start=0, limit=50, resolve_payloads=False):
+		"""Page through the retained log, loading spilled payloads only on request."""
+		log = self.state.log
+		if not isinstance(log, MediatorLog):
+			log = MediatorLog(log or [], limit=max(1, len(log or [])), spill_threshold=0)
+		return {
+			'start': max(0, int(start)),
+			'entries': list(log.iter_entries(start, limit, resolve=resolve_payloads)),
+			**log.stats(),
+		}
@@ -12,6 +12,8 @@ import requests
 
 from backends.llm_router_backend import LLMRouterBackend
 
+from .log_store import MediatorLog
+
 
 def _normalize_chat_history_entry(entry):
 	if isinstance(entry, dict):
@@ -97,7 +99,7 @@ class State:
 		# Core mediator workflow fields
 		self.inquiries = []
 		self.complaint = None
-		self.log = []
+		self.log = MediatorLog()
 		self.username = None
 		self.password = None
 		self.hashed_password = None
@@ -204,7 +206,7 @@ class State:
 		state = cls()
 		state.inquiries = serialized['inquiries']
 		state.complaint = serialized['complaint']
-		state.log = serialized['log']
+		state.log = MediatorLog(serialized['log'])
 
 		return state
 		
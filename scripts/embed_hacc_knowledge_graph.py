@@ -13,7 +13,7 @@ import numpy as np
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
-from integrations.ipfs_datasets import create_vector_index, create_vector_store_async
+from integrations.ipfs_datasets import LocalVectorIndex, create_vector_index, create_vector_store_async
 
 
 def _chunk_text(text: str, *, chunk_size: int = 1200, overlap: int = 200) -> List[str]:
@@ -118,15 +118,11 @@ def _build_graph_documents(documents_dir: Path) -> List[Dict[str, object]]:
 
 
 def _load_saved_index(index_dir: Path, index_name: str) -> tuple[list[dict], np.ndarray]:
-    records_path = index_dir / f"{index_name}.records.jsonl"
-    vectors_path = index_dir / f"{index_name}.vectors.npy"
-    records = [
-        json.loads(line)
-        for line in records_path.read_text(encoding="utf-8").splitlines()
-        if line.strip()
-    ]
-    vectors = np.load(vectors_path)
-    return records, vectors
+    index = LocalVectorIndex.open(index_dir, index_name)
+    try:
+        return index.live_rows()
+    finally:
+        index.close()
 
 
 async def _build_native_ipld_snapshot(
@@ -224,3 +224,37 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(skip_network)
         if (marked_heavy or auto_heavy) and not run_heavy:
             item.add_marker(skip_heavy)
+
+
+@pytest.fixture(autouse=True)
+def _isolate_shared_embedding_cache(monkeypatch):
+    """Give every test a fresh in-memory process-wide embedding cache and HTTP session."""
+
+    monkeypatch.delenv("COMPLAINT_GENERATOR_EMBEDDING_CACHE_DIR", raising=False)
+    monkeypatch.delenv("COMPLAINT_GENERATOR_HTTP_CACHE_DIR", raising=False)
+
+    def _reset_shared_caches():
+        embedding_cache = sys.modules.get("integrations.ipfs_datasets.embedding_cache")
+        if embedding_cache is not None:
+            embedding_cache.set_embedding_cache(None)
+        http_cache = sys.modules.get("integrations.ipfs_datasets.http_cache")
+        if http_cache is not None:
+            http_cache.set_http_session(None)
+
+    _reset_shared_caches()
+    yield
+    _reset_shared_caches()
+
+
+@pytest.fixture(autouse=True)
+def _isolate_mediator_log_spill(monkeypatch, tmp_path_factory):
+    """Spill large mediator log payloads under pytest's temp dir, not statefiles/."""
+
+    monkeypatch.setenv("COMPLAINT_GENERATOR_LOG_SPILL_DIR", str(tmp_path_factory.getbasetemp() / "mediator-log"))
+
+
+@pytest.fixture(autouse=True)
+def _isolate_duckdb_state(monkeypatch, tmp_path):
+    """Keep hook databases opened with default paths out of statefiles/."""
+
+    monkeypatch.setenv("COMPLAINT_GENERATOR_DUCKDB_DIR", str(tmp_path / "duckdb"))
@@ -1101,6 +1101,50 @@ class TestClaimSupportHook:
             if os.path.exists(db_path):
                 os.unlink(db_path)
 
+    def test_find_contradiction_pairs_matches_full_pairwise_scan(self):
+        try:
+            from mediator.claim_support_hooks import ClaimSupportHook
+        except ImportError as e:
+            pytest.skip(f"ClaimSupportHook requires dependencies: {e}")
+
+        mock_mediator = Mock()
+        mock_mediator.log = Mock()
+
+        with tempfile.NamedTemporaryFile(suffix='.duckdb', delete=False) as f:
+            db_path = f.name
+
+        try:
+            hook = ClaimSupportHook(mock_mediator, db_path=db_path)
+            subjects = ['manager', 'supervisor', 'director', 'coworker']
+            actions = ['reviewed', 'received', 'approved', 'answered']
+            objects = ['complaint', 'grievance', 'request', 'timesheet']
+            facts = [
+                {
+                    'fact_id': f'fact-{index}',
+                    'text': (
+                        f"The {subjects[index % 4]} {'did not ' if index % 3 == 0 else ''}"
+                        f"{actions[(index // 4) % 4]} the {objects[(index // 16) % 4]} on day {index % 7}"
+                    ),
+                }
+                for index in range(80)
+            ]
+
+            expected = []
+            for left_index, left in enumerate(facts):
+                for right_index in range(left_index + 1, len(facts)):
+                    right = facts[right_index]
+                    if hook._fact_polarity(left['text']) == hook._fact_polarity(right['text']):
+                        continue
+                    overlap_terms = hook._fact_overlap_terms(left['text'], right['text'])
+                    if len(overlap_terms) >= 2:
+                        expected.append((left_index, right_index, overlap_terms))
+
+            assert expected
+            assert hook._find_contradiction_pairs(facts) == expected
+        finally:
+            if os.path.exists(db_path):
+                os.unlink(db_path)
+
     def test_get_claim_coverage_matrix_summarizes_authority_treatment_signals(self):
         try:
             from mediator.claim_support_hooks import ClaimSupportHook
@@ -1462,6 +1506,56 @@ class TestClaimSupportHook:
             if os.path.exists(db_path):
                 os.unlink(db_path)
 
+    def test_claim_support_version_advances_on_each_write_path(self):
+        try:
+            from mediator.claim_support_hooks import ClaimSupportHook
+        except ImportError as e:
+            pytest.skip(f"ClaimSupportHook requires dependencies: {e}")
+
+        mock_mediator = Mock()
+        mock_mediator.log = Mock()
+
+        with tempfile.NamedTemporaryFile(suffix='.duckdb', delete=False) as f:
+            db_path = f.name
+
+        try:
+            hook = ClaimSupportHook(mock_mediator, db_path=db_path)
+            assert hook.get_claim_support_version('testuser', 'employment') == 0
+
+            hook.register_claim_requirements('testuser', {'employment': ['Protected activity']})
+            assert hook.get_claim_support_version('testuser', 'employment') == 1
+
+            link_kwargs = dict(
+                user_id='testuser',
+                claim_type='employment',
+                claim_element_text='Protected activity',
+                support_kind='evidence',
+                support_ref='QmEvidenceVersion',
+                source_table='evidence',
+            )
+            assert hook.upsert_support_link(**link_kwargs)['created'] is True
+            assert hook.get_claim_support_version('testuser', 'employment') == 2
+            assert hook.upsert_support_link(**link_kwargs)['reused'] is True
+            assert hook.get_claim_support_version('testuser', 'employment') == 3
+
+            hook.save_testimony_record(
+                'testuser',
+                'employment',
+                claim_element_text='Protected activity',
+                raw_narrative='I reported harassment to HR.',
+            )
+            assert hook.get_claim_support_version('testuser', 'employment') == 4
+            assert hook.get_claim_support_version('testuser', 'housing') == 0
+            assert hook.get_claim_support_version('otheruser', 'employment') == 0
+
+            assert hook.bump_claim_support_version('testuser', 'employment') == 5
+            assert hook._build_claim_support_state_token(
+                'testuser', 'employment', ['evidence', 'authority']
+            ) == 'v5:authority,evidence'
+        finally:
+            if os.path.exists(db_path):
+                os.unlink(db_path)
+
     def test_get_claim_support_diagnostic_snapshots_marks_stale_after_support_changes(self):
         try:
             from mediator.claim_support_hooks import ClaimSupportHook
@@ -1521,6 +1615,42 @@ class TestClaimSupportHook:
             if os.path.exists(db_path):
                 os.unlink(db_path)
 
+    def test_get_claim_support_diagnostic_snapshots_marks_stale_when_version_unreadable(self):
+        try:
+            from mediator.claim_support_hooks import ClaimSupportHook
+        except ImportError as e:
+            pytest.skip(f"ClaimSupportHook requires dependencies: {e}")
+
+        mock_mediator = Mock()
+        mock_mediator.log = Mock()
+
+        with tempfile.NamedTemporaryFile(suffix='.duckdb', delete=False) as f:
+            db_path = f.name
+
+        try:
+            hook = ClaimSupportHook(mock_mediator, db_path=db_path)
+            hook.register_claim_requirements(
+                'testuser',
+                {'employment': ['Protected activity']},
+            )
+            with patch.object(hook, 'get_claim_support_version', return_value=-1):
+                assert hook._build_claim_support_state_token('testuser', 'employment') is None
+                hook.persist_claim_support_diagnostics('testuser', 'employment')
+                unreadable = hook.get_claim_support_diagnostic_snapshots('testuser', 'employment')
+
+            assert unreadable['claims']['employment']['snapshots']['gaps']['is_stale'] is True
+            assert unreadable['claims']['employment']['snapshots']['gaps']['current_support_state_token'] is None
+            # Saved without a token, so it stays stale once the version is readable again.
+            recovered = hook.get_claim_support_diagnostic_snapshots('testuser', 'employment')
+            assert recovered['claims']['employment']['snapshots']['gaps']['is_stale'] is True
+
+            hook.persist_claim_support_diagnostics('testuser', 'employment')
+            refreshed = hook.get_claim_support_diagnostic_snapshots('testuser', 'employment')
+            assert refreshed['claims']['employment']['snapshots']['gaps']['is_stale'] is False
+        finally:
+            if os.path.exists(db_path):
+                os.unlink(db_path)
+
     def test_persist_claim_support_diagnostics_prunes_older_snapshot_history(self):
         try:
             from mediator.claim_support_hooks import ClaimSupportHook
@@ -4131,6 +4261,17 @@ class TestClaimSupportHook:
             assert dry_run['updated_count'] == 0
             assert dry_run['records'][0]['claim_element_id'] == 'retaliation:1'
 
+            version = hook.get_claim_support_version('testuser', 'retaliation')
+            with patch.object(hook, '_bump_claim_support_version', side_effect=RuntimeError('bump failed')):
+                failed = hook.backfill_claim_testimony_links('testuser', 'retaliation')
+            assert failed['available'] is False
+            assert failed['updated_count'] == 0
+            conn = duckdb.connect(db_path)
+            assert conn.execute(
+                "SELECT COUNT(*) FROM claim_testimony WHERE claim_element_id IS NOT NULL"
+            ).fetchone()[0] == 0
+            conn.close()
+
             result = hook.backfill_claim_testimony_links('testuser', 'retaliation')
             assert result['scanned_count'] == 2
             assert result['candidate_count'] == 1
@@ -4147,6 +4288,7 @@ class TestClaimSupportHook:
                 ('testimony:retaliation:legacy-proactive', 'retaliation:1', 'Protected activity'),
                 ('testimony:retaliation:legacy-unmatched', None, 'Unknown element'),
             ]
+            assert hook.get_claim_support_version('testuser', 'retaliation') == version + 1
         finally:
             if os.path.exists(db_path):
                 os.unlink(db_path)
@@ -5,11 +5,17 @@ Validates legal pattern extraction, complaint risk scoring, and related keyword
 configuration used by the complaint_analysis utilities.
 """
 
+import re
+
 import pytest
 from complaint_analysis import (
     LegalPatternExtractor,
+    LEGAL_TERMS_REGISTRY,
+    register_legal_terms,
     ComplaintRiskScorer,
     ComplaintAnalyzer,
+    KeywordMatcher,
+    KeywordRegistry,
     COMPLAINT_KEYWORDS,
     EVIDENCE_KEYWORDS,
     LEGAL_AUTHORITY_KEYWORDS,
@@ -114,6 +120,50 @@ class TestLegalPatternExtractor:
         assert result['provision_count'] >= 2
         assert 'custom term' in [t.lower() for t in result['terms_found']]
 
+    def test_registering_terms_rebuilds_existing_extractor(self, monkeypatch):
+        """Test that extractors pick up terms registered after construction."""
+        monkeypatch.setitem(LEGAL_TERMS_REGISTRY, 'test_consumer', [])
+        extractor = LegalPatternExtractor(categories=['test_consumer', 'civil_rights'])
+        text = "The lender used a predatory lending scheme that denied due process."
+        assert extractor.extract_provisions(text)['terms_found'] == ['due process']
+
+        register_legal_terms('test_consumer', [r'\b(predatory lending)\b'])
+        result = extractor.extract_provisions(text)
+
+        assert sorted(result['terms_found']) == ['due process', 'predatory lending']
+        assert [p['position'] for p in result['provisions']] == sorted(p['position'] for p in result['provisions'])
+
+    def test_case_folded_unicode_letters_still_match(self):
+        """Test that the token prefilter keeps IGNORECASE matches on non-ASCII letters."""
+        extractor = LegalPatternExtractor(categories=['civil_rights'])
+        result = extractor.extract_provisions("Equal protection and due proce\u017f\u017f were denied.")
+
+        assert sorted(result['terms_found']) == ['due proce\u017f\u017f', 'equal protection']
+
+    def test_prefilter_skips_only_patterns_it_can_reduce(self):
+        """Test that the token prefilter reads the pattern source and runs opaque patterns."""
+        from complaint_analysis.legal_patterns import _ProvisionMatcher
+
+        patterns = [re.compile(source, re.IGNORECASE) for source in (
+            r'\b(h-?1b|l-?1)\b',
+            r'\b(wom[ae]n[- ]owned)\b',
+            r'\b(section\s+8)\b',
+            r'\b(?:sec\.|section) 9\b',
+        )]
+        matcher = _ProvisionMatcher(patterns)
+
+        assert matcher.candidates("An L1 visa holder.") == [patterns[0], patterns[2]]
+        assert matcher.candidates("A women owned firm under sec. 9.") == patterns[1:]
+
+    def test_analyze_text_matches_individual_methods(self):
+        """Test that the shared keyword scan agrees with the standalone methods."""
+        extractor = LegalPatternExtractor()
+        result = extractor.analyze_text(SAMPLE_FAIR_HOUSING_TEXT)
+
+        assert result['categories'] == extractor.categorize_complaint_type(SAMPLE_FAIR_HOUSING_TEXT)
+        assert result['protected_classes'] == extractor.find_protected_classes(SAMPLE_FAIR_HOUSING_TEXT)
+        assert result['provisions']['provisions'] == extractor.extract_provisions(SAMPLE_FAIR_HOUSING_TEXT)['provisions']
+
 
 class TestRiskScorer:
     """Test risk scoring functionality."""
@@ -195,6 +245,34 @@ class TestKeywords:
         assert len(APPLICABILITY_KEYWORDS['housing']) > 0
         assert 'tenant' in APPLICABILITY_KEYWORDS['housing']
 
+    def test_keyword_matcher_matches_substring_checks(self, monkeypatch):
+        """Test that both matcher strategies agree with per-keyword substring checks."""
+        keywords = ['ADA', 'adapt', 'age', 'page', 'wage theft', 'wage', 'theft', 'Section 8']
+        text = "Canada WAGE THEFT claim; see Section 8 on page 2."
+        expected = [kw for kw in keywords if kw.lower() in text.lower()]
+
+        substring_scan = KeywordMatcher(keywords).scan(text)
+        monkeypatch.setattr('complaint_analysis.keywords.TRIE_MIN_KEYWORDS', 1)
+        trie_scan = KeywordMatcher(keywords).scan(text)
+
+        assert substring_scan.matches(keywords) == expected
+        assert trie_scan.matches(keywords) == expected
+        assert trie_scan.count(['unscanned', 'claim']) == 1
+
+    def test_registry_matcher_is_rebuilt_after_registration(self):
+        """Test that cached keyword lists and matchers follow new registrations."""
+        registry = KeywordRegistry()
+        registry.register_keywords('complaint', ['eviction'])
+        scopes = [('complaint', 'consumer')]
+        assert registry.scan("a predatory lender", scopes).count(registry.get_keywords('complaint', 'consumer')) == 0
+
+        registry.register_keywords('complaint', ['predatory'], complaint_type='consumer')
+        keywords = registry.get_keywords('complaint', 'consumer')
+        keywords.append('mutated')
+
+        assert registry.get_keywords('complaint', 'consumer') == ['eviction', 'predatory']
+        assert registry.scan("a predatory lender", scopes).matches(keywords) == ['predatory']
+
 
 class TestComplaintAnalyzer:
     """Tests for ComplaintAnalyzer analysis tracking."""
@@ -311,6 +389,100 @@ class TestHybridIndexer:
         assert result['metadata'] == metadata
         assert 'indexed_date' in result
     
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_workers", [0, 2])
+    async def test_index_documents_streams_batches_in_order(self, max_workers):
+        """Test batch indexing matches per-document indexing and batches embeddings."""
+        from unittest.mock import Mock
+        from complaint_analysis import HybridDocumentIndexer
+        from integrations.ipfs_datasets.embedding_cache import EmbeddingCache
+
+        texts = [SAMPLE_FAIR_HOUSING_TEXT, SAMPLE_EMPLOYMENT_TEXT, SAMPLE_LOW_RISK_TEXT] * 2
+        indexer = HybridDocumentIndexer(enable_embeddings=False, embedding_cache=EmbeddingCache(max_entries=16))
+        indexer.enable_embeddings = True
+        indexer.embeddings_router = Mock()
+        indexer.embeddings_router.embed_texts_batched = Mock(
+            side_effect=lambda batch: [[float(len(text))] for text in batch]
+        )
+
+        documents = [(text, {'index': index}) for index, text in enumerate(texts)]
+        results = [
+            result async for result in indexer.index_documents(documents, batch_size=6, max_workers=max_workers)
+        ]
+        expected = await HybridDocumentIndexer(enable_embeddings=False).index_document(texts[1], {'index': 1})
+
+        assert [result['metadata']['index'] for result in results] == list(range(6))
+        assert [result['embedding'] for result in results] == [[float(len(text))] for text in texts]
+        assert [call.args[0] for call in indexer.embeddings_router.embed_texts_batched.call_args_list] == [texts[:3]]
+        for key in ('keywords', 'applicability', 'risk_score', 'risk_level', 'risk_factors'):
+            assert results[1][key] == expected[key]
+        assert results[1]['legal_provisions']['provisions'] == expected['legal_provisions']['provisions']
+        assert indexer.total_indexed_documents() == 6
+        assert indexer.documents_with_embeddings() == 6
+
+    def test_thread_workers_do_not_share_an_indexer(self):
+        """Test that thread-pool analysis gives each thread its own indexer."""
+        import threading
+        import complaint_analysis.indexer as indexer_module
+
+        seen = []
+
+        def _analyze():
+            indexer_module._analyze_in_worker(SAMPLE_LOW_RISK_TEXT)
+            seen.append(indexer_module._worker_state.indexer)
+
+        threads = [threading.Thread(target=_analyze) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(seen) == 2
+        assert seen[0] is not seen[1]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_cancels_the_prefetched_batch(self):
+        """Test that an error in one batch stops the batch started after it."""
+        import asyncio
+        from complaint_analysis import HybridDocumentIndexer
+
+        indexer = HybridDocumentIndexer(enable_embeddings=False)
+        cancelled = asyncio.Event()
+
+        async def _index_batch(batch, executor):
+            if batch[0][0] == 'first':
+                await asyncio.sleep(0)
+                raise ValueError('analysis failed')
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        indexer._index_batch = _index_batch
+        with pytest.raises(ValueError):
+            async for _ in indexer.index_documents(['first', 'second'], batch_size=1, max_workers=0):
+                pass
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_index_history_is_bounded_and_spilled(self, tmp_path):
+        """Test that statistics cover every document while memory keeps only the newest."""
+        import json
+        from complaint_analysis import HybridDocumentIndexer
+
+        spill_path = tmp_path / "index_history.jsonl"
+        indexer = HybridDocumentIndexer(enable_embeddings=False, history_limit=2, history_spill_path=str(spill_path))
+        texts = [SAMPLE_FAIR_HOUSING_TEXT, SAMPLE_EMPLOYMENT_TEXT, SAMPLE_LOW_RISK_TEXT]
+        results = [result async for result in indexer.index_documents(texts, batch_size=2, max_workers=0)]
+
+        assert indexer.total_indexed_documents() == 3
+        assert [doc['text_length'] for doc in indexer._indexed_documents] == [len(texts[1]), len(texts[2])]
+        assert indexer.average_relevance_score() == pytest.approx(sum(r['relevance_score'] for r in results) / 3)
+        assert sum(indexer.risk_level_distribution().values()) == 3
+        spilled = [json.loads(line) for line in spill_path.read_text().splitlines()]
+        assert [record['text_length'] for record in spilled] == [len(text) for text in texts]
+
     def test_get_statistics(self):
         """Test statistics generation."""
         from complaint_analysis import HybridDocumentIndexer
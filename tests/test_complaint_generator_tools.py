@@ -3760,3 +3760,96 @@ def test_workspace_save_state_uses_stable_tmp_path(tmp_path):
     assert session_path.is_file()
     assert not tmp_path_candidate.exists()
     assert saved_again["user_id"] == user_id
+
+
+def test_workspace_save_evidence_appends_to_session_log_and_compacts(tmp_path, monkeypatch):
+    import applications.complaint_workspace as complaint_workspace_module
+
+    service = ComplaintWorkspaceService(root_dir=tmp_path / "oplog-sessions")
+    user_id = "oplog-user"
+    service.get_session(user_id)
+    session_path = service._session_path(user_id)
+    snapshot_before = session_path.read_text()
+
+    first = service.save_evidence(user_id, kind="document", claim_element_id="causation", title="First", content="one")
+    second = service.save_evidence(user_id, kind="testimony", claim_element_id="harm", title="Second", content="two")
+
+    oplog_path = service._session_oplog_path(user_id)
+    assert session_path.read_text() == snapshot_before
+    assert len(oplog_path.read_text().splitlines()) == 2
+    reloaded = ComplaintWorkspaceService(root_dir=tmp_path / "oplog-sessions")._load_state(user_id)
+    assert reloaded["evidence"]["documents"] == [first["saved"]]
+    assert reloaded["evidence"]["testimony"] == [second["saved"]]
+    assert reloaded["updated_at"] == second["session"]["updated_at"]
+
+    monkeypatch.setattr(complaint_workspace_module, "_SESSION_OPLOG_COMPACT_THRESHOLD", 3)
+    service.save_evidence(user_id, kind="document", claim_element_id="causation", title="Third", content="three")
+    service.save_evidence(user_id, kind="document", claim_element_id="causation", title="Fourth", content="four")
+
+    assert not oplog_path.exists()
+    compacted = json.loads(session_path.read_text())
+    assert [record["title"] for record in compacted["evidence"]["documents"]] == ["First", "Third", "Fourth"]
+
+
+def test_workspace_session_log_ignores_torn_trailing_write(tmp_path):
+    service = ComplaintWorkspaceService(root_dir=tmp_path / "torn-sessions")
+    user_id = "torn-user"
+    service.get_session(user_id)
+    saved = service.save_evidence(user_id, kind="document", claim_element_id="causation", title="Kept", content="ok")
+    with service._session_oplog_path(user_id).open("a", encoding="utf-8") as handle:
+        handle.write('{"op": "append_evidence", "collection": "docu')
+
+    restarted = ComplaintWorkspaceService(root_dir=tmp_path / "torn-sessions")
+    state = restarted._load_state(user_id)
+
+    assert state["evidence"]["documents"] == [saved["saved"]]
+    later = restarted.save_evidence(user_id, kind="document", claim_element_id="causation", title="Later", content="ok")
+    reloaded = ComplaintWorkspaceService(root_dir=tmp_path / "torn-sessions")._load_state(user_id)
+    assert later["saved"]["id"] != saved["saved"]["id"]
+    assert reloaded["evidence"]["documents"] == [saved["saved"], later["saved"]]
+
+
+def test_workspace_session_log_left_behind_by_compaction_is_not_replayed_twice(tmp_path, monkeypatch):
+    import applications.complaint_workspace as complaint_workspace_module
+
+    service = ComplaintWorkspaceService(root_dir=tmp_path / "crash-sessions")
+    user_id = "crash-user"
+    service.get_session(user_id)
+    service.save_evidence(user_id, kind="document", claim_element_id="causation", title="First", content="one")
+    oplog_path = service._session_oplog_path(user_id)
+    leftover = oplog_path.read_bytes()
+
+    monkeypatch.setattr(complaint_workspace_module, "_SESSION_OPLOG_COMPACT_THRESHOLD", 1)
+    service.save_evidence(user_id, kind="document", claim_element_id="causation", title="Second", content="two")
+    # Simulate a crash after the snapshot was replaced but before the log was removed.
+    oplog_path.write_bytes(leftover)
+    monkeypatch.setattr(complaint_workspace_module, "_SESSION_OPLOG_COMPACT_THRESHOLD", 256)
+
+    restarted = ComplaintWorkspaceService(root_dir=tmp_path / "crash-sessions")
+    state = restarted._load_state(user_id)
+    assert [record["title"] for record in state["evidence"]["documents"]] == ["First", "Second"]
+    restarted.save_evidence(user_id, kind="document", claim_element_id="causation", title="Third", content="three")
+    reloaded = ComplaintWorkspaceService(root_dir=tmp_path / "crash-sessions")._load_state(user_id)
+    assert [record["title"] for record in reloaded["evidence"]["documents"]] == ["First", "Second", "Third"]
+
+
+def test_workspace_save_evidence_many_writes_session_once(tmp_path, monkeypatch):
+    service = ComplaintWorkspaceService(root_dir=tmp_path / "batch-sessions")
+    user_id = "batch-user"
+    service.get_session(user_id)
+    loads = []
+    original_load_state = service._load_state
+    monkeypatch.setattr(service, "_load_state", lambda uid: loads.append(uid) or original_load_state(uid))
+
+    payload = service.save_evidence_many(
+        user_id,
+        [
+            {"kind": "document", "claim_element_id": "causation", "title": f"Doc {index}", "content": str(index)}
+            for index in range(5)
+        ],
+    )
+
+    assert loads == [user_id]
+    assert [record["id"] for record in payload["saved"]] == [f"documents-{index}" for index in range(1, 6)]
+    assert len(service._session_oplog_path(user_id).read_text().splitlines()) == 5
+    assert len(service.get_session(user_id)["session"]["evidence"]["documents"]) == 5
@@ -0,0 +1,230 @@
+import asyncio
+import io
+import json
+import threading
+import time
+
+import pytest
+
+from applications import complaint_mcp_server
+from applications.complaint_mcp_server import (
+    DIAGNOSTICS_TOOL_NAME,
+    ConcurrentComplaintMCPServer,
+)
+
+
+pytestmark = [pytest.mark.no_auto_network]
+
+
+class _SlowService:
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self.active = {}
+        self.max_active = 0
+        self.max_active_per_user = {}
+        self.calls = []
+
+    def list_mcp_tools(self):
+        return {"tools": [{"name": "complaint.echo", "description": "Echo."}]}
+
+    def call_mcp_tool(self, tool_name, arguments):
+        user_id = arguments.get("user_id", "")
+        with self._lock:
+            self.active[user_id] = self.active.get(user_id, 0) + 1
+            self.max_active = max(self.max_active, sum(self.active.values()))
+            self.max_active_per_user[user_id] = max(self.max_active_per_user.get(user_id, 0), self.active[user_id])
+            self.calls.append((user_id, arguments.get("step")))
+        time.sleep(self.delay)
+        with self._lock:
+            self.active[user_id] -= 1
+        if tool_name == "complaint.fail":
+            raise ValueError("boom")
+        return {"user_id": user_id, "step": arguments.get("step")}
+
+
+def _call(request_id, user_id, step=0, tool="complaint.echo"):
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": tool, "arguments": {"user_id": user_id, "step": step}},
+    }
+
+
+def _serve(server, requests, monkeypatch):
+    stdout = io.StringIO()
+    monkeypatch.setattr("sys.stdout", stdout)
+    stdin = io.StringIO("".join(json.dumps(request) + "\n" for request in requests))
+    asyncio.run(server.serve(stdin))
+    return [json.loads(line) for line in stdout.getvalue().splitlines() if line.strip()]
+
+
+def test_requests_for_different_users_run_concurrently(monkeypatch):
+    service = _SlowService()
+    server = ConcurrentComplaintMCPServer(service, max_workers=4)
+
+    started = time.perf_counter()
+    responses = _serve(server, [_call(index, f"user-{index}") for index in range(4)], monkeypatch)
+    elapsed = time.perf_counter() - started
+
+    assert sorted(response["id"] for response in responses) == [0, 1, 2, 3]
+    assert service.max_active > 1
+    assert elapsed < service.delay * 4
+
+
+def test_requests_for_one_user_are_serialized_in_arrival_order(monkeypatch):
+    service = _SlowService(delay=0.02)
+    server = ConcurrentComplaintMCPServer(service, max_workers=4)
+
+    requests = [_call(index, "user-a", step=index) for index in range(3)]
+    requests += [_call(10 + index, "user-b", step=index) for index in range(3)]
+    _serve(server, requests, monkeypatch)
+
+    assert service.max_active_per_user == {"user-a": 1, "user-b": 1}
+    assert [step for user_id, step in service.calls if user_id == "user-a"] == [0, 1, 2]
+    assert [step for user_id, step in service.calls if user_id == "user-b"] == [0, 1, 2]
+
+
+def test_user_ids_sharing_a_workspace_are_serialized(monkeypatch):
+    service = _SlowService(delay=0.02)
+    server = ConcurrentComplaintMCPServer(service, max_workers=4)
+
+    requests = [_call(0, "user a"), _call(1, "user/a"), _call(2, "user-a")]
+    requests += [_call(3, ""), _call(4, "did:key:anonymous")]
+    _serve(server, requests, monkeypatch)
+
+    assert service.max_active == 2
+    calls = [user_id for user_id, _ in service.calls]
+    assert [user_id for user_id in calls if user_id.startswith("user")] == ["user a", "user/a", "user-a"]
+    assert [user_id for user_id in calls if not user_id.startswith("user")] == ["", "did:key:anonymous"]
+
+
+def test_draft_refinement_errors_stay_with_their_user(monkeypatch, tmp_path):
+    from applications.complaint_workspace import ComplaintWorkspaceService
+
+    service = ComplaintWorkspaceService(root_dir=tmp_path / "sessions")
+    refining = threading.Barrier(2, timeout=5)
+    failed = threading.Barrier(2, timeout=5)
+
+    def fake_refine(self, state, base_draft, **kwargs):
+        refining.wait()
+        if state["user_id"] == "failing-user":
+            self._last_draft_refinement_error = "provider failed"
+        failed.wait()
+        return None
+
+    monkeypatch.setattr(ComplaintWorkspaceService, "_refine_draft_with_llm_router", fake_refine)
+    drafts = {}
+
+    def _generate(user_id):
+        payload = service.generate_complaint(user_id, use_llm=True, provider="codex_cli")
+        drafts[user_id] = payload["draft"]
+
+    threads = [threading.Thread(target=_generate, args=(user_id,)) for user_id in ("failing-user", "other-user")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert drafts["failing-user"]["draft_fallback_reason"] == "provider failed"
+    assert "draft_fallback_reason" not in drafts["other-user"]
+
+
+def test_batch_request_returns_one_array_and_skips_notifications(monkeypatch):
+    server = ConcurrentComplaintMCPServer(_SlowService(delay=0), max_workers=2)
+    batch = [
+        _call(1, "user-a"),
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        {"jsonrpc": "2.0", "id": 2, "method": "ping"},
+    ]
+
+    responses = _serve(server, [batch, []], monkeypatch)
+
+    (batch_response,) = [response for response in responses if isinstance(response, list)]
+    (empty_response,) = [response for response in responses if isinstance(response, dict)]
+    assert [item["id"] for item in batch_response] == [1, 2]
+    assert batch_response[0]["result"]["structuredContent"] == {"user_id": "user-a", "step": 0}
+    assert empty_response["error"]["code"] == -32600
+
+
+def test_exit_drains_in_flight_requests_and_stops_reading(monkeypatch):
+    service = _SlowService()
+    server = ConcurrentComplaintMCPServer(service, max_workers=2)
+
+    responses = _serve(
+        server,
+        [_call(1, "user-a"), {"jsonrpc": "2.0", "id": 2, "method": "exit"}, _call(3, "user-b")],
+        monkeypatch,
+    )
+
+    assert [response["id"] for response in responses] == [1]
+    assert service.calls == [("user-a", 0)]
+
+
+def test_diagnostics_tool_reports_per_method_counters(monkeypatch):
+    server = ConcurrentComplaintMCPServer(_SlowService(delay=0), max_workers=2)
+    requests = [
+        {"jsonrpc": "2.0", "id": 1, "method": "tools/list"},
+        _call(2, "user-a"),
+        _call(3, "user-a", tool="complaint.fail"),
+    ]
+    responses = _serve(server, requests, monkeypatch)
+
+    tool_names = [tool["name"] for tool in next(r for r in responses if r["id"] == 1)["result"]["tools"]]
+    assert tool_names == ["complaint.echo", DIAGNOSTICS_TOOL_NAME]
+
+    diagnostics = _serve(
+        server,
+        [{"jsonrpc": "2.0", "id": 4, "method": "tools/call", "params": {"name": DIAGNOSTICS_TOOL_NAME}}],
+        monkeypatch,
+    )[0]["result"]["structuredContent"]
+    assert diagnostics["mode"] == "concurrent"
+    assert diagnostics["in_flight"] == 0
+    assert diagnostics["completed"] == 3
+    assert diagnostics["methods"]["complaint.echo"]["count"] == 1
+    assert diagnostics["methods"]["complaint.fail"]["errors"] == 1
+    assert diagnostics["methods"]["tools/list"]["count"] == 1
+
+
+def test_main_uses_concurrent_server_when_configured(monkeypatch):
+    service = _SlowService(delay=0)
+    stdin = io.StringIO(json.dumps([_call(1, "user-a"), _call(2, "user-b")]) + "\n")
+    stdout = io.StringIO()
+    monkeypatch.setenv(complaint_mcp_server.SERVER_MODE_ENV, "concurrent")
+    monkeypatch.setenv(complaint_mcp_server.MAX_WORKERS_ENV, "2")
+    monkeypatch.setattr("applications.complaint_mcp_server.ComplaintWorkspaceService", lambda: service)
+    monkeypatch.setattr("sys.stdin", stdin)
+    monkeypatch.setattr("sys.stdout", stdout)
+
+    complaint_mcp_server.main()
+
+    (response,) = [json.loads(line) for line in stdout.getvalue().splitlines() if line.strip()]
+    assert sorted(item["id"] for item in response) == [1, 2]
+
+
+def test_diagnostics_tool_is_validated_like_other_tools(monkeypatch):
+    server = ConcurrentComplaintMCPServer(_SlowService(delay=0), max_workers=2)
+    diagnostics_params = {"name": DIAGNOSTICS_TOOL_NAME}
+    requests = [
+        {"id": 1, "method": "tools/call", "params": diagnostics_params},
+        {"jsonrpc": "2.0", "method": "tools/call", "params": diagnostics_params},
+        {"jsonrpc": "2.0", "method": "tools/call", "params": {"name": "complaint.echo", "arguments": {}}},
+        {"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": diagnostics_params},
+    ]
+
+    responses = {response["id"]: response for response in _serve(server, requests, monkeypatch)}
+
+    assert sorted(responses) == [1, 2]
+    assert responses[1]["error"]["code"] == -32600
+    assert responses[2]["result"]["structuredContent"]["mode"] == "concurrent"
+
+
+def test_user_locks_are_dropped_once_users_go_idle(monkeypatch):
+    server = ConcurrentComplaintMCPServer(_SlowService(delay=0.01), max_workers=4)
+    requests = [_call(index, f"user-{index % 5}", step=index) for index in range(20)]
+
+    responses = _serve(server, requests, monkeypatch)
+
+    assert len(responses) == 20
+    assert server.diagnostics()["serialized_workspaces"] == 0
@@ -96,6 +96,27 @@ class TestKnowledgeGraph:
         assert len(kg2.entities) == 1
         assert kg2.get_entity("e1").name == "John Doe"
     
+    def test_next_ids_follow_loaded_and_merged_graphs(self):
+        """Test id allocation continues past ids added through load and merge."""
+        kg = KnowledgeGraph()
+        kg.add_entity(Entity(id="entity_3", type="person", name="John Doe"))
+        kg.add_entity(Entity(id="e9", type="person", name="Jane Roe"))
+        kg.add_relationship(Relationship(id="rel_2", source_id="entity_3", target_id="e9",
+                                         relation_type="knows"))
+        assert kg.next_entity_id() == "entity_4"
+        assert kg.next_entity_id("e") == "e_1"
+        assert kg.next_relationship_id() == "rel_3"
+
+        loaded = KnowledgeGraph.from_dict(kg.to_dict())
+        assert loaded.next_entity_id() == "entity_4"
+
+        other = KnowledgeGraph()
+        other.add_entity(Entity(id="entity_10", type="organization", name="Acme Corp"))
+        loaded.merge_with(other)
+        assert loaded.next_entity_id() == "entity_11"
+        loaded.remove_entity("entity_10")
+        assert loaded.next_entity_id() == "entity_11"
+    
     def test_knowledge_graph_builder(self):
         """Test building knowledge graph from text."""
         builder = KnowledgeGraphBuilder()
@@ -382,6 +403,63 @@ class TestComplaintDenoiser:
         assert 'blocking_level' in questions[0]
         assert 'expected_update_kind' in questions[0]
 
+    def test_question_turn_collects_candidates_once(self):
+        """Test that a question turn shares one candidate collection with generate_questions."""
+        denoiser = ComplaintDenoiser()
+
+        kg = KnowledgeGraph()
+        kg.add_entity(Entity("e1", "person", "John", confidence=0.5))
+
+        dg = DependencyGraph()
+        dg.add_node(DependencyNode("n1", NodeType.CLAIM, "Claim1"))
+
+        expected = denoiser.generate_questions(kg, dg, max_questions=5)
+        with denoiser.question_turn():
+            candidates = denoiser.collect_question_candidates(kg, dg, max_questions=5)
+            questions = denoiser.generate_questions(kg, dg, max_questions=5)
+            again = denoiser.collect_question_candidates(kg, dg, max_questions=5)
+            kg.add_entity(Entity("e2", "organization", "Acme", confidence=0.4))
+            denoiser.collect_question_candidates(kg, dg, max_questions=5)
+
+        assert questions == expected
+        assert again == candidates
+        assert 'actor_critic_score' not in candidates[0]
+        assert denoiser.get_candidate_snapshot_stats() == {'collections': 3, 'reuses': 2}
+
+        denoiser.collect_question_candidates(kg, dg, max_questions=5)
+        assert denoiser.get_candidate_snapshot_stats()['collections'] == 4
+
+    def test_already_asked_tracks_history_growth_and_replacement(self):
+        """Test the asked-question index follows appends and a replaced history list."""
+        denoiser = ComplaintDenoiser()
+        denoiser.questions_asked.append({'question': {'type': 'timeline', 'question': ' When did it happen? '}, 'answer': ''})
+
+        assert denoiser._already_asked('when did it happen?')
+        assert not denoiser._already_asked('Who was involved?')
+
+        denoiser.questions_asked.append({'question': 'Who was involved?', 'answer': ''})
+        assert denoiser._already_asked('who was involved?')
+
+        denoiser.questions_asked = []
+        assert not denoiser._already_asked('when did it happen?')
+
+    def test_add_helpers_reuse_indexed_entities_and_relationships(self):
+        """Test entity and relationship lookups go through the graph indexes."""
+        denoiser = ComplaintDenoiser()
+        kg = KnowledgeGraph.from_dict(KnowledgeGraph().to_dict())
+        kg.add_entity(Entity(id="entity_7", type="person", name="Sam Lee"))
+
+        entity, created = denoiser._add_entity_if_missing(kg, "Person", "  sam lee ", {}, 0.7)
+        assert (entity.id, created) == ("entity_7", False)
+        entity, created = denoiser._add_entity_if_missing(kg, "organization", "Acme", {}, 0.7)
+        assert (entity.id, created) == ("entity_8", True)
+        assert denoiser._find_entity(kg, "", "Acme") is None
+
+        rel, created = denoiser._add_relationship_if_missing(kg, "entity_7", "entity_8", "employed_by", 0.6)
+        assert (rel.id, created) == ("rel_1", True)
+        again, created = denoiser._add_relationship_if_missing(kg, "entity_7", "entity_8", "employed_by", 0.6)
+        assert again is rel and not created
+
     def test_generate_questions_prioritizes_timeline_before_clarification(self):
         """Test proof-directed ranking prefers chronology questions over lower-value clarification."""
         denoiser = ComplaintDenoiser()
@@ -1772,6 +1850,45 @@ class TestPhaseManager:
         assert action['claim_type'] == 'employment_discrimination'
         assert action['claim_element_id'] == 'causation'
 
+    def test_derived_readiness_recomputes_once_per_batch(self):
+        """Derived intake readiness should be rebuilt on read, once per batch of writes."""
+        pm = PhaseManager()
+
+        with pm.batch_updates():
+            pm.update_phase_data(ComplaintPhase.INTAKE, 'knowledge_graph', {})
+            pm.update_phase_data(ComplaintPhase.INTAKE, 'dependency_graph', {})
+            pm.update_phase_data(ComplaintPhase.INTAKE, 'current_questions', [])
+            pm.update_phase_data(ComplaintPhase.INTAKE, 'remaining_gaps', 0)
+            pm.update_phase_data(ComplaintPhase.INTAKE, 'denoising_converged', True)
+            assert pm.get_phase_data(ComplaintPhase.INTAKE, 'remaining_gaps') == 0
+            assert pm.get_derived_state_stats()['total_recomputes'] == 0
+            readiness = pm.get_intake_readiness()
+            pm.get_next_action()
+            pm.is_phase_complete(ComplaintPhase.INTAKE)
+
+        stats = pm.get_derived_state_stats()
+        assert readiness['ready'] is True
+        assert stats['writes'] == 5
+        assert stats['recomputes'] == {'intake': 1, 'evidence': 0}
+        assert stats['last_batch_recomputes'] == 1
+        assert stats['batches'] == 1
+
+    def test_derived_view_ignores_writes_outside_its_inputs(self):
+        """Writes to keys a derived view does not read should leave it clean."""
+        pm = PhaseManager()
+        pm.update_phase_data(ComplaintPhase.INTAKE, 'knowledge_graph', {})
+        pm.get_intake_readiness()
+
+        pm.update_phase_data(ComplaintPhase.INTAKE, 'current_questions', [{'question': 'When?'}])
+        assert pm.get_derived_state_stats()['dirty_views'] == []
+        pm.update_phase_data(ComplaintPhase.INTAKE, 'intake_blockers', ['needs_review'])
+        assert pm.get_derived_state_stats()['dirty_views'] == ['intake']
+
+        assert 'needs_review' in pm.get_phase_data(ComplaintPhase.INTAKE, 'intake_readiness_blockers')
+        assert pm.get_derived_state_stats()['recomputes']['intake'] == 2
+        restored = PhaseManager.from_dict(pm.to_dict())
+        assert restored.get_intake_readiness() == pm.get_intake_readiness()
+
 
 class TestLegalGraph:
     """Tests for LegalGraph and LegalGraphBuilder."""
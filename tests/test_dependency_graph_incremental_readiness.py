@@ -0,0 +1,178 @@
+"""
+Tests for the incremental satisfaction/readiness caches in DependencyGraph.
+
+Each scenario mutates a graph in place and checks that the cached results
+match a graph rebuilt from scratch, and that only the touched claims were
+recomputed.
+"""
+
+import copy
+import json
+
+import pytest
+
+from complaint_phases import (
+    DependencyGraph,
+    DependencyNode,
+    Dependency,
+    NodeType,
+    DependencyType,
+)
+
+
+def _build_graph(claim_count: int = 3, requirements_per_claim: int = 3) -> DependencyGraph:
+    graph = DependencyGraph()
+    for claim_index in range(claim_count):
+        claim_id = f"claim_{claim_index}"
+        graph.add_node(DependencyNode(
+            id=claim_id,
+            node_type=NodeType.CLAIM,
+            name=f"Claim {claim_index}",
+            attributes={'claim_type': 'retaliation'},
+        ))
+        for req_index in range(requirements_per_claim):
+            req_id = f"req_{claim_index}_{req_index}"
+            graph.add_node(DependencyNode(
+                id=req_id,
+                node_type=NodeType.REQUIREMENT,
+                name=f"Requirement {claim_index}.{req_index}",
+                attributes={'requirement_key': f"element_{req_index}"},
+            ))
+            graph.add_dependency(Dependency(
+                id=f"dep_{claim_index}_{req_index}",
+                source_id=req_id,
+                target_id=claim_id,
+                dependency_type=DependencyType.REQUIRES,
+            ))
+    return graph
+
+
+def _fresh_results(graph: DependencyGraph):
+    fresh = DependencyGraph.from_dict(json.loads(json.dumps(graph.to_dict())))
+    return fresh.get_claim_readiness(), fresh.find_unsatisfied_requirements()
+
+
+def _assert_matches_fresh(graph: DependencyGraph):
+    expected_readiness, expected_unsatisfied = _fresh_results(graph)
+    assert graph.get_claim_readiness() == expected_readiness
+    assert graph.find_unsatisfied_requirements() == expected_unsatisfied
+
+
+class TestIncrementalReadiness:
+    """Cached readiness stays equal to a full recompute."""
+
+    def test_second_call_reuses_every_claim(self):
+        graph = _build_graph()
+        graph.get_claim_readiness()
+        graph.get_claim_readiness()
+        stats = graph.readiness_cache_stats()
+        assert stats['last_readiness_recomputed_claims'] == 0
+        assert stats['last_readiness_reused_claims'] == 3
+
+    def test_flipping_satisfied_recomputes_only_downstream_claim(self):
+        graph = _build_graph()
+        graph.get_claim_readiness()
+        graph.find_unsatisfied_requirements()
+
+        graph.nodes['req_1_0'].satisfied = True
+        assert graph.readiness_cache_stats()['pending_dirty_claims'] == 1
+        _assert_matches_fresh(graph)
+        stats = graph.readiness_cache_stats()
+        assert stats['last_readiness_recomputed_claims'] == 1
+        assert stats['last_readiness_reused_claims'] == 2
+
+    def test_satisfying_all_requirements_moves_claim_to_ready(self):
+        graph = _build_graph()
+        graph.get_claim_readiness()
+        for req_index in range(3):
+            graph.nodes[f"req_0_{req_index}"].satisfied = True
+        readiness = graph.get_claim_readiness()
+        assert readiness['ready_claims'] == 1
+        assert [item['node_id'] for item in graph.find_unsatisfied_requirements()] == ['claim_1', 'claim_2']
+        _assert_matches_fresh(graph)
+
+    def test_adding_dependency_invalidates_target(self):
+        graph = _build_graph()
+        graph.get_claim_readiness()
+        graph.add_node(DependencyNode(id='req_extra', node_type=NodeType.REQUIREMENT, name='Causation'))
+        graph.add_dependency(Dependency(
+            id='dep_extra', source_id='req_extra', target_id='claim_2',
+            dependency_type=DependencyType.REQUIRES,
+        ))
+        _assert_matches_fresh(graph)
+        assert graph.readiness_cache_stats()['last_readiness_recomputed_claims'] == 1
+
+    def test_attribute_and_confidence_edits_are_tracked(self):
+        graph = _build_graph()
+        graph.get_claim_readiness()
+        node = graph.nodes['req_2_1']
+        attrs = node.attributes
+        attrs['gap_type'] = 'missing_staff_identity'
+        node.attributes = attrs
+        graph.nodes['claim_0'].confidence = 0.9
+        _assert_matches_fresh(graph)
+        assert graph.readiness_cache_stats()['last_readiness_recomputed_claims'] == 2
+
+    def test_unchanged_assignment_does_not_invalidate(self):
+        graph = _build_graph()
+        graph.get_claim_readiness()
+        graph.nodes['req_0_0'].satisfied = False
+        graph.nodes['req_0_0'].confidence = 0.0
+        assert graph.readiness_cache_stats()['pending_dirty_claims'] == 0
+
+    def test_removal_and_dependency_edits_are_tracked(self):
+        graph = _build_graph()
+        graph.get_claim_readiness()
+        graph.find_unsatisfied_requirements()
+        graph.remove_node('req_0_0')
+        graph.dependencies['dep_1_0'].required = False
+        _assert_matches_fresh(graph)
+
+    def test_removed_node_no_longer_reports_changes(self):
+        graph = _build_graph()
+        graph.get_claim_readiness()
+        node = graph.remove_node('req_0_0')
+        graph.get_claim_readiness()
+        node.satisfied = True
+        assert graph.readiness_cache_stats()['pending_dirty_claims'] == 0
+
+    def test_deepcopy_rebinds_nodes_to_copy(self):
+        graph = _build_graph()
+        graph.get_claim_readiness()
+        clone = copy.deepcopy(graph)
+        clone.nodes['req_0_0'].satisfied = True
+        assert graph.readiness_cache_stats()['pending_dirty_claims'] == 0
+        assert clone.readiness_cache_stats()['pending_dirty_claims'] == 1
+        _assert_matches_fresh(clone)
+
+    def test_returned_results_do_not_alias_cache(self):
+        graph = _build_graph()
+        first = graph.find_unsatisfied_requirements()
+        first[0]['missing_dependencies'].clear()
+        assert graph.find_unsatisfied_requirements()[0]['missing_dependencies']
+
+    def test_readiness_results_do_not_alias_cache(self):
+        graph = _build_graph()
+        first = graph.get_claim_readiness()
+        detail = first['incomplete_claim_details'][0]
+        detail['claim_name'] = 'edited'
+        with pytest.raises(TypeError):
+            detail['missing_dependencies'][0]['source_name'] = 'edited'
+        with pytest.raises(TypeError):
+            detail['missing_dependencies'].clear()
+        editable = copy.deepcopy(detail)
+        editable['missing_dependencies'].clear()
+        assert type(editable['missing_dependencies']) is list
+        _assert_matches_fresh(graph)
+
+    def test_in_place_attribute_edits_invalidate_readiness(self):
+        graph = _build_graph()
+        before = graph.get_claim_readiness()
+        graph.nodes['req_0_0'].attributes['gap_type'] = 'missing_staff_identity'
+        assert graph.readiness_cache_stats()['pending_dirty_claims'] == 1
+        assert graph.get_claim_readiness() != before
+        _assert_matches_fresh(graph)
+
+        graph.nodes['req_0_0'].attributes.pop('gap_type')
+        _assert_matches_fresh(graph)
+        assert type(graph.nodes['req_0_0'].to_dict()['attributes']) is dict
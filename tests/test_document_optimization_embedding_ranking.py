@@ -0,0 +1,120 @@
+from unittest.mock import Mock
+
+import document_optimization
+from document_optimization import AgenticDocumentOptimizer
+
+
+def _vector_for(text):
+    lowered = text.lower()
+    return [
+        float("retaliation" in lowered),
+        float("terminated" in lowered or "fired" in lowered),
+        float(len(text.split())),
+    ]
+
+
+class _BatchedEmbeddingsRouter:
+    def __init__(self):
+        self.batch_calls = []
+        self.single_calls = []
+
+    def embed_texts_batched(self, texts):
+        self.batch_calls.append(list(texts))
+        return [_vector_for(text) for text in texts]
+
+    def embed_text(self, text):
+        self.single_calls.append(text)
+        return _vector_for(text)
+
+
+class _SingleEmbeddingsRouter:
+    def __init__(self):
+        self.single_calls = []
+
+    def embed_text(self, text):
+        self.single_calls.append(text)
+        return {"embedding": _vector_for(text)}
+
+
+class _BrokenBatchEmbeddingsRouter(_SingleEmbeddingsRouter):
+    def embed_texts_batched(self, texts):
+        return [[1.0]]
+
+
+CANDIDATES = [
+    {"text": "Plaintiff was terminated after reporting retaliation."},
+    {"text": "The weather was pleasant."},
+    {"text": "Plaintiff complained about retaliation."},
+]
+
+
+def _optimizer_with_router(monkeypatch, router):
+    monkeypatch.setattr(document_optimization, "EMBEDDINGS_AVAILABLE", True)
+    optimizer = AgenticDocumentOptimizer(Mock())
+    optimizer._reset_runtime_state()
+    optimizer._embeddings_router = router
+    return optimizer
+
+
+def _reference_ranking(optimizer, query, candidates):
+    query_terms = set(query.lower().split())
+    rows = []
+    for row in candidates:
+        semantic = optimizer._cosine_similarity(_vector_for(query), _vector_for(row["text"]))
+        lexical = optimizer._lexical_overlap_score(query_terms, row["text"])
+        rows.append((row["text"], min(max(semantic * 0.8 + lexical * 0.2, 0.0), 1.0)))
+    return sorted(rows, key=lambda item: item[1], reverse=True)
+
+
+def test_rank_candidates_embeds_uncached_texts_in_one_batch(monkeypatch):
+    router = _BatchedEmbeddingsRouter()
+    optimizer = _optimizer_with_router(monkeypatch, router)
+
+    ranked = optimizer._rank_candidates(query="retaliation terminated", candidates=CANDIDATES)
+
+    assert router.batch_calls == [["retaliation terminated", *[row["text"] for row in CANDIDATES]]]
+    assert router.single_calls == []
+    expected = _reference_ranking(optimizer, "retaliation terminated", CANDIDATES)
+    assert [row["text"] for row in ranked] == [text for text, _ in expected]
+    for row, (_, score) in zip(ranked, expected):
+        assert abs(row["score"] - score) < 1e-5
+        assert row["ranking_method"] == "embeddings_router_hybrid"
+
+
+def test_rank_candidates_only_batches_cache_misses(monkeypatch):
+    router = _BatchedEmbeddingsRouter()
+    optimizer = _optimizer_with_router(monkeypatch, router)
+    optimizer._rank_candidates(query="retaliation terminated", candidates=CANDIDATES)
+
+    extra = {"text": "Manager fired plaintiff."}
+    optimizer._rank_candidates(query="retaliation terminated", candidates=[*CANDIDATES, extra])
+
+    assert router.batch_calls[-1] == ["Manager fired plaintiff."]
+    usage = optimizer._router_usage_summary()
+    assert usage["embedding_batches"] == 2
+    assert usage["embedding_batch_sizes"] == [4, 1]
+    assert usage["embedding_cache_hits"] == 4
+    assert usage["embedding_cache_hit_rate"] == round(4 / 9, 4)
+
+
+def test_rank_candidates_falls_back_to_per_text_embeddings(monkeypatch):
+    for router in (_SingleEmbeddingsRouter(), _BrokenBatchEmbeddingsRouter()):
+        optimizer = _optimizer_with_router(monkeypatch, router)
+
+        ranked = optimizer._rank_candidates(query="retaliation terminated", candidates=CANDIDATES)
+
+        assert len(router.single_calls) == 4
+        expected = _reference_ranking(optimizer, "retaliation terminated", CANDIDATES)
+        assert [row["text"] for row in ranked] == [text for text, _ in expected]
+        assert optimizer._router_usage_summary()["embedding_batches"] == 0
+
+
+def test_rank_candidates_keeps_lexical_fallback_without_router(monkeypatch):
+    monkeypatch.setattr(document_optimization, "EMBEDDINGS_AVAILABLE", False)
+    optimizer = AgenticDocumentOptimizer(Mock())
+    optimizer._reset_runtime_state()
+
+    ranked = optimizer._rank_candidates(query="retaliation", candidates=CANDIDATES)
+
+    assert {row["ranking_method"] for row in ranked} == {"lexical_fallback"}
+    assert optimizer._router_usage_summary()["embedding_requests"] == 0
@@ -0,0 +1,263 @@
+"""Tests for the pooled DuckDB connections shared by the mediator hooks."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+duckdb = pytest.importorskip("duckdb")
+
+from mediator.duckdb_pool import DuckDBConnectionManager, get_connection_manager
+
+
+pytestmark = pytest.mark.no_auto_network
+
+
+def _manager(tmp_path, **kwargs):
+    manager = DuckDBConnectionManager(str(tmp_path / "pool.duckdb"), **kwargs)
+    conn = manager.connect()
+    conn.execute("CREATE TABLE items (id INTEGER, label VARCHAR)")
+    conn.close()
+    return manager
+
+
+def test_connections_are_reused_instead_of_reopened(tmp_path):
+    manager = _manager(tmp_path)
+
+    for index in range(10):
+        conn = manager.connect()
+        conn.execute("INSERT INTO items VALUES (?, ?)", [index, f"item-{index}"])
+        conn.close()
+
+    stats = manager.stats()
+    assert stats["database_opens"] == 1
+    assert stats["cursors_created"] == 1
+    assert stats["pooled_reuses"] == 10
+    assert manager.connect().execute("SELECT COUNT(*) FROM items").fetchone()[0] == 10
+    manager.close()
+
+
+def test_session_pins_one_cursor_and_ignores_inner_close(tmp_path):
+    manager = _manager(tmp_path)
+
+    with manager.session() as outer:
+        inner = manager.connect()
+        inner.execute("INSERT INTO items VALUES (1, 'a')")
+        inner.close()
+        assert inner._cursor is outer._cursor
+        assert outer.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 1
+
+    stats = manager.stats()
+    assert stats["sessions"] == 1
+    assert stats["session_reuses"] == 1
+    manager.close()
+
+
+def test_transaction_commits_once_and_rolls_back_on_error(tmp_path):
+    manager = _manager(tmp_path)
+
+    with manager.transaction():
+        with manager.session(transaction=True):
+            manager.connect().execute("INSERT INTO items VALUES (1, 'kept')")
+        manager.connect().execute("INSERT INTO items VALUES (2, 'kept')")
+
+    with pytest.raises(RuntimeError):
+        with manager.transaction():
+            manager.connect().execute("INSERT INTO items VALUES (3, 'dropped')")
+            raise RuntimeError("boom")
+
+    labels = [row[0] for row in manager.connect().execute("SELECT label FROM items ORDER BY id").fetchall()]
+    assert labels == ["kept", "kept"]
+    assert manager.stats()["transactions"] == 2
+    assert manager.stats()["rollbacks"] == 1
+    manager.close()
+
+
+def test_threads_get_their_own_cursors(tmp_path):
+    manager = _manager(tmp_path)
+    cursors = {}
+
+    def _worker(name):
+        with manager.session() as conn:
+            conn.execute("INSERT INTO items VALUES (?, ?)", [len(name), name])
+            cursors[name] = id(conn._cursor)
+
+    threads = [threading.Thread(target=_worker, args=(name,)) for name in ("a", "bb", "ccc")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(cursors.values())) == 3
+    assert manager.connect().execute("SELECT COUNT(*) FROM items").fetchone()[0] == 3
+    assert manager.stats()["database_opens"] == 1
+    manager.close()
+
+
+def test_close_invalidates_pooled_cursors(tmp_path):
+    manager = _manager(tmp_path)
+    manager.close()
+
+    conn = manager.connect()
+    assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+    conn.close()
+    assert manager.stats()["database_opens"] == 2
+    manager.close()
+
+
+def test_idle_connection_is_closed_to_release_the_file(tmp_path):
+    manager = _manager(tmp_path, idle_timeout=0.05)
+    held = manager.connect()
+    time.sleep(0.2)
+    assert manager.stats()["open"]
+    held.close()
+
+    deadline = time.monotonic() + 5
+    while manager.stats()["open"] and time.monotonic() < deadline:
+        time.sleep(0.02)
+    stats = manager.stats()
+    assert not stats["open"]
+    assert stats["idle_closes"] == 1
+
+    conn = manager.connect()
+    assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+    conn.close()
+    assert manager.stats()["database_opens"] == 2
+    manager.close()
+
+
+def test_zero_idle_timeout_keeps_the_connection_open(tmp_path):
+    manager = _manager(tmp_path, idle_timeout=0)
+    time.sleep(0.1)
+    assert manager.stats()["open"]
+    manager.close()
+
+
+def test_managers_are_shared_per_database_path(tmp_path):
+    db_path = str(tmp_path / "shared.duckdb")
+
+    first = get_connection_manager(db_path)
+    assert get_connection_manager(str(tmp_path / "." / "shared.duckdb")) is first
+    assert get_connection_manager(str(tmp_path / "other.duckdb")) is not first
+
+
+def test_default_hook_databases_follow_the_configured_directory(tmp_path, monkeypatch):
+    from mediator.claim_support_hooks import ClaimSupportHook
+
+    monkeypatch.setenv("COMPLAINT_GENERATOR_DUCKDB_DIR", str(tmp_path / "state"))
+    hook = ClaimSupportHook(Mock())
+    assert hook.db_path == str(tmp_path / "state" / "claim_support.duckdb")
+
+
+def test_hooks_share_one_connection_across_a_mediator_turn(tmp_path):
+    from mediator.claim_support_hooks import ClaimSupportHook
+    from mediator.mediator import Mediator
+
+    mediator = Mock()
+    hook = ClaimSupportHook(mediator, db_path=str(tmp_path / "claims.duckdb"))
+    hook.register_claim_requirements("user", {"employment": ["Protected activity"]})
+    before = hook.connection_stats()
+
+    host = Mediator.__new__(Mediator)
+    host.claim_support = hook
+    with host.storage_session(transaction=True):
+        hook.add_support_link(
+            user_id="user",
+            claim_type="employment",
+            support_kind="evidence",
+            support_ref="QmEvidence",
+        )
+        assert len(hook.get_support_links("user", "employment")) == 1
+
+    after = hook.connection_stats()
+    assert after["database_opens"] == 1
+    assert after["cursors_created"] == before["cursors_created"]
+    assert after["sessions"] == before["sessions"] + 1
+    assert after["session_reuses"] > before["session_reuses"]
+    assert host.get_storage_connection_stats()["claim_support"]["db_path"] == hook.db_path
+
+
+def test_mediator_io_runs_the_turn_in_one_storage_session(tmp_path):
+    from mediator.claim_support_hooks import ClaimSupportHook
+    from mediator.mediator import Mediator
+
+    hook = ClaimSupportHook(Mock(), db_path=str(tmp_path / "claims.duckdb"))
+    hook.register_claim_requirements("user", {"employment": ["Protected activity"]})
+    host = Mediator.__new__(Mediator)
+    host.log = Mock()
+    host.claim_support = hook
+
+    def _turn(text):
+        hook.add_support_link(
+            user_id="user",
+            claim_type="employment",
+            support_kind="evidence",
+            support_ref="QmEvidence",
+        )
+        return str(len(hook.get_support_links("user", "employment")))
+
+    host.process = _turn
+    before = hook.connection_stats()
+
+    assert host.io("answer") == "1"
+    after = hook.connection_stats()
+    assert after["sessions"] == before["sessions"] + 1
+    assert after["leases"] == before["leases"] + 1
+
+
+@pytest.mark.parametrize("use_arrow", [True, False])
+def test_bulk_insert_matches_row_by_row_inserts(tmp_path, monkeypatch, use_arrow):
+    import mediator.duckdb_pool as duckdb_pool
+
+    if not use_arrow:
+        monkeypatch.setattr(duckdb_pool, "pa", None)
+    manager = _manager(tmp_path)
+    rows = [[index, None if index % 3 else f"item-{index}"] for index in range(50)]
+
+    with manager.transaction() as conn:
+        assert duckdb_pool.bulk_insert(conn, "items", ("id", "label"), rows) == 50
+        assert duckdb_pool.bulk_insert(conn, "items", ("id", "label"), []) == 0
+        # Mixed Python types cannot become an Arrow column and use executemany.
+        duckdb_pool.bulk_insert(conn, "items", ("id", "label"), [[100, "x"], [101, 7]])
+
+    stored = manager.connect().execute("SELECT id, label FROM items ORDER BY id").fetchall()
+    assert [list(row) for row in stored] == [*rows, [100, "x"], [101, "7"]]
+    manager.close()
+
+
+def test_evidence_document_rows_commit_in_one_transaction(tmp_path):
+    from mediator.evidence_hooks import EvidenceStateHook
+
+    hook = EvidenceStateHook(Mock(), db_path=str(tmp_path / "evidence.duckdb"))
+    chunks = [
+        {"chunk_id": f"chunk-{index}", "index": index, "start": index * 10, "end": index * 10 + 9, "text": f"Chunk {index}"}
+        for index in range(40)
+    ]
+    evidence_info = {
+        "cid": "QmBulk",
+        "type": "document",
+        "size": 400,
+        "metadata": {},
+        "document_parse": {"status": "parsed", "text": "Chunk text", "chunks": chunks, "metadata": {}},
+        "document_graph": {
+            "status": "ready",
+            "entities": [
+                {"id": f"fact-{index}", "type": "fact", "name": f"Fact {index}", "confidence": 0.5, "attributes": {"text": f"Fact {index}"}}
+                for index in range(10)
+            ],
+            "relationships": [],
+        },
+    }
+    before = hook.connection_stats()["transactions"]
+
+    record_id = hook.add_evidence_record("user", evidence_info)
+
+    conn = hook._connect()
+    assert conn.execute("SELECT COUNT(*) FROM evidence_chunks WHERE evidence_id = ?", [record_id]).fetchone()[0] == 40
+    assert conn.execute("SELECT COUNT(*) FROM evidence_facts WHERE evidence_id = ?", [record_id]).fetchone()[0] == 10
+    assert conn.execute(
+        "SELECT chunk_id FROM evidence_chunks WHERE evidence_id = ? ORDER BY chunk_index LIMIT 2", [record_id]
+    ).fetchall() == [("chunk-0",), ("chunk-1",)]
+    conn.close()
+    assert hook.connection_stats()["transactions"] == before + 1
@@ -0,0 +1,193 @@
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+import document_optimization
+import integrations.ipfs_datasets.vector_store as vector_store_module
+from document_optimization import AgenticDocumentOptimizer
+from integrations.ipfs_datasets.embedding_cache import (
+    EmbeddingCache,
+    embedding_cache_key,
+    get_embedding_cache,
+    set_embedding_cache,
+)
+
+
+def _vector_for(text):
+    return [float(len(text)), float(text.count("a")), 1.0]
+
+
+class _CountingEmbedder:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [_vector_for(text) for text in texts]
+
+
+def test_embed_many_only_embeds_unique_misses():
+    cache = EmbeddingCache()
+    embedder = _CountingEmbedder()
+
+    first = cache.embed_many(["alpha", "beta", "alpha"], embedder, model_name="m", provider="p")
+    second = cache.embed_many(["beta", "gamma"], embedder, model_name="m", provider="p")
+
+    assert embedder.calls == [["alpha", "beta"], ["gamma"]]
+    assert first == [_vector_for("alpha"), _vector_for("beta"), _vector_for("alpha")]
+    assert second == [_vector_for("beta"), _vector_for("gamma")]
+    assert cache.stats()["hits"] == 1
+
+
+def test_cache_is_namespaced_by_provider_and_model():
+    cache = EmbeddingCache()
+    cache.put("alpha", [1.0, 2.0], model_name="small", provider="local")
+
+    assert cache.get("alpha", model_name="small", provider="local") == [1.0, 2.0]
+    assert cache.get("alpha", model_name="large", provider="local") is None
+    assert cache.get("alpha", model_name="small", provider="remote") is None
+    assert embedding_cache_key("alpha", model_name="small") != embedding_cache_key("alpha", model_name="large")
+
+
+def test_lru_bound_evicts_least_recently_used():
+    cache = EmbeddingCache(max_entries=2)
+    cache.put("a", [1.0])
+    cache.put("b", [2.0])
+    cache.get("a")
+    cache.put("c", [3.0])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [1.0]
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["entries"] == 2
+
+
+def test_disk_store_is_shared_across_cache_instances(tmp_path):
+    writer = EmbeddingCache(cache_dir=str(tmp_path))
+    reader = EmbeddingCache(cache_dir=str(tmp_path))
+    reader.get("warm", model_name="m")
+
+    writer.embed_many(["alpha", "beta"], _CountingEmbedder(), model_name="m")
+    embedder = _CountingEmbedder()
+    vectors = reader.embed_many(["alpha", "beta"], embedder, model_name="m")
+    fresh = EmbeddingCache(cache_dir=str(tmp_path)).get("alpha", model_name="m")
+
+    assert embedder.calls == []
+    assert vectors == [_vector_for("alpha"), _vector_for("beta")]
+    assert fresh == _vector_for("alpha")
+    assert reader.stats()["disk_hits"] == 2
+
+
+def test_disk_store_restarts_when_size_bound_is_exceeded(tmp_path):
+    record_size = 32 + 3 * 4
+    cache = EmbeddingCache(cache_dir=str(tmp_path), max_disk_bytes=record_size * 2)
+    cache.embed_many(["a", "b", "c"], _CountingEmbedder())
+
+    reloaded = EmbeddingCache(cache_dir=str(tmp_path))
+    assert reloaded.get("c") == _vector_for("c")
+    assert reloaded.get("a") is None
+    assert [path.stat().st_size for path in tmp_path.glob("*.vectors")] == [record_size]
+
+
+def test_rotation_does_not_rewrite_a_file_other_readers_map(tmp_path):
+    record_size = 32 + 3 * 4
+    writer = EmbeddingCache(cache_dir=str(tmp_path), max_disk_bytes=record_size * 2)
+    reader = EmbeddingCache(cache_dir=str(tmp_path), max_entries=1)
+    writer.embed_many(["a", "b"], _CountingEmbedder())
+    assert reader.get("a") == _vector_for("a")
+    assert reader.get("b") == _vector_for("b")
+    (first_generation,) = tmp_path.glob("*.vectors")
+
+    writer.embed_many(["cc", "ddd"], _CountingEmbedder())
+
+    assert not first_generation.exists()
+    assert reader.get("a") is None
+    assert reader.get("cc") == _vector_for("cc")
+    assert reader.get("ddd") == _vector_for("ddd")
+    assert len(list(tmp_path.glob("*.vectors"))) == 1
+
+
+def test_torn_append_is_not_read_at_shifted_offsets(tmp_path):
+    record_size = 32 + 3 * 4
+    cache = EmbeddingCache(cache_dir=str(tmp_path))
+    cache.embed_many(["a", "b"], _CountingEmbedder())
+    (data_path,) = tmp_path.glob("*.vectors")
+    with data_path.open("ab") as handle:
+        handle.write(b"\x00" * (record_size // 2))
+
+    cache.embed_many(["cc"], _CountingEmbedder())
+
+    reloaded = EmbeddingCache(cache_dir=str(tmp_path))
+    assert [reloaded.get(text) for text in ["a", "b", "cc"]] == [_vector_for(text) for text in ["a", "b", "cc"]]
+    assert [path.stat().st_size for path in tmp_path.glob("*.vectors")] == [record_size * 3]
+
+
+def test_concurrent_writers_do_not_recreate_rotated_generations(tmp_path):
+    record_size = 32 + 3 * 4
+    writers = [EmbeddingCache(cache_dir=str(tmp_path), max_disk_bytes=record_size * 3) for _ in range(4)]
+
+    def fill(cache, worker):
+        for index in range(60):
+            cache.put(f"{worker}-{index}", _vector_for(f"{worker}-{index}"))
+
+    threads = [threading.Thread(target=fill, args=(cache, worker)) for worker, cache in enumerate(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    files = list(tmp_path.glob("*.vectors"))
+    assert len(files) == 1
+    assert files[0].stat().st_size % record_size == 0
+
+
+def test_vector_index_build_reuses_cached_embeddings(tmp_path, monkeypatch):
+    pytest.importorskip("numpy")
+    embedder = Mock(side_effect=lambda texts, **kwargs: [_vector_for(text) for text in texts])
+    monkeypatch.setattr(vector_store_module, "embed_texts_batched", embedder)
+    documents = [{"id": "doc-1", "text": "Rent policy"}, {"id": "doc-2", "text": "Inspection notice"}]
+
+    vector_store_module.create_vector_index(documents, index_name="first", output_dir=str(tmp_path))
+    vector_store_module.create_vector_index(
+        [*documents, {"id": "doc-3", "text": "Late fee"}],
+        index_name="second",
+        output_dir=str(tmp_path),
+    )
+
+    assert [call.args[0] for call in embedder.call_args_list] == [["Rent policy", "Inspection notice"], ["Late fee"]]
+
+
+def test_indexer_and_optimizer_share_process_cache(monkeypatch):
+    from complaint_analysis.indexer import HybridDocumentIndexer
+
+    router = Mock()
+    router.embed_text = Mock(side_effect=lambda text: _vector_for(text))
+    monkeypatch.setattr(document_optimization, "EMBEDDINGS_AVAILABLE", True)
+    for _ in range(2):
+        optimizer = AgenticDocumentOptimizer(Mock())
+        optimizer._reset_runtime_state()
+        optimizer._embeddings_router = router
+        optimizer._rank_candidates(query="retaliation", candidates=[{"text": "Plaintiff was fired."}])
+
+    assert router.embed_text.call_count == 2
+    assert optimizer._router_usage_summary()["embedding_shared_cache_hits"] == 2
+
+    indexer = HybridDocumentIndexer(enable_embeddings=False)
+    indexer.embeddings_router = Mock()
+    indexer.embeddings_router.embed_text = Mock(side_effect=lambda text: asyncio.sleep(0, result=_vector_for(text)))
+    first = asyncio.run(indexer._embed_text("Rent policy"))
+    second = asyncio.run(indexer._embed_text("Rent policy"))
+
+    assert first == second == _vector_for("Rent policy")
+    assert indexer.embeddings_router.embed_text.call_count == 1
+    assert get_embedding_cache().stats()["entries"] == 3
+
+
+def test_set_embedding_cache_replaces_process_cache():
+    custom = EmbeddingCache(max_entries=8)
+    set_embedding_cache(custom)
+    assert get_embedding_cache() is custom
+    set_embedding_cache(None)
+    assert get_embedding_cache() is not custom
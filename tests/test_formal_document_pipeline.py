@@ -17,7 +17,7 @@ from complaint_phases.neurosymbolic_matcher import NeurosymbolicMatcher
 from applications.document_api import _annotate_review_links
 from document_pipeline import FormalComplaintDocumentBuilder
 from mediator import Mediator
-from mediator.formal_document import ComplaintDocumentBuilder, HAS_DOCX
+from mediator.formal_document import ComplaintDocumentBuilder, HAS_DOCX, _prune_near_duplicate_allegations
 
 
 pytestmark = pytest.mark.no_auto_network
@@ -2381,3 +2381,21 @@ def test_export_formal_complaint_docx_writes_file(tmp_path):
         document_xml = archive.read('word/document.xml').decode('utf-8')
     assert 'Protected Activity and Complaints' in document_xml
     assert 'Adverse Action and Retaliatory Conduct' in document_xml
+
+
+def test_prune_near_duplicate_allegations_drops_restatements_only():
+    allegations = [
+        'Plaintiff reported unpaid overtime to human resources on March 3, 2025.',
+        'Plaintiff reported the unpaid overtime to human resources on March 3, 2025 (see Exhibit A).',
+        'Defendant terminated Plaintiff and removed her key accounts after the overtime complaint.',
+        'Management stripped Plaintiff of major accounts, cut overtime, and terminated her employment.',
+        'Plaintiff lost wages and benefits.',
+        'Plaintiff requested a light duty accommodation for medical restrictions.',
+    ]
+
+    assert _prune_near_duplicate_allegations(allegations) == [
+        allegations[0],
+        allegations[2],
+        allegations[4],
+        allegations[5],
+    ]
@@ -0,0 +1,175 @@
+"""
+Tests for the adjacency, type and name indexes maintained by KnowledgeGraph
+and DependencyGraph.
+
+Every indexed lookup is compared against the equivalent full scan over the
+graph's public dicts so the indexes can never drift from the source of truth.
+"""
+
+from complaint_phases import (
+    KnowledgeGraph,
+    Entity,
+    Relationship,
+    DependencyGraph,
+    DependencyNode,
+    Dependency,
+    NodeType,
+    DependencyType,
+)
+
+
+def _scan_relationships(kg: KnowledgeGraph, entity_id: str):
+    return [
+        rel for rel in kg.relationships.values()
+        if rel.source_id == entity_id or rel.target_id == entity_id
+    ]
+
+
+def _scan_dependencies(graph: DependencyGraph, node_id: str, direction: str = 'both'):
+    deps = []
+    for dep in graph.dependencies.values():
+        if direction in ['incoming', 'both'] and dep.target_id == node_id:
+            deps.append(dep)
+        if direction in ['outgoing', 'both'] and dep.source_id == node_id:
+            deps.append(dep)
+    return deps
+
+
+def _build_knowledge_graph() -> KnowledgeGraph:
+    kg = KnowledgeGraph()
+    kg.add_entity(Entity(id='e1', type='person', name='Jane Doe'))
+    kg.add_entity(Entity(id='e2', type='organization', name='Acme Corp'))
+    kg.add_entity(Entity(id='e3', type='person', name='  john smith '))
+    kg.add_relationship(Relationship(id='r1', source_id='e1', target_id='e2', relation_type='employed_by'))
+    kg.add_relationship(Relationship(id='r2', source_id='e3', target_id='e2', relation_type='employed_by'))
+    kg.add_relationship(Relationship(id='r3', source_id='e2', target_id='e1', relation_type='terminated'))
+    kg.add_relationship(Relationship(id='r4', source_id='e1', target_id='e1', relation_type='self_reference'))
+    return kg
+
+
+def _build_dependency_graph() -> DependencyGraph:
+    graph = DependencyGraph()
+    graph.add_node(DependencyNode(id='c1', node_type=NodeType.CLAIM, name='Retaliation'))
+    graph.add_node(DependencyNode(id='r1', node_type=NodeType.REQUIREMENT, name='Protected Activity', satisfied=True))
+    graph.add_node(DependencyNode(id='r2', node_type=NodeType.REQUIREMENT, name='Adverse Action'))
+    graph.add_node(DependencyNode(id='ev1', node_type=NodeType.EVIDENCE, name='Email', satisfied=True))
+    graph.add_dependency(Dependency(id='d1', source_id='r1', target_id='c1', dependency_type=DependencyType.REQUIRES))
+    graph.add_dependency(Dependency(id='d2', source_id='r2', target_id='c1', dependency_type=DependencyType.REQUIRES))
+    graph.add_dependency(Dependency(id='d3', source_id='ev1', target_id='r2', dependency_type=DependencyType.SUPPORTS, required=False))
+    graph.add_dependency(Dependency(id='d4', source_id='c1', target_id='c1', dependency_type=DependencyType.DEPENDS_ON, required=False))
+    return graph
+
+
+class TestKnowledgeGraphIndexes:
+    """KnowledgeGraph index consistency."""
+
+    def test_relationship_lookup_matches_full_scan(self):
+        kg = _build_knowledge_graph()
+        for entity_id in ['e1', 'e2', 'e3', 'missing']:
+            assert kg.get_relationships_for_entity(entity_id) == _scan_relationships(kg, entity_id)
+
+    def test_directional_relationship_lookup(self):
+        kg = _build_knowledge_graph()
+        assert [r.id for r in kg.get_relationships_for_entity('e2', direction='incoming')] == ['r1', 'r2']
+        assert [r.id for r in kg.get_relationships_for_entity('e2', direction='outgoing')] == ['r3']
+
+    def test_type_and_name_lookup(self):
+        kg = _build_knowledge_graph()
+        assert [e.id for e in kg.get_entities_by_type('person')] == ['e1', 'e3']
+        assert kg.find_entity('PERSON', 'John Smith').id == 'e3'
+        assert kg.find_entity('organization', 'john smith') is None
+        assert [e.id for e in kg.find_entities_by_name('organization', 'acme corp')] == ['e2']
+
+    def test_overwriting_entity_moves_index_entries(self):
+        kg = _build_knowledge_graph()
+        kg.add_entity(Entity(id='e3', type='organization', name='Smith LLC'))
+        assert [e.id for e in kg.get_entities_by_type('person')] == ['e1']
+        assert kg.find_entity('person', 'john smith') is None
+        assert kg.find_entity('organization', 'smith llc').id == 'e3'
+
+    def test_overwriting_relationship_keeps_dict_order(self):
+        kg = _build_knowledge_graph()
+        kg.add_relationship(Relationship(id='r1', source_id='e3', target_id='e2', relation_type='managed_by'))
+        for entity_id in ['e1', 'e2', 'e3']:
+            assert kg.get_relationships_for_entity(entity_id) == _scan_relationships(kg, entity_id)
+
+    def test_remove_entity_cascades_relationships(self):
+        kg = _build_knowledge_graph()
+        removed = kg.remove_entity('e1')
+        assert removed.id == 'e1'
+        assert set(kg.relationships) == {'r2'}
+        assert kg.get_relationships_for_entity('e1') == []
+        assert kg.find_entity('person', 'jane doe') is None
+        assert kg.remove_entity('e1') is None
+
+    def test_merge_with_indexes_new_entities(self):
+        kg = _build_knowledge_graph()
+        other = KnowledgeGraph()
+        other.add_entity(Entity(id='e4', type='person', name='Pat Lee'))
+        other.add_relationship(Relationship(id='r5', source_id='e4', target_id='e2', relation_type='employed_by'))
+        kg.merge_with(other)
+        assert kg.find_entity('person', 'pat lee').id == 'e4'
+        assert kg.get_relationships_for_entity('e2') == _scan_relationships(kg, 'e2')
+
+    def test_from_dict_rebuilds_indexes(self):
+        kg = KnowledgeGraph.from_dict(_build_knowledge_graph().to_dict())
+        for entity_id in ['e1', 'e2', 'e3']:
+            assert kg.get_relationships_for_entity(entity_id) == _scan_relationships(kg, entity_id)
+        assert kg.find_entity('person', 'jane doe').id == 'e1'
+
+
+class TestDependencyGraphIndexes:
+    """DependencyGraph index consistency."""
+
+    def test_dependency_lookup_matches_full_scan(self):
+        graph = _build_dependency_graph()
+        for node_id in ['c1', 'r1', 'r2', 'ev1', 'missing']:
+            for direction in ['incoming', 'outgoing', 'both']:
+                assert graph.get_dependencies_for_node(node_id, direction) == _scan_dependencies(
+                    graph, node_id, direction
+                )
+
+    def test_type_and_name_lookup(self):
+        graph = _build_dependency_graph()
+        assert [n.id for n in graph.get_nodes_by_type(NodeType.REQUIREMENT)] == ['r1', 'r2']
+        assert graph.find_node(NodeType.REQUIREMENT, ' adverse action ').id == 'r2'
+        assert graph.find_node(NodeType.CLAIM, 'adverse action') is None
+        assert [n.id for n in graph.find_nodes_by_name(NodeType.EVIDENCE, 'EMAIL')] == ['ev1']
+
+    def test_unsatisfied_requirements_use_incoming_index(self):
+        graph = _build_dependency_graph()
+        unsatisfied = graph.find_unsatisfied_requirements()
+        assert [item['node_id'] for item in unsatisfied] == ['c1']
+        assert unsatisfied[0]['satisfied_count'] == 1
+        assert unsatisfied[0]['total_required'] == 2
+
+    def test_remove_node_cascades_dependencies(self):
+        graph = _build_dependency_graph()
+        removed = graph.remove_node('r2')
+        assert removed.id == 'r2'
+        assert set(graph.dependencies) == {'d1', 'd4'}
+        assert graph.check_satisfaction('c1')['satisfied'] is True
+        assert graph.find_node(NodeType.REQUIREMENT, 'adverse action') is None
+        assert graph.remove_node('r2') is None
+
+    def test_remove_dependency(self):
+        graph = _build_dependency_graph()
+        assert graph.remove_dependency('d2').id == 'd2'
+        assert graph.remove_dependency('d2') is None
+        assert graph.get_dependencies_for_node('c1', 'incoming') == _scan_dependencies(graph, 'c1', 'incoming')
+
+    def test_from_dict_rebuilds_indexes(self):
+        graph = DependencyGraph.from_dict(_build_dependency_graph().to_dict())
+        for node_id in ['c1', 'r1', 'r2', 'ev1']:
+            assert graph.get_dependencies_for_node(node_id) == _scan_dependencies(graph, node_id)
+        assert graph.find_node(NodeType.CLAIM, 'retaliation').id == 'c1'
+
+    def test_rebuild_indexes_after_direct_mutation(self):
+        graph = _build_dependency_graph()
+        graph.nodes['r3'] = DependencyNode(id='r3', node_type=NodeType.REQUIREMENT, name='Causation')
+        graph.dependencies['d5'] = Dependency(
+            id='d5', source_id='r3', target_id='c1', dependency_type=DependencyType.REQUIRES
+        )
+        graph.rebuild_indexes()
+        assert graph.get_dependencies_for_node('c1') == _scan_dependencies(graph, 'c1')
+        assert graph.find_node(NodeType.REQUIREMENT, 'causation').id == 'r3'
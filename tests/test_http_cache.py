@@ -0,0 +1,154 @@
+import json
+import time
+from unittest.mock import Mock
+
+from integrations.ipfs_datasets.http_cache import (
+    CachedHttpSession,
+    HttpResponseCache,
+    http_cache_key,
+)
+
+
+def _response(payload, *, status_code=200, headers=None, url="https://example.com/api"):
+    response = Mock()
+    response.status_code = status_code
+    response.url = url
+    response.content = json.dumps(payload).encode("utf-8")
+    response.encoding = "utf-8"
+    response.headers = headers or {"content-type": "application/json"}
+    response.json = Mock(return_value=payload)
+    response.raise_for_status = Mock()
+    return response
+
+
+def _session(cache, responses):
+    session = CachedHttpSession(cache)
+    session.session.get = Mock(side_effect=list(responses))
+    return session
+
+
+def test_cache_key_ignores_param_order():
+    first = http_cache_key("https://example.com/api", {"q": "housing", "page": 1})
+    second = http_cache_key("https://example.com/api", {"page": 1, "q": "housing"})
+
+    assert first == second
+    assert first != http_cache_key("https://example.com/api", {"q": "voucher", "page": 1})
+
+
+def test_fresh_hit_skips_network_and_counts_metrics():
+    session = _session(HttpResponseCache(), [_response({"results": [1]})])
+
+    first = session.get("https://example.com/api", params={"q": "housing"})
+    second = session.get("https://example.com/api", params={"q": "housing"})
+
+    assert first.from_cache is False
+    assert second.from_cache is True
+    assert second.json() == {"results": [1]}
+    assert session.session.get.call_count == 1
+    stats = session.stats()
+    assert stats["requests"] == 2
+    assert stats["network_requests"] == 1
+    assert stats["cache"]["hits"] == 1
+    assert stats["cache"]["misses"] == 1
+
+
+def test_stale_entry_is_revalidated_with_etag():
+    cache = HttpResponseCache(ttl_seconds=0)
+    original = _response({"results": [1]}, headers={"content-type": "application/json", "etag": '"v1"'})
+    not_modified = _response({}, status_code=304)
+    session = _session(cache, [original, not_modified])
+
+    session.get("https://example.com/api")
+    time.sleep(0.01)
+    revalidated = session.get("https://example.com/api")
+
+    assert revalidated.from_cache is True
+    assert revalidated.revalidated is True
+    assert revalidated.json() == {"results": [1]}
+    assert session.session.get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert session.stats()["not_modified"] == 1
+    assert cache.stats()["revalidated"] == 1
+
+
+def test_errors_are_not_cached():
+    session = _session(HttpResponseCache(), [_response({}, status_code=503), _response({"ok": True})])
+
+    session.get("https://example.com/api")
+    second = session.get("https://example.com/api")
+
+    assert second.from_cache is False
+    assert session.session.get.call_count == 2
+
+
+def test_identical_bodies_are_stored_once_and_size_bound_evicts_lru():
+    payload = {"text": "x" * 100}
+    body_size = len(json.dumps(payload).encode("utf-8"))
+    cache = HttpResponseCache(max_bytes=body_size * 2)
+
+    cache.put(http_cache_key("https://example.com/a"), _response(payload))
+    cache.put(http_cache_key("https://example.com/b"), _response(payload))
+    assert cache.stats()["stored_bytes"] == body_size
+
+    cache.put(http_cache_key("https://example.com/c"), _response({"text": "y" * 100}))
+    cache.put(http_cache_key("https://example.com/d"), _response({"text": "z" * 100}))
+
+    stats = cache.stats()
+    assert stats["stored_bytes"] <= body_size * 2
+    assert stats["evictions"] >= 2
+    assert cache.get(http_cache_key("https://example.com/a")) is None
+    assert cache.get(http_cache_key("https://example.com/d")) is not None
+
+
+def test_disk_cache_is_shared_across_instances(tmp_path):
+    writer = _session(HttpResponseCache(cache_dir=str(tmp_path)), [_response({"results": [2]})])
+    writer.get("https://example.com/api", params={"q": "ecfr"})
+
+    reader = _session(HttpResponseCache(cache_dir=str(tmp_path)), [])
+    response = reader.get("https://example.com/api", params={"q": "ecfr"})
+
+    assert response.from_cache is True
+    assert response.json() == {"results": [2]}
+    assert reader.session.get.call_count == 0
+
+
+def test_cache_key_includes_representation_headers():
+    url = "https://example.com/api"
+
+    assert http_cache_key(url, headers={"Accept": "application/json"}) != http_cache_key(
+        url, headers={"Accept": "text/html"}
+    )
+    assert http_cache_key(url, headers={"accept": "text/html"}) == http_cache_key(
+        url, headers={"Accept": "text/html"}
+    )
+
+
+def test_authorized_requests_bypass_the_cache():
+    cache = HttpResponseCache()
+    session = _session(cache, [_response({"user": "a"}), _response({"user": "b"}), _response({"public": True})])
+
+    first = session.get("https://example.com/api", headers={"Authorization": "Bearer a"})
+    second = session.get("https://example.com/api", headers={"Authorization": "Bearer b"})
+    public = session.get("https://example.com/api")
+
+    assert [first.json(), second.json()] == [{"user": "a"}, {"user": "b"}]
+    assert public.from_cache is False
+    assert session.session.get.call_count == 3
+    assert cache.stats()["stores"] == 1
+
+
+def test_vary_header_selects_matching_requests_only():
+    cache = HttpResponseCache()
+    english = _response({"lang": "en"}, headers={"content-type": "application/json", "vary": "X-Region"})
+    session = _session(cache, [english, _response({"lang": "fr"})])
+
+    session.get("https://example.com/api", headers={"X-Region": "us"})
+    hit = session.get("https://example.com/api", headers={"X-Region": "us"})
+    other = session.get("https://example.com/api", headers={"X-Region": "ca"})
+
+    assert hit.from_cache is True
+    assert other.from_cache is False
+    assert other.json() == {"lang": "fr"}
+
+    uncacheable = _session(HttpResponseCache(), [_response({}, headers={"vary": "*"}), _response({})])
+    uncacheable.get("https://example.com/api")
+    assert uncacheable.get("https://example.com/api").from_cache is False
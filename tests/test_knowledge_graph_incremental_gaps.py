@@ -0,0 +1,174 @@
+"""
+Tests for the incremental gap profiles behind KnowledgeGraph.find_gaps.
+
+Each scenario edits a graph (through the API or in place) and checks that
+the gaps match a graph rebuilt from scratch, and that only the touched
+entities were re-profiled.
+"""
+
+import copy
+import json
+from pathlib import Path
+
+from complaint_phases import (
+    ComplaintDenoiser,
+    DependencyGraph,
+    DependencyGraphBuilder,
+    Entity,
+    KnowledgeGraph,
+    KnowledgeGraphBuilder,
+    Relationship,
+)
+
+
+SESSION_DIR = (
+    Path(__file__).resolve().parents[1]
+    / "output" / "hacc_grounded_smoke" / "adversarial" / "sessions" / "session_20260322_003333_000"
+)
+
+_COMPLAINT = (
+    "My employer fired me on January 20, 2026 after I complained about "
+    "discrimination to human resources. My supervisor said I was a "
+    "troublemaker. I have emails and a termination letter, and I lost wages."
+)
+
+_ANSWERS = [
+    "It happened on February 3, 2026 and my manager Sam Lee made the decision.",
+    "I filed a grievance and asked for a hearing but they never replied.",
+    "I lost $4,000 in wages and I want reinstatement.",
+    "I reported it in writing on January 10, 2026, and I was fired because of it.",
+    "I don't remember the exact date.",
+]
+
+
+def _build_graph() -> KnowledgeGraph:
+    graph = KnowledgeGraph()
+    graph.add_entity(Entity(id='claim_1', type='claim', name='Retaliation',
+                            attributes={'claim_type': 'retaliation'}))
+    graph.add_entity(Entity(id='person_1', type='person', name='Sam Lee', confidence=0.6))
+    graph.add_entity(Entity(id='org_1', type='organization', name='Acme Corp'))
+    graph.add_entity(Entity(id='fact_1', type='fact', name='I was fired when I complained',
+                            attributes={'fact_type': 'timeline'}))
+    graph.add_relationship(Relationship(id='rel_1', source_id='person_1', target_id='org_1',
+                                        relation_type='employed_by'))
+    return graph
+
+
+def _fresh_gaps(graph: KnowledgeGraph):
+    return KnowledgeGraph.from_dict(json.loads(json.dumps(graph.to_dict()))).find_gaps()
+
+
+def _assert_matches_fresh(graph: KnowledgeGraph):
+    assert graph.find_gaps() == _fresh_gaps(graph)
+
+
+def _gap_types(graph: KnowledgeGraph):
+    return [gap['type'] for gap in graph.find_gaps()]
+
+
+class TestIncrementalGaps:
+    """Cached gap profiles stay equal to a full recompute."""
+
+    def test_second_call_reuses_every_entity(self):
+        graph = _build_graph()
+        graph.find_gaps()
+        graph.find_gaps()
+        stats = graph.gap_cache_stats()
+        assert stats['last_gaps_recomputed_entities'] == 0
+        assert stats['cached_entities'] == 4
+
+    def test_in_place_attribute_edit_reprofiles_only_that_entity(self):
+        graph = _build_graph()
+        assert 'missing_written_notice' not in _gap_types(graph)
+
+        graph.entities['fact_1'].attributes['description'] = 'They sent a termination letter'
+        assert 'missing_written_notice' in _gap_types(graph)
+        assert graph.gap_cache_stats()['last_gaps_recomputed_entities'] == 1
+        _assert_matches_fresh(graph)
+
+    def test_confidence_and_name_edits_are_tracked(self):
+        graph = _build_graph()
+        graph.find_gaps()
+        graph.entities['person_1'].confidence = 0.95
+        graph.entities['org_1'].name = 'Acme Housing'
+        gaps = graph.find_gaps()
+        assert not [gap for gap in gaps if gap['type'] == 'low_confidence_entity']
+        assert graph.gap_cache_stats()['last_gaps_recomputed_entities'] == 2
+        _assert_matches_fresh(graph)
+
+    def test_relationship_and_entity_removal_are_tracked(self):
+        graph = _build_graph()
+        graph.add_relationship(Relationship(id='rel_2', source_id='fact_1', target_id='claim_1',
+                                            relation_type='caused_by'))
+        assert 'retaliation_missing_causation_link' not in _gap_types(graph)
+
+        graph.remove_relationship('rel_2')
+        assert 'retaliation_missing_causation_link' in _gap_types(graph)
+        graph.remove_entity('org_1')
+        assert 'isolated_entity' in _gap_types(graph)
+        assert graph.gap_cache_stats()['cached_entities'] == 3
+        _assert_matches_fresh(graph)
+
+    def test_replacing_relationship_updates_relation_counts(self):
+        graph = _build_graph()
+        graph.add_relationship(Relationship(id='rel_2', source_id='fact_1', target_id='claim_1',
+                                            relation_type='occurred_on'))
+        graph.find_gaps()
+        graph.add_relationship(Relationship(id='rel_2', source_id='fact_1', target_id='claim_1',
+                                            relation_type='related_to'))
+        _assert_matches_fresh(graph)
+
+    def test_deepcopy_keeps_profiles_independent(self):
+        graph = _build_graph()
+        graph.find_gaps()
+        clone = copy.deepcopy(graph)
+        clone.entities['fact_1'].attributes['description'] = 'Email dated 2026-01-20 denied my appeal'
+        _assert_matches_fresh(clone)
+        _assert_matches_fresh(graph)
+        assert graph.gap_cache_stats()['last_gaps_recomputed_entities'] == 0
+
+    def test_returned_gaps_do_not_alias_cache(self):
+        graph = _build_graph()
+        first = graph.find_gaps()
+        first[0]['entity_name'] = 'changed'
+        assert graph.find_gaps()[0]['entity_name'] == 'Sam Lee'
+
+
+class TestIncrementalGapsReplay:
+    """Replayed intake turns produce the same gaps as a fresh graph."""
+
+    def test_recorded_session_graph_matches_fresh(self):
+        data = json.loads((SESSION_DIR / "knowledge_graph.json").read_text())
+        graph = KnowledgeGraph.from_dict(data)
+        graph.find_gaps()
+        graph.reset_gap_cache_stats()
+        dependency_graph = DependencyGraph.from_dict(
+            json.loads((SESSION_DIR / "dependency_graph.json").read_text())
+        )
+
+        session = json.loads((SESSION_DIR / "session.json").read_text())
+        answers = [
+            turn['content'] for turn in session['conversation_history']
+            if turn.get('role') == 'complainant' and turn.get('content')
+        ]
+        denoiser = ComplaintDenoiser()
+        for answer in answers + _ANSWERS:
+            questions = denoiser.generate_questions(graph, dependency_graph, max_questions=3)
+            question = questions[0] if questions else {'type': 'clarification', 'question': '', 'context': {}}
+            denoiser.process_answer(question, answer, graph, dependency_graph)
+            _assert_matches_fresh(graph)
+        assert graph.gap_cache_stats()['entity_profile_cache_hits'] > 0
+
+    def test_synthetic_turns_match_fresh(self):
+        graph = KnowledgeGraphBuilder().build_from_text(_COMPLAINT)
+        dependency_graph = DependencyGraphBuilder().build_from_claims(
+            [{'name': 'Retaliation', 'type': 'retaliation'}], {}
+        )
+        denoiser = ComplaintDenoiser()
+        for turn in range(20):
+            questions = denoiser.generate_questions(graph, dependency_graph, max_questions=5)
+            if not questions:
+                break
+            denoiser.process_answer(questions[turn % len(questions)], _ANSWERS[turn % len(_ANSWERS)],
+                                    graph, dependency_graph)
+            _assert_matches_fresh(graph)
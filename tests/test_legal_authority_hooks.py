@@ -250,7 +250,7 @@ class TestLegalAuthoritySearchHook:
             mock_response.json = Mock(return_value=ecfr_payload)
 
             with patch('mediator.legal_authority_hooks.search_federal_register', new=None):
-                with patch('mediator.legal_authority_hooks.requests.get', return_value=mock_response):
+                with patch.object(hook._http_session, 'get', return_value=mock_response):
                     results = hook.search_federal_register('24 CFR 982.555 housing voucher hearing', max_results=5)
 
             assert results
@@ -287,7 +287,7 @@ class TestLegalAuthoritySearchHook:
             mock_response.json = Mock(return_value=courtlistener_payload)
 
             with patch('mediator.legal_authority_hooks.search_recap_documents', new=None):
-                with patch('mediator.legal_authority_hooks.requests.get', return_value=mock_response):
+                with patch.object(hook._http_session, 'get', return_value=mock_response):
                     results = hook.search_case_law('housing authority informal hearing', jurisdiction='pa', max_results=5)
 
             assert results
@@ -338,7 +338,7 @@ class TestLegalAuthoritySearchHook:
             mock_response.text = '<html><head><title>42 U.S.C. § 3604 - Discrimination in the sale or rental of housing</title></head></html>'
 
             with patch('mediator.legal_authority_hooks.search_us_code', new=None):
-                with patch('mediator.legal_authority_hooks.requests.get', return_value=mock_response):
+                with patch.object(hook._http_session, 'get', return_value=mock_response):
                     results = hook.search_us_code('fair housing reasonable accommodation voucher', max_results=5)
 
             assert results
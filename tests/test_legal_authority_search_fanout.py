@@ -0,0 +1,162 @@
+"""End-to-end fan-out tests for LegalAuthoritySearchHook.search_all_sources.
+
+The eCFR and CourtListener fallbacks are pointed at local stub HTTP servers
+with artificial latency so the concurrency and deadline behaviour is
+exercised over real sockets.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+from urllib.parse import urlsplit
+
+import pytest
+
+from mediator.legal_authority_hooks import LegalAuthoritySearchHook
+
+
+pytestmark = pytest.mark.no_auto_network
+
+ECFR_PAYLOAD = {
+    "results": [
+        {
+            "hierarchy": {"title": "29", "part": "1614", "subpart": "A", "section": "1614.101"},
+            "headings": {"section": "Retaliation prohibited"},
+            "full_text_excerpt": "No person shall be subject to retaliation for opposing discrimination.",
+        }
+    ]
+}
+COURTLISTENER_PAYLOAD = {
+    "results": [
+        {
+            "caseName": "Smith v. Retaliation Employer",
+            "court": "9th Cir.",
+            "snippet": "retaliation claim",
+            "absolute_url": "/opinion/1/smith/",
+        }
+    ]
+}
+
+
+class _StubServer:
+    def __init__(self, payload, delay):
+        self.delay = delay
+        self.requests = 0
+        stub = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub.requests += 1
+                time.sleep(stub.delay)
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub_sources():
+    servers = {
+        "www.ecfr.gov": _StubServer(ECFR_PAYLOAD, delay=0.6),
+        "www.courtlistener.com": _StubServer(COURTLISTENER_PAYLOAD, delay=0.6),
+    }
+    yield servers
+    for server in servers.values():
+        server.close()
+
+
+def _hook_against(servers):
+    hook = LegalAuthoritySearchHook(Mock())
+    original_get_json = hook._http_get_json
+
+    def _routed_get_json(url, *, params=None):
+        parts = urlsplit(url)
+        return original_get_json(servers[parts.netloc].base_url + parts.path, params=params)
+
+    hook._http_get_json = _routed_get_json
+    hook.search_state_laws = Mock(return_value=[])
+    hook.search_administrative_law = Mock(return_value=[])
+    hook.search_us_code = Mock(return_value=[])
+    hook.search_web_archives = Mock(return_value=[])
+    hook.search_federal_register = lambda query, max_results=10: hook._search_ecfr_fallback(query, max_results=max_results)
+    hook.search_case_law = lambda query, jurisdiction=None, max_results=10: hook._search_courtlistener_fallback(
+        query, jurisdiction=jurisdiction, max_results=max_results
+    )
+    return hook
+
+
+def _timed_search(hook, **kwargs):
+    start = time.perf_counter()
+    results = hook.search_all_sources("retaliation", **kwargs)
+    return results, time.perf_counter() - start
+
+
+def test_latency_tracks_slowest_source_not_the_sum(stub_sources):
+    sequential_hook = _hook_against(stub_sources)
+    sequential_hook.search_max_workers = 1
+    _, sequential_seconds = _timed_search(sequential_hook)
+    sequential_hook._http_session.cache.clear()
+
+    hook = _hook_against(stub_sources)
+    results, parallel_seconds = _timed_search(hook)
+
+    assert results["regulations"][0]["citation"] == "29 C.F.R. § 1614.101"
+    assert results["case_law"][0]["title"] == "Smith v. Retaliation Employer"
+    assert sequential_seconds >= 1.2
+    assert parallel_seconds < 1.0
+    assert results["search_diagnostics"]["source_status"]["case_law"]["status"] == "ok"
+
+
+def test_slow_source_misses_deadline_and_returns_partial_results(stub_sources):
+    stub_sources["www.courtlistener.com"].delay = 2.0
+    hook = _hook_against(stub_sources)
+
+    results, elapsed = _timed_search(hook, source_deadlines={"case_law": 0.8})
+
+    status = results["search_diagnostics"]["source_status"]
+    assert elapsed < 1.5
+    assert results["regulations"]
+    assert results["case_law"] == []
+    assert status["case_law"]["status"] == "timeout"
+    assert status["regulations"]["status"] == "ok"
+    hook.mediator.log.assert_any_call(
+        "legal_authority_search_timeout", search_type="case_law", deadline_seconds=0.8
+    )
+
+
+def test_repeat_searches_are_served_from_the_source_cache(stub_sources):
+    hook = _hook_against(stub_sources)
+    first, _ = _timed_search(hook)
+    requests_after_first = {host: server.requests for host, server in stub_sources.items()}
+
+    second, elapsed = _timed_search(hook)
+
+    assert elapsed < 0.3
+    assert second["regulations"] == first["regulations"]
+    assert {host: server.requests for host, server in stub_sources.items()} == requests_after_first
+    assert second["search_diagnostics"]["source_status"]["regulations"]["status"] == "cached"
+
+    hook.clear_source_cache()
+    hook._http_session.cache.clear()
+    _timed_search(hook)
+    assert stub_sources["www.ecfr.gov"].requests > requests_after_first["www.ecfr.gov"]
@@ -4,6 +4,8 @@ from email.message import EmailMessage
 from pathlib import Path
 import zipfile
 
+import pytest
+
 from complaint_generator.local_evidence_import import import_local_evidence
 from complaint_generator.workspace import ComplaintWorkspaceService
 
@@ -139,3 +141,154 @@ def test_import_local_evidence_can_auto_assign_claim_element_from_content(tmp_pa
     session = service.get_session("case-user")["session"]
     documents = session["evidence"]["documents"]
     assert documents[0]["claim_element_id"] == "protected_activity"
+
+
+def test_import_local_evidence_saves_large_mbox_in_one_workspace_batch(tmp_path, monkeypatch):
+    workspace_root = tmp_path / "sessions"
+    service = ComplaintWorkspaceService(root_dir=workspace_root)
+
+    archive_path = tmp_path / "bulk.mbox"
+    box = mailbox.mbox(str(archive_path))
+    for index in range(40):
+        message = EmailMessage()
+        message["Subject"] = f"Update {index}"
+        message["From"] = "hr@example.com"
+        message["To"] = "employee@example.com"
+        message.set_content(f"Message body {index}")
+        box.add(message)
+    box.flush()
+    box.close()
+
+    save_calls = []
+    original_save_many = service.save_evidence_many
+    monkeypatch.setattr(
+        service,
+        "save_evidence_many",
+        lambda user_id, items: save_calls.append(len(items)) or original_save_many(user_id, items),
+    )
+    monkeypatch.setattr(service, "save_evidence", lambda *args, **kwargs: pytest.fail("per-item save"))
+
+    payload = import_local_evidence(
+        paths=[archive_path],
+        user_id="case-user",
+        claim_element_id="causation",
+        workspace_root=workspace_root,
+        evidence_root=tmp_path / "evidence",
+        service=service,
+    )
+
+    assert save_calls == [40]
+    assert [item["workspace_evidence_id"] for item in payload["imported"]] == [f"documents-{index}" for index in range(1, 41)]
+    documents = service.get_session("case-user")["session"]["evidence"]["documents"]
+    assert [record["title"] for record in documents] == [f"Mailbox import: Update {index}" for index in range(40)]
+
+
+def test_import_local_evidence_resumes_after_interruption_and_reports_progress(tmp_path, monkeypatch):
+    from complaint_generator import local_evidence_import as local_evidence_import_module
+
+    workspace_root = tmp_path / "sessions"
+    service = ComplaintWorkspaceService(root_dir=workspace_root)
+
+    archive_path = tmp_path / "resume.mbox"
+    box = mailbox.mbox(str(archive_path))
+    for index in range(10):
+        message = EmailMessage()
+        message["Subject"] = f"Notice {index}"
+        message["From"] = "hr@example.com"
+        message["To"] = "employee@example.com"
+        message.set_content(f"Notice body {index}")
+        box.add(message)
+    box.flush()
+    box.close()
+
+    original_import_message = local_evidence_import_module._import_mbox_message
+
+    def interrupted_import_message(**kwargs):
+        if kwargs["message_index"] == 7:
+            raise OSError("disk unplugged")
+        return original_import_message(**kwargs)
+
+    import_options = {
+        "paths": [archive_path],
+        "user_id": "case-user",
+        "claim_element_id": "causation",
+        "workspace_root": workspace_root,
+        "evidence_root": tmp_path / "evidence",
+        "service": service,
+        "max_workers": 1,
+        "resume": True,
+    }
+    monkeypatch.setattr(local_evidence_import_module, "_import_mbox_message", interrupted_import_message)
+    with pytest.raises(OSError):
+        import_local_evidence(**import_options)
+    committed = service.get_session("case-user")["session"]["evidence"]["documents"]
+    assert [record["title"] for record in committed] == [f"Mailbox import: Notice {index}" for index in range(6)]
+
+    monkeypatch.setattr(local_evidence_import_module, "_import_mbox_message", original_import_message)
+    snapshots = []
+    payload = import_local_evidence(**import_options, progress_callback=snapshots.append)
+
+    assert payload["resumed_skip_count"] == 6
+    assert payload["imported_count"] == 4
+    documents = service.get_session("case-user")["session"]["evidence"]["documents"]
+    assert [record["title"] for record in documents] == [f"Mailbox import: Notice {index}" for index in range(10)]
+    assert snapshots[-1]["done"] is True
+    assert snapshots[-1]["processed_count"] == 4
+    assert snapshots[-1]["bytes_processed"] > 0
+    assert payload["throughput"] == snapshots[-1]
+
+
+def test_import_local_evidence_only_records_a_manifest_when_resumable(tmp_path):
+    source_file = tmp_path / "timeline.txt"
+    source_file.write_text("Notice arrived late.", encoding="utf-8")
+    import_options = {
+        "paths": [source_file],
+        "user_id": "case-user",
+        "claim_element_id": "causation",
+        "workspace_root": tmp_path / "sessions",
+        "evidence_root": tmp_path / "evidence",
+    }
+
+    import_local_evidence(**import_options)
+    assert not list((tmp_path / "evidence").rglob("import_manifest.jsonl"))
+
+    import_local_evidence(**import_options, resume=True)
+    assert len(list((tmp_path / "evidence").rglob("import_manifest.jsonl"))) == 1
+
+
+def test_failed_zip_member_stops_running_members_before_the_archive_closes(tmp_path, monkeypatch):
+    import threading
+    import time
+
+    from complaint_generator import local_evidence_import as local_evidence_import_module
+
+    archive_path = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.writestr("first.txt", "first")
+        archive.writestr("second.txt", "second")
+
+    original_import_member = local_evidence_import_module._import_zip_member
+    second_started = threading.Event()
+    archive_closed_while_running = []
+
+    def failing_import_member(**kwargs):
+        if kwargs["member_index"] == 1:
+            second_started.wait(5)
+            raise OSError("unreadable member")
+        second_started.set()
+        time.sleep(0.2)
+        archive_closed_while_running.append(kwargs["archive"].fp is None)
+        return original_import_member(**kwargs)
+
+    monkeypatch.setattr(local_evidence_import_module, "_import_zip_member", failing_import_member)
+    with pytest.raises(OSError):
+        import_local_evidence(
+            paths=[archive_path],
+            user_id="case-user",
+            claim_element_id="causation",
+            workspace_root=tmp_path / "sessions",
+            evidence_root=tmp_path / "evidence",
+            max_workers=2,
+        )
+
+    assert archive_closed_while_running == [False]
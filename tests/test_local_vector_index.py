@@ -0,0 +1,245 @@
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import integrations.ipfs_datasets.vector_index as vector_index_module
+import integrations.ipfs_datasets.vector_store as vector_store_module
+from integrations.ipfs_datasets.vector_index import LocalVectorIndex
+
+
+DOCUMENTS = [
+    {"id": "rent", "text": "Rent contribution policy", "metadata": {"kind": "rule"}},
+    {"id": "inspection", "text": "Inspection standards", "metadata": {"kind": "section"}},
+    {"id": "notice", "text": "Termination notice", "metadata": {"kind": "letter"}},
+]
+VECTORS = [[3.0, 0.0, 0.0], [0.0, 2.0, 0.0], [0.0, 0.5, 0.5]]
+
+
+def _full_scan(vectors, query, top_k):
+    matrix = np.asarray(vectors, dtype=np.float32)
+    query = np.asarray(query, dtype=np.float32)
+    scores = matrix @ query / np.maximum(np.linalg.norm(matrix, axis=1) * np.linalg.norm(query), 1e-12)
+    return [int(index) for index in np.argsort(-scores, kind="stable")[:top_k]]
+
+
+def _index_files(index_dir, index_name):
+    return sorted(path.name for path in index_dir.glob(f"{index_name}.*") if not path.name.endswith(".manifest.json"))
+
+
+def _manifest_files(index):
+    keys = ("vectors_file", "records_file", "offsets_file", "ids_file")
+    return sorted(segment.entry[key] for segment in index.segments for key in keys)
+
+
+def _fake_embed(texts, **kwargs):
+    vectors = []
+    for text in texts:
+        lowered = text.lower()
+        vectors.append([
+            float("rent" in lowered),
+            float("inspection" in lowered or "notice" in lowered),
+            float("fee" in lowered or "notice" in lowered),
+        ])
+    return vectors
+
+
+def test_vectors_are_stored_normalized_and_memory_mapped(tmp_path):
+    index = LocalVectorIndex.create(tmp_path, "idx", DOCUMENTS, VECTORS)
+    reopened = LocalVectorIndex.open(tmp_path, "idx")
+
+    vectors = reopened.segments[0].vectors
+    assert isinstance(vectors, np.memmap)
+    assert vectors.dtype == np.float32
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+    for query in ([1.0, 0.1, 0.0], [0.0, 1.0, 1.0]):
+        expected = [DOCUMENTS[i]["id"] for i in _full_scan(VECTORS, query, 2)]
+        assert [row["id"] for row in reopened.search(query, 2)] == expected
+    index.close()
+    reopened.close()
+
+
+def test_search_only_decodes_returned_records(tmp_path, monkeypatch):
+    LocalVectorIndex.create(tmp_path, "idx", DOCUMENTS, VECTORS).close()
+    index = LocalVectorIndex.open(tmp_path, "idx")
+    decoded = []
+    original_loads = json.loads
+    monkeypatch.setattr(
+        "integrations.ipfs_datasets.vector_index.json.loads",
+        lambda payload, *a, **k: decoded.append(payload) or original_loads(payload, *a, **k),
+    )
+
+    results = index.search([1.0, 0.0, 0.0], top_k=1)
+
+    assert [row["id"] for row in results] == ["rent"]
+    assert results[0]["metadata"] == {"kind": "rule"}
+    assert len(decoded) == 1
+    index.close()
+
+
+def test_append_and_delete_segments_without_rebuilding(tmp_path):
+    index = LocalVectorIndex.create(tmp_path, "idx", DOCUMENTS, VECTORS)
+    base_path = index.segments[0].vectors_path
+    base_vectors = base_path.read_bytes()
+
+    summary = index.append(
+        [
+            {"id": "fee", "text": "Late fee", "metadata": {}},
+            {"id": "rent", "text": "Rent update", "metadata": {"kind": "amended"}},
+        ],
+        [[0.0, 0.0, 4.0], [1.0, 0.0, 0.0]],
+    )
+    assert summary == {"appended": 2, "replaced": 1, "segment": 1}
+    assert base_path.read_bytes() == base_vectors
+
+    reopened = LocalVectorIndex.open(tmp_path, "idx")
+    assert reopened.document_count == 4
+    assert [row["text"] for row in reopened.search([1.0, 0.0, 0.0], 1)] == ["Rent update"]
+    assert [row["id"] for row in reopened.search([0.0, 0.0, 1.0], 2)] == ["fee", "notice"]
+
+    assert reopened.delete(["fee", "missing"]) == 1
+    reopened.close()
+    reopened = LocalVectorIndex.open(tmp_path, "idx")
+    assert [row["id"] for row in reopened.search([0.0, 0.0, 1.0], 10)] == ["notice", "inspection", "rent"]
+
+    reopened.compact()
+    assert len(reopened.segments) == 1
+    assert _index_files(tmp_path, "idx") == _manifest_files(reopened)
+    assert sorted(LocalVectorIndex.open(tmp_path, "idx").segments[0].ids()) == ["inspection", "notice", "rent"]
+
+
+def test_create_replaces_files_without_disturbing_open_index(tmp_path):
+    warm = LocalVectorIndex.create(tmp_path, "idx", DOCUMENTS, VECTORS)
+    warm.append([{"id": "fee", "text": "Late fee", "metadata": {}}], [[0.0, 0.0, 4.0]])
+    before = [[row["id"] for row in warm.search(query, 4)] for query in VECTORS]
+
+    replacement = [{"id": f"new-{number}", "text": f"New {number}", "metadata": {}} for number in range(5)]
+    LocalVectorIndex.create(tmp_path, "idx", replacement, np.eye(5, 3, dtype=np.float32)).close()
+
+    assert [[row["id"] for row in warm.search(query, 4)] for query in VECTORS] == before
+    assert sorted(warm._locations()) == ["fee", "inspection", "notice", "rent"]
+    assert not list(tmp_path.glob(".*.tmp"))
+    reopened = LocalVectorIndex.open(tmp_path, "idx")
+    assert _index_files(tmp_path, "idx") == _manifest_files(reopened)
+    assert sorted(reopened.segments[0].ids()) == [record["id"] for record in replacement]
+    warm.close()
+    reopened.close()
+
+
+def test_interrupted_create_leaves_previous_generation_whole(tmp_path, monkeypatch):
+    LocalVectorIndex.create(tmp_path, "idx", DOCUMENTS, VECTORS).close()
+    before = {name: (tmp_path / name).read_bytes() for name in _index_files(tmp_path, "idx")}
+
+    def _crash(path, payload):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(vector_index_module, "_write_json_atomic", _crash)
+    replacement = [{"id": f"new-{number}", "text": f"New {number}", "metadata": {}} for number in range(5)]
+    with pytest.raises(OSError):
+        LocalVectorIndex.create(tmp_path, "idx", replacement, np.eye(5, 3, dtype=np.float32))
+
+    assert all((tmp_path / name).read_bytes() == data for name, data in before.items())
+    reopened = LocalVectorIndex.open(tmp_path, "idx")
+    assert sorted(reopened.segments[0].ids()) == sorted(document["id"] for document in DOCUMENTS)
+    reopened.close()
+
+
+def test_staging_paths_are_unique_per_writer(tmp_path):
+    target = tmp_path / "idx.manifest.json"
+    assert vector_index_module._staging_path(target) != vector_index_module._staging_path(target)
+
+
+def test_open_reads_and_upgrades_unsegmented_indexes(tmp_path):
+    np.save(tmp_path / "old.vectors.npy", np.asarray(VECTORS, dtype=np.float32))
+    (tmp_path / "old.records.jsonl").write_text(
+        "".join(json.dumps(document) + "\n" for document in DOCUMENTS) + "\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "old.manifest.json").write_text(json.dumps({"index_name": "old", "document_count": 3}))
+
+    index = LocalVectorIndex.open(tmp_path, "old")
+    assert [row["id"] for row in index.search([0.0, 1.0, 1.0], 3)] == [
+        DOCUMENTS[i]["id"] for i in _full_scan(VECTORS, [0.0, 1.0, 1.0], 3)
+    ]
+
+    index.append([{"id": "fee", "text": "Late fee", "metadata": {}}], [[0.0, 0.0, 1.0]])
+    upgraded = json.loads((tmp_path / "old.manifest.json").read_text())
+    assert upgraded["format_version"] == 2
+    assert upgraded["normalized"] is True
+    reopened = LocalVectorIndex.open(tmp_path, "old")
+    assert reopened.document_count == 4
+    assert _index_files(tmp_path, "old") == _manifest_files(reopened)
+
+
+def test_vector_store_append_and_delete_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(vector_store_module, "embed_texts_batched", _fake_embed)
+    created = vector_store_module.create_vector_index(DOCUMENTS[:2], index_name="idx", output_dir=str(tmp_path))
+    appended = vector_store_module.append_to_vector_index(
+        [{"id": "fee", "text": "Late fee notice"}],
+        index_name="idx",
+        index_dir=str(tmp_path),
+    )
+    found = vector_store_module.search_vector_index("late fee", index_name="idx", index_dir=str(tmp_path), top_k=1)
+    deleted = vector_store_module.delete_from_vector_index(["fee"], index_name="idx", index_dir=str(tmp_path))
+    after = vector_store_module.search_vector_index("late fee", index_name="idx", index_dir=str(tmp_path), top_k=5)
+
+    assert created["status"] == "success"
+    assert appended["status"] == "success"
+    assert appended["total_document_count"] == 3
+    assert [row["id"] for row in found["results"]] == ["fee"]
+    assert deleted["deleted"] == 1
+    assert "fee" not in [row["id"] for row in after["results"]]
+    missing = vector_store_module.append_to_vector_index([DOCUMENTS[2]], index_name="nope", index_dir=str(tmp_path))
+    assert missing["status"] == "error"
+
+
+def test_vector_index_handle_stays_warm_until_manifest_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(vector_store_module, "embed_texts_batched", _fake_embed)
+    vector_store_module.create_vector_index(DOCUMENTS, index_name="idx", output_dir=str(tmp_path))
+    handle = vector_store_module.get_vector_index_handle(tmp_path, "idx")
+
+    for query in ("rent", "inspection", "notice"):
+        vector_store_module.search_vector_index(query, index_name="idx", index_dir=str(tmp_path))
+    assert handle.stats["loads"] == 1
+
+    vector_store_module.append_to_vector_index(
+        [{"id": "fee", "text": "Late fee"}], index_name="idx", index_dir=str(tmp_path)
+    )
+    assert [row["id"] for row in handle.search("fee", 1)] == ["fee"]
+    assert handle.stats["loads"] == 2
+    vector_store_module.clear_vector_index_handles()
+
+
+def test_search_many_embeds_once_and_matches_single_queries(tmp_path, monkeypatch):
+    calls = []
+
+    def _recording_embed(texts, **kwargs):
+        calls.append(list(texts))
+        return _fake_embed(texts)
+
+    monkeypatch.setattr(vector_store_module, "embed_texts_batched", _recording_embed)
+    vector_store_module.create_vector_index(DOCUMENTS, index_name="idx", output_dir=str(tmp_path))
+    queries = ["rent policy", "inspection", "notice of fee"]
+
+    batch = vector_store_module.search_vector_index_many(
+        queries, index_name="idx", index_dir=str(tmp_path), top_k=2
+    )
+
+    assert calls[-1] == queries
+    assert batch["status"] == "success"
+    assert batch["metadata"]["batch_size"] == 3
+    for query, results in zip(queries, batch["results"]):
+        single = vector_store_module.search_vector_index(query, index_name="idx", index_dir=str(tmp_path), top_k=2)
+        assert results == single["results"]
+    vector_store_module.clear_vector_index_handles()
+
+
+def test_vector_index_handles_are_bounded(tmp_path):
+    handles = [
+        vector_store_module.get_vector_index_handle(tmp_path, f"idx{number}", max_handles=2)
+        for number in range(3)
+    ]
+    assert vector_store_module.get_vector_index_handle(tmp_path, "idx2", max_handles=2) is handles[2]
+    assert vector_store_module.get_vector_index_handle(tmp_path, "idx0", max_handles=2) is not handles[0]
+    vector_store_module.clear_vector_index_handles()
@@ -0,0 +1,233 @@
+"""
+Tests for the bounded mediator log and the bounded PhaseManager loss history.
+"""
+
+import copy
+import gc
+import json
+import os
+import pickle
+import tracemalloc
+from unittest.mock import Mock
+
+import pytest
+
+from complaint_phases import ComplaintPhase, PhaseManager
+from mediator.log_store import SPILL_KEY, MediatorLog, is_spill_ref
+from mediator.state import State
+
+
+def _prompt(turn: int, size: int = 8000) -> str:
+    return (f"turn {turn}: please summarize the complainant's answer. " * (size // 40))[:size]
+
+
+class TestMediatorLog:
+    """Tests for MediatorLog."""
+
+    def test_keeps_most_recent_entries(self):
+        log = MediatorLog(limit=3, spill_threshold=0)
+        for index in range(5):
+            log.append({'type': 'event', 'index': index})
+
+        assert [entry['index'] for entry in log] == [2, 3, 4]
+        assert log[-1]['index'] == 4
+        assert log.stats()['dropped'] == 2
+        assert log.total == 5
+
+    def test_large_payloads_spill_and_load_lazily(self, tmp_path):
+        log = MediatorLog(limit=10, spill_dir=str(tmp_path), spill_threshold=100)
+        prompt = _prompt(1, 500)
+        log.append({'type': 'backend_query', 'prompt': prompt, 'response': 'ok'})
+        log.append('No username or password provided')
+
+        entry = log[0]
+        assert is_spill_ref(entry['prompt'])
+        assert entry['prompt'][SPILL_KEY]['chars'] == 500
+        assert entry['response'] == 'ok'
+        assert log.read_payload(entry['prompt']) == prompt
+        assert list(log.iter_entries(0, 1, resolve=True))[0]['prompt'] == prompt
+        assert list(log.iter_entries(1)) == ['No username or password provided']
+        assert len(json.dumps(log)) < len(prompt)
+        assert list(tmp_path.glob('*.seg'))
+
+    def test_segments_roll_over_and_keep_offsets(self, tmp_path):
+        log = MediatorLog(limit=50, spill_dir=str(tmp_path), spill_threshold=10, segment_bytes=256)
+        prompts = [_prompt(turn, 400) + str(turn) for turn in range(20)]
+        for prompt in prompts:
+            log.append({'type': 'backend_query', 'prompt': prompt})
+
+        assert len(list(tmp_path.glob('*.seg'))) > 1
+        assert [entry['prompt'] for entry in log.iter_entries(resolve=True)] == prompts
+
+    def test_trimmed_segments_are_deleted(self, tmp_path):
+        log = MediatorLog(limit=5, spill_dir=str(tmp_path), spill_threshold=10, segment_bytes=256)
+        prompts = [_prompt(turn, 400) + str(turn) for turn in range(200)]
+        for prompt in prompts[:100]:
+            log.append({'type': 'backend_query', 'prompt': prompt})
+        snapshot = copy.deepcopy(log)
+        for prompt in prompts[100:]:
+            log.append({'type': 'backend_query', 'prompt': prompt})
+
+        assert len(list(tmp_path.glob('*.seg'))) < 10
+        assert [entry['prompt'] for entry in log.iter_entries(resolve=True)] == prompts[-5:]
+        assert [entry['prompt'] for entry in snapshot.iter_entries(resolve=True)] == prompts[95:100]
+
+    def test_spill_dir_is_capped(self, tmp_path):
+        for index in range(3):
+            old = tmp_path / f'log-1-0000{index}.seg'
+            old.write_bytes(b'x' * 1000)
+            os.utime(old, (index, index))
+        log = MediatorLog(spill_dir=str(tmp_path), spill_threshold=10, max_spill_bytes=1500)
+        log.append({'prompt': _prompt(1, 100)})
+
+        assert sorted(path.name for path in tmp_path.glob('log-1-*.seg')) == ['log-1-00002.seg']
+        assert log.resolve_entry(log[0])['prompt'] == _prompt(1, 100)
+
+    def test_missing_segment_keeps_reference(self, tmp_path):
+        log = MediatorLog(spill_dir=str(tmp_path), spill_threshold=10)
+        log.append({'prompt': _prompt(1, 100)})
+        for segment in tmp_path.glob('*.seg'):
+            segment.unlink()
+
+        assert is_spill_ref(log.resolve_entry(log[0])['prompt'])
+
+    def test_references_resolve_only_inside_spill_dir(self, tmp_path):
+        secret = tmp_path / 'secret.seg'
+        secret.write_bytes(b'not a log segment')
+        log = MediatorLog(spill_dir=str(tmp_path / 'spill'), spill_threshold=10)
+        log.append({'prompt': _prompt(1, 100)})
+        assert 'directory' not in log[0]['prompt'][SPILL_KEY]
+
+        for name in ('../secret.seg', str(secret), 'log-1-00001.seg/..', None):
+            forged = {SPILL_KEY: {**log[0]['prompt'][SPILL_KEY], 'segment': name}}
+            with pytest.raises(ValueError):
+                log.read_payload(forged)
+            assert log.resolve_entry({'prompt': forged})['prompt'] == forged
+
+    def test_copy_and_pickle_keep_settings(self, tmp_path):
+        log = MediatorLog(limit=2, spill_dir=str(tmp_path), spill_threshold=10)
+        for index in range(3):
+            log.append({'index': index, 'prompt': _prompt(index, 50)})
+
+        for clone in (copy.deepcopy(log), pickle.loads(pickle.dumps(log))):
+            assert isinstance(clone, MediatorLog)
+            assert clone == log
+            assert clone.dropped == 1
+            clone.append({'index': 3})
+            assert [entry['index'] for entry in clone] == [2, 3]
+            assert clone.read_payload(clone[0]['prompt']) == _prompt(2, 50)
+        assert len(log) == 2
+
+    def test_default_spill_dir_is_durable(self, tmp_path, monkeypatch):
+        import mediator.log_store as log_store
+
+        monkeypatch.delenv('COMPLAINT_GENERATOR_LOG_SPILL_DIR', raising=False)
+        assert log_store._default_spill_dir().parent.name == 'statefiles'
+        monkeypatch.setattr(log_store, '_default_spill_dir', lambda: tmp_path / 'mediator_log')
+        log = MediatorLog(spill_threshold=10)
+        log.append({'prompt': _prompt(1, 100)})
+        saved = json.loads(json.dumps(log))
+        del log
+        gc.collect()
+
+        restored = MediatorLog(saved)
+        assert restored.read_payload(restored[0]['prompt']) == _prompt(1, 100)
+        assert restored.spill_dir == tmp_path / 'mediator_log'
+
+
+class TestMediatorLogState:
+    """Tests for the log wiring in State and Mediator."""
+
+    def test_state_round_trip_keeps_bounded_log(self):
+        state = State()
+        state.log.append({'type': 'event'})
+        restored = State.from_serialized(json.loads(json.dumps(state.serialize())))
+
+        assert isinstance(restored.log, MediatorLog)
+        assert restored.log == [{'type': 'event'}]
+
+    def test_mediator_log_rewraps_assigned_list_and_reads_pages(self, tmp_path, monkeypatch):
+        try:
+            from mediator import Mediator
+        except ImportError as e:
+            pytest.skip(f"Mediator class has dependency issues: {e}")
+        monkeypatch.setenv('COMPLAINT_GENERATOR_LOG_SPILL_DIR', str(tmp_path))
+        backend = Mock()
+        backend.id = 'test-backend'
+        mediator = Mediator(backends=[backend])
+
+        mediator.state.log = [{'type': 'restored'}]
+        mediator.log('backend_query', prompt=_prompt(1), response='ok')
+
+        assert isinstance(mediator.state.log, MediatorLog)
+        page = mediator.read_log(start=1, limit=1)
+        assert page['total'] == 2
+        assert is_spill_ref(page['entries'][0]['prompt'])
+        resolved = mediator.read_log(start=1, limit=1, resolve_payloads=True)
+        assert resolved['entries'][0]['prompt'] == _prompt(1)
+
+
+class TestBoundedLossHistory:
+    """Tests for the bounded PhaseManager loss history."""
+
+    def test_aggregates_cover_trimmed_iterations(self):
+        pm = PhaseManager()
+        pm.loss_history_limit = 3
+        for loss in (0.5, 0.1, 0.4, 0.3, 0.2):
+            pm.record_iteration(loss, {})
+
+        assert [entry['loss'] for entry in pm.loss_history] == [0.4, 0.3, 0.2]
+        assert pm.total_iterations() == 5
+        assert pm.iterations_in_phase(ComplaintPhase.INTAKE) == 5
+        assert pm.minimum_loss() == 0.1
+        assert pm.average_loss() == pytest.approx(0.3)
+
+        restored = PhaseManager.from_dict(json.loads(json.dumps(pm.to_dict())))
+        assert restored.minimum_loss() == 0.1
+        assert restored.get_loss_summary()['count'] == 5
+
+    def test_assigned_history_rebuilds_aggregates(self):
+        pm = PhaseManager()
+        pm.record_iteration(0.9, {})
+        pm.loss_history = [{'loss': 0.2, 'phase': 'evidence'}]
+
+        assert pm.average_loss() == 0.2
+        assert pm.iterations_in_phase(ComplaintPhase.EVIDENCE) == 1
+        assert pm.iterations_in_phase(ComplaintPhase.INTAKE) == 0
+
+
+def test_memory_stays_flat_over_5000_turn_session(tmp_path):
+    """Test a 5,000-turn session holds a bounded log and loss history."""
+    try:
+        from mediator import Mediator
+    except ImportError as e:
+        pytest.skip(f"Mediator class has dependency issues: {e}")
+    backend = Mock()
+    backend.id = 'test-backend'
+    mediator = Mediator(backends=[backend])
+    mediator.state.log = MediatorLog(limit=200, spill_dir=str(tmp_path))
+
+    def _turn(turn: int) -> None:
+        mediator.log('backend_query', backend=backend.id, prompt=_prompt(turn), response=_prompt(turn, 4000))
+        mediator.phase_manager.record_iteration(1.0 / (turn + 1), {'entities': turn, 'relationships': turn})
+
+    tracemalloc.start()
+    try:
+        for turn in range(1000):
+            _turn(turn)
+        warm, _ = tracemalloc.get_traced_memory()
+        for turn in range(1000, 5000):
+            _turn(turn)
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Keeping every prompt and response in memory would grow by ~48 MB here.
+    assert current - warm < 2 * 1024 * 1024
+    assert len(mediator.state.log) == 200
+    assert mediator.state.log.total == 5000
+    assert len(mediator.phase_manager.loss_history) == PhaseManager.LOSS_HISTORY_LIMIT
+    assert mediator.phase_manager.get_loss_summary()['count'] == 5000
+    assert len(json.dumps(mediator.get_state())) < 1024 * 1024
+    last = mediator.read_log(start=199, limit=1, resolve_payloads=True)['entries'][0]
+    assert last['prompt'] == _prompt(4999)
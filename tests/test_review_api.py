@@ -4738,6 +4738,20 @@ def test_claim_support_confirm_intake_summary_route_returns_refreshed_review():
     assert payload["post_confirmation_review"]["intake_case_summary"]["complainant_summary_confirmation"]["confirmed"] is True
 
 
+def test_mediator_log_route_pages_through_read_log():
+    mediator = Mock()
+    mediator.read_log.return_value = {"start": 5, "entries": [{"type": "backend_query"}], "total": 6}
+
+    app = create_review_api_app(mediator)
+    client = TestClient(app)
+
+    response = client.get("/api/claim-support/mediator-log?start=5&limit=1&resolve_payloads=true")
+
+    assert response.status_code == 200
+    assert response.json()["entries"] == [{"type": "backend_query"}]
+    mediator.read_log.assert_called_once_with(start=5, limit=1, resolve_payloads=True)
+
+
 def test_claim_support_save_testimony_route_canonicalizes_text_only_claim_element():
     with tempfile.NamedTemporaryFile(suffix=".duckdb", delete=False) as handle:
         db_path = handle.name
@@ -0,0 +1,155 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("fastapi")
+from fastapi.testclient import TestClient
+
+from applications.mediator_pool import MediatorPool
+from applications.server import SERVER
+
+
+pytestmark = [pytest.mark.no_auto_network]
+
+
+class _BlockingMediator:
+    def __init__(self):
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def io_payload(self, text):
+        self.entered.set()
+        assert self.release.wait(5)
+        return {"message": f"echo {text}"}
+
+
+class _StatefulMediator:
+    def __init__(self):
+        self.state = Mock(spec=[])
+        self.turns = []
+
+    def io_payload(self, text):
+        self.turns.append(text)
+        return {"message": f"{len(self.turns)}:{text}"}
+
+    def get_state(self):
+        return {"turns": list(self.turns)}
+
+    def set_state(self, serialized):
+        self.turns = list(serialized["turns"])
+
+
+def test_health_stays_responsive_while_chat_turn_blocks():
+    mediator = _BlockingMediator()
+    client = TestClient(SERVER(mediator).app)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        chat = pool.submit(client.post, "/api/chat", json={"message": "hello"})
+        assert mediator.entered.wait(5)
+        assert client.get("/health").json() == {"status": "healthy"}
+        assert client.get("/api/chat/queue").json()["executor"]["in_flight"] == 1
+        mediator.release.set()
+        response = chat.result(timeout=5)
+
+    assert response.status_code == 200
+    assert response.json()["message"] == "echo hello"
+    assert response.headers["X-Queue-Position"] == "0"
+
+
+def test_saturated_executor_returns_429_with_queue_position():
+    mediator = _BlockingMediator()
+    client = TestClient(SERVER(mediator, max_workers=1, max_queue=0).app)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        chat = pool.submit(client.post, "/api/chat", json={"message": "first"})
+        assert mediator.entered.wait(5)
+        rejected = client.post("/api/chat", json={"message": "second"})
+        mediator.release.set()
+        assert chat.result(timeout=5).status_code == 200
+
+    assert rejected.status_code == 429
+    assert rejected.headers["Retry-After"] == "1"
+    assert rejected.json()["queue_position"] == 1
+    assert client.get("/api/chat/queue").json()["executor"]["rejected"] == 1
+
+
+def test_per_user_mediators_are_isolated_from_the_shared_default():
+    default = _StatefulMediator()
+    client = TestClient(SERVER(default, mediator_factory=_StatefulMediator).app)
+
+    first = client.post("/api/chat", json={"message": "a", "hashed_username": "user-1"})
+    second = client.post("/api/chat", json={"message": "b", "hashed_username": "user-2"})
+    again = client.post("/api/chat", json={"message": "c", "hashed_username": "user-1"})
+    anonymous = client.post("/api/chat", json={"message": "d"})
+
+    assert [first.json()["message"], second.json()["message"], again.json()["message"]] == ["1:a", "1:b", "2:c"]
+    assert anonymous.json()["message"] == "1:d"
+    assert default.turns == ["d"]
+
+
+def test_pool_evicts_least_recently_used_and_reloads_state(tmp_path):
+    pool = MediatorPool(_StatefulMediator(), _StatefulMediator, max_size=1, state_dir=str(tmp_path))
+
+    pool.run("user-1", lambda mediator: mediator.io_payload("a"))
+    pool.run("user-2", lambda mediator: mediator.io_payload("b"))
+    assert len(pool) == 1
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    reply = pool.run("user-1", lambda mediator: mediator.io_payload("c"))
+
+    assert reply == {"message": "2:c"}
+    stats = pool.stats()
+    assert stats["evicted"] == 2
+    assert stats["reloaded"] == 1
+    assert stats["created"] == 3
+
+
+def test_pool_serializes_calls_for_one_user():
+    pool = MediatorPool(Mock(), _StatefulMediator, max_size=4)
+    active = []
+    overlaps = []
+    lock = threading.Lock()
+
+    def turn(mediator):
+        with lock:
+            active.append(mediator)
+            overlaps.append(active.count(mediator))
+        threading.Event().wait(0.01)
+        with lock:
+            active.remove(mediator)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: pool.run("user-1", turn), range(8)))
+
+    assert max(overlaps) == 1
+
+
+def test_user_returning_before_eviction_persists_reuses_the_entry(tmp_path):
+    pool = MediatorPool(_StatefulMediator(), _StatefulMediator, max_size=1, state_dir=str(tmp_path))
+    pool.run("user-1", lambda mediator: mediator.io_payload("a"))
+    entry, evicted = pool._checkout("user-2")
+    with pool._lock:
+        entry.users -= 1
+
+    reply = pool.run("user-1", lambda mediator: mediator.io_payload("b"))
+    for stale in evicted:
+        pool._persist(stale)
+
+    assert reply == {"message": "2:b"}
+    assert pool.stats()["reloaded"] == 0
+    assert pool.stats()["persisting"] == 0
+    assert pool.run("user-1", lambda mediator: mediator.turns) == ["a", "b"]
+
+
+def test_app_shutdown_flushes_pooled_state(tmp_path):
+    server = SERVER(_StatefulMediator(), mediator_factory=_StatefulMediator, session_state_dir=str(tmp_path))
+
+    with TestClient(server.app) as client:
+        client.post("/api/chat", json={"message": "a", "hashed_username": "user-1"})
+        assert not list(tmp_path.glob("*.json"))
+
+    (state_file,) = tmp_path.glob("*.json")
+    assert json.loads(state_file.read_text(encoding="utf-8")) == {"turns": ["a"]}